@@ -8,14 +8,18 @@ Compares extracted rules across multiple projects to identify:
 - Firm-specific rules (unique to a firm's practice)
 
 Usage:
-    python compare_project_rules.py
+    python compare_project_rules.py            # uses the rule index (rule_index.py)
+    python compare_project_rules.py --rebuild  # re-parse every extraction first
 """
 
 import json
+import sys
 from pathlib import Path
 from collections import defaultdict
 from datetime import datetime
 
+from rule_index import RuleIndex
+
 def load_extracted_projects(base_dir: Path) -> list:
     """Load all extracted project JSON files."""
     projects = []
@@ -75,45 +79,72 @@ def classify_rules(rule_presence: dict, total_projects: int) -> dict:
     }
 
     for rule_id, occurrences in rule_presence.items():
-        presence_ratio = len(occurrences) / total_projects
+        unique_types = set(o["type"] for o in occurrences)
+        _classify_rule(
+            classifications, rule_id, len(occurrences), total_projects,
+            len(unique_types), next(iter(unique_types), None),
+            lambda: [o["project"] for o in occurrences],
+        )
 
-        if total_projects < 3:
-            classifications["insufficient_data"].append({
-                "rule_id": rule_id,
-                "occurrences": len(occurrences),
-                "note": "Need more projects for accurate classification",
-            })
-        elif presence_ratio >= 0.8:
-            classifications["universal"].append({
+    return classifications
+
+def classify_rules_indexed(index: RuleIndex) -> dict:
+    """classify_rules over the rule index: counts come from one GROUP BY query."""
+    classifications = {
+        "universal": [],
+        "type_specific": [],
+        "firm_specific": [],
+        "insufficient_data": [],
+    }
+    total_projects = index.project_count()
+
+    for stats in index.rule_stats():
+        rule_id = stats["rule_id"]
+        _classify_rule(
+            classifications, rule_id, stats["occurrences"], total_projects,
+            stats["type_count"], stats["first_type"],
+            lambda: [o["project"] for o in index.occurrences_of(rule_id)],
+        )
+
+    return classifications
+
+def _classify_rule(classifications: dict, rule_id, count: int, total_projects: int,
+                   type_count: int, only_type, projects) -> None:
+    """Place one rule into its bucket. projects() is only called for firm-specific rules."""
+    presence_ratio = count / total_projects
+
+    if total_projects < 3:
+        classifications["insufficient_data"].append({
+            "rule_id": rule_id,
+            "occurrences": count,
+            "note": "Need more projects for accurate classification",
+        })
+    elif presence_ratio >= 0.8:
+        classifications["universal"].append({
+            "rule_id": rule_id,
+            "presence": f"{count}/{total_projects}",
+            "confidence": "HIGH",
+        })
+    elif presence_ratio >= 0.5:
+        # Check if type-specific
+        if type_count == 1:
+            classifications["type_specific"].append({
                 "rule_id": rule_id,
-                "presence": f"{len(occurrences)}/{total_projects}",
-                "confidence": "HIGH",
+                "applies_to": only_type,
+                "presence": f"{count}/{total_projects}",
             })
-        elif presence_ratio >= 0.5:
-            # Check if type-specific
-            project_types = [o["type"] for o in occurrences]
-            unique_types = set(project_types)
-
-            if len(unique_types) == 1:
-                classifications["type_specific"].append({
-                    "rule_id": rule_id,
-                    "applies_to": list(unique_types)[0],
-                    "presence": f"{len(occurrences)}/{total_projects}",
-                })
-            else:
-                classifications["universal"].append({
-                    "rule_id": rule_id,
-                    "presence": f"{len(occurrences)}/{total_projects}",
-                    "confidence": "MEDIUM",
-                })
         else:
-            classifications["firm_specific"].append({
+            classifications["universal"].append({
                 "rule_id": rule_id,
-                "occurrences": len(occurrences),
-                "projects": [o["project"] for o in occurrences],
+                "presence": f"{count}/{total_projects}",
+                "confidence": "MEDIUM",
             })
-
-    return classifications
+    else:
+        classifications["firm_specific"].append({
+            "rule_id": rule_id,
+            "occurrences": count,
+            "projects": projects(),
+        })
 
 def generate_comparison_report(
     projects: list,
@@ -137,7 +168,8 @@ def generate_comparison_report(
 """
     for p in projects:
         stats = p.get("statistics", {})
-        report += f"| {p.get('project_name', 'Unknown')} | {classify_project_type(p)} | {stats.get('rooms', 0)} | {stats.get('views', 0)} | {stats.get('sheets', 0)} |\n"
+        project_type = p["classified_type"] if "classified_type" in p else classify_project_type(p)
+        report += f"| {p.get('project_name', 'Unknown')} | {project_type} | {stats.get('rooms', 0)} | {stats.get('views', 0)} | {stats.get('sheets', 0)} |\n"
 
     report += """
 ---
@@ -223,9 +255,10 @@ def main():
     print("RULE COMPARISON FRAMEWORK")
     print("=" * 60)
 
-    # Load projects
-    print("\nLoading extracted projects...")
-    projects = load_extracted_projects(base_dir)
+    # Load projects (incremental: only new or changed extractions are parsed)
+    print("\nIndexing extracted projects...")
+    index = RuleIndex.open(base_dir, rebuild="--rebuild" in sys.argv)
+    projects = index.projects()
     print(f"  Found {len(projects)} projects")
 
     if not projects:
@@ -235,12 +268,13 @@ def main():
 
     # Compare rules
     print("\nComparing rules across projects...")
-    rule_presence = compare_rule_presence(projects)
+    rule_presence = index.rule_presence()
     print(f"  Found {len(rule_presence)} unique rules")
 
     # Classify rules
     print("\nClassifying rules...")
-    classifications = classify_rules(rule_presence, len(projects))
+    classifications = classify_rules_indexed(index)
+    index.close()
 
     # Generate report
     report = generate_comparison_report(projects, rule_presence, classifications)
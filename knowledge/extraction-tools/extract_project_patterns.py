@@ -609,6 +609,10 @@ def main():
 
     print(f"Raw data saved to: {json_file}")
 
+    # Keep the cross-project rule index current (only this file is re-parsed)
+    from rule_index import RuleIndex
+    RuleIndex.open(output_dir).close()
+
     return report
 
 if __name__ == "__main__":
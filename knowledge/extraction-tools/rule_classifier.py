@@ -17,6 +17,8 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any
 
+from rule_index import RuleIndex
+
 class RuleClassifier:
     """Classifies and codifies validated rules."""
 
@@ -315,8 +317,6 @@ class RuleClassifier:
 
 def load_validated_rules(base_dir: Path) -> List[Dict]:
     """Load user-validated rules from JSON files."""
-    rules = []
-
     # First check for explicit validated-rules.json
     validated_file = base_dir / "validated-rules.json"
     if validated_file.exists():
@@ -325,15 +325,9 @@ def load_validated_rules(base_dir: Path) -> List[Dict]:
             return data.get("rules", [])
 
     # Otherwise, aggregate from raw extractions (treating HIGH confidence as validated)
-    for json_file in base_dir.glob("*-raw.json"):
-        try:
-            with open(json_file) as f:
-                data = json.load(f)
-                for rule in data.get("proposed_rules", []):
-                    if rule.get("confidence") == "HIGH":
-                        rules.append(rule)
-        except Exception as e:
-            print(f"Error loading {json_file}: {e}")
+    index = RuleIndex.open(base_dir)
+    rules = index.rules_with_confidence("HIGH")
+    index.close()
 
     return rules
 
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Rule Occurrence Index
+=====================
+Persistent SQLite index of proposed rules across extracted projects, so the
+comparison and classification tools don't re-parse every *-raw.json on each run.
+
+Each raw extraction is recorded once (keyed by file, size and mtime). A sync
+only parses files that are new or changed and drops files that were removed,
+so adding one project to a library of hundreds costs one file parse.
+
+Usage:
+    python rule_index.py            # sync and print index summary
+    python rule_index.py --rebuild  # drop and re-parse every extraction
+
+    from rule_index import RuleIndex
+    index = RuleIndex.open(base_dir)   # opens and syncs
+    index.rule_stats()
+"""
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+INDEX_FILENAME = "rule-index.db"
+RAW_PATTERN = "*-raw.json"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    source_file TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    project_name TEXT,
+    project_type TEXT,
+    rooms INTEGER,
+    views INTEGER,
+    sheets INTEGER,
+    statistics_json TEXT
+);
+CREATE TABLE IF NOT EXISTS rule_occurrences (
+    source_file TEXT NOT NULL REFERENCES projects(source_file) ON DELETE CASCADE,
+    ord INTEGER NOT NULL,
+    rule_id TEXT,
+    project TEXT,
+    type TEXT,
+    confidence TEXT,
+    evidence_json TEXT,
+    rule_json TEXT,
+    PRIMARY KEY (source_file, ord)
+);
+CREATE INDEX IF NOT EXISTS idx_occ_rule ON rule_occurrences(rule_id);
+CREATE INDEX IF NOT EXISTS idx_occ_confidence ON rule_occurrences(confidence);
+"""
+
+
+class RuleIndex:
+    """Rule id -> (project, type, confidence) occurrences, kept in sync with the raw files."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+
+    @classmethod
+    def open(cls, base_dir: Path, rebuild: bool = False) -> "RuleIndex":
+        """Open the index stored next to the extractions and bring it up to date."""
+        index = cls(Path(base_dir) / INDEX_FILENAME)
+        index.sync(base_dir, rebuild=rebuild)
+        return index
+
+    def close(self):
+        self.conn.close()
+
+    # ------------------------------------------------------------------
+    # Sync
+    # ------------------------------------------------------------------
+
+    def sync(self, base_dir: Path, rebuild: bool = False) -> Dict[str, int]:
+        """
+        Re-index new or changed extractions and forget removed ones.
+
+        Returns counts of added, updated, removed and unchanged files.
+        """
+        # Imported here: compare_project_rules imports this module
+        from compare_project_rules import classify_project_type
+
+        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        known = {
+            row["source_file"]: (row["mtime_ns"], row["size"])
+            for row in self.conn.execute("SELECT source_file, mtime_ns, size FROM projects")
+        }
+
+        with self.conn:
+            if rebuild:
+                self.conn.execute("DELETE FROM projects")
+                known = {}
+
+            seen = set()
+            for json_file in sorted(Path(base_dir).glob(RAW_PATTERN)):
+                source = str(json_file)
+                seen.add(source)
+                st = json_file.stat()
+                signature = (st.st_mtime_ns, st.st_size)
+                if known.get(source) == signature:
+                    stats["unchanged"] += 1
+                    continue
+
+                try:
+                    with open(json_file) as f:
+                        data = json.load(f)
+                except Exception as e:
+                    print(f"Error loading {json_file}: {e}")
+                    continue
+
+                self.conn.execute("DELETE FROM projects WHERE source_file = ?", (source,))
+                self._insert_project(source, signature, data, classify_project_type(data))
+                stats["updated" if source in known else "added"] += 1
+
+            for source in set(known) - seen:
+                self.conn.execute("DELETE FROM projects WHERE source_file = ?", (source,))
+                stats["removed"] += 1
+
+        return stats
+
+    def _insert_project(self, source: str, signature: Tuple[int, int], data: dict, project_type: str):
+        project_name = data.get("project_name", "Unknown")
+        statistics = data.get("statistics", {})
+        self.conn.execute(
+            "INSERT INTO projects VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (source, signature[0], signature[1], project_name, project_type,
+             statistics.get("rooms", 0), statistics.get("views", 0), statistics.get("sheets", 0),
+             json.dumps(statistics)),
+        )
+        self.conn.executemany(
+            "INSERT INTO rule_occurrences VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (source, ord_, rule.get("id"), project_name, project_type, rule.get("confidence"),
+                 json.dumps(rule.get("evidence")), json.dumps(rule))
+                for ord_, rule in enumerate(data.get("proposed_rules", []))
+            ],
+        )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def project_count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM projects").fetchone()[0]
+
+    def projects(self) -> List[Dict]:
+        """Indexed projects in file order: name, type and statistics."""
+        return [
+            {
+                "project_name": row["project_name"],
+                "classified_type": row["project_type"],
+                "statistics": json.loads(row["statistics_json"] or "{}"),
+                "source_file": row["source_file"],
+            }
+            for row in self.conn.execute("SELECT * FROM projects ORDER BY source_file")
+        ]
+
+    def rule_count(self) -> int:
+        return self.conn.execute(
+            "SELECT COUNT(DISTINCT rule_id) FROM rule_occurrences"
+        ).fetchone()[0]
+
+    def rule_stats(self) -> List[Dict]:
+        """
+        Per-rule aggregates in first-seen order: occurrence count, number of
+        distinct project types, and the type itself when there is only one.
+        """
+        rows = self.conn.execute("""
+            SELECT rule_id,
+                   COUNT(*) AS occurrences,
+                   COUNT(DISTINCT type) AS type_count,
+                   MIN(type) AS first_type,
+                   MIN(source_file || '|' || printf('%08d', ord)) AS first_seen
+            FROM rule_occurrences
+            GROUP BY rule_id
+            ORDER BY first_seen
+        """)
+        return [dict(row) for row in rows]
+
+    def occurrences(self, rule_id: Optional[str] = None) -> Iterator[Dict]:
+        """Occurrences of one rule (or all rules) in file order."""
+        if rule_id is None:
+            return self._occurrences("", ())
+        return self._occurrences(" WHERE rule_id = ?", (rule_id,))
+
+    def occurrences_of(self, rule_id: Optional[str]) -> Iterator[Dict]:
+        """Occurrences of exactly one rule in file order; None matches rules without an id."""
+        return self._occurrences(" WHERE rule_id IS ?", (rule_id,))
+
+    def _occurrences(self, where: str, params: tuple) -> Iterator[Dict]:
+        sql = "SELECT rule_id, project, type, confidence, evidence_json FROM rule_occurrences"
+        for row in self.conn.execute(sql + where + " ORDER BY source_file, ord", params):
+            yield {
+                "rule_id": row["rule_id"],
+                "project": row["project"],
+                "type": row["type"],
+                "confidence": row["confidence"],
+                "evidence": json.loads(row["evidence_json"]),
+            }
+
+    def rule_presence(self) -> Dict[str, List[Dict]]:
+        """Same shape as compare_project_rules.compare_rule_presence, from the index."""
+        presence: Dict[str, List[Dict]] = {}
+        for occ in self.occurrences():
+            presence.setdefault(occ.pop("rule_id"), []).append(occ)
+        return presence
+
+    def rules_with_confidence(self, confidence: str) -> List[Dict]:
+        """Full rule dicts with the given confidence, in file order."""
+        rows = self.conn.execute(
+            "SELECT rule_json FROM rule_occurrences WHERE confidence = ? ORDER BY source_file, ord",
+            (confidence,),
+        )
+        return [json.loads(row[0]) for row in rows]
+
+
+def main():
+    base_dir = Path(__file__).parent.parent / "extracted-projects"
+    rebuild = "--rebuild" in sys.argv
+
+    index = RuleIndex(base_dir / INDEX_FILENAME)
+    stats = index.sync(base_dir, rebuild=rebuild)
+
+    print("=" * 60)
+    print("RULE OCCURRENCE INDEX")
+    print("=" * 60)
+    print(f"  Index: {index.db_path}")
+    print(f"  Added: {stats['added']}  Updated: {stats['updated']}  "
+          f"Removed: {stats['removed']}  Unchanged: {stats['unchanged']}")
+    print(f"  Projects indexed: {index.project_count()}")
+    print(f"  Unique rules: {index.rule_count()}")
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -19,13 +19,6 @@ from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
 
-try:
-    import fitz  # PyMuPDF
-except ImportError:
-    import subprocess
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "PyMuPDF"])
-    import fitz
-
 try:
     import numpy as np
 except ImportError:
@@ -33,6 +26,19 @@ except ImportError:
     subprocess.check_call([sys.executable, "-m", "pip", "install", "numpy"])
     import numpy as np
 
+from wall_geometry import WallIndex
+
+
+def _load_fitz():
+    """Import PyMuPDF on first PDF access, so the line pipeline runs without it."""
+    try:
+        import fitz  # PyMuPDF
+    except ImportError:
+        import subprocess
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "PyMuPDF"])
+        import fitz
+    return fitz
+
 
 class AutoWallDetector:
     def __init__(self, pdf_path, page_num=0):
@@ -57,6 +63,7 @@ class AutoWallDetector:
 
     def load_pdf(self):
         """Load PDF and extract page info"""
+        fitz = _load_fitz()
         self.doc = fitz.open(self.pdf_path)
         self.page = self.doc[self.page_num]
         self.page_width = self.page.rect.width
@@ -375,6 +382,36 @@ class AutoWallDetector:
                     round(max_y - wall['end_ft'][1], 4)  # Flip Y
                 )
 
+    def validate_walls(self):
+        """
+        Check the detected walls for duplicates, collinear overlaps and
+        near-miss joins before they are sent to Revit. Uses the Revit
+        coordinates (feet) when available, otherwise PDF points.
+        """
+        in_feet = all('revit_start' in w for w in self.wall_segments)
+        walls = [
+            {
+                'id': i + 1,
+                'start': w['revit_start'] if in_feet else w['start'],
+                'end': w['revit_end'] if in_feet else w['end'],
+            }
+            for i, w in enumerate(self.wall_segments)
+        ]
+        if in_feet:
+            index = WallIndex.from_dicts(walls)
+            report = index.analyze()
+        else:
+            # Tolerances are in feet; scale them to PDF points
+            scale = self.scale_factor or 1
+            index = WallIndex.from_dicts(walls, offset_tolerance=0.1 * scale)
+            report = index.analyze(duplicate_tolerance=0.5 * scale, near_miss_gap=0.5 * scale)
+        report['units'] = 'feet' if in_feet else 'pdf_points'
+
+        print(f"  Validation: {len(report['duplicates'])} duplicates, "
+              f"{len(report['collinear_overlaps'])} collinear overlaps, "
+              f"{len(report['near_miss_joins'])} near-miss joins")
+        return report
+
     def generate_revit_commands(self, level_id=30, wall_height=10):
         """Generate Revit MCP commands for creating walls"""
         commands = []
@@ -416,6 +453,7 @@ class AutoWallDetector:
                 'wall_lines_filtered': len(self.wall_lines),
                 'wall_segments_created': len(self.wall_segments)
             },
+            'validation': self.validate_walls(),
             'walls': [],
             'revit_commands': []
         }
@@ -484,6 +522,7 @@ def show_preview(pdf_path, page_num, walls):
         print("Preview requires Pillow and tkinter")
         return
 
+    fitz = _load_fitz()
     doc = fitz.open(pdf_path)
     page = doc[page_num]
 
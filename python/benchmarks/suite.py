@@ -0,0 +1,488 @@
+"""
+Benchmark suite - time and peak memory per stage of the floor-plan stack.
+
+Runs headless on synthetic inputs (see synthetic.py): room programs of 10 to
+500 rooms for every building type in the rule registry, PDF line sets for
+the wall detector, extracted multi-level plans and pattern libraries. Each
+case is a stage of one module (placement_engine, room_intelligence,
+scheme_generator, smart_floor_plan, floor_plan_generator, auto_wall_detect,
+pattern_extractor, pattern_library), parametrized by building type (or
+packer) and room count.
+
+For every case the suite records the fastest of a few timed runs and the
+peak traced allocation of one extra run, then compares them with
+baselines.json. Baseline times are scaled by a calibration loop, so a
+baseline recorded on another machine still applies. A case regresses when
+it is both slower/larger than the tolerance and past an absolute floor; for
+time the floor is the larger of MIN_TIME_DELTA and a few calibration loops,
+so millisecond-scale stages are not failed by scheduler noise.
+
+Profiles:
+    quick   small sizes, a few seconds per module (the default, and what the
+            pytest entry point test_suite.py runs; it checks memory always
+            and time only with BENCH_TIMING=1 set)
+    full    10-500 rooms for every stage; minutes, mostly placement
+
+Usage:
+    python benchmarks/suite.py [--profile quick|full] [--filter placement]
+    python benchmarks/suite.py --save-baseline        # record current numbers
+    python benchmarks/suite.py --json results.json    # also write raw results
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, os.path.join(BENCH_DIR, ".."))
+
+from synthetic import (
+    BUILDING_TYPES, area_program, extracted_rooms, pdf_line_set, project_patterns, room_program
+)
+
+from auto_wall_detect import AutoWallDetector
+from floor_plan_generator import FloorPlanGenerator, PACKERS
+from pattern_extractor import PatternExtractor
+from pattern_library import PatternLibrary
+from placement_engine import (
+    LocalSearchConfig, PlacementStrategy, SmartPlacementEngine, resolve_room_profile
+)
+from room_intelligence import ROOM_RULES_REGISTRY, SIZING_SERVICE, validate_room_program
+from scheme_generator import SchemeGenerator, SchemeSample, run_sample
+from smart_floor_plan import SmartFloorPlanGenerator
+from zone_definitions import ZONE_REGISTRY
+
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baselines.json")
+
+PROFILES = ("quick", "full")
+
+# Regression thresholds: ratio to the (calibrated) baseline and absolute floor.
+# The time floor is max(MIN_TIME_DELTA, CALIBRATION_FLOOR * calibration).
+TIME_TOLERANCE = 1.5
+MEMORY_TOLERANCE = 1.25
+MIN_TIME_DELTA = 0.015      # seconds
+CALIBRATION_FLOOR = 2.0     # calibration loops
+MIN_MEMORY_DELTA = 256.0    # KiB
+
+# Timed runs per case: at least `repeat`, more for fast stages until they add
+# up to MIN_CASE_SECONDS, never past MAX_RUNS or MAX_CASE_SECONDS
+MIN_CASE_SECONDS = 0.25
+MAX_CASE_SECONDS = 5.0
+MAX_RUNS = 25
+
+
+# =============================================================================
+# CASES
+# =============================================================================
+
+@dataclass
+class Case:
+    """
+    One benchmarked stage.
+
+    `factory(param, rooms)` does the untimed setup and returns a zero-argument
+    callable that runs the stage once; it is called again for every run so
+    stages that mutate their inputs always start fresh.
+    """
+    name: str
+    factory: Callable[[str, int], Callable[[], Any]]
+    params: Tuple[str, ...]
+    sizes: Dict[str, Tuple[int, ...]]
+    repeat: int = 3
+
+    def keys(self, profile: str) -> Iterator[Tuple[str, str, int]]:
+        for param in self.params:
+            for rooms in self.sizes[profile]:
+                yield f"{self.name}[{param}-{rooms}]", param, rooms
+
+
+CASES: List[Case] = []
+
+
+def case(name: str, params: Tuple[str, ...], quick: Tuple[int, ...],
+         full: Tuple[int, ...], repeat: int = 3):
+    """Register a stage factory under `name`."""
+    def register(factory):
+        CASES.append(Case(name, factory, params, {"quick": quick, "full": full}, repeat))
+        return factory
+    return register
+
+
+@case("placement_engine.place_rooms", BUILDING_TYPES, quick=(10, 25), full=(10, 50, 100, 200, 500))
+def place_rooms(building_type: str, rooms: int):
+    program, width, depth = room_program(building_type, rooms)
+    engine = SmartPlacementEngine(width, depth, building_type)
+    return lambda: engine.place_rooms(program, PlacementStrategy.DOUBLE_LOADED)
+
+
+@case("placement_engine.local_search", ("office",), quick=(10, 25), full=(10, 50, 100, 200))
+def local_search(building_type: str, rooms: int):
+    program, width, depth = room_program(building_type, rooms)
+    engine = SmartPlacementEngine(width, depth, building_type)
+    # Iteration-bound, not time-bound, so the timing means something
+    config = LocalSearchConfig(max_iterations=500, time_limit=600.0)
+    return lambda: engine.place_rooms(program, PlacementStrategy.DOUBLE_LOADED, optimize=config)
+
+
+def _clear_lookup_caches():
+    """Drop memoized rule, zone and profile lookups, as in a fresh process."""
+    for rules in ROOM_RULES_REGISTRY.values():
+        rules._resolved.clear()
+    for zones in ZONE_REGISTRY.values():
+        zones._resolved.clear()
+    resolve_room_profile.cache_clear()
+
+
+@case("placement_engine.room_profile", BUILDING_TYPES, quick=(200,), full=(50, 200, 500))
+def resolve_profiles(building_type: str, rooms: int):
+    # Canonical, numbered and upper-case names, resolved from cold caches
+    program, _, _ = room_program(building_type, rooms)
+    names = [r["name"] for r in program] + [r["name"].upper() for r in program]
+    _clear_lookup_caches()
+    return lambda: [resolve_room_profile(building_type, name) for name in names]
+
+
+@case("room_intelligence.validate_program", BUILDING_TYPES, quick=(200,), full=(50, 200, 500))
+def validate_program(building_type: str, rooms: int):
+    # A program editor after a one-room edit: size and validate every room
+    # again, with the sizing caches warm from the previous pass
+    program, _, _ = room_program(building_type, rooms)
+
+    def run():
+        for room in program:
+            SIZING_SERVICE.dimensions(building_type, room["name"], room["width"] * room["depth"])
+        return validate_room_program(building_type, program)
+
+    run()
+    program[len(program) // 2]["width"] += 1.0
+    return run
+
+
+@case("scheme_generator.generate_schemes", BUILDING_TYPES, quick=(10,), full=(10, 50, 100, 200))
+def generate_schemes(building_type: str, rooms: int):
+    program, width, depth = room_program(building_type, rooms)
+    generator = SchemeGenerator(width, depth, building_type)
+    return lambda: generator.generate_schemes(program, 3)
+
+
+@case("scheme_generator.sample_schemes", ("office",), quick=(10,), full=(10, 50, 100), repeat=2)
+def sample_schemes(building_type: str, rooms: int):
+    program, width, depth = room_program(building_type, rooms)
+    generator = SchemeGenerator(width, depth, building_type)
+    return lambda: generator.sample_schemes(program, samples=16, seed=0, workers=1)
+
+
+@case("scheme_generator.run_sample", ("office",), quick=(25,), full=(25, 50))
+def seeded_layouts(building_type: str, rooms: int):
+    # Whole seeded layouts, i.e. the candidate loops over the placed-room table
+    program, width, depth = room_program(building_type, rooms)
+    strategies = list(PlacementStrategy)
+    samples = [SchemeSample.from_seed(seed, strategies, len(program)) for seed in range(4)]
+    return lambda: [run_sample(width, depth, building_type, program, s) for s in samples]
+
+
+@case("smart_floor_plan.program", BUILDING_TYPES, quick=(10, 50, 200, 500), full=(10, 50, 200, 500))
+def smart_program(building_type: str, rooms: int):
+    program, width, depth = room_program(building_type, rooms)
+    room_list = [{"name": r["name"].rstrip("0123456789 "), "area": r["width"] * r["depth"]}
+                 for r in program]
+
+    def run():
+        generator = SmartFloorPlanGenerator(building_type, width, depth, apply_learnings=False)
+        generator.add_rooms_from_list(room_list)
+        return generator.validate_program()
+    return run
+
+
+@case("smart_floor_plan.generate", BUILDING_TYPES, quick=(10,), full=(10, 50, 100))
+def smart_generate(building_type: str, rooms: int):
+    program, width, depth = room_program(building_type, rooms)
+    generator = SmartFloorPlanGenerator(building_type, width, depth, apply_learnings=False)
+    generator.add_rooms_from_list(program)
+    return lambda: generator.generate(3)
+
+
+@case("floor_plan_generator.generate", BUILDING_TYPES, quick=(10, 50, 200, 500),
+      full=(10, 50, 200, 500))
+def floor_plan_generate(building_type: str, rooms: int):
+    specs, width, depth = area_program(building_type, rooms)
+    return lambda: FloorPlanGenerator(width, depth).generate_from_rooms(specs)
+
+
+@case("floor_plan_generator.packers", tuple(PACKERS), quick=(50, 500), full=(10, 50, 200, 500))
+def floor_plan_packers(packer: str, rooms: int):
+    specs, width, depth = area_program("office", rooms)
+    return lambda: FloorPlanGenerator(width, depth, packer).generate_from_rooms(specs)
+
+
+def _detector(rooms: int, through: str) -> AutoWallDetector:
+    """A detector fed a synthetic line set and run up to (not including) `through`."""
+    lines, page_width, page_height = pdf_line_set(rooms)
+    detector = AutoWallDetector("synthetic.pdf")
+    detector.all_lines = lines
+    detector.page_width, detector.page_height = page_width, page_height
+    stages = ["filter", "cluster", "snap", "convert"]
+    with contextlib.redirect_stdout(io.StringIO()):
+        for stage in stages[:stages.index(through)]:
+            if stage == "filter":
+                detector.filter_wall_lines()
+                detector.detect_scale()
+            elif stage == "cluster":
+                detector.find_wall_clusters()
+                detector.filter_by_length(2)
+            elif stage == "snap":
+                detector.snap_endpoints()
+    return detector
+
+
+@case("auto_wall_detect.filter", ("pdf",), quick=(50, 200), full=(10, 50, 200, 500))
+def detect_filter(_: str, rooms: int):
+    detector = _detector(rooms, "filter")
+    return detector.filter_wall_lines
+
+
+@case("auto_wall_detect.cluster", ("pdf",), quick=(50, 200), full=(10, 50, 200, 500))
+def detect_cluster(_: str, rooms: int):
+    detector = _detector(rooms, "cluster")
+    return detector.find_wall_clusters
+
+
+@case("auto_wall_detect.snap", ("pdf",), quick=(50, 200), full=(10, 50, 200, 500))
+def detect_snap(_: str, rooms: int):
+    detector = _detector(rooms, "snap")
+    return detector.snap_endpoints
+
+
+@case("auto_wall_detect.validate", ("pdf",), quick=(50, 200), full=(10, 50, 200, 500))
+def detect_validate(_: str, rooms: int):
+    detector = _detector(rooms, "convert")
+
+    def run():
+        detector.convert_to_feet()
+        detector.normalize_origin()
+        return detector.validate_walls()
+    return run
+
+
+@case("pattern_extractor.detect_adjacencies", ("hospital",), quick=(400, 2000),
+      full=(400, 2000, 10000))
+def detect_adjacencies(_: str, rooms: int):
+    extracted = extracted_rooms(rooms, levels=4)
+    return partial(PatternExtractor().detect_adjacencies, extracted)
+
+
+_scratch: Optional[tempfile.TemporaryDirectory] = None
+
+
+def _scratch_path(name: str) -> str:
+    """A path in a temporary directory that is removed when the process exits."""
+    global _scratch
+    if _scratch is None:
+        _scratch = tempfile.TemporaryDirectory(prefix="bench-")
+    return os.path.join(_scratch.name, name)
+
+
+@case("pattern_library.load_statistics", ("npz",), quick=(6000,), full=(6000, 60000, 180000))
+def library_statistics(_: str, rooms: int):
+    # What an extraction run pays up front: read the saved library, summarize it
+    path = _scratch_path(f"patterns-{rooms}.npz")
+    if not os.path.exists(path):
+        library = PatternLibrary()
+        for pattern in project_patterns(rooms // 60, rooms=60):
+            library.add_pattern(pattern)
+        library.save(path)
+    return lambda: PatternLibrary.load(path).statistics()
+
+
+# =============================================================================
+# MEASUREMENT
+# =============================================================================
+
+def calibrate(runs: int = 5) -> float:
+    """Seconds for a fixed pure-Python workload (sorting, dicts, float math)."""
+    best = float("inf")
+    for _ in range(runs):
+        rng = random.Random(0)
+        start = time.perf_counter()
+        values = [rng.random() for _ in range(50000)]
+        values.sort()
+        table = {i: v * 2.0 for i, v in enumerate(values)}
+        total = 0.0
+        for i in range(0, 50000, 3):
+            total += table[i] ** 0.5
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(case_: Case, param: str, rooms: int) -> Dict[str, Any]:
+    """Fastest and median time of the timed runs, then peak traced memory."""
+    times = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        while len(times) < MAX_RUNS:
+            fn = case_.factory(param, rooms)
+            gc.collect()
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+            total = sum(times)
+            if total > MAX_CASE_SECONDS or (len(times) >= case_.repeat and total > MIN_CASE_SECONDS):
+                break
+
+        fn = case_.factory(param, rooms)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "time_min": min(times),
+        "time_median": statistics.median(times),
+        "runs": len(times),
+        "peak_kb": peak / 1024,
+    }
+
+
+def check(key: str, result: Dict[str, Any], baseline: Dict[str, Any], calibration: float,
+          time_tolerance: float = TIME_TOLERANCE,
+          memory_tolerance: float = MEMORY_TOLERANCE,
+          timing: bool = True) -> List[str]:
+    """
+    Regressions of one result against the baseline; empty if none or no
+    baseline. With `timing` off only peak memory is compared.
+    """
+    recorded = baseline.get("results", {}).get(key)
+    if not recorded:
+        return []
+    scale = calibration / recorded["calibration"]
+    problems = []
+
+    expected = recorded["time_min"] * scale
+    floor = max(MIN_TIME_DELTA, CALIBRATION_FLOOR * calibration)
+    if timing and result["time_min"] > expected * time_tolerance and \
+            result["time_min"] - expected > floor:
+        problems.append(f"time {result['time_min'] * 1e3:.1f} ms vs "
+                        f"{expected * 1e3:.1f} ms baseline ({result['time_min'] / expected:.2f}x)")
+
+    if result["peak_kb"] > recorded["peak_kb"] * memory_tolerance and \
+            result["peak_kb"] - recorded["peak_kb"] > MIN_MEMORY_DELTA:
+        problems.append(f"peak memory {result['peak_kb']:.0f} KiB vs "
+                        f"{recorded['peak_kb']:.0f} KiB baseline")
+    return problems
+
+
+# =============================================================================
+# BASELINES
+# =============================================================================
+
+def load_baseline(path: str = DEFAULT_BASELINE) -> Dict[str, Any]:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(results: Dict[str, Dict[str, Any]], calibration: float,
+                  path: str = DEFAULT_BASELINE) -> None:
+    """
+    Merge results into the baseline file. Each entry keeps the calibration it
+    was recorded with, so partial re-recordings never rescale other entries.
+    """
+    baseline = load_baseline(path)
+    kept = baseline.get("results", {})
+    kept.update({
+        key: {**{name: round(value, 6) if isinstance(value, float) else value
+                 for name, value in result.items()},
+              "calibration": round(calibration, 6)}
+        for key, result in results.items()
+    })
+    baseline = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "recorded": datetime.now().isoformat(timespec="seconds"),
+        "results": dict(sorted(kept.items())),
+    }
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2)
+        f.write("\n")
+
+
+# =============================================================================
+# RUNNER
+# =============================================================================
+
+def selected(profile: str, pattern: Optional[str] = None) -> Iterator[Tuple[str, Case, str, int]]:
+    for case_ in CASES:
+        for key, param, rooms in case_.keys(profile):
+            if pattern is None or pattern in key:
+                yield key, case_, param, rooms
+
+
+def run(profile: str = "quick", pattern: Optional[str] = None,
+        baseline_path: str = DEFAULT_BASELINE, save: bool = False,
+        json_path: Optional[str] = None) -> int:
+    baseline = load_baseline(baseline_path)
+    calibration = calibrate()
+
+    print(f"Floor-plan stack benchmark suite ({profile} profile)")
+    print("=" * 92)
+    print(f"calibration {calibration * 1e3:.1f} ms" if baseline else
+          f"calibration {calibration * 1e3:.1f} ms (no baseline at {baseline_path})")
+    print(f"{'case':<52}{'ms (min)':>10}{'vs base':>9}{'peak KiB':>11}  status")
+    print("-" * 92)
+
+    results = {}
+    regressions = 0
+    for key, case_, param, rooms in selected(profile, pattern):
+        result = measure(case_, param, rooms)
+        results[key] = result
+        recorded = baseline.get("results", {}).get(key)
+        problems = check(key, result, baseline, calibration)
+        regressions += bool(problems)
+        ratio = "-"
+        if recorded:
+            expected = recorded["time_min"] * calibration / recorded["calibration"]
+            ratio = f"{result['time_min'] / expected:.2f}x"
+        status = "REGRESSED: " + "; ".join(problems) if problems else ("ok" if recorded else "new")
+        print(f"{key:<52}{result['time_min'] * 1e3:>10.2f}{ratio:>9}"
+              f"{result['peak_kb']:>11.0f}  {status}")
+
+    print("-" * 92)
+    print(f"{len(results)} cases, {regressions} regressions")
+
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump({"calibration": calibration, "profile": profile, "results": results}, f, indent=2)
+    if save:
+        save_baseline(results, calibration, baseline_path)
+        print(f"Baseline updated: {baseline_path}")
+        return 0
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--profile", choices=PROFILES, default="quick")
+    parser.add_argument("--filter", default=None, help="Only cases whose key contains this text")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--json", default=None, help="Write raw results to this file")
+    args = parser.parse_args()
+    sys.exit(run(args.profile, args.filter, args.baseline, args.save_baseline, args.json))
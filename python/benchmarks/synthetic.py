@@ -0,0 +1,224 @@
+"""
+Synthetic inputs for the benchmark suite - no Revit, no PDF files.
+
+room_program()  a seeded room program for any building type in the rule
+                registry, sized from the room rules, with a footprint that
+                leaves room for circulation
+area_program()  the same program as (name, area) pairs for FloorPlanGenerator
+pdf_line_set()  the line dicts AutoWallDetector.extract_lines() would read
+                from a drawn plan: both faces of every wall, door jambs as
+                rectangles, plus hatching, furniture diagonals and tick marks
+extracted_rooms()
+                rooms as PatternExtractor reads them from a multi-level
+                hospital: rows of rooms on a regular grid, same plan per level
+project_patterns()
+                ProjectPatterns of random rooms and adjacencies, for the
+                pattern library
+
+Usage:
+    from synthetic import room_program, pdf_line_set
+
+    program, width, depth = room_program("healthcare", 200, seed=1)
+    lines, page_width, page_height = pdf_line_set(200)
+    rooms = extracted_rooms(2000, levels=4)
+    patterns = project_patterns(3000)
+"""
+
+import contextlib
+import io
+import math
+import os
+import random
+import sys
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from room_intelligence import ROOM_RULES_REGISTRY
+from floor_plan_generator import FloorPlanGenerator
+from pattern_extractor import ExtractedAdjacency, ExtractedRoom, ProjectPattern
+
+BUILDING_TYPES = tuple(ROOM_RULES_REGISTRY)
+
+# Rooms at least this large (gyms, sales floors, open offices) appear once per program
+ASSEMBLY_AREA = 1000
+
+# Share of the footprint left to rooms; the rest is corridors and slack
+ROOM_SHARE = 0.6
+
+# PDF points per foot (1/4" = 1'-0") and drawn wall thickness in feet
+POINTS_PER_FOOT = 18
+WALL_THICKNESS = 0.5
+
+HOSPITAL_ROOM_TYPES = ("Patient Room", "Exam Room", "Nurse Station", "Clean Utility", "Soiled Utility")
+PATTERN_ROOM_TYPES = ("Private Office", "Conference", "Restroom", "Storage", "Exam Room",
+                      "Nurse Station", "Bedroom", "Kitchen", "Classroom", "Corridor")
+
+
+def room_program(building_type: str, rooms: int,
+                 seed: int = 0) -> Tuple[List[Dict[str, Any]], int, int]:
+    """
+    Seeded program of `rooms` rooms with unique names.
+
+    Room types are drawn with weight 1/preferred_area, so small repeated
+    rooms dominate as they do in real programs. Returns (program, width,
+    depth), with the footprint at a 3:2 aspect ratio.
+    """
+    rng = random.Random(f"{building_type}:{rooms}:{seed}")
+    rules = ROOM_RULES_REGISTRY[building_type].rules
+    names = sorted(rules)
+    weights = [1.0 / rules[name].preferred_area for name in names]
+
+    program = []
+    counts: Dict[str, int] = {}
+    while len(program) < rooms:
+        name = rng.choices(names, weights)[0]
+        rule = rules[name]
+        if rule.preferred_area >= ASSEMBLY_AREA and name in counts:
+            continue
+        counts[name] = counts.get(name, 0) + 1
+        width, depth = rule.calculate_dimensions()
+        program.append({
+            "name": name if counts[name] == 1 else f"{name} {counts[name]}",
+            "width": width,
+            "depth": depth,
+        })
+
+    area = sum(r["width"] * r["depth"] for r in program) / ROOM_SHARE
+    width = math.ceil(math.sqrt(area * 1.5))
+    depth = math.ceil(area / width)
+    return program, width, depth
+
+
+def area_program(building_type: str, rooms: int,
+                 seed: int = 0) -> Tuple[List[Tuple[str, float]], int, int]:
+    """room_program() as (name, area) pairs with a footprint for FloorPlanGenerator."""
+    program, _, _ = room_program(building_type, rooms, seed)
+    specs = [(r["name"], round(r["width"] * r["depth"], 1)) for r in program]
+    area = sum(a for _, a in specs) / 0.85
+    width = math.ceil(math.sqrt(area * 1.5))
+    depth = math.ceil(area / width) + FloorPlanGenerator.CORRIDOR_WIDTH
+    return specs, width, depth
+
+
+def _line(x1: float, y1: float, x2: float, y2: float, width: float = 1.0,
+          from_rect: bool = False) -> Dict[str, Any]:
+    """A line dict in AutoWallDetector.extract_lines() format."""
+    dx, dy = x2 - x1, y2 - y1
+    line = {
+        'start': (x1, y1),
+        'end': (x2, y2),
+        'width': width,
+        'color': (0, 0, 0),
+        'length': math.sqrt(dx * dx + dy * dy),
+        'angle': math.degrees(math.atan2(dy, dx)) % 180,
+    }
+    if from_rect:
+        line['from_rect'] = True
+    return line
+
+
+def pdf_line_set(rooms: int, seed: int = 0, building_type: str = "office"
+                 ) -> Tuple[List[Dict[str, Any]], float, float]:
+    """
+    Line set of a plan with `rooms` rooms, in PDF points (Y down).
+
+    Walls come from a treemap FloorPlanGenerator layout of area_program(),
+    which fills the plate without squashing rooms; each wall is drawn as its
+    two faces. Returns (lines, page_width, page_height).
+    """
+    rng = random.Random(f"pdf:{building_type}:{rooms}:{seed}")
+    specs, width, depth = area_program(building_type, rooms, seed)
+    generator = FloorPlanGenerator(width, depth, "treemap")
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator.generate_from_rooms(specs)
+
+    scale = POINTS_PER_FOOT
+    margin = 2 * scale
+    half = WALL_THICKNESS * scale / 2
+    page_height = depth * scale + 2 * margin
+
+    def pt(x: float, y: float) -> Tuple[float, float]:
+        return margin + x * scale, page_height - margin - y * scale
+
+    lines = []
+    for wall in generator.walls:
+        (x1, y1), (x2, y2) = pt(wall.start_x, wall.start_y), pt(wall.end_x, wall.end_y)
+        if abs(y1 - y2) < abs(x1 - x2):
+            for offset in (-half, half):
+                lines.append(_line(x1, y1 + offset, x2, y2 + offset, width=1.5))
+        else:
+            for offset in (-half, half):
+                lines.append(_line(x1 + offset, y1, x2 + offset, y2, width=1.5))
+
+    for room in generator.rooms:
+        x, y = pt(room.x, room.y + room.depth)
+        w, d = room.width * scale, room.depth * scale
+        # Door jamb drawn as a rectangle on the room's south wall
+        jx = x + w / 2
+        jamb = [(jx, y + d - half), (jx + 3 * scale, y + d - half),
+                (jx + 3 * scale, y + d + half), (jx, y + d + half)]
+        for i in range(4):
+            (ax, ay), (bx, by) = jamb[i], jamb[(i + 1) % 4]
+            lines.append(_line(ax, ay, bx, by, from_rect=True))
+        # Furniture diagonal and short hatch/tick marks inside the room
+        lines.append(_line(x + 0.2 * w, y + 0.2 * d, x + 0.7 * w, y + 0.6 * d, width=0.25))
+        for _ in range(rng.randint(2, 6)):
+            hx, hy = x + rng.uniform(0.1, 0.9) * w, y + rng.uniform(0.1, 0.9) * d
+            lines.append(_line(hx, hy, hx + 4, hy + 4, width=0.25))
+
+    return lines, width * scale + 2 * margin, page_height
+
+
+def extracted_rooms(rooms: int, levels: int = 4, seed: int = 0) -> List[ExtractedRoom]:
+    """
+    `rooms` rooms spread over `levels` identical levels, 25 to a row, with
+    a wall thickness between neighbours.
+    """
+    rng = random.Random(f"hospital:{rooms}:{levels}:{seed}")
+    plan = []
+    for k in range(rooms // levels):
+        width, depth = rng.choice([10, 12, 14]), rng.choice([12, 14, 16])
+        col, row = k % 25, k // 25
+        plan.append((rng.choice(HOSPITAL_ROOM_TYPES), width, depth,
+                     col * (14 + WALL_THICKNESS) + width / 2,
+                     row * (16 + WALL_THICKNESS) + depth / 2))
+
+    extracted = []
+    for level in range(levels):
+        for k, (room_type, width, depth, x, y) in enumerate(plan):
+            extracted.append(ExtractedRoom(
+                name=f"{room_type} {level + 1}{k:03d}", room_type=room_type,
+                area=width * depth, width=width, depth=depth,
+                aspect_ratio=round(max(width, depth) / min(width, depth), 2),
+                perimeter=2 * (width + depth), x=x, y=y,
+                level=f"Level {level + 1}", has_exterior_wall=False))
+    return extracted
+
+
+def project_patterns(projects: int, rooms: int = 60, seed: int = 0) -> List[ProjectPattern]:
+    """`projects` extracted projects of `rooms` random rooms, with 2 adjacencies per 3 rooms."""
+    rng = random.Random(f"patterns:{projects}:{rooms}:{seed}")
+    patterns = []
+    for p in range(projects):
+        extracted = []
+        for k in range(rooms):
+            width, depth = rng.uniform(8, 30), rng.uniform(8, 20)
+            extracted.append(ExtractedRoom(
+                name=f"Room {k}", room_type=rng.choice(PATTERN_ROOM_TYPES), area=width * depth,
+                width=width, depth=depth, aspect_ratio=max(width, depth) / min(width, depth),
+                perimeter=2 * (width + depth), x=rng.uniform(0, 200), y=rng.uniform(0, 100),
+                level=f"Level {rng.randint(1, 3)}", has_exterior_wall=rng.random() < 0.4))
+        adjacencies = [
+            ExtractedAdjacency(rng.choice(PATTERN_ROOM_TYPES), rng.choice(PATTERN_ROOM_TYPES),
+                               rng.uniform(4, 20), False)
+            for _ in range(rooms * 2 // 3)
+        ]
+        patterns.append(ProjectPattern(
+            project_name=f"Project {p}", project_path=f"C:/projects/{p}.rvt",
+            building_type=rng.choice(BUILDING_TYPES),
+            total_area=sum(r.area for r in extracted), room_count=rooms,
+            rooms=extracted, adjacencies=adjacencies,
+            building_footprint={"width": 200, "depth": 100, "aspect_ratio": 2.0},
+            extraction_date="2026-01-01T00:00:00", confidence=0.8))
+    return patterns
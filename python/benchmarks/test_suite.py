@@ -0,0 +1,38 @@
+"""
+pytest entry point for the benchmark suite (quick profile).
+
+Each case is measured and compared with baselines.json; a case without a
+recorded baseline is skipped. Peak memory is always compared; wall-clock
+time only when BENCH_TIMING=1 is set, since it depends on the machine's load.
+Run from the python/ directory:
+
+    python -m pytest benchmarks/test_suite.py -q
+    BENCH_TIMING=1 python -m pytest benchmarks/test_suite.py -q
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from suite import DEFAULT_BASELINE, calibrate, check, load_baseline, measure, selected
+
+BASELINE = load_baseline(DEFAULT_BASELINE)
+CASES = list(selected("quick"))
+TIMING = os.environ.get("BENCH_TIMING", "") not in ("", "0")
+
+
+@pytest.fixture(scope="module")
+def calibration():
+    return calibrate()
+
+
+@pytest.mark.parametrize("key, case, param, rooms", CASES, ids=[c[0] for c in CASES])
+def test_no_regression(key, case, param, rooms, calibration):
+    if key not in BASELINE.get("results", {}):
+        pytest.skip(f"no baseline for {key}")
+    result = measure(case, param, rooms)
+    problems = check(key, result, BASELINE, calibration, timing=TIMING)
+    assert not problems, f"{key}: " + "; ".join(problems)
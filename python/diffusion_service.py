@@ -9,6 +9,14 @@ Usage:
     job_id = service.submit_render(image_path, prompt, style_preset)
     status = service.get_status(job_id)
     result = service.get_result(job_id)
+
+Render farms:
+    service = DiffusionService(
+        backend="comfyui",
+        url=["http://gpu1:8188", "http://gpu2:8188"],
+        workers_per_backend=2,
+        max_queue=32,
+    )
 """
 
 import os
@@ -16,15 +24,25 @@ import sys
 import json
 import time
 import base64
+import hashlib
+import shutil
 import uuid
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 from dataclasses import dataclass, asdict
 from enum import Enum
 import threading
-from queue import Queue
+from queue import Queue, Full, Empty
+from collections import OrderedDict
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import websocket  # websocket-client, for event-driven ComfyUI completion
+    HAVE_WEBSOCKET = True
+except ImportError:
+    HAVE_WEBSOCKET = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -60,6 +78,11 @@ class RenderJob:
     result_image: Optional[str] = None
     error: Optional[str] = None
     parameters: Optional[Dict[str, Any]] = None
+    backend_url: Optional[str] = None
+    image_hash: Optional[str] = None
+    cache_key: Optional[str] = None
+    cached: bool = False
+    coalesced_with: Optional[str] = None
 
 
 # Style presets for architectural rendering
@@ -115,42 +138,299 @@ STYLE_PRESETS = {
 }
 
 
+# Event socket connect timeout, and how long to poll before retrying it
+EVENTS_CONNECT_TIMEOUT = 3
+EVENTS_RETRY_SECONDS = 60
+
+# Render cache size in output_dir/.cache (0 disables caching)
+DEFAULT_CACHE_BYTES = 2 * 1024 ** 3
+# Seconds submit_render waits for room in a full bounded queue
+DEFAULT_SUBMIT_TIMEOUT = 30.0
+# Base64-encoded inputs kept for Automatic1111 re-renders of the same capture
+ENCODED_INPUT_CACHE = 8
+
+
+class ServiceBusy(Exception):
+    """Raised by submit_render when the bounded job queue stays full."""
+
+
+class RenderCancelled(Exception):
+    """Raised by a renderer that stopped waiting because its job was cancelled."""
+
+
+class RenderCache:
+    """
+    Content-addressed store of finished renders.
+
+    Keys combine the input image hash with the normalized prompt and
+    parameters, so resubmitting the same capture with the same settings
+    reuses the earlier result. Entries are evicted least recently used first
+    once the cache exceeds max_bytes; hits refresh the file mtime, which is
+    how the order survives a restart.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # key -> bytes, oldest first
+        self._total = 0
+        self._image_hashes: Dict[tuple, str] = {}
+
+        for path in sorted(self.cache_dir.glob("*.png"), key=lambda p: p.stat().st_mtime):
+            size = path.stat().st_size
+            self._entries[path.stem] = size
+            self._total += size
+        with self._lock:
+            self._evict()
+
+    def image_hash(self, image_path: str) -> str:
+        """SHA-256 of the image file, memoized on path, mtime and size."""
+        st = os.stat(image_path)
+        signature = (os.path.abspath(image_path), st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cached = self._image_hashes.get(signature)
+        if cached:
+            return cached
+
+        digest = hashlib.sha256()
+        with open(image_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+
+        with self._lock:
+            if len(self._image_hashes) > 1024:
+                self._image_hashes.clear()
+            self._image_hashes[signature] = digest.hexdigest()
+        return digest.hexdigest()
+
+    @staticmethod
+    def make_key(image_hash: str, backend: Backend, prompt: str,
+                 negative_prompt: str, parameters: Dict[str, Any]) -> str:
+        """Cache key for an input image plus normalized render settings."""
+        normalized = {
+            "image": image_hash,
+            "backend": backend.value,
+            "prompt": " ".join(prompt.split()),
+            "negative_prompt": " ".join(negative_prompt.split()),
+            "parameters": {
+                name: round(value, 4) if isinstance(value, float) else value
+                for name, value in parameters.items()
+            },
+        }
+        return hashlib.sha256(json.dumps(normalized, sort_keys=True).encode()).hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.png"
+
+    def get(self, key: str) -> Optional[Path]:
+        """Cached render for key (marked most recently used), or None."""
+        path = self.path(key)
+        with self._lock:
+            if key not in self._entries or not path.exists():
+                self._total -= self._entries.pop(key, 0)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        os.utime(path, None)
+        return path
+
+    def put(self, key: str, result_path: str):
+        """Copy a finished render into the cache."""
+        path = self.path(key)
+        tmp_path = path.with_suffix(".tmp")
+        shutil.copyfile(result_path, tmp_path)
+        os.replace(tmp_path, path)
+        size = path.stat().st_size
+
+        with self._lock:
+            self._total -= self._entries.pop(key, 0)
+            self._entries[key] = size
+            self._total += size
+            self._evict()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _evict(self):
+        """Drop least recently used entries until under max_bytes (lock held)."""
+        while self._total > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._total -= size
+            try:
+                self.path(key).unlink()
+            except FileNotFoundError:
+                pass
+
+
+class BackendEndpoint:
+    """
+    One render backend URL with a keep-alive connection pool shared by all
+    of its workers.
+    """
+
+    def __init__(self, url: str, workers: int = 1):
+        self.url = url.rstrip("/")
+        self.workers = max(1, workers)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.workers * 2)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.completed = 0
+        self.failed = 0
+        self.uploads: Dict[str, str] = {}  # image hash -> name uploaded to ComfyUI
+        self._lock = threading.Lock()
+
+    def record(self, success: bool):
+        with self._lock:
+            if success:
+                self.completed += 1
+            else:
+                self.failed += 1
+
+    def close(self):
+        self.session.close()
+
+
+class ComfyUIEvents:
+    """
+    Websocket subscription to ComfyUI execution events for one worker.
+
+    Each worker owns a client_id; prompts queued with that client_id report
+    progress and completion on this socket, so the worker waits on events
+    instead of polling /history.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 10):
+        self.client_id = uuid.uuid4().hex
+        ws_url = base_url.replace("https://", "wss://").replace("http://", "ws://")
+        self.ws = websocket.create_connection(f"{ws_url}/ws?clientId={self.client_id}",
+                                              timeout=timeout)
+
+    def wait(self, prompt_id: str, job: RenderJob, timeout: int = 300) -> bool:
+        """
+        Block until ComfyUI finishes prompt_id. Updates job.progress from
+        progress events. False if the job was cancelled meanwhile.
+        """
+        deadline = time.time() + timeout
+        self.ws.settimeout(1)
+        while time.time() < deadline:
+            if job.status == RenderStatus.CANCELLED:
+                return False
+            try:
+                message = self.ws.recv()
+            except websocket.WebSocketTimeoutException:
+                continue
+            if not isinstance(message, str):
+                continue  # binary preview frames
+
+            event = json.loads(message)
+            data = event.get("data", {})
+            if data.get("prompt_id") not in (None, prompt_id):
+                continue
+
+            if event.get("type") == "progress" and data.get("max"):
+                job.progress = min(95, 100.0 * data["value"] / data["max"])
+            elif event.get("type") == "executing" and data.get("node") is None \
+                    and data.get("prompt_id") == prompt_id:
+                return True
+            elif event.get("type") == "execution_error":
+                raise Exception(f"ComfyUI execution error: {data.get('exception_message', data)}")
+
+        raise Exception("ComfyUI render timeout")
+
+    def close(self):
+        try:
+            self.ws.close()
+        except Exception:
+            pass
+
+
 class DiffusionService:
-    """Main service class for AI rendering integration."""
+    """
+    Main service class for AI rendering integration.
+
+    Each backend URL gets workers_per_backend worker threads sharing one
+    pooled requests.Session. When max_queue is set, submit_render blocks
+    (up to submit_timeout seconds; None waits indefinitely) while the queue
+    is full and then raises ServiceBusy.
+
+    Finished renders are cached by content (see RenderCache): a duplicate
+    submission completes immediately from the cache, and one submitted
+    while an identical job is still queued or rendering follows that job
+    instead of rendering again.
+    """
 
     def __init__(
         self,
         backend: str = "automatic1111",
-        url: str = "http://localhost:7860",
+        url: Union[str, List[str]] = "http://localhost:7860",
         output_dir: str = None,
+        workers_per_backend: int = 1,
+        max_queue: int = 0,
+        submit_timeout: Optional[float] = DEFAULT_SUBMIT_TIMEOUT,
+        cache_max_bytes: int = DEFAULT_CACHE_BYTES,
     ):
         self.backend = Backend(backend.lower())
-        self.base_url = url.rstrip("/")
+        urls = [url] if isinstance(url, str) else list(url)
+        self.endpoints = [BackendEndpoint(u, workers_per_backend) for u in urls]
+        self.base_url = self.endpoints[0].url
         self.output_dir = Path(output_dir) if output_dir else Path.cwd() / "renders"
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         self.jobs: Dict[str, RenderJob] = {}
-        self.job_queue: Queue = Queue()
-        self._worker_thread: Optional[threading.Thread] = None
+        self.job_queue: Queue = Queue(maxsize=max_queue)
+        self.submit_timeout = submit_timeout
+        self._workers: List[threading.Thread] = []
         self._running = False
 
-        logger.info(f"DiffusionService initialized: backend={backend}, url={url}")
+        self.cache = RenderCache(self.output_dir / ".cache", cache_max_bytes) if cache_max_bytes else None
+        self._inflight: Dict[str, str] = {}  # cache key -> job rendering it
+        self._followers: Dict[str, List[str]] = {}  # job id -> coalesced duplicate job ids
+        self._coalesce_lock = threading.Lock()
+        self._encoded_inputs: "OrderedDict[str, str]" = OrderedDict()
+        self._encoded_lock = threading.Lock()
+
+        logger.info(f"DiffusionService initialized: backend={backend}, url={urls}, "
+                    f"workers_per_backend={workers_per_backend}, max_queue={max_queue or 'unbounded'}")
 
     def start(self):
-        """Start the background worker thread."""
+        """Start the background worker threads."""
         if self._running:
             return
         self._running = True
-        self._worker_thread = threading.Thread(target=self._process_queue, daemon=True)
-        self._worker_thread.start()
-        logger.info("DiffusionService worker started")
+        for endpoint in self.endpoints:
+            for index in range(endpoint.workers):
+                worker = threading.Thread(
+                    target=self._process_queue,
+                    args=(endpoint,),
+                    name=f"render-{endpoint.url}-{index}",
+                    daemon=True,
+                )
+                worker.start()
+                self._workers.append(worker)
+        logger.info(f"DiffusionService started {len(self._workers)} workers")
 
     def stop(self):
-        """Stop the background worker thread."""
+        """Stop the background worker threads."""
         self._running = False
-        if self._worker_thread:
-            self._worker_thread.join(timeout=5)
-        logger.info("DiffusionService worker stopped")
+        for worker in self._workers:
+            worker.join(timeout=5)
+        self._workers = []
+        for endpoint in self.endpoints:
+            endpoint.close()
+        logger.info("DiffusionService workers stopped")
 
     def submit_render(
         self,
@@ -204,8 +484,44 @@ class DiffusionService:
             parameters=parameters,
         )
 
+        if self.cache:
+            try:
+                job.image_hash = self.cache.image_hash(image_path)
+                job.cache_key = self.cache.make_key(
+                    job.image_hash, self.backend, full_prompt, full_negative, parameters)
+            except OSError:
+                pass  # unreadable input: let the worker report it
+
+        if job.cache_key:
+            cached = self.cache.get(job.cache_key)
+            if cached:
+                self.jobs[job_id] = job
+                self._complete_from(job, str(cached), cached=True)
+                logger.info(f"Job {job_id} served from cache")
+                return job_id
+
+            with self._coalesce_lock:
+                primary_id = self._inflight.get(job.cache_key)
+                if primary_id:
+                    job.coalesced_with = primary_id
+                    self.jobs[job_id] = job
+                    self._followers[primary_id].append(job_id)
+                    logger.info(f"Job {job_id} coalesced with in-flight job {primary_id}")
+                    return job_id
+                self._inflight[job.cache_key] = job_id
+                self._followers[job_id] = []
+
         self.jobs[job_id] = job
-        self.job_queue.put(job_id)
+        try:
+            self.job_queue.put(job_id, timeout=self.submit_timeout)
+        except Full:
+            del self.jobs[job_id]
+            error = f"Render queue full ({self.job_queue.maxsize} jobs waiting)"
+            if job.cache_key:
+                job.status = RenderStatus.FAILED
+                job.error = error
+                self._settle(job)
+            raise ServiceBusy(error)
 
         logger.info(f"Job {job_id} queued: style={style_preset}")
         return job_id
@@ -225,6 +541,9 @@ class DiffusionService:
             "started_at": job.started_at,
             "completed_at": job.completed_at,
             "error": job.error,
+            "backend_url": job.backend_url,
+            "cached": job.cached,
+            "coalesced_with": job.coalesced_with,
         }
 
     def get_result(self, job_id: str) -> Dict[str, Any]:
@@ -248,6 +567,7 @@ class DiffusionService:
             "prompt": job.prompt,
             "style_preset": job.style_preset,
             "processing_time": job.completed_at - job.started_at if job.started_at else 0,
+            "cached": job.cached,
         }
 
     def cancel_job(self, job_id: str) -> Dict[str, Any]:
@@ -288,53 +608,172 @@ class DiffusionService:
             for name, preset in STYLE_PRESETS.items()
         }
 
-    def _process_queue(self):
-        """Background worker that processes the job queue."""
+    def get_service_stats(self) -> Dict[str, Any]:
+        """Queue depth and per-backend throughput."""
+        return {
+            "success": True,
+            "queued": self.job_queue.qsize(),
+            "max_queue": self.job_queue.maxsize,
+            "workers": len(self._workers),
+            "cache": self.cache.stats() if self.cache else None,
+            "backends": [
+                {
+                    "url": endpoint.url,
+                    "workers": endpoint.workers,
+                    "completed": endpoint.completed,
+                    "failed": endpoint.failed,
+                }
+                for endpoint in self.endpoints
+            ],
+        }
+
+    def _process_queue(self, endpoint: BackendEndpoint):
+        """Background worker that processes the job queue against one backend."""
+        worker = _Worker(endpoint)
         while self._running:
             try:
-                # Non-blocking get with timeout
+                # Blocking get with timeout so stop() is noticed
                 try:
                     job_id = self.job_queue.get(timeout=1)
-                except:
+                except Empty:
                     continue
 
                 if job_id not in self.jobs:
                     continue
 
                 job = self.jobs[job_id]
-                if job.status == RenderStatus.CANCELLED:
-                    continue
-
-                job.status = RenderStatus.PROCESSING
-                job.started_at = time.time()
-                logger.info(f"Processing job {job_id}")
-
-                try:
-                    if self.backend == Backend.AUTOMATIC1111:
-                        result = self._render_automatic1111(job)
-                    else:
-                        result = self._render_comfyui(job)
-
-                    job.result_image = result
-                    job.status = RenderStatus.COMPLETED
-                    job.completed_at = time.time()
-                    job.progress = 100.0
-                    logger.info(f"Job {job_id} completed: {result}")
-
-                except Exception as e:
-                    job.status = RenderStatus.FAILED
-                    job.error = str(e)
-                    job.completed_at = time.time()
-                    logger.error(f"Job {job_id} failed: {e}")
+                while job is not None:
+                    # Cancelled jobs, queued or mid-render, hand their
+                    # duplicates to the next one still wanted
+                    if job.status == RenderStatus.CANCELLED:
+                        job = self._promote_follower(job)
+                        continue
+
+                    job.status = RenderStatus.PROCESSING
+                    job.started_at = time.time()
+                    job.backend_url = endpoint.url
+                    logger.info(f"Processing job {job.job_id} on {endpoint.url}")
+
+                    try:
+                        if self.backend == Backend.AUTOMATIC1111:
+                            result = self._render_automatic1111(job, worker)
+                        else:
+                            result = self._render_comfyui(job, worker)
+
+                        job.result_image = result
+                        job.status = RenderStatus.COMPLETED
+                        job.completed_at = time.time()
+                        job.progress = 100.0
+                        endpoint.record(True)
+                        logger.info(f"Job {job.job_id} completed: {result}")
+
+                    except RenderCancelled:
+                        job.completed_at = time.time()
+                        logger.info(f"Job {job.job_id} cancelled while rendering")
+                        continue
+
+                    except Exception as e:
+                        job.status = RenderStatus.FAILED
+                        job.error = str(e)
+                        job.completed_at = time.time()
+                        endpoint.record(False)
+                        logger.error(f"Job {job.job_id} failed: {e}")
+
+                    self._settle(job)
+                    job = None
 
             except Exception as e:
                 logger.error(f"Queue processing error: {e}")
 
-    def _render_automatic1111(self, job: RenderJob) -> str:
+        worker.close()
+
+    def _complete_from(self, job: RenderJob, source: str, cached: bool = False):
+        """Complete a job with a copy of an existing render."""
+        output_path = self.output_dir / f"{job.job_id}_render.png"
+        now = time.time()
+        job.started_at = job.started_at or now
+        try:
+            shutil.copyfile(source, output_path)
+        except OSError as e:
+            job.status = RenderStatus.FAILED
+            job.error = f"Could not copy render: {e}"
+            job.completed_at = now
+            return
+        job.result_image = str(output_path)
+        job.cached = cached
+        job.progress = 100.0
+        job.completed_at = now
+        job.status = RenderStatus.COMPLETED
+
+    def _settle(self, job: RenderJob):
+        """Cache a finished job's render and resolve its coalesced duplicates."""
+        if not job.cache_key:
+            return
+
+        if job.status == RenderStatus.COMPLETED and self.cache:
+            try:
+                self.cache.put(job.cache_key, job.result_image)
+            except OSError as e:
+                logger.warning(f"Could not cache render for job {job.job_id}: {e}")
+
+        with self._coalesce_lock:
+            if self._inflight.get(job.cache_key) == job.job_id:
+                del self._inflight[job.cache_key]
+            followers = self._followers.pop(job.job_id, [])
+
+        for follower_id in followers:
+            follower = self.jobs.get(follower_id)
+            if follower is None or follower.status == RenderStatus.CANCELLED:
+                continue
+            if job.status == RenderStatus.COMPLETED:
+                self._complete_from(follower, job.result_image)
+            else:
+                follower.status = RenderStatus.FAILED
+                follower.error = job.error
+                follower.completed_at = time.time()
+
+    def _promote_follower(self, cancelled: RenderJob) -> Optional[RenderJob]:
+        """A cancelled job hands its duplicates to the first one still wanted."""
+        with self._coalesce_lock:
+            followers = [
+                self.jobs[f] for f in self._followers.pop(cancelled.job_id, [])
+                if f in self.jobs and self.jobs[f].status != RenderStatus.CANCELLED
+            ]
+            if self._inflight.get(cancelled.cache_key) == cancelled.job_id:
+                del self._inflight[cancelled.cache_key]
+            if not followers:
+                return None
+            job = followers[0]
+            job.coalesced_with = None
+            self._inflight[job.cache_key] = job.job_id
+            self._followers[job.job_id] = [f.job_id for f in followers[1:]]
+            for follower in followers[1:]:
+                follower.coalesced_with = job.job_id
+        return job
+
+    def _encoded_input(self, job: RenderJob) -> str:
+        """Base64 of the input image, reused across renders of the same capture."""
+        if job.image_hash:
+            with self._encoded_lock:
+                encoded = self._encoded_inputs.get(job.image_hash)
+                if encoded:
+                    self._encoded_inputs.move_to_end(job.image_hash)
+                    return encoded
+
+        with open(job.input_image, "rb") as f:
+            encoded = base64.b64encode(f.read()).decode()
+
+        if job.image_hash:
+            with self._encoded_lock:
+                self._encoded_inputs[job.image_hash] = encoded
+                while len(self._encoded_inputs) > ENCODED_INPUT_CACHE:
+                    self._encoded_inputs.popitem(last=False)
+        return encoded
+
+    def _render_automatic1111(self, job: RenderJob, worker: "_Worker") -> str:
         """Render using Automatic1111 WebUI API."""
         # Load and encode input image
-        with open(job.input_image, "rb") as f:
-            image_data = base64.b64encode(f.read()).decode()
+        image_data = self._encoded_input(job)
 
         # Prepare img2img payload
         payload = {
@@ -350,8 +789,8 @@ class DiffusionService:
         }
 
         # Call API
-        response = requests.post(
-            f"{self.base_url}/sdapi/v1/img2img",
+        response = worker.session.post(
+            f"{worker.url}/sdapi/v1/img2img",
             json=payload,
             timeout=300,
         )
@@ -369,44 +808,66 @@ class DiffusionService:
 
         return str(output_path)
 
-    def _render_comfyui(self, job: RenderJob) -> str:
+    def _render_comfyui(self, job: RenderJob, worker: "_Worker") -> str:
         """Render using ComfyUI API."""
-        # Load input image
-        with open(job.input_image, "rb") as f:
-            image_data = f.read()
-
-        # Upload image to ComfyUI
-        files = {"image": (Path(job.input_image).name, image_data, "image/png")}
-        upload_response = requests.post(
-            f"{self.base_url}/upload/image",
-            files=files,
-            timeout=30,
-        )
-        upload_response.raise_for_status()
-        uploaded_name = upload_response.json()["name"]
+        # Upload image to ComfyUI (once per capture per backend)
+        uploaded_name = worker.endpoint.uploads.get(job.image_hash) if job.image_hash else None
+        if uploaded_name is None:
+            with open(job.input_image, "rb") as f:
+                image_data = f.read()
+
+            files = {"image": (Path(job.input_image).name, image_data, "image/png")}
+            upload_response = worker.session.post(
+                f"{worker.url}/upload/image",
+                files=files,
+                timeout=30,
+            )
+            upload_response.raise_for_status()
+            uploaded_name = upload_response.json()["name"]
+            if job.image_hash:
+                worker.endpoint.uploads[job.image_hash] = uploaded_name
 
         # Build workflow (simplified img2img workflow)
         workflow = self._build_comfyui_workflow(uploaded_name, job)
 
+        # Subscribe before queueing so the completion event cannot be missed
+        events = worker.events()
+        request = {"prompt": workflow}
+        if events:
+            request["client_id"] = events.client_id
+
         # Queue prompt
-        prompt_response = requests.post(
-            f"{self.base_url}/prompt",
-            json={"prompt": workflow},
+        prompt_response = worker.session.post(
+            f"{worker.url}/prompt",
+            json=request,
             timeout=30,
         )
         prompt_response.raise_for_status()
         prompt_id = prompt_response.json()["prompt_id"]
 
-        # Poll for completion
-        output_images = self._poll_comfyui(prompt_id, job)
-
+        # Wait for completion: execution events, or /history polling without them
+        output_images = None
+        if events:
+            try:
+                if events.wait(prompt_id, job):
+                    output_images = self._comfyui_outputs(prompt_id, worker)
+                else:
+                    output_images = []  # cancelled
+            except (websocket.WebSocketException, OSError) as e:
+                logger.warning(f"ComfyUI event stream lost ({e}), polling instead")
+                worker.drop_events()
+        if output_images is None:
+            output_images = self._poll_comfyui(prompt_id, job, worker)
+
+        if job.status == RenderStatus.CANCELLED:
+            raise RenderCancelled(job.job_id)
         if not output_images:
             raise Exception("No output images from ComfyUI")
 
         # Download first output image
         output_path = self.output_dir / f"{job.job_id}_render.png"
-        image_response = requests.get(
-            f"{self.base_url}/view",
+        image_response = worker.session.get(
+            f"{worker.url}/view",
             params={"filename": output_images[0]},
             timeout=30,
         )
@@ -478,24 +939,33 @@ class DiffusionService:
             },
         }
 
-    def _poll_comfyui(self, prompt_id: str, job: RenderJob, timeout: int = 300) -> List[str]:
-        """Poll ComfyUI for job completion."""
+    def _comfyui_outputs(self, prompt_id: str, worker: "_Worker") -> Optional[List[str]]:
+        """Output filenames from /history, or None while the prompt is still running."""
+        history_response = worker.session.get(
+            f"{worker.url}/history/{prompt_id}",
+            timeout=10,
+        )
+        history = history_response.json()
+
+        if prompt_id not in history:
+            return None
+        outputs = history[prompt_id].get("outputs", {})
+        for node_id, node_output in outputs.items():
+            if "images" in node_output:
+                return [img["filename"] for img in node_output["images"]]
+        return []
+
+    def _poll_comfyui(self, prompt_id: str, job: RenderJob, worker: "_Worker",
+                      timeout: int = 300) -> List[str]:
+        """Poll ComfyUI for job completion (used when no event stream is available)."""
         start_time = time.time()
         while time.time() - start_time < timeout:
             if job.status == RenderStatus.CANCELLED:
                 return []
 
-            history_response = requests.get(
-                f"{self.base_url}/history/{prompt_id}",
-                timeout=10,
-            )
-            history = history_response.json()
-
-            if prompt_id in history:
-                outputs = history[prompt_id].get("outputs", {})
-                for node_id, node_output in outputs.items():
-                    if "images" in node_output:
-                        return [img["filename"] for img in node_output["images"]]
+            output_images = self._comfyui_outputs(prompt_id, worker)
+            if output_images is not None:
+                return output_images
 
             # Update progress (estimated)
             elapsed = time.time() - start_time
@@ -505,6 +975,37 @@ class DiffusionService:
         raise Exception("ComfyUI render timeout")
 
 
+class _Worker:
+    """Per-thread view of a backend: shared session, private event socket."""
+
+    def __init__(self, endpoint: BackendEndpoint):
+        self.endpoint = endpoint
+        self.url = endpoint.url
+        self.session = endpoint.session
+        self._events: Optional[ComfyUIEvents] = None
+        self._retry_events_at = 0.0
+
+    def events(self) -> Optional[ComfyUIEvents]:
+        """Connected event socket, or None when websockets are unavailable."""
+        if not HAVE_WEBSOCKET or time.time() < self._retry_events_at:
+            return None
+        if self._events is None:
+            try:
+                self._events = ComfyUIEvents(self.url, timeout=EVENTS_CONNECT_TIMEOUT)
+            except Exception as e:
+                logger.warning(f"ComfyUI websocket unavailable at {self.url}: {e}")
+                self._retry_events_at = time.time() + EVENTS_RETRY_SECONDS
+                return None
+        return self._events
+
+    def drop_events(self):
+        if self._events:
+            self._events.close()
+            self._events = None
+
+    def close(self):
+        self.drop_events()
+
 # Simple HTTP API wrapper for MCP integration
 class DiffusionServiceAPI:
     """HTTP API wrapper for use with MCP server."""
@@ -538,6 +1039,9 @@ class DiffusionServiceAPI:
                 jobs = self.service.list_jobs(params.get("status"))
                 return {"success": True, "jobs": jobs}
 
+            elif method == "render.stats":
+                return self.service.get_service_stats()
+
             elif method == "render.presets":
                 presets = self.service.list_presets()
                 return {"success": True, "presets": presets}
@@ -556,7 +1060,14 @@ if __name__ == "__main__":
 
     parser = argparse.ArgumentParser(description="AI Rendering Service for RevitMCPBridge")
     parser.add_argument("--backend", default="automatic1111", choices=["automatic1111", "comfyui"])
-    parser.add_argument("--url", default="http://localhost:7860", help="Backend API URL")
+    parser.add_argument("--url", nargs="+", default=["http://localhost:7860"],
+                        help="Backend API URL(s); jobs are spread across all of them")
+    parser.add_argument("--workers", type=int, default=1, help="Worker threads per backend URL")
+    parser.add_argument("--max-queue", type=int, default=0, help="Bound on queued jobs (0 = unbounded)")
+    parser.add_argument("--submit-timeout", type=float, default=DEFAULT_SUBMIT_TIMEOUT,
+                        help="Seconds to wait for room in a full queue before rejecting a job")
+    parser.add_argument("--cache-mb", type=int, default=DEFAULT_CACHE_BYTES // (1024 * 1024),
+                        help="Render cache size in MB (0 disables the cache)")
     parser.add_argument("--output", default="./renders", help="Output directory")
     parser.add_argument("--test", action="store_true", help="Run test render")
     parser.add_argument("--image", help="Input image for test render")
@@ -569,6 +1080,10 @@ if __name__ == "__main__":
         backend=args.backend,
         url=args.url,
         output_dir=args.output,
+        workers_per_backend=args.workers,
+        max_queue=args.max_queue,
+        submit_timeout=args.submit_timeout,
+        cache_max_bytes=args.cache_mb * 1024 * 1024,
     )
     service.start()
 
@@ -1,27 +1,44 @@
 """
 Fast Local AI Rendering for Revit Views
 Uses SD-Turbo optimized for CPU - produces results in ~30-60 seconds
+
+One-shot mode loads the model, renders one image and exits. Daemon mode
+(--serve) keeps the pipeline resident in a RenderWorker and accepts jobs as
+JSON lines over a local socket, batching same-size requests into one
+pipeline call:
+
+    python fast_render.py --serve --port 8765
+    python fast_render.py view.png --daemon 8765
 """
 
 import sys
 import os
+import json
+import queue
+import socket
+import socketserver
 import argparse
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-def render_image(input_path: str, output_path: str = None, strength: float = 0.5,
-                 prompt: str = "photorealistic architectural rendering, professional photography, natural lighting"):
-    """
-    Transform a Revit 3D view into a photorealistic rendering.
+DEFAULT_PROMPT = "photorealistic architectural rendering, professional photography, natural lighting"
+DEFAULT_PORT = 8765
+MAX_SIZE = 768
+NUM_INFERENCE_STEPS = 4  # SD-Turbo is designed for 4 steps
 
-    Args:
-        input_path: Path to input image (captured from Revit)
-        output_path: Path for output image (default: input_rendered.png)
-        strength: Denoising strength 0.3-0.7 (lower = more geometry preservation)
-        prompt: Style prompt for rendering
-    """
+
+# =============================================================================
+# PIPELINE LOADING
+# =============================================================================
+
+def load_sdxl_turbo():
+    """Default loader: SDXL-Turbo img2img pipeline on CPU."""
     import torch
     from diffusers import AutoPipelineForImage2Image
-    from PIL import Image
 
     print(f"Loading SDXL-Turbo model (first time will download ~7GB)...")
 
@@ -43,11 +60,53 @@ def render_image(input_path: str, output_path: str = None, strength: float = 0.5
     except:
         pass
 
-    print(f"Loading input image: {input_path}")
+    return pipe
+
+
+class StubPipeline:
+    """
+    Stand-in for the diffusers pipeline in tests and benchmarks.
+
+    Returns the input images unchanged after sleeping call_seconds per call
+    plus image_seconds per image, which is roughly how batched CPU inference
+    scales.
+    """
+
+    def __init__(self, call_seconds: float = 0.0, image_seconds: float = 0.0):
+        self.call_seconds = call_seconds
+        self.image_seconds = image_seconds
+        self.calls: List[int] = []
+
+    def __call__(self, prompt, image, strength, num_inference_steps, guidance_scale):
+        images = image if isinstance(image, list) else [image]
+        self.calls.append(len(images))
+        time.sleep(self.call_seconds + self.image_seconds * len(images))
+        return _PipelineOutput([img.copy() for img in images])
+
+
+@dataclass
+class _PipelineOutput:
+    images: List[Any]
+
+
+def load_stub_pipeline(load_seconds: float = 0.0, call_seconds: float = 0.0,
+                       image_seconds: float = 0.0) -> StubPipeline:
+    """Loader for StubPipeline (load_seconds simulates weight loading)."""
+    time.sleep(load_seconds)
+    return StubPipeline(call_seconds, image_seconds)
+
+
+# =============================================================================
+# IMAGE HELPERS
+# =============================================================================
+
+def prepare_image(input_path: str, max_size: int = MAX_SIZE):
+    """Load an RGB image, resized to max_size on the longest side (multiples of 8)."""
+    from PIL import Image
+
     input_image = Image.open(input_path).convert("RGB")
 
     # Resize for faster processing if too large (max 768px on longest side)
-    max_size = 768
     w, h = input_image.size
     if max(w, h) > max_size:
         ratio = max_size / max(w, h)
@@ -58,23 +117,47 @@ def render_image(input_path: str, output_path: str = None, strength: float = 0.5
         input_image = input_image.resize((new_w, new_h), Image.LANCZOS)
         print(f"Resized to {new_w}x{new_h} for faster processing")
 
+    return input_image
+
+
+def default_output_path(input_path: str) -> str:
+    input_p = Path(input_path)
+    return str(input_p.parent / f"{input_p.stem}_rendered{input_p.suffix}")
+
+
+def render_image(input_path: str, output_path: str = None, strength: float = 0.5,
+                 prompt: str = DEFAULT_PROMPT, pipe=None):
+    """
+    Transform a Revit 3D view into a photorealistic rendering.
+
+    Args:
+        input_path: Path to input image (captured from Revit)
+        output_path: Path for output image (default: input_rendered.png)
+        strength: Denoising strength 0.3-0.7 (lower = more geometry preservation)
+        prompt: Style prompt for rendering
+        pipe: Already-loaded pipeline (loads SDXL-Turbo when omitted)
+    """
+    if pipe is None:
+        pipe = load_sdxl_turbo()
+
+    print(f"Loading input image: {input_path}")
+    input_image = prepare_image(input_path)
+
     print(f"Generating photorealistic rendering (this takes ~30-60 seconds on CPU)...")
     print(f"Prompt: {prompt}")
     print(f"Strength: {strength} (lower = more original geometry preserved)")
 
-    # SD-Turbo is designed for 4 steps
     result = pipe(
         prompt=prompt,
         image=input_image,
         strength=strength,
-        num_inference_steps=4,
+        num_inference_steps=NUM_INFERENCE_STEPS,
         guidance_scale=0.0,  # SD-Turbo doesn't use guidance
     ).images[0]
 
     # Determine output path
     if output_path is None:
-        input_p = Path(input_path)
-        output_path = str(input_p.parent / f"{input_p.stem}_rendered{input_p.suffix}")
+        output_path = default_output_path(input_path)
 
     # Save result
     result.save(output_path, quality=95)
@@ -83,21 +166,333 @@ def render_image(input_path: str, output_path: str = None, strength: float = 0.5
     return output_path
 
 
+# =============================================================================
+# RESIDENT RENDER WORKER
+# =============================================================================
+
+@dataclass
+class RenderJob:
+    """One queued render request."""
+    input_path: str
+    output_path: str
+    strength: float
+    prompt: str
+    future: Future = field(default_factory=Future)
+    submitted_at: float = field(default_factory=time.perf_counter)
+    image: Any = None
+
+    def batch_key(self) -> Tuple:
+        """Jobs with the same key can share one pipeline call."""
+        return (self.image.size, round(self.strength, 4))
+
+
+class RenderWorker:
+    """
+    Keeps one pipeline resident and renders queued jobs on a single thread.
+
+    Jobs arriving within batch_window seconds of each other are grouped by
+    image size and strength; each group runs as one pipeline call of up to
+    max_batch images. Every job's result carries its queue wait and inference
+    time, and stats() aggregates them with the one-off load time.
+    """
+
+    def __init__(self, loader: Callable[[], Any] = load_sdxl_turbo,
+                 max_batch: int = 4, batch_window: float = 0.05):
+        self.loader = loader
+        self.max_batch = max(1, max_batch)
+        self.batch_window = batch_window
+        self.pipe = None
+        self.load_seconds: Optional[float] = None
+        self.load_error: Optional[str] = None
+        self._queue: "queue.Queue[Optional[RenderJob]]" = queue.Queue()
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._totals = {
+            "jobs": 0, "failed": 0, "batches": 0,
+            "queue_seconds": 0.0, "inference_seconds": 0.0,
+        }
+
+    def start(self) -> "RenderWorker":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="render-worker", daemon=True)
+            self._thread.start()
+        return self
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until the pipeline is loaded. False on timeout or load failure."""
+        return self._ready.wait(timeout) and self.load_error is None
+
+    def stop(self, timeout: Optional[float] = None):
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, input_path: str, output_path: str = None, strength: float = 0.5,
+               prompt: str = DEFAULT_PROMPT) -> Future:
+        """Queue a render. The future resolves to a result dict (see _finish)."""
+        job = RenderJob(
+            input_path=input_path,
+            output_path=output_path or default_output_path(input_path),
+            strength=strength,
+            prompt=prompt,
+        )
+        self.start()
+        self._queue.put(job)
+        return job.future
+
+    def render(self, input_path: str, output_path: str = None, strength: float = 0.5,
+               prompt: str = DEFAULT_PROMPT, timeout: Optional[float] = None) -> Dict:
+        return self.submit(input_path, output_path, strength, prompt).result(timeout)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            totals = dict(self._totals)
+        done = max(1, totals["jobs"])
+        return {
+            "ready": self._ready.is_set() and self.load_error is None,
+            "load_seconds": self.load_seconds,
+            "load_error": self.load_error,
+            "queued": self._queue.qsize(),
+            "jobs": totals["jobs"],
+            "failed": totals["failed"],
+            "batches": totals["batches"],
+            "avg_batch_size": round(totals["jobs"] / max(1, totals["batches"]), 2),
+            "avg_queue_seconds": round(totals["queue_seconds"] / done, 4),
+            "avg_inference_seconds": round(totals["inference_seconds"] / done, 4),
+        }
+
+    # -------------------------------------------------------------------------
+
+    def _run(self):
+        start = time.perf_counter()
+        try:
+            self.pipe = self.loader()
+        except Exception as e:
+            self.load_error = f"{type(e).__name__}: {e}"
+        self.load_seconds = round(time.perf_counter() - start, 3)
+        self._ready.set()
+
+        while True:
+            jobs, stopping = self._collect()
+            for group in self._group(jobs):
+                self._render_batch(group)
+            if stopping:
+                break
+
+    def _collect(self) -> Tuple[List[RenderJob], bool]:
+        """Block for one job, then gather whatever else arrives within the window."""
+        first = self._queue.get()
+        if first is None:
+            return [], True
+
+        jobs = [first]
+        deadline = time.perf_counter() + self.batch_window
+        while True:
+            remaining = deadline - time.perf_counter()
+            try:
+                job = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                return jobs, False
+            if job is None:
+                return jobs, True
+            jobs.append(job)
+
+    def _group(self, jobs: List[RenderJob]) -> List[List[RenderJob]]:
+        """Load inputs and split jobs into same-key batches of at most max_batch."""
+        groups: Dict[Tuple, List[RenderJob]] = {}
+        for job in jobs:
+            if self.load_error:
+                self._fail(job, f"Pipeline failed to load: {self.load_error}")
+                continue
+            try:
+                job.image = prepare_image(job.input_path)
+            except Exception as e:
+                self._fail(job, f"Could not read input image: {e}")
+                continue
+            groups.setdefault(job.batch_key(), []).append(job)
+
+        batches = []
+        for group in groups.values():
+            for i in range(0, len(group), self.max_batch):
+                batches.append(group[i:i + self.max_batch])
+        return batches
+
+    def _render_batch(self, batch: List[RenderJob]):
+        started = time.perf_counter()
+        try:
+            images = self.pipe(
+                prompt=[job.prompt for job in batch],
+                image=[job.image for job in batch],
+                strength=batch[0].strength,
+                num_inference_steps=NUM_INFERENCE_STEPS,
+                guidance_scale=0.0,
+            ).images
+        except Exception as e:
+            for job in batch:
+                self._fail(job, f"Inference failed: {e}")
+            return
+        inference = time.perf_counter() - started
+
+        with self._lock:
+            self._totals["batches"] += 1
+
+        for job, image in zip(batch, images):
+            try:
+                image.save(job.output_path, quality=95)
+            except Exception as e:
+                self._fail(job, f"Could not save output: {e}")
+                continue
+            self._finish(job, started, inference, len(batch))
+
+    def _finish(self, job: RenderJob, started: float, inference: float, batch_size: int):
+        queue_wait = started - job.submitted_at
+        with self._lock:
+            self._totals["jobs"] += 1
+            self._totals["queue_seconds"] += queue_wait
+            self._totals["inference_seconds"] += inference
+        job.image = None
+        job.future.set_result({
+            "success": True,
+            "output": job.output_path,
+            "batch_size": batch_size,
+            "timings": {
+                "queue_seconds": round(queue_wait, 4),
+                "inference_seconds": round(inference, 4),
+                "total_seconds": round(time.perf_counter() - job.submitted_at, 4),
+            },
+        })
+
+    def _fail(self, job: RenderJob, error: str):
+        with self._lock:
+            self._totals["failed"] += 1
+        job.image = None
+        job.future.set_result({"success": False, "output": None, "error": error})
+
+
+# =============================================================================
+# LOCAL SOCKET SERVER
+# =============================================================================
+
+class _RenderRequestHandler(socketserver.StreamRequestHandler):
+    """
+    One JSON object per line in, one per line out:
+        {"input": "...", "output": "...", "strength": 0.5, "prompt": "..."}
+        {"cmd": "stats"}
+    """
+
+    def handle(self):
+        worker: RenderWorker = self.server.worker
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                if request.get("cmd") == "stats":
+                    response = {"success": True, "stats": worker.stats()}
+                else:
+                    response = worker.render(
+                        request["input"],
+                        request.get("output"),
+                        float(request.get("strength", 0.5)),
+                        request.get("prompt", DEFAULT_PROMPT),
+                    )
+            except Exception as e:
+                response = {"success": False, "error": str(e)}
+            self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+            self.wfile.flush()
+
+
+class RenderServer(socketserver.ThreadingTCPServer):
+    """Local TCP front end for a RenderWorker (one thread per connection)."""
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, worker: RenderWorker, host: str = "127.0.0.1", port: int = DEFAULT_PORT):
+        self.worker = worker
+        super().__init__((host, port), _RenderRequestHandler)
+
+
+def serve(loader: Callable[[], Any] = load_sdxl_turbo, host: str = "127.0.0.1",
+          port: int = DEFAULT_PORT, max_batch: int = 4, batch_window: float = 0.05):
+    """Run the render daemon until interrupted."""
+    worker = RenderWorker(loader, max_batch=max_batch, batch_window=batch_window).start()
+    with RenderServer(worker, host, port) as server:
+        print(f"Render daemon listening on {host}:{server.server_address[1]} (loading pipeline...)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            worker.stop(timeout=5)
+
+
+def daemon_request(request: Dict, host: str = "127.0.0.1", port: int = DEFAULT_PORT,
+                   timeout: float = 600) -> Dict:
+    """Send one request to a running render daemon and return its response."""
+    with socket.create_connection((host, port), timeout=timeout) as sock:
+        sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        with sock.makefile("r", encoding="utf-8") as reader:
+            line = reader.readline()
+    if not line:
+        return {"success": False, "error": "Render daemon closed the connection"}
+    return json.loads(line)
+
+
+def render_via_daemon(input_path: str, output_path: str = None, strength: float = 0.5,
+                      prompt: str = DEFAULT_PROMPT, host: str = "127.0.0.1",
+                      port: int = DEFAULT_PORT, timeout: float = 600) -> Dict:
+    """Render through a running daemon instead of loading the model here."""
+    return daemon_request({
+        "input": os.path.abspath(input_path),
+        "output": os.path.abspath(output_path) if output_path else None,
+        "strength": strength,
+        "prompt": prompt,
+    }, host, port, timeout)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Fast AI Rendering for Revit Views")
-    parser.add_argument("input", help="Input image path (Revit 3D view capture)")
+    parser.add_argument("input", nargs="?", help="Input image path (Revit 3D view capture)")
     parser.add_argument("-o", "--output", help="Output image path")
     parser.add_argument("-s", "--strength", type=float, default=0.5,
                        help="Denoising strength 0.3-0.7 (default: 0.5, lower preserves more geometry)")
     parser.add_argument("-p", "--prompt", default="photorealistic architectural rendering, professional photography, natural lighting, high detail",
                        help="Style prompt")
+    parser.add_argument("--serve", action="store_true",
+                       help="Run as a resident render daemon instead of rendering once")
+    parser.add_argument("--daemon", type=int, metavar="PORT",
+                       help="Send the render to a daemon listening on PORT")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Daemon port for --serve")
+    parser.add_argument("--max-batch", type=int, default=4, help="Largest batch per pipeline call")
+    parser.add_argument("--stub", action="store_true",
+                       help="Serve with the stub pipeline (no model, for testing)")
 
     args = parser.parse_args()
 
+    if args.serve:
+        serve(load_stub_pipeline if args.stub else load_sdxl_turbo,
+              port=args.port, max_batch=args.max_batch)
+        return
+
+    if not args.input:
+        parser.error("input is required unless --serve is given")
+
     if not os.path.exists(args.input):
         print(f"Error: Input file not found: {args.input}")
         sys.exit(1)
 
+    if args.daemon:
+        result = render_via_daemon(args.input, args.output, args.strength, args.prompt,
+                                   port=args.daemon)
+        if not result.get("success"):
+            print(f"Error during rendering: {result.get('error')}")
+            sys.exit(1)
+        print(f"\nSuccess! Rendering complete: {result['output']}")
+        print(f"Timings: {result['timings']}")
+        return
+
     try:
         output = render_image(args.input, args.output, args.strength, args.prompt)
         print(f"\nSuccess! Rendering complete: {output}")
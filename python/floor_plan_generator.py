@@ -10,11 +10,16 @@ This replaces paid services like Hypar by using:
 Usage:
     python floor_plan_generator.py --width 60 --depth 40 --program office
     python floor_plan_generator.py --rooms "Reception:200,Office:150x4,Conference:300"
+    python floor_plan_generator.py --program office --packer guillotine
+
+Packers: strip (default, original row packing), shelf, guillotine, treemap
 """
 
 import json
 import sys
 import argparse
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import List, Dict, Tuple, Optional
 import math
@@ -61,6 +66,266 @@ class Door:
     host_wall: Optional[Wall] = None
 
 
+class WallRegistry:
+    """
+    Walls keyed on their endpoints snapped to a 6" grid, in either direction,
+    so duplicate checks are a set lookup instead of a scan over every wall.
+    """
+
+    SNAP = 0.5
+
+    def __init__(self):
+        self._keys = set()
+
+    def key(self, wall: Wall) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        a = (round(wall.start_x / self.SNAP), round(wall.start_y / self.SNAP))
+        b = (round(wall.end_x / self.SNAP), round(wall.end_y / self.SNAP))
+        return (a, b) if a <= b else (b, a)
+
+    def add(self, wall: Wall) -> bool:
+        """Register a wall. Returns False if an equivalent wall is already registered."""
+        key = self.key(wall)
+        if key in self._keys:
+            return False
+        self._keys.add(key)
+        return True
+
+
+def _canonical(values: List[float], epsilon: float) -> Dict[float, float]:
+    """Map each value to the first of its run of values less than epsilon apart."""
+    canonical = {}
+    first = previous = None
+    for value in sorted(set(values)):
+        if previous is None or value - previous >= epsilon:
+            first = value
+        canonical[value] = first
+        previous = value
+    return canonical
+
+
+# =============================================================================
+# PACKING BACKENDS
+# =============================================================================
+# Each packer places rooms inside the region (x0, y0, width, depth) by setting
+# room.x/room.y (and possibly width/depth), and returns the rooms it could not
+# place. `gap` is the wall thickness left between rooms.
+
+def pack_strip(rooms: List[Room], x0: float, y0: float, width: float, depth: float,
+               gap: float = 0.5) -> List[Room]:
+    """
+    Rows left to right, largest rooms first. Rooms that overflow the depth
+    are squashed to fit, so nothing is reported unplaced.
+    """
+    sorted_rooms = sorted(rooms, key=lambda r: r.target_area, reverse=True)
+
+    current_x = x0
+    current_y = y0
+    row_height = 0
+    top = y0 + depth
+
+    for room in sorted_rooms:
+        # Check if room fits in current row
+        if current_x + room.width > x0 + width:
+            # Start new row
+            current_x = x0
+            current_y += row_height + gap
+            row_height = 0
+
+        # Check if we've exceeded depth
+        if current_y + room.depth > top:
+            print(f"Warning: Room {room.name} may not fit")
+            # Try to fit anyway with reduced size
+            room.depth = top - current_y
+            room.width = room.target_area / room.depth
+
+        # Place room
+        room.x = current_x
+        room.y = current_y
+
+        # Update position
+        current_x += room.width + gap
+        row_height = max(row_height, room.depth)
+
+    return []
+
+
+def pack_shelf(rooms: List[Room], x0: float, y0: float, width: float, depth: float,
+               gap: float = 0.5) -> List[Room]:
+    """
+    Shelf packing, best fit: each room (tallest first) goes on the open shelf
+    it leaves the least width on, rotated if that is the only way it fits;
+    a new shelf is opened when none fits.
+    """
+    shelves: List[List[float]] = []  # [y, height, used_x]
+    next_y = 0.0
+    span_w, span_d = width + gap, depth + gap
+    unplaced = []
+
+    for room in sorted(rooms, key=lambda r: (max(r.width, r.depth), r.target_area), reverse=True):
+        best = None
+        for w, d in ((room.width, room.depth), (room.depth, room.width)):
+            for shelf in shelves:
+                leftover = span_w - shelf[2] - (w + gap)
+                if d + gap <= shelf[1] + 1e-9 and leftover >= -1e-9:
+                    if best is None or leftover < best[0]:
+                        best = (leftover, shelf, w, d)
+            if best:
+                break
+
+        if best is None:
+            # Open a new shelf, preferring the orientation that keeps it low
+            for w, d in sorted(((room.width, room.depth), (room.depth, room.width)), key=lambda s: s[1]):
+                if w + gap <= span_w + 1e-9 and next_y + d + gap <= span_d + 1e-9:
+                    shelf = [next_y, d + gap, 0.0]
+                    shelves.append(shelf)
+                    next_y += d + gap
+                    best = (None, shelf, w, d)
+                    break
+
+        if best is None:
+            unplaced.append(room)
+            continue
+
+        _, shelf, room.width, room.depth = best
+        room.x = x0 + shelf[2]
+        room.y = y0 + shelf[0]
+        shelf[2] += room.width + gap
+
+    return unplaced
+
+
+def pack_guillotine(rooms: List[Room], x0: float, y0: float, width: float, depth: float,
+                    gap: float = 0.5) -> List[Room]:
+    """
+    Guillotine packing: each room (largest first) goes into the free rectangle
+    it fits most tightly (best area fit, either orientation), and the leftover
+    is split along the shorter leftover axis.
+    """
+    free = [(0.0, 0.0, width + gap, depth + gap)]  # (x, y, w, d) with gap allowance
+    unplaced = []
+
+    for room in sorted(rooms, key=lambda r: r.target_area, reverse=True):
+        best = None
+        for i, (fx, fy, fw, fd) in enumerate(free):
+            for w, d in ((room.width, room.depth), (room.depth, room.width)):
+                pw, pd = w + gap, d + gap
+                if pw <= fw + 1e-9 and pd <= fd + 1e-9:
+                    waste = fw * fd - pw * pd
+                    if best is None or waste < best[0]:
+                        best = (waste, i, w, d)
+        if best is None:
+            unplaced.append(room)
+            continue
+
+        _, i, room.width, room.depth = best
+        fx, fy, fw, fd = free.pop(i)
+        pw, pd = room.width + gap, room.depth + gap
+        room.x = x0 + fx
+        room.y = y0 + fy
+
+        if fw - pw < fd - pd:
+            right = (fx + pw, fy, fw - pw, pd)
+            above = (fx, fy + pd, fw, fd - pd)
+        else:
+            right = (fx + pw, fy, fw - pw, fd)
+            above = (fx, fy + pd, pw, fd - pd)
+        free.extend(r for r in (right, above) if r[2] > 1e-9 and r[3] > 1e-9)
+
+    return unplaced
+
+
+def pack_treemap(rooms: List[Room], x0: float, y0: float, width: float, depth: float,
+                 gap: float = 0.5) -> List[Room]:
+    """
+    Squarified treemap: rooms tile the region with aspect ratios kept near 1,
+    sharing walls (gap is not used). Rooms keep their target areas and any
+    slack is left as one open area; an over-full program is scaled down
+    evenly instead of squashing the last rooms.
+    """
+    placeable = [r for r in rooms if r.target_area > 0]
+    unplaced = [r for r in rooms if r.target_area <= 0]
+    total = sum(r.target_area for r in placeable)
+    region = width * depth
+    if region <= 0:
+        return list(rooms)
+    if not placeable:
+        return unplaced
+
+    scale = 1.0
+    if total > region:
+        scale = region / total
+        print(f"Warning: program is {total:.0f} SF for {region:.0f} SF; rooms scaled to {scale:.0%}")
+
+    items: List[Tuple[float, Optional[Room]]] = [(r.target_area * scale, r) for r in placeable]
+    slack = region - total * scale
+    if slack > 1e-6:
+        items.append((slack, None))
+    items.sort(key=lambda item: item[0], reverse=True)
+
+    rects = _squarify([area for area, _ in items], x0, y0, width, depth)
+    for (_, room), (x, y, w, d) in zip(items, rects):
+        if room is not None:
+            room.x, room.y, room.width, room.depth = x, y, w, d
+
+    return unplaced
+
+
+def _squarify(areas: List[float], x: float, y: float, w: float, d: float) -> List[Tuple[float, float, float, float]]:
+    """Squarified treemap (Bruls et al.) of areas (descending, summing to w*d)."""
+    def worst(row_sum: float, row_min: float, row_max: float, side: float) -> float:
+        side2 = side * side
+        sum2 = row_sum * row_sum
+        return max(side2 * row_max / sum2, sum2 / (side2 * row_min))
+
+    rects = []
+    i = 0
+    while i < len(areas):
+        side = min(w, d)
+        row_sum = row_min = row_max = areas[i]
+        j = i + 1
+        while j < len(areas):
+            a = areas[j]
+            if worst(row_sum + a, min(row_min, a), max(row_max, a), side) > \
+               worst(row_sum, row_min, row_max, side):
+                break
+            row_sum += a
+            row_min = min(row_min, a)
+            row_max = max(row_max, a)
+            j += 1
+
+        if w >= d:
+            # Column along the left edge
+            col_w = row_sum / d if d > 0 else 0
+            cy = y
+            for a in areas[i:j]:
+                h = a / col_w if col_w > 0 else 0
+                rects.append((x, cy, col_w, h))
+                cy += h
+            x += col_w
+            w -= col_w
+        else:
+            # Row along the bottom edge
+            row_d = row_sum / w if w > 0 else 0
+            cx = x
+            for a in areas[i:j]:
+                rw = a / row_d if row_d > 0 else 0
+                rects.append((cx, y, rw, row_d))
+                cx += rw
+            y += row_d
+            d -= row_d
+        i = j
+
+    return rects
+
+
+PACKERS = {
+    "strip": pack_strip,
+    "shelf": pack_shelf,
+    "guillotine": pack_guillotine,
+    "treemap": pack_treemap,
+}
+
+
 class FloorPlanGenerator:
     """
     Generates floor plans algorithmically.
@@ -121,28 +386,39 @@ class FloorPlanGenerator:
         ],
     }
 
-    def __init__(self, width: float, depth: float):
+    CORRIDOR_WIDTH = 5  # Along the south side
+    WALL_GAP = 0.5      # 6" wall thickness between packed rooms
+
+    def __init__(self, width: float, depth: float, packer: str = "strip"):
         """
         Initialize generator with building envelope.
 
         Args:
             width: Total building width in feet
             depth: Total building depth in feet
+            packer: Packing backend, one of PACKERS
         """
+        if packer not in PACKERS:
+            raise ValueError(f"Unknown packer '{packer}'. Available: {list(PACKERS)}")
         self.width = width
         self.depth = depth
+        self.packer = packer
         self.rooms: List[Room] = []
+        self.unplaced: List[Room] = []
         self.walls: List[Wall] = []
+        self.wall_registry = WallRegistry()
         self.doors: List[Door] = []
 
     def add_exterior_walls(self):
         """Add the building perimeter walls."""
-        self.walls.extend([
+        for wall in [
             Wall(0, 0, self.width, 0, "Exterior"),  # South
             Wall(self.width, 0, self.width, self.depth, "Exterior"),  # East
             Wall(self.width, self.depth, 0, self.depth, "Exterior"),  # North
             Wall(0, self.depth, 0, 0, "Exterior"),  # West
-        ])
+        ]:
+            self.wall_registry.add(wall)
+            self.walls.append(wall)
 
     def generate_from_program(self, program: str) -> bool:
         """
@@ -188,8 +464,8 @@ class FloorPlanGenerator:
 
     def _layout_rooms(self) -> bool:
         """
-        Layout rooms using strip packing algorithm.
-        Simple but effective for rectangular spaces.
+        Layout rooms with the selected packing backend, north of the corridor.
+        Rooms the packer cannot place are moved to self.unplaced.
         """
         # Add exterior walls first
         self.add_exterior_walls()
@@ -201,40 +477,17 @@ class FloorPlanGenerator:
             room.depth = math.sqrt(room.target_area / ratio)
             room.width = room.target_area / room.depth
 
-        # Sort rooms by area (largest first)
-        sorted_rooms = sorted(self.rooms, key=lambda r: r.target_area, reverse=True)
-
-        # Simple strip packing
-        current_x = 0
-        current_y = 0
-        row_height = 0
-        corridor_width = 5
-
         # Leave space for corridor along south side
-        current_y = corridor_width
-
-        for room in sorted_rooms:
-            # Check if room fits in current row
-            if current_x + room.width > self.width:
-                # Start new row
-                current_x = 0
-                current_y += row_height + 0.5  # 6" wall thickness
-                row_height = 0
-
-            # Check if we've exceeded depth
-            if current_y + room.depth > self.depth:
-                print(f"Warning: Room {room.name} may not fit")
-                # Try to fit anyway with reduced size
-                room.depth = self.depth - current_y
-                room.width = room.target_area / room.depth
-
-            # Place room
-            room.x = current_x
-            room.y = current_y
-
-            # Update position
-            current_x += room.width + 0.5  # 6" wall thickness
-            row_height = max(row_height, room.depth)
+        unplaced = PACKERS[self.packer](
+            self.rooms, 0, self.CORRIDOR_WIDTH,
+            self.width, self.depth - self.CORRIDOR_WIDTH, self.WALL_GAP
+        )
+        if unplaced:
+            skipped = {id(r) for r in unplaced}
+            self.unplaced = unplaced
+            self.rooms = [r for r in self.rooms if id(r) not in skipped]
+            print(f"Warning: {len(unplaced)} room(s) did not fit: "
+                  f"{', '.join(r.name for r in unplaced[:5])}{'...' if len(unplaced) > 5 else ''}")
 
         # Generate interior walls
         self._generate_interior_walls()
@@ -242,10 +495,19 @@ class FloorPlanGenerator:
         # Generate doors
         self._generate_doors()
 
-        return True
+        return not self.unplaced
 
     def _generate_interior_walls(self):
-        """Generate interior partition walls between rooms."""
+        """
+        Generate interior partition walls between rooms.
+
+        Rooms packed edge to edge meet at T-junctions, where one room's edge
+        runs past the corners of two neighbours. Every edge is first split at
+        the room corners on its line, so a shared stretch becomes the same
+        piece for both rooms and the registry merges it.
+        """
+        epsilon = 0.01
+        edges = []
         for room in self.rooms:
             x1, y1, x2, y2 = room.bounds
 
@@ -260,9 +522,38 @@ class FloorPlanGenerator:
             for wall in walls_to_add:
                 # Skip if this is on the perimeter (would duplicate exterior wall)
                 if not self._is_perimeter_wall(wall):
-                    # Check for duplicates
-                    if not self._wall_exists(wall):
-                        self.walls.append(wall)
+                    edges.append(wall)
+
+        # The same corner computed for two rooms can differ by float noise;
+        # collapse such coordinates so shared pieces get identical endpoints
+        xs = _canonical([v for w in edges for v in (w.start_x, w.end_x)], epsilon)
+        ys = _canonical([v for w in edges for v in (w.start_y, w.end_y)], epsilon)
+        spans = []
+        corners = defaultdict(set)
+        for wall in edges:
+            x1, y1, x2, y2 = xs[wall.start_x], ys[wall.start_y], xs[wall.end_x], ys[wall.end_y]
+            line, start, end = (("h", y1), x1, x2) if y1 == y2 else (("v", x1), y1, y2)
+            if start == end:
+                continue
+            corners[line].update((start, end))
+            spans.append((line, start, end))
+
+        corners = {line: sorted(points) for line, points in corners.items()}
+        for (axis, at), start, end in spans:
+            points = corners[(axis, at)]
+            lo, hi = min(start, end), max(start, end)
+            cuts = [lo] + points[bisect_right(points, lo):bisect_left(points, hi)] + [hi]
+            if start > end:
+                cuts.reverse()
+
+            for a, b in zip(cuts, cuts[1:]):
+                if axis == "h":
+                    piece = Wall(a, at, b, at, "Interior")
+                else:
+                    piece = Wall(at, a, at, b, "Interior")
+                # Register, skipping duplicates (shared walls of adjacent rooms)
+                if self.wall_registry.add(piece):
+                    self.walls.append(piece)
 
     def _is_perimeter_wall(self, wall: Wall) -> bool:
         """Check if wall is on the building perimeter."""
@@ -283,17 +574,6 @@ class FloorPlanGenerator:
 
         return False
 
-    def _wall_exists(self, wall: Wall) -> bool:
-        """Check if a wall already exists (avoid duplicates)."""
-        epsilon = 0.5
-        for existing in self.walls:
-            if (abs(existing.start_x - wall.start_x) < epsilon and
-                abs(existing.start_y - wall.start_y) < epsilon and
-                abs(existing.end_x - wall.end_x) < epsilon and
-                abs(existing.end_y - wall.end_y) < epsilon):
-                return True
-        return False
-
     def _generate_doors(self):
         """Generate doors for each room."""
         for room in self.rooms:
@@ -323,6 +603,8 @@ class FloorPlanGenerator:
                 "room_count": len(self.rooms),
                 "wall_count": len(self.walls),
                 "door_count": len(self.doors),
+                "packer": self.packer,
+                "unplaced_rooms": [r.name for r in self.unplaced],
             }
         }
 
@@ -369,11 +651,14 @@ class FloorPlanGenerator:
         print("FLOOR PLAN GENERATED")
         print(f"{'='*50}")
         print(f"Building: {self.width}' x {self.depth}' = {self.width * self.depth} SF")
+        print(f"Packer: {self.packer}")
         print(f"\nRooms ({len(self.rooms)}):")
         for room in self.rooms:
             print(f"  - {room.name}: {room.width:.1f}' x {room.depth:.1f}' = {room.area:.0f} SF")
         print(f"\nWalls: {len(self.walls)} (including {4} exterior)")
         print(f"Doors: {len(self.doors)}")
+        if self.unplaced:
+            print(f"Unplaced: {len(self.unplaced)} room(s)")
         print(f"{'='*50}")
 
 
@@ -406,6 +691,8 @@ def main():
                        help="Program type: office, residential, retail, healthcare")
     parser.add_argument("--rooms", type=str, default=None,
                        help='Custom rooms: "Reception:200,Office:150x4,Conference:300"')
+    parser.add_argument("--packer", type=str, default="strip", choices=list(PACKERS),
+                       help="Packing backend")
     parser.add_argument("--output", type=str, default="floor_plan.json",
                        help="Output JSON file")
 
@@ -416,7 +703,7 @@ def main():
     print("No API keys. No subscriptions. No cost.")
     print("=" * 50)
 
-    generator = FloorPlanGenerator(args.width, args.depth)
+    generator = FloorPlanGenerator(args.width, args.depth, args.packer)
 
     if args.rooms:
         # Custom room list
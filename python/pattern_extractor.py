@@ -18,11 +18,13 @@ Usage:
     python pattern_extractor.py --folder "path/to/projects" --building-type residential
 """
 
+import heapq
 import json
 import os
 import sys
 import math
 import subprocess
+from collections import defaultdict
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
@@ -33,6 +35,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from adjacency_rules import MUST_CONNECT, SHOULD_ADJACENT, PREFER_NEAR, NEUTRAL, SHOULD_SEPARATE
 from room_intelligence import DaylightRequirement, PlacementConstraint
+from pattern_library import PatternLibrary
 
 
 @dataclass
@@ -53,6 +56,12 @@ class ExtractedRoom:
     def to_dict(self) -> Dict:
         return asdict(self)
 
+    @property
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """Estimated footprint (x1, y1, x2, y2), width along X, centred on (x, y)."""
+        half_w, half_d = self.width / 2, self.depth / 2
+        return (self.x - half_w, self.y - half_d, self.x + half_w, self.y + half_d)
+
 
 @dataclass
 class ExtractedAdjacency:
@@ -191,10 +200,17 @@ class PatternExtractor:
         'educational': ['school', 'classroom', 'library', 'gymnasium', 'cafeteria'],
     }
 
-    def __init__(self, mcp_pipe: str = r"\\.\pipe\RevitMCPBridge2026"):
-        """Initialize pattern extractor with MCP pipe name."""
+    def __init__(self, mcp_pipe: str = r"\\.\pipe\RevitMCPBridge2026",
+                 library: Optional[PatternLibrary] = None):
+        """
+        Initialize pattern extractor with MCP pipe name.
+
+        Extracted patterns are appended to `library` (a fresh PatternLibrary
+        by default), which may already hold projects from earlier runs.
+        """
         self.mcp_pipe = mcp_pipe
         self.extracted_patterns: List[ProjectPattern] = []
+        self.library = library if library is not None else PatternLibrary()
 
     def call_mcp(self, method: str, params: Optional[Dict] = None) -> Dict:
         """Call RevitMCPBridge via named pipe."""
@@ -325,40 +341,73 @@ Write-Output $response
         return near_edge
 
     def detect_adjacencies(self, rooms: List[ExtractedRoom],
-                           threshold: float = 10.0) -> List[ExtractedAdjacency]:
-        """Detect room adjacencies based on proximity."""
-        adjacencies = []
-
-        for i, room_a in enumerate(rooms):
-            for room_b in rooms[i+1:]:
-                # Calculate distance between room centers
-                dx = abs(room_a.x - room_b.x)
-                dy = abs(room_a.y - room_b.y)
-
-                # Estimate if rooms share a wall
-                # Rooms are adjacent if centers are close enough considering their sizes
-                combined_width = (room_a.width + room_b.width) / 2
-                combined_depth = (room_a.depth + room_b.depth) / 2
-
-                # Check if rooms could share a wall
-                shares_x_wall = dx < combined_width + 2 and dy < max(room_a.depth, room_b.depth)
-                shares_y_wall = dy < combined_depth + 2 and dx < max(room_a.width, room_b.width)
-
-                if shares_x_wall or shares_y_wall:
-                    # Estimate shared wall length
-                    if shares_x_wall:
-                        shared_length = min(room_a.depth, room_b.depth)
-                    else:
-                        shared_length = min(room_a.width, room_b.width)
-
-                    adjacencies.append(ExtractedAdjacency(
-                        room_a=room_a.room_type,
-                        room_b=room_b.room_type,
-                        shared_wall_length=shared_length,
-                        has_door=False  # Would need door data to determine
-                    ))
-
-        return adjacencies
+                           tolerance: float = 1.0,
+                           min_shared: float = 1.0) -> List[ExtractedAdjacency]:
+        """
+        Detect rooms that share a wall, level by level.
+
+        Two rooms are adjacent when an edge of one lies within `tolerance` feet
+        (a wall thickness) of the facing edge of the other and the edges overlap
+        by at least `min_shared` feet. Runs in O(n log n + k) per level by
+        sweeping sorted edges instead of comparing every pair of rooms.
+        """
+        by_level: Dict[str, List[int]] = defaultdict(list)
+        for i, room in enumerate(rooms):
+            by_level[room.level].append(i)
+
+        shared: Dict[Tuple[int, int], float] = {}
+        for indices in by_level.values():
+            bounds = {i: rooms[i].bounds for i in indices}
+            # Right edge of one room against left edge of the next, then top against bottom
+            vertical = [(b[2], b[1], b[3], 0, i) for i, b in bounds.items()]
+            vertical += [(b[0], b[1], b[3], 1, i) for i, b in bounds.items()]
+            horizontal = [(b[3], b[0], b[2], 0, i) for i, b in bounds.items()]
+            horizontal += [(b[1], b[0], b[2], 1, i) for i, b in bounds.items()]
+            for edges in (vertical, horizontal):
+                for a, b, length in self._match_edges(edges, tolerance, min_shared):
+                    key = (a, b) if a < b else (b, a)
+                    shared[key] = max(shared.get(key, 0.0), length)
+
+        return [
+            ExtractedAdjacency(
+                room_a=rooms[a].room_type,
+                room_b=rooms[b].room_type,
+                shared_wall_length=round(length, 2),
+                has_door=False  # Would need door data to determine
+            )
+            for (a, b), length in sorted(shared.items())
+        ]
+
+    @staticmethod
+    def _match_edges(edges: List[Tuple[float, float, float, int, int]],
+                     tolerance: float, min_shared: float):
+        """
+        Yield (room, room, overlap) for facing edges that touch.
+
+        Edges are (offset, start, end, side, room), side 0 for a room's high
+        edge and 1 for its low edge. Edges are grouped into bands of offsets
+        within `tolerance`, and each band is swept along its span with one
+        active heap per side so only overlapping pairs are visited.
+        """
+        edges.sort()
+        band_start = 0
+        for k in range(1, len(edges) + 1):
+            if k < len(edges) and edges[k][0] - edges[k - 1][0] <= tolerance:
+                continue
+            band = sorted(edges[band_start:k], key=lambda e: e[1])
+            band_start = k
+            active: Tuple[list, list] = ([], [])
+            for offset, start, end, side, room in band:
+                other = active[1 - side]
+                while other and other[0][0] <= start:
+                    heapq.heappop(other)
+                for other_end, other_offset, other_room in other:
+                    if other_room == room or abs(other_offset - offset) > tolerance:
+                        continue
+                    overlap = min(end, other_end) - start
+                    if overlap >= min_shared:
+                        yield room, other_room, overlap
+                heapq.heappush(active[side], (end, offset, room))
 
     def extract_from_current_model(self, project_name: Optional[str] = None) -> Optional[ProjectPattern]:
         """
@@ -470,6 +519,7 @@ Write-Output $response
         )
 
         self.extracted_patterns.append(pattern)
+        self.library.add_pattern(pattern)
         return pattern
 
     def store_pattern_to_memory(self, pattern: ProjectPattern) -> bool:
@@ -517,64 +567,18 @@ Source: {pattern.project_path}"""
         return True
 
     def generate_room_statistics(self) -> Dict[str, Any]:
-        """Generate statistics from all extracted patterns."""
-        if not self.extracted_patterns:
+        """Generate statistics from every project in the pattern library."""
+        if not self.library.project_count:
             return {"error": "No patterns extracted"}
 
-        # Aggregate by building type
-        by_type = {}
-        for pattern in self.extracted_patterns:
-            bt = pattern.building_type
-            if bt not in by_type:
-                by_type[bt] = {
-                    "projects": [],
-                    "room_areas": {},  # room_type -> [areas]
-                    "adjacencies": {}  # (room_a, room_b) -> count
-                }
-
-            by_type[bt]["projects"].append(pattern.project_name)
-
-            for room in pattern.rooms:
-                rt = room.room_type
-                if rt not in by_type[bt]["room_areas"]:
-                    by_type[bt]["room_areas"][rt] = []
-                by_type[bt]["room_areas"][rt].append(room.area)
-
-            for adj in pattern.adjacencies:
-                key = tuple(sorted([adj.room_a, adj.room_b]))
-                if key not in by_type[bt]["adjacencies"]:
-                    by_type[bt]["adjacencies"][key] = 0
-                by_type[bt]["adjacencies"][key] += 1
-
-        # Calculate averages
-        stats = {}
-        for bt, data in by_type.items():
-            room_avg = {}
-            for rt, areas in data["room_areas"].items():
-                room_avg[rt] = {
-                    "count": len(areas),
-                    "avg_area": sum(areas) / len(areas),
-                    "min_area": min(areas),
-                    "max_area": max(areas)
-                }
-
-            # Top adjacencies
-            top_adj = sorted(data["adjacencies"].items(), key=lambda x: x[1], reverse=True)[:15]
-
-            stats[bt] = {
-                "project_count": len(data["projects"]),
-                "room_statistics": room_avg,
-                "common_adjacencies": [{"rooms": list(k), "count": v} for k, v in top_adj]
-            }
-
-        return stats
+        return self.library.statistics()
 
     def export_to_skill_file(self, output_path: str) -> bool:
         """Export extracted patterns as a skill file for future use."""
         stats = self.generate_room_statistics()
 
         content = f"""# Floor Plan Pattern Library
-# Auto-generated from {len(self.extracted_patterns)} real projects
+# Auto-generated from {self.library.project_count} real projects
 # Generated: {datetime.now().isoformat()}
 
 ## Purpose
@@ -589,10 +593,11 @@ architectural projects. Use these patterns to inform AI-generated floor plans.
             content += f"Projects analyzed: {data['project_count']}\n\n"
 
             content += "#### Room Sizes (SF)\n"
-            content += "| Room Type | Avg | Min | Max | Count |\n"
-            content += "|-----------|-----|-----|-----|-------|\n"
+            content += "| Room Type | Avg | Median | Min | Max | Count |\n"
+            content += "|-----------|-----|--------|-----|-----|-------|\n"
             for rt, rs in sorted(data["room_statistics"].items()):
-                content += f"| {rt} | {rs['avg_area']:.0f} | {rs['min_area']:.0f} | {rs['max_area']:.0f} | {rs['count']} |\n"
+                content += (f"| {rt} | {rs['avg_area']:.0f} | {rs['area_p50']:.0f} | {rs['min_area']:.0f} "
+                            f"| {rs['max_area']:.0f} | {rs['count']} |\n")
 
             content += "\n#### Common Adjacencies\n"
             for adj in data["common_adjacencies"]:
@@ -617,10 +622,13 @@ def main():
     parser.add_argument("--current", action="store_true", help="Extract from current model")
     parser.add_argument("--output", type=str, default="/mnt/d/_CLAUDE-TOOLS/Claude_Skills/floor-plan-patterns.skill",
                        help="Output skill file path")
+    parser.add_argument("--library", type=str, default=None,
+                       help="Pattern library (.npz) to append to; statistics cover every project in it")
 
     args = parser.parse_args()
 
-    extractor = PatternExtractor()
+    library = PatternLibrary.load(args.library) if args.library else None
+    extractor = PatternExtractor(library=library)
 
     if args.current:
         print("Extracting from current Revit model...")
@@ -635,8 +643,15 @@ def main():
             # Store to memory
             extractor.store_pattern_to_memory(pattern)
 
+            if args.library:
+                extractor.library.save(args.library)
+                print(f"Pattern library: {extractor.library.project_count} projects in {args.library}")
+
             # Export skill file
             extractor.export_to_skill_file(args.output)
+    elif library is not None and library.project_count:
+        print(f"Summarizing {library.project_count} projects from {args.library}")
+        extractor.export_to_skill_file(args.output)
     else:
         print("Use --current to extract from the currently open Revit model")
         print("Or provide --project path to extract from specific file")
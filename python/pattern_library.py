@@ -0,0 +1,363 @@
+"""
+Pattern Library - columnar store for patterns extracted from many projects.
+
+PatternExtractor produces one ProjectPattern per model. The library keeps
+them as three column tables instead of lists of dataclasses, so thousands of
+projects load in one read and summarize with grouped array operations:
+
+    projects     project_name, project_path, building_type, total_area,
+                 room_count, width, depth, confidence, extraction_date
+    rooms        project_id, room_type, level, area, width, depth,
+                 aspect_ratio, perimeter, x, y, has_exterior_wall
+    adjacencies  project_id, room_a, room_b, shared_wall_length, has_door
+
+Repeated strings (room types, levels, building types) are stored as integer
+codes into a vocabulary. A library is saved as a single .npz file; extraction
+runs load it, append their patterns, and save it back.
+
+Usage:
+    from pattern_library import PatternLibrary
+
+    library = PatternLibrary.load("patterns.npz")   # empty if missing
+    library.add_pattern(pattern)
+    library.save("patterns.npz")
+    stats = library.room_statistics()
+"""
+
+import os
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple, Any
+
+try:
+    import numpy as np
+except ImportError:
+    import subprocess
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "numpy"])
+    import numpy as np
+
+
+# Column name -> dtype. "U" columns hold short strings, "code:<vocab>" columns
+# hold indexes into the named vocabulary.
+SCHEMA = {
+    "projects": {
+        "project_name": "U",
+        "project_path": "U",
+        "building_type": "code:building_type",
+        "total_area": "f8",
+        "room_count": "i4",
+        "width": "f8",
+        "depth": "f8",
+        "confidence": "f4",
+        "extraction_date": "U",
+    },
+    "rooms": {
+        "project_id": "i4",
+        "room_type": "code:room_type",
+        "level": "code:level",
+        "area": "f8",
+        "width": "f4",
+        "depth": "f4",
+        "aspect_ratio": "f4",
+        "perimeter": "f4",
+        "x": "f8",
+        "y": "f8",
+        "has_exterior_wall": "?",
+    },
+    "adjacencies": {
+        "project_id": "i4",
+        "room_a": "code:room_type",
+        "room_b": "code:room_type",
+        "shared_wall_length": "f4",
+        "has_door": "?",
+    },
+}
+
+VOCABULARIES = ("building_type", "room_type", "level")
+
+DEFAULT_PERCENTILES = (10, 50, 90)
+
+
+def _empty(kind: str) -> "np.ndarray":
+    if kind == "U":
+        return np.array([], dtype="<U1")
+    if kind.startswith("code:"):
+        return np.array([], dtype="i4")
+    return np.array([], dtype=kind)
+
+
+def _grouped_percentiles(values: "np.ndarray", starts: "np.ndarray", counts: "np.ndarray",
+                         q: float) -> "np.ndarray":
+    """Linear-interpolated percentile per group; values sorted within each group."""
+    position = starts + (q / 100.0) * (counts - 1)
+    lower = np.floor(position).astype(np.int64)
+    upper = np.minimum(lower + 1, starts + counts - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+class PatternLibrary:
+    """
+    Append-only columnar tables of projects, rooms and adjacencies.
+
+    Patterns are buffered as Python rows while they are added and turned into
+    arrays on the first read, so a batch extraction pays one concatenation.
+    """
+
+    def __init__(self):
+        self.vocab: Dict[str, List[str]] = {name: [] for name in VOCABULARIES}
+        self._codes: Dict[str, Dict[str, int]] = {name: {} for name in VOCABULARIES}
+        self._tables: Dict[str, Dict[str, "np.ndarray"]] = {
+            table: {col: _empty(kind) for col, kind in columns.items()}
+            for table, columns in SCHEMA.items()
+        }
+        self._pending: Dict[str, Dict[str, list]] = {
+            table: {col: [] for col in columns} for table, columns in SCHEMA.items()
+        }
+        self._pending_projects = 0
+
+    # =========================================================================
+    # BUILDING
+    # =========================================================================
+
+    def code(self, vocabulary: str, value: str) -> int:
+        """Integer code for a string, adding it to the vocabulary if new."""
+        codes = self._codes[vocabulary]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self.vocab[vocabulary])
+            self.vocab[vocabulary].append(value)
+        return code
+
+    def add_pattern(self, pattern) -> int:
+        """Append a ProjectPattern; returns its project_id."""
+        project_id = self.project_count
+        footprint = pattern.building_footprint or {}
+
+        projects = self._pending["projects"]
+        projects["project_name"].append(pattern.project_name)
+        projects["project_path"].append(pattern.project_path)
+        projects["building_type"].append(self.code("building_type", pattern.building_type))
+        projects["total_area"].append(pattern.total_area)
+        projects["room_count"].append(pattern.room_count)
+        projects["width"].append(footprint.get("width", 0.0))
+        projects["depth"].append(footprint.get("depth", 0.0))
+        projects["confidence"].append(pattern.confidence)
+        projects["extraction_date"].append(pattern.extraction_date)
+
+        rooms = self._pending["rooms"]
+        for room in pattern.rooms:
+            rooms["project_id"].append(project_id)
+            rooms["room_type"].append(self.code("room_type", room.room_type))
+            rooms["level"].append(self.code("level", room.level))
+            rooms["area"].append(room.area)
+            rooms["width"].append(room.width)
+            rooms["depth"].append(room.depth)
+            rooms["aspect_ratio"].append(room.aspect_ratio)
+            rooms["perimeter"].append(room.perimeter)
+            rooms["x"].append(room.x)
+            rooms["y"].append(room.y)
+            rooms["has_exterior_wall"].append(room.has_exterior_wall)
+
+        adjacencies = self._pending["adjacencies"]
+        for adj in pattern.adjacencies:
+            adjacencies["project_id"].append(project_id)
+            adjacencies["room_a"].append(self.code("room_type", adj.room_a))
+            adjacencies["room_b"].append(self.code("room_type", adj.room_b))
+            adjacencies["shared_wall_length"].append(adj.shared_wall_length)
+            adjacencies["has_door"].append(adj.has_door)
+
+        self._pending_projects += 1
+        return project_id
+
+    def extend(self, other: "PatternLibrary") -> None:
+        """Append every project of another library, remapping ids and codes."""
+        offset = self.project_count
+        remap = {
+            name: np.array([self.code(name, value) for value in other.vocab[name]], dtype="i4")
+            for name in VOCABULARIES
+        }
+        self._flush()
+        for table, columns in SCHEMA.items():
+            incoming = other.table(table)
+            for col, kind in columns.items():
+                values = incoming[col]
+                if col == "project_id":
+                    values = values + offset
+                elif kind.startswith("code:"):
+                    values = remap[kind[5:]][values]
+                self._tables[table][col] = np.concatenate([self._tables[table][col], values])
+
+    def _flush(self) -> None:
+        if not self._pending_projects:
+            return
+        for table, columns in SCHEMA.items():
+            pending = self._pending[table]
+            for col, kind in columns.items():
+                if not pending[col]:
+                    continue
+                added = np.array(pending[col], dtype=None if kind == "U" else
+                                 "i4" if kind.startswith("code:") else kind)
+                self._tables[table][col] = np.concatenate([self._tables[table][col], added])
+                pending[col] = []
+        self._pending_projects = 0
+
+    # =========================================================================
+    # ACCESS
+    # =========================================================================
+
+    def table(self, name: str) -> Dict[str, "np.ndarray"]:
+        """Column arrays of one table (projects, rooms or adjacencies)."""
+        self._flush()
+        return self._tables[name]
+
+    @property
+    def project_count(self) -> int:
+        return len(self._tables["projects"]["room_count"]) + self._pending_projects
+
+    @property
+    def room_count(self) -> int:
+        return len(self.table("rooms")["area"])
+
+    def building_types(self) -> List[str]:
+        return list(self.vocab["building_type"])
+
+    def _room_building_types(self) -> "np.ndarray":
+        return self.table("projects")["building_type"][self.table("rooms")["project_id"]]
+
+    # =========================================================================
+    # PERSISTENCE
+    # =========================================================================
+
+    def save(self, path: str) -> None:
+        """Write all tables and vocabularies to one uncompressed .npz file."""
+        arrays = {
+            f"{table}.{col}": values
+            for table in SCHEMA for col, values in self.table(table).items()
+        }
+        for name in VOCABULARIES:
+            arrays[f"vocab.{name}"] = np.array(self.vocab[name], dtype=str)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "PatternLibrary":
+        """Read a library saved with save(); a missing file gives an empty library."""
+        library = cls()
+        if not os.path.exists(path):
+            return library
+        with np.load(path, allow_pickle=False) as data:
+            for name in VOCABULARIES:
+                values = [str(v) for v in data[f"vocab.{name}"]]
+                library.vocab[name] = values
+                library._codes[name] = {v: i for i, v in enumerate(values)}
+            for table, columns in SCHEMA.items():
+                for col in columns:
+                    key = f"{table}.{col}"
+                    if key in data.files:
+                        library._tables[table][col] = data[key]
+        return library
+
+    # =========================================================================
+    # STATISTICS
+    # =========================================================================
+
+    def room_statistics(self, building_type: Optional[str] = None,
+                        percentiles: Sequence[float] = DEFAULT_PERCENTILES
+                        ) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Area and aspect-ratio statistics per building type and room type.
+
+        Returns {building_type: {room_type: {count, avg_area, min_area, max_area,
+        area_p<q>..., avg_aspect, aspect_p<q>...}}}.
+        """
+        rooms = self.table("rooms")
+        if not len(rooms["area"]):
+            return {}
+        bt = self._room_building_types().astype(np.int64)
+        rt = rooms["room_type"].astype(np.int64)
+        mask = None
+        if building_type is not None:
+            if building_type not in self._codes["building_type"]:
+                return {}
+            mask = bt == self._codes["building_type"][building_type]
+            bt, rt = bt[mask], rt[mask]
+
+        n_types = max(len(self.vocab["room_type"]), 1)
+        key = bt * n_types + rt
+        area = rooms["area"] if mask is None else rooms["area"][mask]
+        aspect = rooms["aspect_ratio"].astype("f8")
+        aspect = aspect if mask is None else aspect[mask]
+
+        # Sort by group, then by value inside each group for min/max/percentiles
+        area_order = np.lexsort((area, key))
+        area_sorted = area[area_order]
+        aspect_sorted = aspect[np.lexsort((aspect, key))]
+        groups, starts, counts = np.unique(key[area_order], return_index=True, return_counts=True)
+        starts = starts.astype(np.int64)
+        columns = {
+            "count": counts,
+            "avg_area": np.add.reduceat(area_sorted, starts) / counts,
+            "min_area": area_sorted[starts],
+            "max_area": area_sorted[starts + counts - 1],
+            "avg_aspect": np.add.reduceat(aspect_sorted, starts) / counts,
+        }
+        for q in percentiles:
+            label = f"{q:g}"
+            columns[f"area_p{label}"] = _grouped_percentiles(area_sorted, starts, counts, q)
+            columns[f"aspect_p{label}"] = _grouped_percentiles(aspect_sorted, starts, counts, q)
+
+        rows = {name: values.tolist() for name, values in columns.items()}
+        stats: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for i, group in enumerate(groups.tolist()):
+            bt_name = self.vocab["building_type"][group // n_types]
+            rt_name = self.vocab["room_type"][group % n_types]
+            stats.setdefault(bt_name, {})[rt_name] = {name: values[i] for name, values in rows.items()}
+        return stats
+
+    def adjacency_counts(self, top: int = 15) -> Dict[str, List[Tuple[Tuple[str, str], int]]]:
+        """Most frequent room-type pairs per building type, pair order ignored."""
+        adjacencies = self.table("adjacencies")
+        if not len(adjacencies["project_id"]):
+            return {}
+        bt = self.table("projects")["building_type"][adjacencies["project_id"]].astype(np.int64)
+        a = adjacencies["room_a"].astype(np.int64)
+        b = adjacencies["room_b"].astype(np.int64)
+        low, high = np.minimum(a, b), np.maximum(a, b)
+        n_types = max(len(self.vocab["room_type"]), 1)
+        key = (bt * n_types + low) * n_types + high
+        pairs, counts = np.unique(key, return_counts=True)
+
+        result: Dict[str, List[Tuple[Tuple[str, str], int]]] = {}
+        pair_bt = pairs // (n_types * n_types)
+        for code in np.unique(pair_bt).tolist():
+            in_type = np.flatnonzero(pair_bt == code)
+            # Stable sort keeps ties in room-type order
+            order = in_type[np.argsort(-counts[in_type], kind="stable")][:top]
+            names = self.vocab["room_type"]
+            # Vocabulary codes follow first appearance; key pairs alphabetically
+            result[self.vocab["building_type"][code]] = [
+                (tuple(sorted((names[(p // n_types) % n_types], names[p % n_types]))), c)
+                for p, c in zip(pairs[order].tolist(), counts[order].tolist())
+            ]
+        return result
+
+    def statistics(self, top_adjacencies: int = 15) -> Dict[str, Any]:
+        """Per building type summary in PatternExtractor.generate_room_statistics shape."""
+        projects = self.table("projects")
+        project_counts = np.bincount(projects["building_type"],
+                                     minlength=len(self.vocab["building_type"]))
+        rooms = self.room_statistics()
+        adjacencies = self.adjacency_counts(top_adjacencies)
+        return {
+            bt: {
+                "project_count": int(project_counts[code]),
+                "room_statistics": rooms.get(bt, {}),
+                "common_adjacencies": [
+                    {"rooms": list(pair), "count": count}
+                    for pair, count in adjacencies.get(bt, [])
+                ],
+            }
+            for code, bt in enumerate(self.vocab["building_type"])
+            if project_counts[code]
+        }
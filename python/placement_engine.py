@@ -16,10 +16,14 @@ The engine uses a priority-based constraint satisfaction approach:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Set, Any
+from typing import Dict, List, NamedTuple, Optional, Tuple, Set, Any
 from enum import Enum, auto
+from functools import lru_cache
+from array import array
 import math
 import json
+import random
+import time
 
 from adjacency_rules import (
     get_adjacencies, calculate_adjacency_score, build_adjacency_graph,
@@ -31,10 +35,73 @@ from zone_definitions import (
 )
 from room_intelligence import (
     get_room_rule, get_room_rules, get_daylight_rooms, get_placement_constraints,
-    DaylightRequirement, PlacementConstraint, suggest_room_size
+    DaylightRequirement, PlacementConstraint, RoomRule, suggest_room_size
 )
 
 
+class RoomProfile(NamedTuple):
+    """Everything the engine needs to know about a room name, resolved once."""
+    rule: Optional[RoomRule]
+    zone: Optional[ZoneType]
+    priority: str
+    daylight: DaylightRequirement
+    constraints: Tuple[PlacementConstraint, ...]
+
+
+@lru_cache(maxsize=4096)
+def resolve_room_profile(building_type: str, room_name: str) -> RoomProfile:
+    """
+    Resolve rule, zone, placement priority, daylight and constraints for a
+    room name. Memoized - the engine calls this per room and per candidate.
+    """
+    rule = get_room_rule(building_type, room_name)
+    return RoomProfile(
+        rule=rule,
+        zone=get_room_zone(building_type, room_name),
+        priority=get_placement_priority(building_type, room_name),
+        daylight=rule.daylight if rule else DaylightRequirement.PREFERRED,
+        constraints=tuple(rule.constraints) if rule else ()
+    )
+
+
+class RoomRequest(NamedTuple):
+    """A program room augmented with its profile, as the engine places it."""
+    name: str
+    width: float
+    depth: float
+    zone: Optional[ZoneType]
+    priority: str
+    constraints: Tuple[PlacementConstraint, ...]
+    daylight: DaylightRequirement
+    adjacency_weight: float
+
+
+def shares_wall(ax: float, ay: float, aright: float, atop: float,
+                bx: float, by: float, bright: float, btop: float,
+                tolerance: float = 0.5) -> Optional[str]:
+    """
+    Wall test on raw rectangle edges (a relative to b), so candidate positions
+    can be tested without building a PlacedRoom.
+    """
+    # Check vertical alignment (east/west walls)
+    if abs(ay - by) < tolerance or abs(atop - btop) < tolerance or \
+       (ay < btop and atop > by):
+        if abs(aright - bx) < tolerance:
+            return "east"
+        if abs(bright - ax) < tolerance:
+            return "west"
+
+    # Check horizontal alignment (north/south walls)
+    if abs(ax - bx) < tolerance or abs(aright - bright) < tolerance or \
+       (ax < bright and aright > bx):
+        if abs(atop - by) < tolerance:
+            return "north"
+        if abs(btop - ay) < tolerance:
+            return "south"
+
+    return None
+
+
 class PlacementStrategy(Enum):
     """Different placement strategies for scheme generation."""
     LINEAR = auto()          # Single-loaded corridor
@@ -98,23 +165,8 @@ class PlacedRoom:
         Check if rooms share a wall. Returns wall direction or None.
         'north', 'south', 'east', 'west' from perspective of self.
         """
-        # Check vertical alignment (east/west walls)
-        if abs(self.y - other.y) < tolerance or abs(self.top - other.top) < tolerance or \
-           (self.y < other.top and self.top > other.y):
-            if abs(self.right - other.x) < tolerance:
-                return "east"
-            if abs(other.right - self.x) < tolerance:
-                return "west"
-
-        # Check horizontal alignment (north/south walls)
-        if abs(self.x - other.x) < tolerance or abs(self.right - other.right) < tolerance or \
-           (self.x < other.right and self.right > other.x):
-            if abs(self.top - other.y) < tolerance:
-                return "north"
-            if abs(other.top - self.y) < tolerance:
-                return "south"
-
-        return None
+        return shares_wall(self.x, self.y, self.right, self.top,
+                           other.x, other.y, other.right, other.top, tolerance)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -124,7 +176,7 @@ class PlacedRoom:
             "y": self.y,
             "width": self.width,
             "depth": self.depth,
-            "zone": self.zone.name,
+            "zone": self.zone.name if self.zone is not None else None,
             "rotation": self.rotation,
             "has_exterior_wall": self.has_exterior_wall,
             "connected_to": self.connected_to
@@ -185,6 +237,395 @@ class PlacementGrid:
         return True
 
 
+@dataclass
+class FreeRectangles:
+    """
+    Maximal free rectangles of the floor plate (MaxRects).
+
+    Every free point lies in at least one rectangle and no rectangle contains
+    another, so a w x d room fits somewhere iff some rectangle is at least
+    w x d, and that rectangle's corners are exact feasible positions.
+    """
+    width: float
+    depth: float
+    rects: List[Tuple[float, float, float, float]] = field(default_factory=list)  # (x, y, right, top)
+
+    EPSILON = 1e-9
+
+    def __post_init__(self):
+        if not self.rects:
+            self.rects = [(0.0, 0.0, float(self.width), float(self.depth))]
+
+    def occupy(self, x: float, y: float, w: float, d: float):
+        """Remove a rectangle from free space, splitting what it intersects."""
+        eps = self.EPSILON
+        right, top = x + w, y + d
+        kept = []
+        split = []
+        for fx, fy, fr, ft in self.rects:
+            if right <= fx + eps or fr <= x + eps or top <= fy + eps or ft <= y + eps:
+                kept.append((fx, fy, fr, ft))
+                continue
+            if x > fx + eps:
+                split.append((fx, fy, x, ft))        # Left
+            if right < fr - eps:
+                split.append((right, fy, fr, ft))    # Right
+            if y > fy + eps:
+                split.append((fx, fy, fr, y))        # Below
+            if top < ft - eps:
+                split.append((fx, top, fr, ft))      # Above
+
+        # Only the new pieces can be redundant: drop those inside another rectangle
+        result = kept
+        for i, piece in enumerate(split):
+            if any(self._contains(other, piece) for other in result) or \
+               any(self._contains(other, piece) and (other != piece or j < i)
+                   for j, other in enumerate(split) if j != i):
+                continue
+            result.append(piece)
+        self.rects = result
+
+    def positions(self, w: float, d: float) -> List[Tuple[float, float]]:
+        """Exact positions (free-rectangle corners) where a w x d room fits."""
+        eps = self.EPSILON
+        found = {}
+        for fx, fy, fr, ft in self.rects:
+            if fr - fx + eps < w or ft - fy + eps < d:
+                continue
+            for pos in ((fx, fy), (fr - w, fy), (fx, ft - d), (fr - w, ft - d)):
+                found[pos] = None
+        return sorted(found)
+
+    def fits(self, x: float, y: float, w: float, d: float) -> bool:
+        return any(self._contains(rect, (x, y, x + w, y + d)) for rect in self.rects)
+
+    @classmethod
+    def _contains(cls, outer: Tuple[float, float, float, float],
+                  inner: Tuple[float, float, float, float]) -> bool:
+        eps = cls.EPSILON
+        return (outer[0] <= inner[0] + eps and outer[1] <= inner[1] + eps and
+                outer[2] >= inner[2] - eps and outer[3] >= inner[3] - eps)
+
+
+class RoomTable:
+    """
+    Struct-of-arrays copy of placed-room geometry, row i = LayoutState.rooms[i].
+
+    Candidate positions are tested against these flat arrays with plain
+    floats, so the placement loops allocate nothing per candidate.
+    """
+
+    __slots__ = ("x", "y", "right", "top", "center_x", "center_y", "names", "plumbing")
+
+    def __init__(self):
+        self.x = array("d")
+        self.y = array("d")
+        self.right = array("d")
+        self.top = array("d")
+        self.center_x = array("d")
+        self.center_y = array("d")
+        self.names: List[str] = []
+        self.plumbing = array("b")  # PLUMBING_CLUSTER rooms
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def append(self, room: PlacedRoom, plumbing: bool):
+        self.x.append(room.x)
+        self.y.append(room.y)
+        self.right.append(room.right)
+        self.top.append(room.top)
+        self.center_x.append(room.center_x)
+        self.center_y.append(room.center_y)
+        self.names.append(room.name)
+        self.plumbing.append(plumbing)
+
+    def update(self, i: int, room: PlacedRoom):
+        self.x[i] = room.x
+        self.y[i] = room.y
+        self.right[i] = room.right
+        self.top[i] = room.top
+        self.center_x[i] = room.center_x
+        self.center_y[i] = room.center_y
+
+    def overlaps_any(self, x: float, y: float, right: float, top: float,
+                     buffer: float = 0.0) -> bool:
+        """Same test as PlacedRoom.overlaps against every row."""
+        xs, ys, rights, tops = self.x, self.y, self.right, self.top
+        for i in range(len(xs)):
+            if not (right + buffer <= xs[i] or rights[i] + buffer <= x or
+                    top + buffer <= ys[i] or tops[i] + buffer <= y):
+                return True
+        return False
+
+
+def is_on_perimeter(x: float, y: float, width: float, depth: float,
+                    building_width: float, building_depth: float,
+                    tolerance: float = 1.0) -> bool:
+    """Check if a room rectangle touches the building perimeter (has an exterior wall)."""
+    return (x < tolerance or  # West edge
+            x + width > building_width - tolerance or  # East edge
+            y < tolerance or  # South edge
+            y + depth > building_depth - tolerance)  # North edge
+
+
+class LayoutState:
+    """
+    Placed rooms plus the bookkeeping the quality metrics need, kept current
+    as rooms are added or moved so metrics() costs O(1):
+
+    - name -> room index (first room with a name wins, as rule lookups always did)
+    - wall-sharing graph between rooms, and the door connections derived from it
+    - running totals for room area, perimeter rooms and satisfied adjacency rules
+    - a RoomTable mirroring room geometry for allocation-free candidate tests
+
+    Adding or moving a room re-tests walls against the other rooms and
+    re-evaluates only the adjacency rules that name it.
+    """
+
+    def __init__(self, building_width: float, building_depth: float, adjacencies,
+                 corridors: Optional[List[Corridor]] = None,
+                 building_type: Optional[str] = None):
+        self.building_width = building_width
+        self.building_depth = building_depth
+        self.adjacencies = adjacencies
+        self.corridors: List[Corridor] = corridors if corridors is not None else []
+        self.building_type = building_type
+
+        self.rooms: List[PlacedRoom] = []
+        self.table = RoomTable()
+        self.walls: List[Set[int]] = []
+        self.by_name: Dict[str, int] = {}
+        self.total_area = 0
+        self.daylight_rooms = 0
+
+        # Non-neutral rules, indexed by the room names they mention
+        self.rules = [r for r in adjacencies.rules if r.strength != NEUTRAL] if adjacencies else []
+        self.rules_by_name: Dict[str, List[int]] = {}
+        for k, rule in enumerate(self.rules):
+            for name in {rule.room_a.lower(), rule.room_b.lower()}:
+                self.rules_by_name.setdefault(name, []).append(k)
+        self.rule_state: List[Optional[bool]] = [None] * len(self.rules)
+        self.rules_total = 0
+        self.rules_satisfied = 0
+        self._strengths: Dict[Tuple[str, str], int] = {}
+
+    @classmethod
+    def from_scheme(cls, scheme: Dict[str, Any], building_type: str) -> 'LayoutState':
+        """Build state from a scheme dict (GeneratedScheme.to_dict)."""
+        dims = scheme.get("building_dimensions", {})
+        corridors = [Corridor(**c) for c in scheme.get("corridors", [])]
+        state = cls(dims.get("width", 0), dims.get("depth", 0),
+                    get_adjacencies(building_type), corridors, building_type)
+        for r in scheme.get("placed_rooms", []):
+            state.add(PlacedRoom(
+                name=r["name"], x=r["x"], y=r["y"], width=r["width"], depth=r["depth"],
+                zone=ZoneType[r["zone"]] if r.get("zone") is not None else None,
+                rotation=r.get("rotation", 0.0),
+                has_exterior_wall=r.get("has_exterior_wall", False)
+            ))
+        return state
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+
+    def add(self, room: PlacedRoom) -> int:
+        """Add a placed room (its has_exterior_wall is taken as given)."""
+        i = len(self.rooms)
+        self.rooms.append(room)
+        self.walls.append(set())
+        self.total_area += room.area
+        self.daylight_rooms += room.has_exterior_wall
+        self.by_name.setdefault(room.name.lower(), i)
+        plumbing = bool(self.building_type) and PlacementConstraint.PLUMBING_CLUSTER in \
+            resolve_room_profile(self.building_type, room.name).constraints
+        self.table.append(room, plumbing)
+
+        for j in range(i):
+            if room.shares_wall(self.rooms[j]):
+                self._link(j, i)
+        self._refresh_rules(i)
+        return i
+
+    def move(self, name: str, x: Optional[float] = None, y: Optional[float] = None,
+             width: Optional[float] = None, depth: Optional[float] = None) -> Set[int]:
+        """
+        Move and/or resize a room. Returns the indices of every room whose
+        geometry, walls or connections changed.
+        """
+        i = self.index_of(name)
+        if i is None:
+            raise KeyError(name)
+        room = self.rooms[i]
+
+        old_area = room.area
+        self.daylight_rooms -= room.has_exterior_wall
+        if x is not None:
+            room.x = x
+        if y is not None:
+            room.y = y
+        if width is not None:
+            room.width = width
+        if depth is not None:
+            room.depth = depth
+        room.has_exterior_wall = is_on_perimeter(room.x, room.y, room.width, room.depth,
+                                                 self.building_width, self.building_depth)
+        # Rounded so repeated moves don't drift from a fresh sum
+        self.total_area = round(self.total_area - old_area + room.area, 9)
+        self.table.update(i, room)
+        self.daylight_rooms += room.has_exterior_wall
+
+        touched = {i} | self.walls[i]
+        for j in list(self.walls[i]):
+            self._unlink(i, j)
+        for j, other in enumerate(self.rooms):
+            if j != i and room.shares_wall(other):
+                self._link(min(i, j), max(i, j))
+                touched.add(j)
+        self._refresh_rules(i)
+        return touched
+
+    def rebuild(self):
+        """Recompute everything after rooms were changed outside move()."""
+        rooms = list(self.rooms)
+        self.rooms.clear()
+        self.table = RoomTable()
+        self.walls = []
+        self.by_name = {}
+        self.total_area = 0
+        self.daylight_rooms = 0
+        self.rule_state = [None] * len(self.rules)
+        self.rules_total = 0
+        self.rules_satisfied = 0
+        for room in rooms:
+            room.connected_to.clear()
+            room.has_exterior_wall = is_on_perimeter(room.x, room.y, room.width, room.depth,
+                                                     self.building_width, self.building_depth)
+            self.add(room)
+
+    def _link(self, i: int, j: int):
+        """Record a shared wall (i < j) and add a door if the rooms need one."""
+        self.walls[i].add(j)
+        self.walls[j].add(i)
+        a, b = self.rooms[i], self.rooms[j]
+        if self.strength(a.name, b.name) >= SHOULD_ADJACENT:
+            if b.name not in a.connected_to:
+                a.connected_to.append(b.name)
+            if a.name not in b.connected_to:
+                b.connected_to.append(a.name)
+
+    def _unlink(self, i: int, j: int):
+        self.walls[i].discard(j)
+        self.walls[j].discard(i)
+        a, b = self.rooms[i], self.rooms[j]
+        if b.name in a.connected_to:
+            a.connected_to.remove(b.name)
+        if a.name in b.connected_to:
+            b.connected_to.remove(a.name)
+
+    def _refresh_rules(self, i: int):
+        """Re-evaluate the rules that name room i, if it is the room rules resolve to."""
+        key = self.rooms[i].name.lower()
+        if self.by_name.get(key) != i:
+            return
+        for k in self.rules_by_name.get(key, ()):
+            rule = self.rules[k]
+            room_a = self.find(rule.room_a)
+            room_b = self.find(rule.room_b)
+            new = self._rule_satisfied(rule.strength, room_a, room_b) if room_a and room_b else None
+            old = self.rule_state[k]
+            if old is not None:
+                self.rules_total -= 1
+                self.rules_satisfied -= old
+            if new is not None:
+                self.rules_total += 1
+                self.rules_satisfied += new
+            self.rule_state[k] = new
+
+    @staticmethod
+    def _rule_satisfied(strength: int, room_a: PlacedRoom, room_b: PlacedRoom) -> bool:
+        shares_wall = room_a.shares_wall(room_b) is not None
+        distance = room_a.distance_to(room_b)
+
+        if strength >= MUST_CONNECT:
+            return shares_wall and room_b.name in room_a.connected_to
+        if strength >= SHOULD_ADJACENT:
+            return shares_wall
+        if strength >= PREFER_NEAR:
+            return distance < 30
+        if strength <= MUST_SEPARATE:
+            return distance > 40
+        if strength <= SHOULD_SEPARATE:
+            return not shares_wall and distance > 20
+        return False
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def index_of(self, name: str) -> Optional[int]:
+        return self.by_name.get(name.lower())
+
+    def find(self, name: str) -> Optional[PlacedRoom]:
+        i = self.by_name.get(name.lower())
+        return self.rooms[i] if i is not None else None
+
+    def strength(self, room_a: str, room_b: str) -> int:
+        """Adjacency strength between two room names (first matching rule), cached."""
+        key = (room_a.lower(), room_b.lower())
+        cached = self._strengths.get(key)
+        if cached is not None:
+            return cached
+        strength = NEUTRAL
+        if self.adjacencies:
+            for rule in self.adjacencies.rules:
+                names = (rule.room_a.lower(), rule.room_b.lower())
+                if key[0] in names and key[1] in names:
+                    strength = rule.strength
+                    break
+        self._strengths[key] = strength
+        return strength
+
+    def strength_row(self, name: str) -> List[int]:
+        """Strength between `name` and each placed room, in table order."""
+        return [self.strength(name, other) for other in self.table.names]
+
+    def neighbors(self, name: str) -> List[str]:
+        """Names of rooms sharing a wall with the named room."""
+        i = self.index_of(name)
+        return [self.rooms[j].name for j in sorted(self.walls[i])] if i is not None else []
+
+    def adjacency_satisfaction(self) -> float:
+        """Fraction of applicable adjacency rules currently satisfied."""
+        if not self.adjacencies:
+            return 1.0
+        return self.rules_satisfied / self.rules_total if self.rules_total > 0 else 1.0
+
+    def metrics(self, rooms_requested: int) -> Dict[str, Any]:
+        """Quality metrics for the current layout."""
+        corridor_area = sum(c.area for c in self.corridors)
+        building_area = self.building_width * self.building_depth
+        circulation_ratio = corridor_area / building_area if building_area > 0 else 0
+        efficiency = self.total_area / building_area if building_area > 0 else 0
+
+        rooms_placed = len(self.rooms)
+        daylight_score = self.daylight_rooms / rooms_placed if rooms_placed else 0
+        placement_success = rooms_placed / rooms_requested if rooms_requested > 0 else 0
+
+        return {
+            "efficiency": round(efficiency, 3),
+            "net_area_sf": round(self.total_area, 0),
+            "gross_area_sf": round(building_area, 0),
+            "circulation_ratio": round(circulation_ratio, 3),
+            "adjacency_score": round(self.adjacency_satisfaction(), 3),
+            "daylight_ratio": round(daylight_score, 3),
+            "rooms_placed": rooms_placed,
+            "rooms_requested": rooms_requested,
+            "placement_success": round(placement_success, 3)
+        }
+
+
 class SmartPlacementEngine:
     """
     Intelligent room placement engine using constraint satisfaction.
@@ -205,7 +646,8 @@ class SmartPlacementEngine:
     CORRIDOR_WIDTH_SECONDARY = 5.0  # Secondary corridor
 
     def __init__(self, building_width: float, building_depth: float,
-                 building_type: str, entry_side: str = "south"):
+                 building_type: str, entry_side: str = "south",
+                 seed: Optional[int] = None, priority_jitter: float = 0.0):
         """
         Initialize placement engine.
 
@@ -214,11 +656,17 @@ class SmartPlacementEngine:
             building_depth: Total depth in feet (Y dimension)
             building_type: Type of building (office, residential, etc.)
             entry_side: Which side has main entry (south, north, east, west)
+            seed: If given, equal-scoring candidates are picked at random
+                  instead of first-found (used for scheme sampling)
+            priority_jitter: With a seed, random perturbation applied to each
+                  room's placement priority and adjacency weight
         """
         self.building_width = building_width
         self.building_depth = building_depth
         self.building_type = building_type.lower()
         self.entry_side = entry_side.lower()
+        self.rng = random.Random(seed) if seed is not None else None
+        self.priority_jitter = priority_jitter
 
         # Get rules and adjacencies
         self.adjacencies = get_adjacencies(building_type)
@@ -226,30 +674,38 @@ class SmartPlacementEngine:
         self.room_rules = get_room_rules(building_type)
 
         # Placement state
-        self.placed_rooms: List[PlacedRoom] = []
         self.corridors: List[Corridor] = []
+        self.layout = LayoutState(building_width, building_depth, self.adjacencies,
+                                  self.corridors, self.building_type)
+        self.placed_rooms: List[PlacedRoom] = self.layout.rooms
         self.grid = PlacementGrid(building_width, building_depth)
+        self.free_space = FreeRectangles(building_width, building_depth)
 
         # Strategy configuration
         self.strategy = PlacementStrategy.DOUBLE_LOADED
         self.main_corridor_y = None  # Y position of main corridor
 
     def place_rooms(self, program: List[Dict[str, Any]],
-                    strategy: PlacementStrategy = PlacementStrategy.DOUBLE_LOADED) -> Dict[str, Any]:
+                    strategy: PlacementStrategy = PlacementStrategy.DOUBLE_LOADED,
+                    optimize: Optional['LocalSearchConfig'] = None) -> Dict[str, Any]:
         """
         Place all rooms from program using specified strategy.
 
         Args:
             program: List of room dicts with 'name', 'width', 'depth'
             strategy: Placement strategy to use
+            optimize: If given, improve the greedy placement with local search
 
         Returns:
             Dict with placed_rooms, corridors, metrics
         """
         self.strategy = strategy
-        self.placed_rooms = []
         self.corridors = []
+        self.layout = LayoutState(self.building_width, self.building_depth,
+                                  self.adjacencies, self.corridors, self.building_type)
+        self.placed_rooms = self.layout.rooms
         self.grid = PlacementGrid(self.building_width, self.building_depth)
+        self.free_space = FreeRectangles(self.building_width, self.building_depth)
 
         # Step 1: Augment program with zone and adjacency info
         rooms_with_info = self._augment_program(program)
@@ -264,20 +720,43 @@ class SmartPlacementEngine:
         for room_info in sorted_rooms:
             self._place_single_room(room_info)
 
-        # Step 5: Establish door connections
-        self._establish_connections()
+        # Step 4b: Optional local search over the greedy result
+        optimization = None
+        if optimize is not None:
+            optimization = LayoutOptimizer(self, optimize).run()
+            self.layout.rebuild()
+            self._rebuild_grid()
+
+        # Step 5: Door connections are kept by self.layout as rooms are placed
 
         # Step 6: Calculate metrics
         metrics = self._calculate_metrics(program)
 
-        return {
+        result = {
             "placed_rooms": [r.to_dict() for r in self.placed_rooms],
             "corridors": [c.to_dict() for c in self.corridors],
             "metrics": metrics,
             "strategy": strategy.name
         }
+        if optimization is not None:
+            result["optimization"] = optimization
+        return result
 
-    def _augment_program(self, program: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _rebuild_grid(self):
+        """Re-mark the occupancy grid and free space after rooms have been moved."""
+        self.grid = PlacementGrid(self.building_width, self.building_depth)
+        self.free_space = FreeRectangles(self.building_width, self.building_depth)
+        for c in self.corridors:
+            self._occupy(c.x, c.y, c.width, c.depth)
+        for r in self.placed_rooms:
+            self._occupy(r.x, r.y, r.width, r.depth)
+
+    def _occupy(self, x: float, y: float, w: float, d: float):
+        """Mark an area taken in both the candidate grid and the free-space tracker."""
+        self.grid.mark_occupied(x, y, w, d)
+        self.free_space.occupy(x, y, w, d)
+
+    def _augment_program(self, program: List[Dict[str, Any]]) -> List[RoomRequest]:
         """Add zone, priority, and constraint info to each room."""
         augmented = []
         for room in program:
@@ -285,22 +764,18 @@ class SmartPlacementEngine:
             width = room.get("width", 10)
             depth = room.get("depth", 10)
 
-            zone = get_room_zone(self.building_type, name)
-            priority = get_placement_priority(self.building_type, name)
-            rule = get_room_rule(self.building_type, name)
-            constraints = rule.constraints if rule else []
-            daylight = rule.daylight if rule else DaylightRequirement.PREFERRED
-
-            augmented.append({
-                "name": name,
-                "width": width,
-                "depth": depth,
-                "zone": zone,
-                "priority": priority,
-                "constraints": constraints,
-                "daylight": daylight,
-                "adjacency_weight": self._calculate_adjacency_importance(name)
-            })
+            profile = resolve_room_profile(self.building_type, name)
+
+            augmented.append(RoomRequest(
+                name=name,
+                width=width,
+                depth=depth,
+                zone=profile.zone,
+                priority=profile.priority,
+                constraints=profile.constraints,
+                daylight=profile.daylight,
+                adjacency_weight=self._calculate_adjacency_importance(name)
+            ))
 
         return augmented
 
@@ -316,7 +791,7 @@ class SmartPlacementEngine:
 
         return total_weight
 
-    def _sort_by_priority(self, rooms: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _sort_by_priority(self, rooms: List[RoomRequest]) -> List[RoomRequest]:
         """Sort rooms by placement priority."""
         def sort_key(room):
             # Priority order: zone (PUBLIC first), then specific priority, then adjacency weight
@@ -324,11 +799,15 @@ class SmartPlacementEngine:
                           ZoneType.PRIVATE: 2, ZoneType.SERVICE: 3}
             priority_map = {"near_entry": 0, "perimeter": 1, "middle": 2, "core": 3, "back": 4}
 
-            zone_val = zone_order.get(room["zone"], 2)
-            priority_val = priority_map.get(room["priority"], 2)
-            adj_weight = -room["adjacency_weight"]  # Negative so high weight comes first
+            zone_val = zone_order.get(room.zone, 2)
+            priority_val = priority_map.get(room.priority, 2)
+            adj_weight = -room.adjacency_weight  # Negative so high weight comes first
+
+            if self.rng and self.priority_jitter:
+                priority_val += self.rng.uniform(-self.priority_jitter, self.priority_jitter)
+                adj_weight *= 1 + self.rng.uniform(-self.priority_jitter, self.priority_jitter)
 
-            return (zone_val, priority_val, adj_weight, room["name"])
+            return (zone_val, priority_val, adj_weight, room.name)
 
         return sorted(rooms, key=sort_key)
 
@@ -344,7 +823,7 @@ class SmartPlacementEngine:
                 depth=self.CORRIDOR_WIDTH_PRIMARY,
                 is_primary=True
             ))
-            self.grid.mark_occupied(0, corridor_y, self.building_width, self.CORRIDOR_WIDTH_PRIMARY)
+            self._occupy(0, corridor_y, self.building_width, self.CORRIDOR_WIDTH_PRIMARY)
 
         elif strategy == PlacementStrategy.DOUBLE_LOADED:
             # Central corridor
@@ -356,7 +835,7 @@ class SmartPlacementEngine:
                 depth=self.CORRIDOR_WIDTH_PRIMARY,
                 is_primary=True
             ))
-            self.grid.mark_occupied(0, corridor_y, self.building_width, self.CORRIDOR_WIDTH_PRIMARY)
+            self._occupy(0, corridor_y, self.building_width, self.CORRIDOR_WIDTH_PRIMARY)
 
         elif strategy == PlacementStrategy.PERIMETER:
             # No central corridor - rooms connect around perimeter
@@ -380,24 +859,18 @@ class SmartPlacementEngine:
                 is_primary=True
             ))
             for c in self.corridors:
-                self.grid.mark_occupied(c.x, c.y, c.width, c.depth)
+                self._occupy(c.x, c.y, c.width, c.depth)
 
         elif strategy == PlacementStrategy.CLUSTER:
             # Multiple smaller corridors connecting clusters
             self.main_corridor_y = (self.building_depth - self.CORRIDOR_WIDTH_PRIMARY) / 2
 
-    def _place_single_room(self, room_info: Dict[str, Any]) -> bool:
+    def _place_single_room(self, room_info: RoomRequest) -> bool:
         """
         Place a single room in the best available position.
         Returns True if successfully placed.
         """
-        name = room_info["name"]
-        width = room_info["width"]
-        depth = room_info["depth"]
-        zone = room_info["zone"]
-        priority = room_info["priority"]
-        daylight = room_info["daylight"]
-        constraints = room_info["constraints"]
+        name, width, depth, zone, priority, constraints, daylight, _ = room_info
 
         # Determine candidate positions based on zone and constraints
         candidates = self._generate_candidate_positions(
@@ -415,12 +888,20 @@ class SmartPlacementEngine:
         # Score each candidate and pick best
         best_pos = None
         best_score = float('-inf')
+        ties = 0
+        strengths = self.layout.strength_row(name) if self.adjacencies else None
 
         for x, y in candidates:
-            score = self._score_position(x, y, width, depth, room_info)
+            score = self._score_position(x, y, width, depth, room_info, strengths)
             if score > best_score:
                 best_score = score
                 best_pos = (x, y)
+                ties = 1
+            elif self.rng and score == best_score:
+                # Reservoir pick: each tied candidate equally likely
+                ties += 1
+                if self.rng.random() * ties < 1:
+                    best_pos = (x, y)
 
         if best_pos:
             x, y = best_pos
@@ -435,8 +916,8 @@ class SmartPlacementEngine:
                 zone=zone,
                 has_exterior_wall=has_exterior
             )
-            self.placed_rooms.append(placed)
-            self.grid.mark_occupied(x, y, width, depth)
+            self.layout.add(placed)
+            self._occupy(x, y, width, depth)
             return True
 
         return False
@@ -519,34 +1000,25 @@ class SmartPlacementEngine:
 
         # Filter out positions that overlap existing rooms
         valid = []
+        table = self.layout.table
         for x, y in candidates:
             if self.grid.is_available(x, y, width, depth):
                 # Also check actual room overlaps with small buffer
-                overlaps = False
-                for placed in self.placed_rooms:
-                    test_room = PlacedRoom("test", x, y, width, depth, zone)
-                    if test_room.overlaps(placed, buffer=0.5):
-                        overlaps = True
-                        break
-                if not overlaps:
+                if not table.overlaps_any(x, y, x + width, y + depth, buffer=0.5):
                     valid.append((x, y))
 
         return valid
 
     def _find_any_available_space(self, width: float, depth: float) -> List[Tuple[float, float]]:
-        """Find any available space in the building."""
-        candidates = []
-        step = 2.0
-
-        for x in self._frange(0, self.building_width - width, step):
-            for y in self._frange(0, self.building_depth - depth, step):
-                if self.grid.is_available(x, y, width, depth):
-                    candidates.append((x, y))
-
-        return candidates
+        """
+        Find any available space in the building: the exact positions from the
+        free-space tracker, independent of the candidate grid step.
+        """
+        return self.free_space.positions(width, depth)
 
     def _score_position(self, x: float, y: float, width: float, depth: float,
-                        room_info: Dict[str, Any]) -> float:
+                        room_info: RoomRequest,
+                        strengths: Optional[List[int]] = None) -> float:
         """
         Score a candidate position. Higher is better.
 
@@ -556,33 +1028,44 @@ class SmartPlacementEngine:
         - Daylight access (perimeter bonus)
         - Entry proximity for public rooms
         - Corridor access
+
+        `strengths` is the room's LayoutState.strength_row, computed once per
+        room rather than per candidate.
         """
         score = 0.0
-        name = room_info["name"]
-        zone = room_info["zone"]
-        daylight = room_info["daylight"]
-        priority = room_info["priority"]
-
-        # Create temporary room for testing
-        test_room = PlacedRoom(name, x, y, width, depth, zone)
+        name = room_info.name
+        zone = room_info.zone
+        daylight = room_info.daylight
+        priority = room_info.priority
+
+        # Candidate edges, tested against the placed-room table
+        table = self.layout.table
+        right = x + width
+        top = y + depth
+        center_x = x + width / 2
+        center_y = y + depth / 2
 
         # 1. Adjacency scoring (most important)
         if self.adjacencies:
-            for placed in self.placed_rooms:
-                adj_strength = self._get_adjacency_strength(name, placed.name)
+            if strengths is None:
+                strengths = self.layout.strength_row(name)
+            for i, adj_strength in enumerate(strengths):
                 if adj_strength != 0:
-                    distance = test_room.distance_to(placed)
-                    shares_wall = test_room.shares_wall(placed) is not None
+                    dx = center_x - table.center_x[i]
+                    dy = center_y - table.center_y[i]
+                    distance = math.sqrt(dx * dx + dy * dy)
+                    touching = shares_wall(x, y, right, top, table.x[i], table.y[i],
+                                           table.right[i], table.top[i]) is not None
 
                     if adj_strength > 0:  # Should be close
-                        if shares_wall and adj_strength >= SHOULD_ADJACENT:
+                        if touching and adj_strength >= SHOULD_ADJACENT:
                             score += 100  # Big bonus for required adjacency
                         elif distance < 20:
                             score += 50 * (1 - distance / 20)  # Closer is better
                     else:  # Should be separated
                         if distance > 30:
                             score += 20  # Bonus for separation
-                        elif shares_wall and adj_strength <= SHOULD_SEPARATE:
+                        elif touching and adj_strength <= SHOULD_SEPARATE:
                             score -= 100  # Penalty for unwanted adjacency
 
         # 2. Daylight bonus
@@ -600,8 +1083,8 @@ class SmartPlacementEngine:
         if zone == ZoneType.PUBLIC or priority == "near_entry":
             entry_y = 0 if self.entry_side == "south" else self.building_depth
             entry_x = self.building_width / 2
-            dist_to_entry = math.sqrt((test_room.center_x - entry_x)**2 +
-                                       (test_room.center_y - entry_y)**2)
+            dist_to_entry = math.sqrt((center_x - entry_x)**2 +
+                                       (center_y - entry_y)**2)
             score += 30 * (1 - dist_to_entry / max(self.building_width, self.building_depth))
 
         # 4. Corridor access bonus
@@ -614,15 +1097,15 @@ class SmartPlacementEngine:
                 score += 20  # Adjacent to corridor
 
         # 5. Plumbing cluster bonus
-        if PlacementConstraint.PLUMBING_CLUSTER in room_info["constraints"]:
-            for placed in self.placed_rooms:
-                placed_rule = get_room_rule(self.building_type, placed.name)
-                if placed_rule and PlacementConstraint.PLUMBING_CLUSTER in placed_rule.constraints:
-                    if test_room.shares_wall(placed):
+        if PlacementConstraint.PLUMBING_CLUSTER in room_info.constraints:
+            for i in range(len(table)):
+                if table.plumbing[i]:
+                    if shares_wall(x, y, right, top, table.x[i], table.y[i],
+                                   table.right[i], table.top[i]):
                         score += 30  # Bonus for back-to-back plumbing
 
         # 6. Corner bonus for corner-preferred rooms
-        if PlacementConstraint.CORNER in room_info["constraints"]:
+        if PlacementConstraint.CORNER in room_info.constraints:
             corners = [(0, 0), (self.building_width - width, 0),
                        (0, self.building_depth - depth),
                        (self.building_width - width, self.building_depth - depth)]
@@ -634,127 +1117,23 @@ class SmartPlacementEngine:
 
     def _get_adjacency_strength(self, room_a: str, room_b: str) -> int:
         """Get adjacency strength between two rooms."""
-        if not self.adjacencies:
-            return NEUTRAL
-
-        for rule in self.adjacencies.rules:
-            if (room_a.lower() in [rule.room_a.lower(), rule.room_b.lower()] and
-                room_b.lower() in [rule.room_a.lower(), rule.room_b.lower()]):
-                return rule.strength
-
-        return NEUTRAL
+        return self.layout.strength(room_a, room_b)
 
     def _is_on_perimeter(self, x: float, y: float, width: float, depth: float) -> bool:
         """Check if room is on building perimeter (has exterior wall)."""
-        tolerance = 1.0
-        return (x < tolerance or  # West edge
-                x + width > self.building_width - tolerance or  # East edge
-                y < tolerance or  # South edge
-                y + depth > self.building_depth - tolerance)  # North edge
-
-    def _establish_connections(self):
-        """Establish door connections between rooms based on adjacency requirements."""
-        for i, room_a in enumerate(self.placed_rooms):
-            for j, room_b in enumerate(self.placed_rooms):
-                if i >= j:
-                    continue
-
-                adj_strength = self._get_adjacency_strength(room_a.name, room_b.name)
-                shares_wall = room_a.shares_wall(room_b)
-
-                # Connect if required adjacency and sharing wall
-                if adj_strength >= SHOULD_ADJACENT and shares_wall:
-                    if room_b.name not in room_a.connected_to:
-                        room_a.connected_to.append(room_b.name)
-                    if room_a.name not in room_b.connected_to:
-                        room_b.connected_to.append(room_a.name)
+        return is_on_perimeter(x, y, width, depth, self.building_width, self.building_depth)
 
     def _calculate_metrics(self, original_program: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate quality metrics for the placement."""
-        # Calculate areas
-        total_room_area = sum(r.area for r in self.placed_rooms)
-        corridor_area = sum(c.area for c in self.corridors)
-        building_area = self.building_width * self.building_depth
-        circulation_ratio = corridor_area / building_area if building_area > 0 else 0
-
-        # Efficiency
-        net_area = total_room_area
-        gross_area = building_area
-        efficiency = net_area / gross_area if gross_area > 0 else 0
-
-        # Adjacency satisfaction
-        adjacency_score = self._calculate_adjacency_satisfaction()
-
-        # Daylight ratio
-        daylight_rooms = sum(1 for r in self.placed_rooms if r.has_exterior_wall)
-        daylight_required = len([r for r in self.placed_rooms
-                                 if get_room_rule(self.building_type, r.name) and
-                                 get_room_rule(self.building_type, r.name).daylight == DaylightRequirement.REQUIRED])
-        daylight_score = daylight_rooms / len(self.placed_rooms) if self.placed_rooms else 0
-
-        # Rooms placed
-        rooms_placed = len(self.placed_rooms)
-        rooms_requested = len(original_program)
-        placement_success = rooms_placed / rooms_requested if rooms_requested > 0 else 0
-
-        return {
-            "efficiency": round(efficiency, 3),
-            "net_area_sf": round(net_area, 0),
-            "gross_area_sf": round(gross_area, 0),
-            "circulation_ratio": round(circulation_ratio, 3),
-            "adjacency_score": round(adjacency_score, 3),
-            "daylight_ratio": round(daylight_score, 3),
-            "rooms_placed": rooms_placed,
-            "rooms_requested": rooms_requested,
-            "placement_success": round(placement_success, 3)
-        }
+        return self.layout.metrics(len(original_program))
 
     def _calculate_adjacency_satisfaction(self) -> float:
         """Calculate what percentage of adjacency requirements are satisfied."""
-        if not self.adjacencies:
-            return 1.0
-
-        satisfied = 0
-        total = 0
-
-        for rule in self.adjacencies.rules:
-            if rule.strength == NEUTRAL:
-                continue
-
-            room_a = self._find_placed_room(rule.room_a)
-            room_b = self._find_placed_room(rule.room_b)
-
-            if not room_a or not room_b:
-                continue
-
-            total += 1
-            shares_wall = room_a.shares_wall(room_b) is not None
-            distance = room_a.distance_to(room_b)
-
-            if rule.strength >= MUST_CONNECT:
-                if shares_wall and room_b.name in room_a.connected_to:
-                    satisfied += 1
-            elif rule.strength >= SHOULD_ADJACENT:
-                if shares_wall:
-                    satisfied += 1
-            elif rule.strength >= PREFER_NEAR:
-                if distance < 30:
-                    satisfied += 1
-            elif rule.strength <= MUST_SEPARATE:
-                if distance > 40:
-                    satisfied += 1
-            elif rule.strength <= SHOULD_SEPARATE:
-                if not shares_wall and distance > 20:
-                    satisfied += 1
-
-        return satisfied / total if total > 0 else 1.0
+        return self.layout.adjacency_satisfaction()
 
     def _find_placed_room(self, name: str) -> Optional[PlacedRoom]:
         """Find a placed room by name."""
-        for room in self.placed_rooms:
-            if room.name.lower() == name.lower():
-                return room
-        return None
+        return self.layout.find(name)
 
     def _frange(self, start: float, stop: float, step: float):
         """Float range generator."""
@@ -764,6 +1143,304 @@ class SmartPlacementEngine:
             current += step
 
 
+# =============================================================================
+# LOCAL SEARCH
+# =============================================================================
+
+@dataclass
+class LocalSearchConfig:
+    """Budgets and annealing schedule for the post-placement improvement stage."""
+    max_iterations: int = 2000
+    time_limit: float = 1.0            # Seconds; whichever budget runs out first
+    seed: Optional[int] = 0            # Fixed seed keeps schemes reproducible
+    initial_temperature: float = 1.0
+    final_temperature: float = 0.02
+    move_step: float = 2.0             # Feet per shift move
+    daylight_weight: float = 0.5       # Per daylight-required room on the perimeter
+
+
+class LayoutOptimizer:
+    """
+    Simulated annealing over a greedy placement.
+
+    Moves are shift/snap (move one room), swap (exchange two rooms' positions)
+    and rotate (exchange width and depth). The objective is the number of
+    satisfied adjacency rules plus a daylight term, and each move is scored by
+    re-evaluating only the rules and perimeter flags of the rooms it touched.
+
+    Rooms anchored to the entry (NEAR_ENTRY) stay where the greedy pass put them.
+    Moved rooms may touch neighbours but never overlap rooms or corridors.
+    No move lowers the number of daylight-required rooms on the perimeter, and
+    a layout only counts as best if it satisfies at least as many adjacency
+    rules as the greedy seed.
+    """
+
+    EPSILON = 1e-6
+
+    def __init__(self, engine: 'SmartPlacementEngine', config: LocalSearchConfig):
+        self.engine = engine
+        self.config = config
+        self.rooms = engine.placed_rooms
+        self.rng = random.Random(config.seed)
+
+        # Adjacency terms, resolved the same way _calculate_adjacency_satisfaction does
+        self.terms: List[Tuple[int, int, int]] = []
+        self.room_terms: List[List[int]] = [[] for _ in self.rooms]
+        index_by_name: Dict[str, int] = {}
+        for i, room in enumerate(self.rooms):
+            index_by_name.setdefault(room.name.lower(), i)
+        if engine.adjacencies:
+            for rule in engine.adjacencies.rules:
+                if rule.strength == NEUTRAL:
+                    continue
+                a = index_by_name.get(rule.room_a.lower())
+                b = index_by_name.get(rule.room_b.lower())
+                if a is None or b is None:
+                    continue
+                t = len(self.terms)
+                self.terms.append((a, b, rule.strength))
+                self.room_terms[a].append(t)
+                if b != a:
+                    self.room_terms[b].append(t)
+
+        # Per-room daylight weight, hard daylight requirement and movability
+        self.daylight_weights: List[float] = []
+        self.required: List[bool] = []
+        self.movable: List[int] = []
+        for i, room in enumerate(self.rooms):
+            profile = resolve_room_profile(engine.building_type, room.name)
+            self.required.append(profile.daylight == DaylightRequirement.REQUIRED)
+            if profile.daylight == DaylightRequirement.REQUIRED:
+                self.daylight_weights.append(config.daylight_weight)
+            elif profile.daylight == DaylightRequirement.PREFERRED:
+                self.daylight_weights.append(config.daylight_weight / 2)
+            else:
+                self.daylight_weights.append(0.0)
+            if PlacementConstraint.NEAR_ENTRY not in profile.constraints:
+                self.movable.append(i)
+
+        # Positive-strength partners for snap moves
+        self.partners: List[List[int]] = [[] for _ in self.rooms]
+        for a, b, strength in self.terms:
+            if strength >= PREFER_NEAR and a != b:
+                self.partners[a].append(b)
+                self.partners[b].append(a)
+
+        self.term_values = [self._term_value(t) for t in range(len(self.terms))]
+        self.unary_values = [self._unary_value(i) for i in range(len(self.rooms))]
+        self.perimeter = [self._on_perimeter(i) for i in range(len(self.rooms))]
+
+    # -------------------------------------------------------------------------
+    # Scoring
+    # -------------------------------------------------------------------------
+
+    def objective(self) -> float:
+        return sum(self.term_values) + sum(self.unary_values)
+
+    def _term_value(self, t: int) -> float:
+        """1.0 if the rule is satisfied. Mirrors _calculate_adjacency_satisfaction;
+        MUST_CONNECT only needs a shared wall since doors follow from walls."""
+        a, b, strength = self.terms[t]
+        room_a, room_b = self.rooms[a], self.rooms[b]
+        if strength >= SHOULD_ADJACENT:
+            return 1.0 if room_a.shares_wall(room_b) else 0.0
+        distance = room_a.distance_to(room_b)
+        if strength >= PREFER_NEAR:
+            return 1.0 if distance < 30 else 0.0
+        if strength <= MUST_SEPARATE:
+            return 1.0 if distance > 40 else 0.0
+        return 1.0 if distance > 20 and not room_a.shares_wall(room_b) else 0.0
+
+    def _on_perimeter(self, i: int) -> bool:
+        room = self.rooms[i]
+        return self.engine._is_on_perimeter(room.x, room.y, room.width, room.depth)
+
+    def _unary_value(self, i: int) -> float:
+        return self.daylight_weights[i] if self._on_perimeter(i) else 0.0
+
+    def _delta(self, touched: Tuple[int, ...]) -> Tuple[float, Dict[int, float], Dict[int, float]]:
+        """Score change for the touched rooms only, plus the new term/unary values."""
+        new_terms: Dict[int, float] = {}
+        for i in touched:
+            for t in self.room_terms[i]:
+                if t not in new_terms:
+                    new_terms[t] = self._term_value(t)
+        new_unary = {i: self._unary_value(i) for i in touched}
+        delta = sum(v - self.term_values[t] for t, v in new_terms.items())
+        delta += sum(v - self.unary_values[i] for i, v in new_unary.items())
+        return delta, new_terms, new_unary
+
+    # -------------------------------------------------------------------------
+    # Feasibility
+    # -------------------------------------------------------------------------
+
+    def _fits(self, i: int, ignore: Tuple[int, ...] = ()) -> bool:
+        """Room i lies inside the building and clear of corridors and other rooms."""
+        room = self.rooms[i]
+        eps = self.EPSILON
+        if (room.x < -eps or room.y < -eps or
+                room.right > self.engine.building_width + eps or
+                room.top > self.engine.building_depth + eps):
+            return False
+        for c in self.engine.corridors:
+            if (room.x < c.x + c.width - eps and c.x < room.right - eps and
+                    room.y < c.y + c.depth - eps and c.y < room.top - eps):
+                return False
+        for j, other in enumerate(self.rooms):
+            if j == i or j in ignore:
+                continue
+            if (room.x < other.right - eps and other.x < room.right - eps and
+                    room.y < other.top - eps and other.y < room.top - eps):
+                return False
+        return True
+
+    def _loses_daylight(self, touched: Tuple[int, ...]) -> bool:
+        """True if the move leaves fewer daylight-required rooms on the perimeter."""
+        change = 0
+        for i in touched:
+            if self.required[i]:
+                change += self._on_perimeter(i) - self.perimeter[i]
+        return change < 0
+
+    # -------------------------------------------------------------------------
+    # Moves - each applies itself and returns (touched rooms, undo) or None
+    # -------------------------------------------------------------------------
+
+    def _move(self):
+        i = self.rng.choice(self.movable)
+        room = self.rooms[i]
+        old = (room.x, room.y)
+        partners = self.partners[i]
+        if partners and self.rng.random() < 0.5:
+            # Snap against a side of an adjacency partner
+            p = self.rooms[self.rng.choice(partners)]
+            side = self.rng.randrange(4)
+            if side < 2:
+                room.x = p.right if side == 0 else p.x - room.width
+                room.y = p.y if self.rng.random() < 0.5 else p.top - room.depth
+            else:
+                room.y = p.top if side == 2 else p.y - room.depth
+                room.x = p.x if self.rng.random() < 0.5 else p.right - room.width
+        else:
+            offset = self.config.move_step * self.rng.randint(1, 3) * self.rng.choice((-1, 1))
+            if self.rng.random() < 0.5:
+                room.x += offset
+            else:
+                room.y += offset
+
+        def undo():
+            room.x, room.y = old
+
+        if not self._fits(i):
+            undo()
+            return None
+        return (i,), undo
+
+    def _swap(self):
+        if len(self.movable) < 2:
+            return None
+        i, j = self.rng.sample(self.movable, 2)
+        a, b = self.rooms[i], self.rooms[j]
+        old_a, old_b = (a.x, a.y), (b.x, b.y)
+        a.x, a.y, b.x, b.y = old_b[0], old_b[1], old_a[0], old_a[1]
+
+        def undo():
+            a.x, a.y = old_a
+            b.x, b.y = old_b
+
+        if not (self._fits(i, (j,)) and self._fits(j, (i,)) and not a.overlaps(b)):
+            undo()
+            return None
+        return (i, j), undo
+
+    def _rotate(self):
+        i = self.rng.choice(self.movable)
+        room = self.rooms[i]
+        if room.width == room.depth:
+            return None
+        old = (room.width, room.depth, room.rotation)
+        room.width, room.depth = room.depth, room.width
+        room.rotation = 0.0 if room.rotation else 90.0
+
+        def undo():
+            room.width, room.depth, room.rotation = old
+
+        if not self._fits(i):
+            undo()
+            return None
+        return (i,), undo
+
+    # -------------------------------------------------------------------------
+    # Annealing loop
+    # -------------------------------------------------------------------------
+
+    def run(self) -> Dict[str, Any]:
+        """Anneal in place, leave the best layout found on the rooms, return stats."""
+        config = self.config
+        start = time.perf_counter()
+        current = initial = self.objective()
+        best = current
+        adjacency_floor = sum(self.term_values) - self.EPSILON
+        best_layout = self._snapshot()
+        iterations = accepted = improved = 0
+
+        if self.movable and config.max_iterations > 0:
+            moves = (self._move, self._move, self._swap, self._rotate)
+            t0, t1 = config.initial_temperature, config.final_temperature
+            cooling = (t1 / t0) ** (1.0 / config.max_iterations) if t0 > 0 and t1 > 0 else 0.0
+            temperature = t0
+
+            while iterations < config.max_iterations:
+                if time.perf_counter() - start > config.time_limit:
+                    break
+                iterations += 1
+                temperature *= cooling
+
+                applied = self.rng.choice(moves)()
+                if applied is None:
+                    continue
+                touched, undo = applied
+                if self._loses_daylight(touched):
+                    undo()
+                    continue
+                delta, new_terms, new_unary = self._delta(touched)
+
+                if delta >= 0 or (temperature > 0 and
+                                  self.rng.random() < math.exp(delta / temperature)):
+                    accepted += 1
+                    for t, v in new_terms.items():
+                        self.term_values[t] = v
+                    for i, v in new_unary.items():
+                        self.unary_values[i] = v
+                        self.perimeter[i] = self._on_perimeter(i)
+                    current += delta
+                    if (current > best + self.EPSILON and
+                            sum(self.term_values) >= adjacency_floor):
+                        best = current
+                        best_layout = self._snapshot()
+                        improved += 1
+                else:
+                    undo()
+
+        self._restore(best_layout)
+        return {
+            "iterations": iterations,
+            "accepted": accepted,
+            "improvements": improved,
+            "initial_objective": round(initial, 3),
+            "final_objective": round(best, 3),
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+        }
+
+    def _snapshot(self) -> List[Tuple[float, float, float, float, float]]:
+        return [(r.x, r.y, r.width, r.depth, r.rotation) for r in self.rooms]
+
+    def _restore(self, layout: List[Tuple[float, float, float, float, float]]):
+        for room, (x, y, w, d, rot) in zip(self.rooms, layout):
+            room.x, room.y, room.width, room.depth, room.rotation = x, y, w, d, rot
+            room.has_exterior_wall = self.engine._is_on_perimeter(x, y, w, d)
+
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
@@ -777,7 +1454,8 @@ def create_placement_engine(width: float, depth: float, building_type: str,
 def place_floor_plan(width: float, depth: float, building_type: str,
                      program: List[Dict[str, Any]],
                      strategy: PlacementStrategy = PlacementStrategy.DOUBLE_LOADED,
-                     entry_side: str = "south") -> Dict[str, Any]:
+                     entry_side: str = "south",
+                     optimize: Optional[LocalSearchConfig] = None) -> Dict[str, Any]:
     """
     Convenience function to place a complete floor plan.
 
@@ -788,12 +1466,13 @@ def place_floor_plan(width: float, depth: float, building_type: str,
         program: List of room dicts
         strategy: Placement strategy
         entry_side: Side with main entry
+        optimize: Optional local search budget (see LocalSearchConfig)
 
     Returns:
         Complete placement result with rooms, corridors, metrics
     """
     engine = SmartPlacementEngine(width, depth, building_type, entry_side)
-    return engine.place_rooms(program, strategy)
+    return engine.place_rooms(program, strategy, optimize)
 
 
 # =============================================================================
@@ -856,5 +1535,16 @@ if __name__ == "__main__":
               f"{corr['width']}'x{corr['depth']}' "
               f"{'[PRIMARY]' if corr['is_primary'] else '[SECONDARY]'}")
 
+    print("\n" + "-" * 60)
+    print("WITH LOCAL SEARCH:")
+    optimized = place_floor_plan(80, 50, "office", test_program,
+                                 PlacementStrategy.DOUBLE_LOADED,
+                                 optimize=LocalSearchConfig())
+    stats = optimized["optimization"]
+    print(f"  adjacency_score: {result['metrics']['adjacency_score']} -> "
+          f"{optimized['metrics']['adjacency_score']}")
+    print(f"  objective: {stats['initial_objective']} -> {stats['final_objective']} "
+          f"({stats['iterations']} iterations, {stats['elapsed_ms']} ms)")
+
     print("\n" + "=" * 60)
     print("Placement Engine loaded successfully!")
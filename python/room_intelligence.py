@@ -13,7 +13,9 @@ Works with adjacency_rules.py and zone_definitions.py to create
 intelligent floor plan layouts.
 """
 
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Any
 from enum import Enum, auto
 
@@ -115,23 +117,54 @@ class RoomRule:
         return (len(issues) == 0, issues)
 
 
+# Bound on memoized room-name lookups per building type
+RULE_CACHE_SIZE = 4096
+
+
 @dataclass
 class BuildingRoomRules:
-    """Collection of room rules for a building type."""
+    """
+    Collection of room rules for a building type.
+
+    Lookup tables are built once at construction (import time for the
+    registry below) and resolved names are memoized, so `rules` must not be
+    mutated afterwards.
+    """
     building_type: str
     rules: Dict[str, RoomRule]
+    _exact: Dict[str, RoomRule] = field(init=False, repr=False, compare=False)
+    _keys: List[Tuple[str, RoomRule]] = field(init=False, repr=False, compare=False)
+    _resolved: Dict[str, Optional[RoomRule]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._exact = {}
+        self._keys = []
+        for key, rule in self.rules.items():
+            lowered = sys.intern(key.lower())
+            self._exact.setdefault(lowered, rule)  # first definition wins, as in a scan
+            self._keys.append((lowered, rule))
+        self._resolved = {}
 
     def get_rule(self, room_type: str) -> Optional[RoomRule]:
         """Get rule for room type (case-insensitive)."""
+        try:
+            return self._resolved[room_type]
+        except KeyError:
+            pass
+
         normalized = room_type.lower().replace("_", " ").replace("-", " ")
-        for key, rule in self.rules.items():
-            if key.lower() == normalized:
-                return rule
-        # Try partial match
-        for key, rule in self.rules.items():
-            if normalized in key.lower() or key.lower() in normalized:
-                return rule
-        return None
+        rule = self._exact.get(normalized)
+        if rule is None:
+            # Try partial match
+            for key, candidate in self._keys:
+                if normalized in key or key in normalized:
+                    rule = candidate
+                    break
+
+        if len(self._resolved) >= RULE_CACHE_SIZE:
+            self._resolved.clear()
+        self._resolved[room_type] = rule
+        return rule
 
     def get_perimeter_rooms(self) -> List[str]:
         """Get list of rooms that must be on perimeter."""
@@ -1040,17 +1073,7 @@ def size_room_by_occupancy(building_type: str, room_type: str, occupant_count: i
     Calculate room dimensions based on target occupancy.
     Returns (width, depth) tuple or None if no per_person_sf defined.
     """
-    rule = get_room_rule(building_type, room_type)
-    if not rule or not rule.per_person_sf:
-        return None
-
-    target_area = occupant_count * rule.per_person_sf
-    # Clamp to min/max
-    target_area = max(target_area, rule.min_area)
-    if rule.max_area:
-        target_area = min(target_area, rule.max_area)
-
-    return rule.calculate_dimensions(target_area)
+    return SIZING_SERVICE.occupancy_dimensions(building_type, room_type, occupant_count)
 
 
 def get_daylight_rooms(building_type: str) -> Dict[str, List[str]]:
@@ -1094,34 +1117,10 @@ def validate_room_program(building_type: str, rooms: List[Dict[str, Any]]) -> Di
         rooms: List of dicts with 'name', 'width', 'depth' keys
 
     Returns:
-        Dict with 'valid' bool, 'issues' list, 'warnings' list
+        Dict with 'valid' bool, 'issues' list, 'warnings' list and
+        per-room diagnostics under 'rooms'
     """
-    rules = get_room_rules(building_type)
-    if not rules:
-        return {"valid": False, "issues": [f"Unknown building type: {building_type}"], "warnings": []}
-
-    issues = []
-    warnings = []
-
-    for room in rooms:
-        name = room.get("name", "Unknown")
-        width = room.get("width", 0)
-        depth = room.get("depth", 0)
-
-        rule = rules.get_rule(name)
-        if not rule:
-            warnings.append(f"No rules defined for room type: {name}")
-            continue
-
-        is_valid, room_issues = rule.validate_dimensions(width, depth)
-        for issue in room_issues:
-            issues.append(f"{name}: {issue}")
-
-    return {
-        "valid": len(issues) == 0,
-        "issues": issues,
-        "warnings": warnings
-    }
+    return SIZING_SERVICE.validate_program(building_type, rooms)
 
 
 def suggest_room_size(building_type: str, room_type: str,
@@ -1135,42 +1134,211 @@ def suggest_room_size(building_type: str, room_type: str,
         - aspect_ratio: Actual ratio
         - notes: Any relevant notes about the sizing
     """
-    rule = get_room_rule(building_type, room_type)
-    if not rule:
-        return {"error": f"No rule found for {room_type} in {building_type}"}
-
-    # Calculate based on occupancy if provided, otherwise use preferred
-    if target_occupancy and rule.per_person_sf:
-        width, depth = size_room_by_occupancy(building_type, room_type, target_occupancy)
-        sizing_method = f"Sized for {target_occupancy} occupants @ {rule.per_person_sf} SF/person"
-    else:
-        width, depth = rule.calculate_dimensions()
-        sizing_method = "Using preferred area"
-
-    area = width * depth
-    ratio = max(width, depth) / min(width, depth) if min(width, depth) > 0 else 1.0
-
-    notes = [sizing_method]
-    if rule.daylight == DaylightRequirement.REQUIRED:
-        notes.append("Requires exterior wall with window")
-    if PlacementConstraint.PERIMETER in rule.constraints:
-        notes.append("Must be on building perimeter")
-    if PlacementConstraint.PLUMBING_CLUSTER in rule.constraints:
-        notes.append("Cluster with other wet rooms")
-    if rule.code_reference:
-        notes.append(f"Code: {rule.code_reference}")
-
-    return {
-        "width": width,
-        "depth": depth,
-        "area": round(area, 0),
-        "aspect_ratio": round(ratio, 2),
-        "min_area": rule.min_area,
-        "max_area": rule.max_area,
-        "daylight": rule.daylight.name.lower(),
-        "notes": notes
-    }
+    return SIZING_SERVICE.suggest(building_type, room_type, target_occupancy)
+
+
+# =============================================================================
+# SIZING SERVICE
+# =============================================================================
+
+# Bound on memoized results per cache in a RoomSizingService
+SIZING_CACHE_SIZE = 8192
+
+
+def normalize_room_type(room_type: str) -> str:
+    """Room type as BuildingRoomRules.get_rule matches it (case and separators ignored)."""
+    return room_type.lower().replace("_", " ").replace("-", " ")
+
+
+class RoomSizingService:
+    """
+    Memoized room sizing and program validation.
 
+    Results are keyed by (building type, normalized room type, area,
+    occupants), or by width and depth for validation, in bounded LRU caches.
+    A program editor re-validating after every tweak only resolves rules for
+    the rooms that changed. Room rules are fixed after import, so cached
+    results never go stale.
+    """
+
+    def __init__(self, maxsize: int = SIZING_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._occupancy = lru_cache(maxsize=maxsize)(self._compute_occupancy)
+        self._dimensions = lru_cache(maxsize=maxsize)(self._compute_dimensions)
+        self._suggestion = lru_cache(maxsize=maxsize)(self._compute_suggestion)
+        self._check = lru_cache(maxsize=maxsize)(self._compute_check)
+
+    # -------------------------------------------------------------------------
+    # Sizing
+    # -------------------------------------------------------------------------
+
+    def occupancy_dimensions(self, building_type: str, room_type: str,
+                             occupants: int) -> Optional[Tuple[float, float]]:
+        """(width, depth) for an occupant count, None if the rule has no per_person_sf."""
+        return self._occupancy(building_type.lower(), normalize_room_type(room_type), occupants)
+
+    def dimensions(self, building_type: str, room_type: str,
+                   area: Optional[float] = None,
+                   occupants: Optional[int] = None) -> Optional[Tuple[float, float]]:
+        """
+        (width, depth) sized by occupants when the rule has a per-person area,
+        else by area, else at the rule's preferred area. None if no rule matches.
+        """
+        return self._dimensions(building_type.lower(), normalize_room_type(room_type),
+                                area or None, occupants or None)
+
+    def suggest(self, building_type: str, room_type: str,
+                occupants: Optional[int] = None) -> Dict[str, Any]:
+        """suggest_room_size result; a fresh dict the caller may modify."""
+        cached = self._suggestion(building_type.lower(), normalize_room_type(room_type),
+                                  occupants or None)
+        if cached is None:
+            return {"error": f"No rule found for {room_type} in {building_type}"}
+        result = dict(cached)
+        result["notes"] = list(result["notes"])
+        return result
+
+    def _compute_occupancy(self, building_type: str, room_type: str,
+                           occupants: int) -> Optional[Tuple[float, float]]:
+        rule = get_room_rule(building_type, room_type)
+        if not rule or not rule.per_person_sf:
+            return None
+
+        target_area = occupants * rule.per_person_sf
+        # Clamp to min/max
+        target_area = max(target_area, rule.min_area)
+        if rule.max_area:
+            target_area = min(target_area, rule.max_area)
+
+        return rule.calculate_dimensions(target_area)
+
+    def _compute_dimensions(self, building_type: str, room_type: str,
+                            area: Optional[float],
+                            occupants: Optional[int]) -> Optional[Tuple[float, float]]:
+        if occupants:
+            sized = self._occupancy(building_type, room_type, occupants)
+            if sized:
+                return sized
+        rule = get_room_rule(building_type, room_type)
+        if not rule:
+            return None
+        return rule.calculate_dimensions(area)
+
+    def _compute_suggestion(self, building_type: str, room_type: str,
+                            occupants: Optional[int]) -> Optional[Dict[str, Any]]:
+        rule = get_room_rule(building_type, room_type)
+        if not rule:
+            return None
+
+        # Calculate based on occupancy if provided, otherwise use preferred
+        if occupants and rule.per_person_sf:
+            width, depth = self._occupancy(building_type, room_type, occupants)
+            sizing_method = f"Sized for {occupants} occupants @ {rule.per_person_sf} SF/person"
+        else:
+            width, depth = rule.calculate_dimensions()
+            sizing_method = "Using preferred area"
+
+        area = width * depth
+        ratio = max(width, depth) / min(width, depth) if min(width, depth) > 0 else 1.0
+
+        notes = [sizing_method]
+        if rule.daylight == DaylightRequirement.REQUIRED:
+            notes.append("Requires exterior wall with window")
+        if PlacementConstraint.PERIMETER in rule.constraints:
+            notes.append("Must be on building perimeter")
+        if PlacementConstraint.PLUMBING_CLUSTER in rule.constraints:
+            notes.append("Cluster with other wet rooms")
+        if rule.code_reference:
+            notes.append(f"Code: {rule.code_reference}")
+
+        return {
+            "width": width,
+            "depth": depth,
+            "area": round(area, 0),
+            "aspect_ratio": round(ratio, 2),
+            "min_area": rule.min_area,
+            "max_area": rule.max_area,
+            "daylight": rule.daylight.name.lower(),
+            "notes": tuple(notes)
+        }
+
+    # -------------------------------------------------------------------------
+    # Validation
+    # -------------------------------------------------------------------------
+
+    def _compute_check(self, building_type: str, room_type: str, width: float,
+                       depth: float) -> Tuple[Optional[str], Tuple[str, ...]]:
+        rule = get_room_rule(building_type, room_type)
+        if not rule:
+            return None, ()
+        _, issues = rule.validate_dimensions(width, depth)
+        return rule.room_type, tuple(issues)
+
+    def validate_program(self, building_type: str, rooms: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Validate a whole program in one pass.
+
+        Each distinct (room type, width, depth) is checked once and then
+        served from the cache, so re-validating an edited program only
+        checks the rooms that changed. Returns the validate_room_program
+        summary plus per-room diagnostics under 'rooms'.
+        """
+        if not get_room_rules(building_type):
+            return {"valid": False, "issues": [f"Unknown building type: {building_type}"],
+                    "warnings": [], "rooms": []}
+
+        key = building_type.lower()
+        check = self._check
+        issues = []
+        warnings = []
+        diagnostics = []
+
+        for room in rooms:
+            name = room.get("name", "Unknown")
+            width = room.get("width", 0)
+            depth = room.get("depth", 0)
+
+            rule_type, room_issues = check(key, normalize_room_type(name), width, depth)
+            if rule_type is None:
+                warnings.append(f"No rules defined for room type: {name}")
+            for issue in room_issues:
+                issues.append(f"{name}: {issue}")
+
+            short = min(width, depth)
+            diagnostics.append({
+                "name": name,
+                "rule": rule_type,
+                "area": width * depth,
+                "aspect_ratio": round(max(width, depth) / short, 2) if short > 0 else None,
+                "valid": not room_issues,
+                "issues": list(room_issues)
+            })
+
+        return {
+            "valid": len(issues) == 0,
+            "issues": issues,
+            "warnings": warnings,
+            "rooms": diagnostics
+        }
+
+    # -------------------------------------------------------------------------
+    # Cache control
+    # -------------------------------------------------------------------------
+
+    def cache_info(self) -> Dict[str, Dict[str, int]]:
+        """Hits, misses and size of each cache."""
+        return {
+            name: getattr(self, f"_{name}").cache_info()._asdict()
+            for name in ("occupancy", "dimensions", "suggestion", "check")
+        }
+
+    def clear(self):
+        """Drop every memoized result."""
+        for name in ("occupancy", "dimensions", "suggestion", "check"):
+            getattr(self, f"_{name}").cache_clear()
+
+
+SIZING_SERVICE = RoomSizingService()
 
 # =============================================================================
 # MODULE TEST
@@ -11,11 +11,17 @@ Each scheme includes:
 - Strengths and trade-offs analysis
 """
 
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 from typing import Dict, List, Optional, Tuple, Any
 from enum import Enum
 import json
 import math
+import os
+import random
+import time
 from datetime import datetime
 
 from placement_engine import (
@@ -113,10 +119,11 @@ class GeneratedScheme:
     building_depth: float
     building_type: str
     generated_at: str
+    sample: Optional[Dict[str, Any]] = None  # Seed and variants, for sampled schemes
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
+        data = {
             "scheme_id": self.scheme_id,
             "strategy": self.strategy.name,
             "scheme_name": self.scheme_info.name,
@@ -134,6 +141,156 @@ class GeneratedScheme:
             "building_type": self.building_type,
             "generated_at": self.generated_at
         }
+        if self.sample is not None:
+            data["sample"] = self.sample
+        return data
+
+
+def overall_score(metrics: Dict[str, Any]) -> float:
+    """Weighted combination used to rank schemes overall."""
+    e = metrics.get("efficiency", 0)
+    a = metrics.get("adjacency_score", 0)
+    d = metrics.get("daylight_ratio", 0)
+    p = metrics.get("placement_success", 0)
+    return (e * 0.3) + (a * 0.35) + (d * 0.2) + (p * 0.15)
+
+
+# =============================================================================
+# SAMPLING
+# =============================================================================
+
+# The engine distinguishes south-facing entries from everything else
+ENTRY_SIDES = ("south", "north")
+
+PARETO_OBJECTIVES = ("efficiency", "adjacency_score", "daylight_ratio")
+
+# Samples placed in-process first; their timing decides whether workers pay off
+CALIBRATION_SAMPLES = 8
+
+# Remaining work (serial seconds, capped by the time budget) below which
+# starting worker processes costs more than it saves
+MIN_POOL_SECONDS = 2.0
+
+# Target serial seconds per worker chunk: few, large round trips
+CHUNK_SECONDS = 0.5
+
+
+@dataclass(frozen=True)
+class SchemeSample:
+    """One randomized placement run, fully determined by its seed."""
+    seed: int
+    strategy: PlacementStrategy
+    entry_side: str
+    flipped: Tuple[int, ...]     # Program indices placed rotated 90 degrees
+    priority_jitter: float
+
+    @classmethod
+    def from_seed(cls, seed: int, strategies: List[PlacementStrategy], room_count: int,
+                  flip_probability: float = 0.25,
+                  priority_jitter: float = 0.6) -> 'SchemeSample':
+        rng = random.Random(seed)
+        return cls(
+            seed=seed,
+            strategy=rng.choice(strategies),
+            entry_side=rng.choice(ENTRY_SIDES),
+            flipped=tuple(i for i in range(room_count) if rng.random() < flip_probability),
+            priority_jitter=priority_jitter
+        )
+
+    def apply(self, program: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Program with this sample's orientation variants applied."""
+        varied = [dict(room) for room in program]
+        for i in self.flipped:
+            room = varied[i]
+            room["width"], room["depth"] = room.get("depth", 10), room.get("width", 10)
+        return varied
+
+
+def run_sample(building_width: float, building_depth: float, building_type: str,
+               program: List[Dict[str, Any]], sample: SchemeSample) -> Dict[str, Any]:
+    """Place one sample. Module-level so worker processes can run it."""
+    engine = SmartPlacementEngine(building_width, building_depth, building_type,
+                                  sample.entry_side, seed=sample.seed,
+                                  priority_jitter=sample.priority_jitter)
+    return engine.place_rooms(sample.apply(program), sample.strategy)
+
+
+def _run_chunk(place, samples: List[SchemeSample], deadline: Optional[float] = None
+               ) -> Tuple[int, int, List[Tuple[SchemeSample, Dict[str, Any]]]]:
+    """
+    Place samples in order until done or past `deadline` (time.time()).
+    Returns (evaluated, incomplete, Pareto front of the chunk), so a worker
+    sends back only the layouts that can still make the overall front.
+    """
+    front = ParetoFront()
+    evaluated = incomplete = 0
+    for sample in samples:
+        result = place(sample)
+        evaluated += 1
+        if result["metrics"].get("placement_success", 0) < 1.0:
+            incomplete += 1
+        else:
+            front.add(result["metrics"], (sample, result))
+        if deadline is not None and time.time() > deadline:
+            break
+    return evaluated, incomplete, front.items()
+
+
+def _map_bounded(executor: Executor, place, samples: List[SchemeSample],
+                 chunksize: int, window: int, deadline: Optional[float] = None):
+    """
+    Ordered map of _run_chunk over chunks with at most `window` chunks in
+    flight, so stopping early doesn't wait on every queued sample. Closing
+    the generator cancels the chunks still queued.
+    """
+    starts = iter(range(0, len(samples), chunksize))
+    pending = deque()
+
+    def submit():
+        for start in starts:
+            pending.append(executor.submit(_run_chunk, place,
+                                           samples[start:start + chunksize], deadline))
+            return
+
+    for _ in range(window):
+        submit()
+    try:
+        while pending:
+            chunk = pending.popleft().result()
+            submit()
+            yield chunk
+    finally:
+        # By hand: shutdown(cancel_futures=True) needs Python 3.9
+        for future in pending:
+            future.cancel()
+
+
+class ParetoFront:
+    """Non-dominated set over PARETO_OBJECTIVES (all maximized)."""
+
+    def __init__(self, objectives: Tuple[str, ...] = PARETO_OBJECTIVES):
+        self.objectives = objectives
+        self.entries: List[Tuple[Tuple[float, ...], Any]] = []
+
+    def key(self, metrics: Dict[str, Any]) -> Tuple[float, ...]:
+        return tuple(metrics.get(name, 0) for name in self.objectives)
+
+    def add(self, metrics: Dict[str, Any], item: Any) -> bool:
+        """Insert unless dominated or equal to an existing entry. Returns True if kept."""
+        point = self.key(metrics)
+        for other, _ in self.entries:
+            if all(o >= p for o, p in zip(other, point)):
+                return False
+        self.entries = [(other, kept) for other, kept in self.entries
+                        if not all(p >= o for p, o in zip(point, other))]
+        self.entries.append((point, item))
+        return True
+
+    def items(self) -> List[Any]:
+        return [item for _, item in self.entries]
+
+    def __len__(self) -> int:
+        return len(self.entries)
 
 
 class SchemeGenerator:
@@ -190,6 +347,123 @@ class SchemeGenerator:
 
         return schemes
 
+    def sample_schemes(self, program: List[Dict[str, Any]],
+                       samples: int = 1000,
+                       seed: int = 0,
+                       workers: Optional[int] = None,
+                       time_limit: Optional[float] = None,
+                       strategies: Optional[List[PlacementStrategy]] = None,
+                       flip_probability: float = 0.25,
+                       priority_jitter: float = 0.6) -> Dict[str, Any]:
+        """
+        Explore the design space with seeded, randomized placement runs.
+
+        Each sample varies strategy, entry side, room orientation, placement
+        order and tie-breaking. Sample i uses seed + i, so any scheme can be
+        reproduced from its seed whatever the worker count. Only layouts that
+        place every room are kept, and only on the Pareto front over
+        efficiency, adjacency and daylight.
+
+        The first samples run in-process. Worker processes are started only
+        if their timing says the remaining work (within time_limit) can pay
+        for the pool; each worker then gets chunks of about CHUNK_SECONDS and
+        returns only its chunk's front.
+
+        Args:
+            program: List of room dicts with 'name', 'width', 'depth'
+            samples: Number of layouts to evaluate
+            seed: Base seed
+            workers: Maximum worker processes (default and cap: all cores, 1 = in-process)
+            time_limit: Stop early after this many seconds
+            strategies: Strategies to sample from (default: all)
+            flip_probability: Chance of placing each room rotated 90 degrees
+            priority_jitter: Placement-order perturbation (see SmartPlacementEngine)
+
+        Returns:
+            Dict with 'schemes' (the front, best overall first) and throughput stats
+        """
+        program_copy = self._make_unique_names(program)
+        strategies = list(strategies or SCHEME_TYPES)
+        specs = [SchemeSample.from_seed(seed + i, strategies, len(program_copy),
+                                        flip_probability, priority_jitter)
+                 for i in range(samples)]
+        place = partial(run_sample, self.building_width, self.building_depth,
+                        self.building_type, program_copy)
+        # More processes than cores only adds contention
+        cores = os.cpu_count() or 1
+        workers = max(1, min(workers or cores, cores))
+
+        front = ParetoFront()
+        evaluated = incomplete = 0
+        start = time.perf_counter()
+        deadline = time.time() + time_limit if time_limit is not None else None
+
+        def merge(chunk):
+            # Chunks arrive in seed order, so ties resolve as in one serial pass
+            nonlocal evaluated, incomplete
+            chunk_evaluated, chunk_incomplete, kept = chunk
+            evaluated += chunk_evaluated
+            incomplete += chunk_incomplete
+            for sample, result in kept:
+                front.add(result["metrics"], (sample, result))
+
+        head = specs if workers == 1 else specs[:CALIBRATION_SAMPLES]
+        merge(_run_chunk(place, head, deadline))
+        rest = specs[len(head):]
+        if deadline is not None and time.time() > deadline:
+            rest = []
+
+        pool_workers = 1
+        if rest:
+            per_sample = (time.perf_counter() - start) / evaluated
+            work = per_sample * len(rest)
+            if deadline is not None:
+                work = min(work, deadline - time.time())
+            if work >= MIN_POOL_SECONDS:
+                pool_workers = min(workers, len(rest))
+                chunksize = max(1, min(math.ceil(len(rest) / pool_workers),
+                                       round(CHUNK_SECONDS / per_sample)))
+                executor = ProcessPoolExecutor(max_workers=pool_workers)
+                chunks = _map_bounded(executor, place, rest, chunksize, pool_workers * 2, deadline)
+                try:
+                    for chunk in chunks:
+                        merge(chunk)
+                        if deadline is not None and time.time() > deadline:
+                            break
+                finally:
+                    chunks.close()
+                    executor.shutdown(wait=True)
+            else:
+                merge(_run_chunk(place, rest, deadline))
+
+        elapsed = time.perf_counter() - start
+        prefix = self.building_type[:3].upper()
+        schemes = [
+            self._scheme_from_result(
+                result, sample.strategy,
+                f"{prefix}-{sample.strategy.name[:4]}-S{sample.seed}",
+                sample={
+                    "seed": sample.seed,
+                    "entry_side": sample.entry_side,
+                    "flipped_rooms": [program_copy[i]["name"] for i in sample.flipped],
+                    "priority_jitter": sample.priority_jitter
+                }
+            )
+            for sample, result in front.items()
+        ]
+        schemes.sort(key=lambda s: (-overall_score(s.metrics), s.sample["seed"]))
+
+        return {
+            "schemes": schemes,
+            "samples_requested": samples,
+            "evaluated": evaluated,
+            "incomplete": incomplete,
+            "front_size": len(front),
+            "workers": pool_workers,
+            "elapsed_seconds": round(elapsed, 2),
+            "layouts_per_minute": round(evaluated / elapsed * 60) if elapsed > 0 else 0
+        }
+
     def _select_strategies(self, program: List[Dict[str, Any]],
                            count: int) -> List[PlacementStrategy]:
         """Select best strategies for this building and program."""
@@ -268,12 +542,18 @@ class SchemeGenerator:
             self.entry_side
         )
 
+        scheme_id = f"{self.building_type[:3].upper()}-{strategy.name[:4]}-{scheme_number:02d}"
+        return self._scheme_from_result(result, strategy, scheme_id)
+
+    def _scheme_from_result(self, result: Dict[str, Any],
+                            strategy: PlacementStrategy,
+                            scheme_id: str,
+                            sample: Optional[Dict[str, Any]] = None) -> GeneratedScheme:
+        """Wrap a placement result with its analysis."""
         # Analyze strengths and trade-offs
         info = SCHEME_TYPES[strategy]
         strengths, trade_offs = self._analyze_scheme(result, info)
 
-        scheme_id = f"{self.building_type[:3].upper()}-{strategy.name[:4]}-{scheme_number:02d}"
-
         return GeneratedScheme(
             scheme_id=scheme_id,
             strategy=strategy,
@@ -286,7 +566,8 @@ class SchemeGenerator:
             building_width=self.building_width,
             building_depth=self.building_depth,
             building_type=self.building_type,
-            generated_at=datetime.now().isoformat()
+            generated_at=datetime.now().isoformat(),
+            sample=sample
         )
 
     def _make_unique_names(self, program: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -376,14 +657,7 @@ class SchemeGenerator:
                              reverse=True)
 
         # Overall = weighted combination
-        def overall_score(s):
-            e = s.metrics.get("efficiency", 0)
-            a = s.metrics.get("adjacency_score", 0)
-            d = s.metrics.get("daylight_ratio", 0)
-            p = s.metrics.get("placement_success", 0)
-            return (e * 0.3) + (a * 0.35) + (d * 0.2) + (p * 0.15)
-
-        by_overall = sorted(schemes, key=overall_score, reverse=True)
+        by_overall = sorted(schemes, key=lambda s: overall_score(s.metrics), reverse=True)
 
         for s in by_efficiency:
             comparison["by_efficiency"].append({
@@ -403,7 +677,7 @@ class SchemeGenerator:
         for s in by_overall:
             comparison["by_overall"].append({
                 "scheme_id": s.scheme_id,
-                "value": round(overall_score(s), 3)
+                "value": round(overall_score(s.metrics), 3)
             })
 
         # Recommendation
@@ -421,7 +695,9 @@ class SchemeGenerator:
 
 def generate_design_schemes(building_width: float, building_depth: float,
                            building_type: str, program: List[Dict[str, Any]],
-                           count: int = 3, entry_side: str = "south") -> Dict[str, Any]:
+                           count: int = 3, entry_side: str = "south",
+                           samples: int = 0, seed: int = 0,
+                           workers: Optional[int] = None) -> Dict[str, Any]:
     """
     Convenience function to generate multiple design schemes.
 
@@ -432,15 +708,24 @@ def generate_design_schemes(building_width: float, building_depth: float,
         program: List of room dicts
         count: Number of schemes to generate
         entry_side: Side with main entry
+        samples: If > 0, sample this many randomized layouts and return
+                 their Pareto front instead of one scheme per strategy
+        seed: Base seed for sampling
+        workers: Worker processes for sampling (default: all cores)
 
     Returns:
         Dict with schemes, comparison, and metadata
     """
     generator = SchemeGenerator(building_width, building_depth, building_type, entry_side)
-    schemes = generator.generate_schemes(program, count)
+    sampling = None
+    if samples > 0:
+        sampling = generator.sample_schemes(program, samples, seed, workers)
+        schemes = sampling.pop("schemes")
+    else:
+        schemes = generator.generate_schemes(program, count)
     comparison = generator.compare_schemes(schemes)
 
-    return {
+    result = {
         "building_type": building_type,
         "building_dimensions": {
             "width": building_width,
@@ -452,6 +737,9 @@ def generate_design_schemes(building_width: float, building_depth: float,
         "comparison": comparison,
         "generated_at": datetime.now().isoformat()
     }
+    if sampling is not None:
+        result["sampling"] = sampling
+    return result
 
 
 # =============================================================================
@@ -512,5 +800,17 @@ if __name__ == "__main__":
     print(f"\n  RECOMMENDATION: {comp['recommendation']}")
     print(f"  {comp['recommendation_reason']}")
 
+    print("\n" + "-" * 60)
+    print("SAMPLED PARETO FRONT (60 layouts):")
+    sampled = generate_design_schemes(80, 50, "office", test_program, samples=60)
+    stats = sampled["sampling"]
+    print(f"  Evaluated {stats['evaluated']} layouts on {stats['workers']} worker(s) "
+          f"in {stats['elapsed_seconds']}s ({stats['layouts_per_minute']}/min), "
+          f"{stats['incomplete']} incomplete")
+    for scheme in sampled["schemes"]:
+        m = scheme["metrics"]
+        print(f"    {scheme['scheme_id']}: eff {m['efficiency']:.3f}  "
+              f"adj {m['adjacency_score']:.3f}  daylight {m['daylight_ratio']:.3f}")
+
     print("\n" + "=" * 60)
     print("Scheme Generator loaded successfully!")
@@ -43,11 +43,11 @@ from zone_definitions import (
     get_zones, get_room_zone, group_rooms_by_zone, ZoneType
 )
 from room_intelligence import (
-    get_room_rule, get_room_rules, suggest_room_size, size_room_by_occupancy,
-    validate_room_program, DaylightRequirement, PlacementConstraint
+    get_room_rules, validate_room_program, DaylightRequirement, PlacementConstraint,
+    SIZING_SERVICE
 )
 from placement_engine import (
-    SmartPlacementEngine, PlacementStrategy, place_floor_plan
+    SmartPlacementEngine, PlacementStrategy, place_floor_plan, LayoutState
 )
 from scheme_generator import (
     SchemeGenerator, generate_design_schemes, SCHEME_TYPES, GeneratedScheme
@@ -121,6 +121,7 @@ class SmartFloorPlanGenerator:
         # Generated schemes
         self.schemes: List[Dict[str, Any]] = []
         self.selected_scheme: Optional[Dict[str, Any]] = None
+        self.layout: Optional[LayoutState] = None  # Live state of the selected scheme
 
     def add_room(self, name: str, area: Optional[float] = None,
                  width: Optional[float] = None, depth: Optional[float] = None,
@@ -270,30 +271,16 @@ class SmartFloorPlanGenerator:
             spec.final_depth = spec.depth
             return
 
-        # Try occupancy-based sizing first
-        if spec.occupancy:
-            result = size_room_by_occupancy(self.building_type, spec.name, spec.occupancy)
-            if result:
-                spec.final_width, spec.final_depth = result
-                return
-
-        # Try area-based sizing
-        if spec.area:
-            rule = get_room_rule(self.building_type, spec.name)
-            if rule:
-                spec.final_width, spec.final_depth = rule.calculate_dimensions(spec.area)
-            else:
-                # Fallback: square root for roughly square room
-                side = math.sqrt(spec.area)
-                spec.final_width = round(side * 1.2, 1)  # Slightly rectangular
-                spec.final_depth = round(spec.area / spec.final_width, 1)
-            return
-
-        # Use room rule defaults
-        suggestion = suggest_room_size(self.building_type, spec.name)
-        if "error" not in suggestion:
-            spec.final_width = suggestion["width"]
-            spec.final_depth = suggestion["depth"]
+        # Occupancy, then area, then the rule's preferred size (memoized)
+        result = SIZING_SERVICE.dimensions(self.building_type, spec.name,
+                                           spec.area, spec.occupancy)
+        if result:
+            spec.final_width, spec.final_depth = result
+        elif spec.area:
+            # Fallback: square root for roughly square room
+            side = math.sqrt(spec.area)
+            spec.final_width = round(side * 1.2, 1)  # Slightly rectangular
+            spec.final_depth = round(spec.area / spec.final_width, 1)
         else:
             # Ultimate fallback
             spec.final_width = 12
@@ -404,6 +391,7 @@ class SmartFloorPlanGenerator:
             raise ValueError(f"Invalid scheme index. Must be 0-{len(self.schemes)-1}")
 
         self.selected_scheme = self.schemes[scheme_index]
+        self.layout = LayoutState.from_scheme(self.selected_scheme, self.building_type)
         rejected = [s for i, s in enumerate(self.schemes) if i != scheme_index]
 
         # Record selection for learning
@@ -419,6 +407,9 @@ class SmartFloorPlanGenerator:
         """
         Record a correction to a room in the selected scheme.
 
+        The correction is applied to the selected scheme, whose room entries
+        and metrics are re-scored incrementally.
+
         Args:
             room_name: Name of room to correct
             new_x, new_y: New position (if changed)
@@ -436,7 +427,7 @@ class SmartFloorPlanGenerator:
         original = None
         for room in placed_rooms:
             if room["name"] == room_name:
-                original = room
+                original = dict(room)
                 break
 
         if not original:
@@ -454,6 +445,15 @@ class SmartFloorPlanGenerator:
         if new_depth is not None:
             corrected["depth"] = new_depth
 
+        # Apply to the selected scheme and re-score
+        if self.layout is None:
+            self.layout = LayoutState.from_scheme(self.selected_scheme, self.building_type)
+        touched = self.layout.move(room_name, new_x, new_y, new_width, new_depth)
+        for i in touched:
+            placed_rooms[i].update(self.layout.rooms[i].to_dict())
+        metrics = self.selected_scheme.setdefault("metrics", {})
+        metrics.update(self.layout.metrics(metrics.get("rooms_requested", len(placed_rooms))))
+
         # Record correction
         if self.learner:
             record_correction(room_name, self.building_type, original, corrected, reason)
@@ -0,0 +1,8 @@
+"""Make the flat python/ modules and the benchmark generators importable from the tests."""
+
+import os
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
@@ -0,0 +1,221 @@
+"""DiffusionService against stub Automatic1111 and ComfyUI servers on localhost."""
+
+import base64
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from diffusion_service import DiffusionService, ServiceBusy
+
+RENDER = b"\x89PNG stub render"
+
+
+class StubA1111:
+    """img2img endpoint that counts requests and can hold them until released."""
+
+    def __init__(self):
+        self.requests = 0
+        self.received = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                length = int(self.headers["Content-Length"])
+                payload = json.loads(self.rfile.read(length))
+                assert self.path == "/sdapi/v1/img2img" and payload["init_images"]
+                stub.requests += 1
+                stub.received.set()
+                stub.release.wait(10)
+                body = json.dumps({"images": [base64.b64encode(RENDER).decode()]}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.release.set()
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class StubComfyUI:
+    """Upload/prompt/history/view endpoints; prompts finish only once released."""
+
+    def __init__(self):
+        self.prompts = []
+        self.received = threading.Event()
+        self.release = threading.Event()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _reply(self, status, body, content_type="application/json"):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                if self.path == "/upload/image":
+                    self._reply(200, json.dumps({"name": "upload.png"}).encode())
+                else:
+                    prompt_id = f"p{len(stub.prompts)}"
+                    stub.prompts.append(prompt_id)
+                    stub.received.set()
+                    self._reply(200, json.dumps({"prompt_id": prompt_id}).encode())
+
+            def do_GET(self):
+                if self.path.startswith("/history/"):
+                    prompt_id = self.path.rsplit("/", 1)[1]
+                    history = {}
+                    if stub.release.is_set():
+                        history[prompt_id] = {"outputs": {"8": {"images": [{"filename": "out.png"}]}}}
+                    self._reply(200, json.dumps(history).encode())
+                elif self.path.startswith("/view"):
+                    self._reply(200, RENDER, "image/png")
+                else:
+                    self._reply(404, b"")  # no websocket: the worker polls /history
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.release.set()
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stubs():
+    servers = [StubA1111(), StubA1111()]
+    yield servers
+    for server in servers:
+        server.close()
+
+
+def _image(tmp_path, name):
+    path = tmp_path / f"{name}.png"
+    path.write_bytes(name.encode())
+    return str(path)
+
+
+def _wait(service, job_id, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = service.get_status(job_id)
+        if status["status"] in ("completed", "failed", "cancelled"):
+            return status
+        time.sleep(0.02)
+    raise AssertionError(f"job {job_id} still {status['status']}")
+
+
+def test_jobs_render_across_backends(stubs, tmp_path):
+    for stub in stubs:
+        stub.release.clear()
+    service = DiffusionService(url=[s.url for s in stubs], output_dir=str(tmp_path / "out"),
+                               workers_per_backend=2)
+    service.start()
+    try:
+        jobs = [service.submit_render(_image(tmp_path, f"view{i}"), "lobby") for i in range(12)]
+        # Held renders keep every worker busy until both backends have a job
+        assert all(stub.received.wait(5) for stub in stubs)
+        for stub in stubs:
+            stub.release.set()
+        for job_id in jobs:
+            assert _wait(service, job_id)["status"] == "completed"
+            with open(service.get_result(job_id)["result_image"], "rb") as f:
+                assert f.read() == RENDER
+    finally:
+        service.stop()
+    assert sum(s.requests for s in stubs) == 12
+    assert all(s.requests for s in stubs)
+
+
+def test_duplicate_submission_is_served_from_cache(stubs, tmp_path):
+    service = DiffusionService(url=stubs[0].url, output_dir=str(tmp_path / "out"))
+    service.start()
+    try:
+        image = _image(tmp_path, "view")
+        first = service.submit_render(image, "lobby")
+        assert _wait(service, first)["status"] == "completed"
+        second = service.submit_render(image, "lobby")
+        assert _wait(service, second)["status"] == "completed"
+        assert service.jobs[second].cached
+    finally:
+        service.stop()
+    assert stubs[0].requests == 1
+
+
+def test_full_queue_raises_service_busy(stubs, tmp_path):
+    stub = stubs[0]
+    stub.release.clear()
+    service = DiffusionService(url=stub.url, output_dir=str(tmp_path / "out"),
+                               max_queue=1, submit_timeout=0.2, cache_max_bytes=0)
+    service.start()
+    try:
+        rendering = service.submit_render(_image(tmp_path, "a"), "lobby")
+        assert stub.received.wait(5)
+        queued = service.submit_render(_image(tmp_path, "b"), "lobby")
+        start = time.monotonic()
+        with pytest.raises(ServiceBusy):
+            service.submit_render(_image(tmp_path, "c"), "lobby")
+        assert time.monotonic() - start < 2
+        stub.release.set()
+        assert _wait(service, rendering)["status"] == "completed"
+        assert _wait(service, queued)["status"] == "completed"
+    finally:
+        service.stop()
+
+
+def test_bounded_queue_waits_a_finite_time_by_default(tmp_path):
+    service = DiffusionService(output_dir=str(tmp_path / "out"), max_queue=4)
+    assert service.submit_timeout is not None and service.submit_timeout > 0
+
+
+def test_cancelled_comfyui_render_hands_off_to_duplicate(tmp_path):
+    stub = StubComfyUI()
+    service = DiffusionService(backend="comfyui", url=stub.url, output_dir=str(tmp_path / "out"))
+    service.start()
+    try:
+        image = _image(tmp_path, "view")
+        primary = service.submit_render(image, "lobby")
+        follower = service.submit_render(image, "lobby")
+        assert service.jobs[follower].coalesced_with == primary
+        assert stub.received.wait(5)
+
+        assert service.cancel_job(primary)["success"]
+        stub.release.set()
+        assert _wait(service, follower)["status"] == "completed"
+        assert service.get_status(primary)["status"] == "cancelled"
+        with open(service.get_result(follower)["result_image"], "rb") as f:
+            assert f.read() == RENDER
+    finally:
+        service.stop()
+        stub.close()
+    assert len(stub.prompts) == 2
@@ -0,0 +1,83 @@
+"""Interior walls from every packing backend."""
+
+import contextlib
+import io
+import math
+import random
+
+import pytest
+
+from floor_plan_generator import FloorPlanGenerator, PACKERS
+from wall_geometry import WallIndex, WallSegment
+
+
+ROOM_AREAS = [40, 60, 80, 120, 150, 200, 250, 300, 600]
+
+
+def _generate(packer, rooms, seed):
+    """Random program on a plate sized for roughly 90% occupancy."""
+    rng = random.Random(seed)
+    specs = [(f"Room {i + 1}", float(rng.choice(ROOM_AREAS))) for i in range(rooms)]
+    area = sum(a for _, a in specs) / 0.9
+    width = math.ceil(math.sqrt(area * 1.5))
+    depth = math.ceil(area / width) + FloorPlanGenerator.CORRIDOR_WIDTH
+    generator = FloorPlanGenerator(width, depth, packer)
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator.generate_from_rooms(specs)
+    return generator
+
+
+def _index(generator):
+    return WallIndex(WallSegment(i, (w.start_x, w.start_y), (w.end_x, w.end_y))
+                     for i, w in enumerate(generator.walls))
+
+
+def test_default_packer_is_strip():
+    assert FloorPlanGenerator(60, 40).packer == "strip"
+
+
+@pytest.mark.parametrize("program", sorted(FloorPlanGenerator.PROGRAMS))
+@pytest.mark.parametrize("packer", list(PACKERS))
+def test_no_duplicate_or_overlapping_walls(packer, program):
+    generator = FloorPlanGenerator(60, 40, packer)
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator.generate_from_program(program)
+    index = _index(generator)
+    # Faces either side of the wall gap are parallel walls, not duplicates
+    assert index.duplicates(generator.WALL_GAP / 2) == []
+    assert index.collinear_overlaps() == []
+
+
+def test_t_junction_edge_is_split():
+    generator = FloorPlanGenerator(40, 25, "treemap")
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator.generate_from_rooms([("Large", 400), ("Small A", 200), ("Small B", 200)])
+    assert _index(generator).collinear_overlaps() == []
+
+
+@pytest.mark.parametrize("rooms", [10, 50, 200, 1000])
+@pytest.mark.parametrize("packer", list(PACKERS))
+def test_random_programs_have_clean_walls(packer, rooms):
+    for seed in range(3):
+        index = _index(_generate(packer, rooms, seed))
+        assert index.duplicates(FloorPlanGenerator.WALL_GAP / 2) == []
+        assert index.collinear_overlaps() == []
+
+
+@pytest.mark.parametrize("rooms", [10, 50, 200])
+@pytest.mark.parametrize("packer", [p for p in PACKERS if p != "strip"])
+def test_random_programs_stay_on_the_plate(packer, rooms):
+    # strip still squashes rooms that overflow, as the original generator did
+    eps = 1e-6
+    for seed in range(3):
+        generator = _generate(packer, rooms, seed)
+        ordered = sorted(generator.rooms, key=lambda r: r.x)
+        for i, a in enumerate(ordered):
+            assert a.width > 0 and a.depth > 0
+            assert a.x >= -eps and a.y >= generator.CORRIDOR_WIDTH - eps
+            assert a.x + a.width <= generator.width + eps
+            assert a.y + a.depth <= generator.depth + eps
+            for b in ordered[i + 1:]:
+                if b.x >= a.x + a.width - eps:
+                    break
+                assert not (a.y < b.y + b.depth - eps and b.y < a.y + a.depth - eps), (a.name, b.name)
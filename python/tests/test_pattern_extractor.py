@@ -0,0 +1,55 @@
+"""Adjacency detection against an all-pairs reference."""
+
+import random
+
+from pattern_extractor import ExtractedRoom, PatternExtractor
+
+
+def _room(name, level, x1, y1, x2, y2):
+    width, depth = x2 - x1, y2 - y1
+    return ExtractedRoom(
+        name=name, room_type=name, area=width * depth, width=width, depth=depth,
+        aspect_ratio=round(max(width, depth) / min(width, depth), 2),
+        perimeter=2 * (width + depth), x=(x1 + x2) / 2, y=(y1 + y2) / 2,
+        level=level, has_exterior_wall=False)
+
+
+def _shared(a, b, tolerance=1.0):
+    if a.level != b.level:
+        return 0.0
+    ax1, ay1, ax2, ay2 = a.bounds
+    bx1, by1, bx2, by2 = b.bounds
+    length = 0.0
+    if abs(ax2 - bx1) <= tolerance or abs(bx2 - ax1) <= tolerance:
+        length = max(length, min(ay2, by2) - max(ay1, by1))
+    if abs(ay2 - by1) <= tolerance or abs(by2 - ay1) <= tolerance:
+        length = max(length, min(ax2, bx2) - max(ax1, bx1))
+    return length
+
+
+def test_grid_matches_all_pairs():
+    rng = random.Random(0)
+    rooms = []
+    for level in ("Level 1", "Level 2"):
+        for k in range(120):
+            col, row = k % 12, k // 12
+            x, y = col * 14.5, row * 16.5
+            rooms.append(_room(f"{level} {k}", level, x, y,
+                               x + rng.choice([10, 12, 14]), y + rng.choice([12, 14, 16])))
+
+    expected = {}
+    for i, a in enumerate(rooms):
+        for b in rooms[i + 1:]:
+            length = _shared(a, b)
+            if length >= 1.0:
+                expected[(a.name, b.name)] = round(length, 2)
+
+    found = {(adj.room_a, adj.room_b): adj.shared_wall_length
+             for adj in PatternExtractor().detect_adjacencies(rooms)}
+    assert found == expected
+    assert expected
+
+
+def test_rooms_on_other_levels_are_not_adjacent():
+    rooms = [_room("A", "Level 1", 0, 0, 10, 10), _room("B", "Level 2", 10.5, 0, 20, 10)]
+    assert PatternExtractor().detect_adjacencies(rooms) == []
@@ -0,0 +1,65 @@
+"""Columnar statistics against per-room and per-pair aggregation, and .npz round trips."""
+
+from collections import Counter
+
+import pytest
+
+from pattern_library import PatternLibrary
+from synthetic import project_patterns
+
+
+def _patterns():
+    return project_patterns(12, rooms=20)
+
+
+def _library(patterns):
+    library = PatternLibrary()
+    for pattern in patterns:
+        library.add_pattern(pattern)
+    return library
+
+
+def test_room_statistics_match_per_room_aggregation():
+    patterns = _patterns()
+    stats = _library(patterns).statistics()
+
+    areas = {}
+    for pattern in patterns:
+        for room in pattern.rooms:
+            areas.setdefault((pattern.building_type, room.room_type), []).append(room.area)
+    assert sum(len(s["room_statistics"]) for s in stats.values()) == len(areas)
+    for (bt, rt), values in areas.items():
+        row = stats[bt]["room_statistics"][rt]
+        assert row["count"] == len(values)
+        assert row["avg_area"] == pytest.approx(sum(values) / len(values))
+        assert row["min_area"] == min(values)
+        assert row["max_area"] == max(values)
+    assert {bt: s["project_count"] for bt, s in stats.items()} == {
+        bt: sum(p.building_type == bt for p in patterns) for bt in stats}
+
+
+def test_adjacency_pairs_are_keyed_alphabetically():
+    patterns = _patterns()
+    counts = _library(patterns).adjacency_counts(top=1000)
+
+    expected = {}
+    for pattern in patterns:
+        for adj in pattern.adjacencies:
+            pair = tuple(sorted([adj.room_a, adj.room_b]))
+            expected.setdefault(pattern.building_type, Counter())[pair] += 1
+    assert {bt: dict(pairs) for bt, pairs in counts.items()} == {
+        bt: dict(counter) for bt, counter in expected.items()}
+
+
+def test_save_and_load_round_trip(tmp_path):
+    library = _library(_patterns())
+    path = str(tmp_path / "patterns.npz")
+    library.save(path)
+    loaded = PatternLibrary.load(path)
+    assert loaded.project_count == library.project_count
+    assert loaded.statistics() == library.statistics()
+
+
+def test_missing_file_loads_empty(tmp_path):
+    library = PatternLibrary.load(str(tmp_path / "missing.npz"))
+    assert library.statistics() == {}
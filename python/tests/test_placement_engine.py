@@ -0,0 +1,66 @@
+"""Serialization round trips for placed rooms and layout state, and local search guarantees."""
+
+import contextlib
+import copy
+import io
+
+import pytest
+
+from placement_engine import (
+    DaylightRequirement, LayoutState, LocalSearchConfig, PlacementStrategy,
+    SmartPlacementEngine, resolve_room_profile,
+)
+from synthetic import room_program
+from zone_definitions import ZoneType
+
+PROGRAM = [
+    {"name": "Entry", "width": 10, "depth": 8},
+    {"name": "Reception", "width": 15, "depth": 12},
+    {"name": "Private Office", "width": 12, "depth": 10},
+    {"name": "Vault", "width": 9, "depth": 9},  # no zone in the office tables
+]
+
+
+def _scheme():
+    engine = SmartPlacementEngine(80, 60, "office")
+    result = engine.place_rooms(PROGRAM, PlacementStrategy.DOUBLE_LOADED)
+    scheme = dict(result, building_dimensions={"width": 80, "depth": 60})
+    return engine, scheme
+
+
+def test_public_room_keeps_its_zone():
+    engine, scheme = _scheme()
+    rooms = {r["name"]: r for r in scheme["placed_rooms"]}
+    assert engine.layout.find("Entry").zone == ZoneType.PUBLIC
+    assert rooms["Entry"]["zone"] == "PUBLIC"
+    assert rooms["Vault"]["zone"] is None
+
+
+def test_zones_survive_round_trip():
+    engine, scheme = _scheme()
+    state = LayoutState.from_scheme(scheme, "office")
+    for room in engine.placed_rooms:
+        assert state.find(room.name).zone is room.zone
+    assert [r.to_dict() for r in state.rooms] == scheme["placed_rooms"]
+
+
+def _required_on_perimeter(engine):
+    return sum(
+        r.has_exterior_wall for r in engine.placed_rooms
+        if resolve_room_profile(engine.building_type, r.name).daylight == DaylightRequirement.REQUIRED
+    )
+
+
+@pytest.mark.parametrize("building_type", ["office", "healthcare", "educational"])
+@pytest.mark.parametrize("seed", range(4))
+def test_local_search_never_loses_to_greedy_seed(building_type, seed):
+    program, width, depth = room_program(building_type, 20, seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        greedy = SmartPlacementEngine(width, depth, building_type)
+        baseline = greedy.place_rooms(copy.deepcopy(program))
+        optimized = SmartPlacementEngine(width, depth, building_type)
+        result = optimized.place_rooms(copy.deepcopy(program),
+                                       optimize=LocalSearchConfig(seed=seed, time_limit=60.0))
+
+    assert _required_on_perimeter(optimized) >= _required_on_perimeter(greedy)
+    assert result["metrics"]["adjacency_score"] >= baseline["metrics"]["adjacency_score"]
@@ -0,0 +1,65 @@
+"""Scheme sampling: worker processes match the in-process path and honour time_limit."""
+
+import contextlib
+import io
+import os
+import time
+
+import pytest
+
+import scheme_generator
+from scheme_generator import SchemeGenerator
+from synthetic import room_program
+
+
+@pytest.fixture
+def generator_and_program():
+    program, width, depth = room_program("residential", 8, seed=1)
+    return SchemeGenerator(width * 1.3, depth * 1.3, "residential"), program
+
+
+@pytest.fixture
+def force_pool(monkeypatch):
+    """Start workers whatever the workload and core count of the test machine."""
+    monkeypatch.setattr(scheme_generator, "MIN_POOL_SECONDS", 0.0)
+    monkeypatch.setattr(os, "cpu_count", lambda: 3)
+
+
+def _sample(generator, program, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return generator.sample_schemes(program, seed=7, **kwargs)
+
+
+def _front(stats):
+    return sorted((s.sample["seed"], s.metrics["efficiency"], s.metrics["adjacency_score"],
+                   s.metrics["daylight_ratio"]) for s in stats["schemes"])
+
+
+def test_workers_return_the_serial_pareto_front(generator_and_program, force_pool):
+    generator, program = generator_and_program
+    serial = _sample(generator, program, samples=40, workers=1)
+    pooled = _sample(generator, program, samples=40, workers=3)
+
+    assert pooled["workers"] == 3
+    assert _front(pooled) == _front(serial)
+    assert (pooled["evaluated"], pooled["incomplete"]) == (serial["evaluated"], serial["incomplete"])
+
+
+def test_workers_respect_time_limit(generator_and_program, force_pool):
+    generator, program = generator_and_program
+    start = time.perf_counter()
+    stats = _sample(generator, program, samples=5000, workers=3, time_limit=0.5)
+    elapsed = time.perf_counter() - start
+
+    assert stats["workers"] == 3
+    assert 0 < stats["evaluated"] < 5000
+    assert elapsed < 2.0
+
+
+def test_short_budget_stays_in_process(generator_and_program, monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 3)
+    generator, program = generator_and_program
+    stats = _sample(generator, program, samples=5000, workers=3, time_limit=0.5)
+
+    assert stats["workers"] == 1
+    assert stats["evaluated"] > scheme_generator.CALIBRATION_SAMPLES
@@ -0,0 +1,37 @@
+"""WallIndex overlap checks against the pairwise reference."""
+
+import random
+
+from wall_geometry import WallIndex, WallSegment
+
+
+def test_overlap_across_cell_boundary():
+    # 0.06 ft apart, inside the offset tolerance, either side of y = 10
+    index = WallIndex([WallSegment(1, (0, 9.99), (10, 9.99)),
+                       WallSegment(2, (5, 10.05), (15, 10.05))])
+    assert index.cell_size == 10.0
+    pairs = index.collinear_overlaps()
+    assert [(p.a, p.b, p.overlap) for p in pairs] == [(1, 2, 5.0)]
+
+
+def test_matches_brute_force_near_cell_boundaries():
+    rng = random.Random(0)
+    segments = []
+    for i in range(300):
+        # Lines hugging multiples of the 10 ft cell size
+        at = 10 * rng.randint(0, 5) + rng.uniform(-0.08, 0.08)
+        lo = rng.uniform(0, 50)
+        hi = lo + rng.uniform(2, 10)
+        if rng.random() < 0.5:
+            segments.append(WallSegment(i, (lo, at), (hi, at)))
+        else:
+            segments.append(WallSegment(i, (at, lo), (at, hi)))
+    index = WallIndex(segments, cell_size=10.0)
+
+    expected = set()
+    for i, a in enumerate(segments):
+        for b in segments[i + 1:]:
+            overlap = index._overlap(a, b)
+            if overlap is not None and overlap > 0.01:
+                expected.add((a.id, b.id))
+    assert {(p.a, p.b) for p in index.collinear_overlaps()} == expected
@@ -0,0 +1,318 @@
+"""
+Wall Geometry Analysis - spatial index over 2D wall segments.
+
+Replaces the every-wall-against-every-wall checks with two hash buckets:
+
+- a uniform grid (cell -> walls whose bounding box touches it) for point and
+  proximity queries: nearest walls to a door, endpoints that stop short
+- orientation buckets per grid cell (boxes padded by the offset tolerance),
+  so parallel walls near each other land together and overlaps are found
+  with a sort-and-sweep per bucket
+
+Checks:
+    duplicates()          same endpoints (either direction) within a tolerance
+    collinear_overlaps()  walls on the same line whose extents overlap
+    near_miss_joins()     an endpoint that stops just short of another wall
+    nearest(point, r)     walls within r of a point, closest first
+
+Usage:
+    from wall_geometry import WallIndex
+
+    index = WallIndex.from_dicts(walls, start_key="start", end_key="end")
+    report = index.analyze()
+"""
+
+import math
+from collections import defaultdict
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+Point = Tuple[float, float]
+
+# Defaults are in model units (feet for Revit data)
+DUPLICATE_TOLERANCE = 0.5     # endpoint match distance for duplicate walls
+ANGLE_TOLERANCE_DEG = 1.0     # walls within this angle count as parallel
+OFFSET_TOLERANCE = 0.1        # parallel walls closer than this count as collinear
+MIN_OVERLAP = 0.01            # shorter shared extents are treated as touching ends
+JOIN_TOLERANCE = 0.01         # endpoint closer than this to a wall is joined
+NEAR_MISS_GAP = 0.5           # endpoint gaps up to this are reported as near misses
+
+
+@dataclass
+class WallSegment:
+    """A wall centerline in plan."""
+    id: Any
+    start: Point
+    end: Point
+    data: Dict = field(default_factory=dict, repr=False)
+
+    @property
+    def length(self) -> float:
+        return math.hypot(self.end[0] - self.start[0], self.end[1] - self.start[1])
+
+    @property
+    def angle(self) -> float:
+        """Undirected orientation in [0, pi)."""
+        a = math.atan2(self.end[1] - self.start[1], self.end[0] - self.start[0])
+        return a % math.pi
+
+    def distance_to(self, p: Point) -> float:
+        """Shortest distance from a point to this segment."""
+        x1, y1 = self.start
+        dx = self.end[0] - x1
+        dy = self.end[1] - y1
+        len_sq = dx * dx + dy * dy
+        if len_sq == 0:
+            return math.hypot(p[0] - x1, p[1] - y1)
+        t = max(0.0, min(1.0, ((p[0] - x1) * dx + (p[1] - y1) * dy) / len_sq))
+        return math.hypot(p[0] - (x1 + t * dx), p[1] - (y1 + t * dy))
+
+
+@dataclass
+class WallPair:
+    """Two walls flagged together (duplicate or collinear overlap)."""
+    a: Any
+    b: Any
+    kind: str
+    overlap: float = 0.0
+
+
+@dataclass
+class NearMiss:
+    """An endpoint that stops short of (or just past) another wall."""
+    wall: Any
+    end: str
+    point: Point
+    other: Any
+    gap: float
+
+
+def _dist(p: Point, q: Point) -> float:
+    return math.hypot(p[0] - q[0], p[1] - q[1])
+
+
+class WallIndex:
+    """
+    Grid + orientation-bucket index over wall segments.
+
+    cell_size defaults to the mean wall length, which keeps both the number of
+    cells per wall and the number of walls per cell small for floor plans.
+    """
+
+    def __init__(self, segments: Iterable[WallSegment], cell_size: Optional[float] = None,
+                 angle_tolerance_deg: float = ANGLE_TOLERANCE_DEG,
+                 offset_tolerance: float = OFFSET_TOLERANCE):
+        self.segments: List[WallSegment] = list(segments)
+        self.angle_tolerance = math.radians(angle_tolerance_deg)
+        self.offset_tolerance = offset_tolerance
+
+        if cell_size is None:
+            lengths = [s.length for s in self.segments]
+            cell_size = sum(lengths) / len(lengths) if lengths else 1.0
+        self.cell_size = max(cell_size, 1e-6)
+
+        self._grid: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        self._ends: Dict[Tuple[int, int], List[Tuple[int, str]]] = {}
+        self._ends_cell = None
+        self._angle_buckets = max(1, int(math.ceil(math.pi / self.angle_tolerance)))
+        self._oriented: Dict[Tuple[int, int, int], List[int]] = defaultdict(list)
+
+        pad = self.offset_tolerance
+        for i, seg in enumerate(self.segments):
+            a = int(seg.angle / self.angle_tolerance) % self._angle_buckets
+            x0, y0, x1, y1 = self._bbox(seg)
+            for cell in self._cells_for_box(x0, y0, x1, y1):
+                self._grid[cell].append(i)
+            # Padded by the offset tolerance so collinear walls either side of
+            # a cell boundary still share an orientation bucket
+            for cell in self._cells_for_box(x0 - pad, y0 - pad, x1 + pad, y1 + pad):
+                self._oriented[(a,) + cell].append(i)
+
+    @classmethod
+    def from_dicts(cls, walls: Sequence[Dict], start_key: str = "start", end_key: str = "end",
+                   id_key: str = "id", **kwargs) -> "WallIndex":
+        """Build from wall dicts with (x, y[, z]) start/end points."""
+        segments = [
+            WallSegment(
+                id=w.get(id_key, i),
+                start=(float(w[start_key][0]), float(w[start_key][1])),
+                end=(float(w[end_key][0]), float(w[end_key][1])),
+                data=w,
+            )
+            for i, w in enumerate(walls)
+        ]
+        return cls(segments, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Bucketing
+    # ------------------------------------------------------------------
+
+    def _cell(self, p: Point) -> Tuple[int, int]:
+        return (int(math.floor(p[0] / self.cell_size)), int(math.floor(p[1] / self.cell_size)))
+
+    @staticmethod
+    def _bbox(seg: WallSegment) -> Tuple[float, float, float, float]:
+        return (min(seg.start[0], seg.end[0]), min(seg.start[1], seg.end[1]),
+                max(seg.start[0], seg.end[0]), max(seg.start[1], seg.end[1]))
+
+    def _cells_for_box(self, x0: float, y0: float, x1: float, y1: float):
+        cx0, cy0 = self._cell((x0, y0))
+        cx1, cy1 = self._cell((x1, y1))
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                yield (cx, cy)
+
+    def candidates_near(self, p: Point, radius: float) -> List[int]:
+        """Indexes of walls whose grid cells come within radius of p."""
+        found = set()
+        for cell in self._cells_for_box(p[0] - radius, p[1] - radius, p[0] + radius, p[1] + radius):
+            found.update(self._grid.get(cell, ()))
+        return sorted(found)
+
+    def _endpoint_grid(self, cell: float) -> Dict[Tuple[int, int], List[Tuple[int, str]]]:
+        if self._ends_cell != cell:
+            self._ends = defaultdict(list)
+            for i, seg in enumerate(self.segments):
+                for end, p in (("start", seg.start), ("end", seg.end)):
+                    self._ends[(int(math.floor(p[0] / cell)), int(math.floor(p[1] / cell)))].append((i, end))
+            self._ends_cell = cell
+        return self._ends
+
+    # ------------------------------------------------------------------
+    # Checks
+    # ------------------------------------------------------------------
+
+    def nearest(self, p: Point, radius: float, limit: Optional[int] = None) -> List[Tuple[WallSegment, float]]:
+        """Walls within radius of p, closest first."""
+        hits = []
+        for i in self.candidates_near(p, radius):
+            d = self.segments[i].distance_to(p)
+            if d < radius:
+                hits.append((self.segments[i], d))
+        hits.sort(key=lambda h: h[1])
+        return hits[:limit] if limit is not None else hits
+
+    def duplicates(self, tolerance: float = DUPLICATE_TOLERANCE) -> List[WallPair]:
+        """Walls whose endpoints both match (in either direction) within tolerance."""
+        ends = self._endpoint_grid(tolerance)
+        pairs = []
+        for i, seg in enumerate(self.segments):
+            cx, cy = int(math.floor(seg.start[0] / tolerance)), int(math.floor(seg.start[1] / tolerance))
+            for nx in (cx - 1, cx, cx + 1):
+                for ny in (cy - 1, cy, cy + 1):
+                    for j, end in ends.get((nx, ny), ()):
+                        if j <= i:
+                            continue
+                        other = self.segments[j]
+                        if end == "start":
+                            match = _dist(seg.start, other.start) < tolerance and _dist(seg.end, other.end) < tolerance
+                        else:
+                            match = _dist(seg.start, other.end) < tolerance and _dist(seg.end, other.start) < tolerance
+                        if match:
+                            pairs.append(WallPair(seg.id, other.id, "duplicate", round(min(seg.length, other.length), 4)))
+        return pairs
+
+    def collinear_overlaps(self, min_overlap: float = MIN_OVERLAP) -> List[WallPair]:
+        """
+        Parallel walls on the same line whose extents overlap by more than
+        min_overlap. Walls are bucketed with their bounding boxes padded by
+        the offset tolerance, so overlapping walls always share a cell even
+        when they sit either side of a cell boundary; each (orientation, cell)
+        bucket plus its neighbouring orientations is swept once along its
+        direction and only overlapping extents are compared.
+        """
+        pairs = []
+        seen = set()
+        for key in sorted(self._oriented):
+            own = self._oriented[key]
+            group = set(own)
+            for da in (-1, 1):
+                # Orientation wraps at pi: 179.9 degrees neighbours 0
+                group.update(self._oriented.get(((key[0] + da) % self._angle_buckets,) + key[1:], ()))
+            if len(group) < 2:
+                continue
+
+            angle = (key[0] + 0.5) * self.angle_tolerance
+            ux, uy = math.cos(angle), math.sin(angle)
+            spans = []
+            for i in group:
+                seg = self.segments[i]
+                t0 = seg.start[0] * ux + seg.start[1] * uy
+                t1 = seg.end[0] * ux + seg.end[1] * uy
+                spans.append((min(t0, t1), max(t0, t1), i))
+            spans.sort()
+
+            own = set(own)
+            active: List[Tuple[float, int]] = []
+            for lo, hi, i in spans:
+                active = [(a_hi, j) for a_hi, j in active if a_hi - lo > min_overlap]
+                for _, j in active:
+                    pair = (min(i, j), max(i, j))
+                    if pair in seen or (i not in own and j not in own):
+                        continue
+                    seen.add(pair)
+                    overlap = self._overlap(self.segments[pair[0]], self.segments[pair[1]])
+                    if overlap is not None and overlap > min_overlap:
+                        pairs.append(WallPair(self.segments[pair[0]].id, self.segments[pair[1]].id,
+                                              "collinear_overlap", round(overlap, 4)))
+                active.append((hi, i))
+        return pairs
+
+    def _overlap(self, a: WallSegment, b: WallSegment) -> Optional[float]:
+        """Shared extent of two walls if they are collinear, else None."""
+        diff = abs(a.angle - b.angle)
+        if min(diff, math.pi - diff) > self.angle_tolerance:
+            return None
+        length = a.length
+        if length == 0:
+            return None
+        ux = (a.end[0] - a.start[0]) / length
+        uy = (a.end[1] - a.start[1]) / length
+        for p in (b.start, b.end):
+            if abs(-uy * (p[0] - a.start[0]) + ux * (p[1] - a.start[1])) > self.offset_tolerance:
+                return None
+        tb0 = (b.start[0] - a.start[0]) * ux + (b.start[1] - a.start[1]) * uy
+        tb1 = (b.end[0] - a.start[0]) * ux + (b.end[1] - a.start[1]) * uy
+        return min(length, max(tb0, tb1)) - max(0.0, min(tb0, tb1))
+
+    def near_miss_joins(self, gap: float = NEAR_MISS_GAP,
+                        join_tolerance: float = JOIN_TOLERANCE) -> List[NearMiss]:
+        """
+        Free wall ends that come within gap of another wall without touching
+        it - the usual cause of unjoined corners and doors that will not cut.
+        """
+        misses = []
+        for i, seg in enumerate(self.segments):
+            for end, p in (("start", seg.start), ("end", seg.end)):
+                closest = None
+                joined = False
+                for j in self.candidates_near(p, gap):
+                    if j == i:
+                        continue
+                    d = self.segments[j].distance_to(p)
+                    if d <= join_tolerance:
+                        joined = True
+                        break
+                    if d <= gap and (closest is None or d < closest[1]):
+                        closest = (j, d)
+                if not joined and closest is not None:
+                    misses.append(NearMiss(seg.id, end, p, self.segments[closest[0]].id, round(closest[1], 4)))
+        return misses
+
+    def analyze(self, duplicate_tolerance: float = DUPLICATE_TOLERANCE,
+                near_miss_gap: float = NEAR_MISS_GAP) -> Dict:
+        """All checks as a JSON-ready dict."""
+        duplicates = self.duplicates(duplicate_tolerance)
+        duplicate_pairs = {(p.a, p.b) for p in duplicates}
+        overlaps = [p for p in self.collinear_overlaps() if (p.a, p.b) not in duplicate_pairs]
+        # Ends lying on a wall they already overlap are not join problems
+        flagged = duplicate_pairs | {(p.a, p.b) for p in overlaps}
+        near_misses = [m for m in self.near_miss_joins(near_miss_gap)
+                       if (m.wall, m.other) not in flagged and (m.other, m.wall) not in flagged]
+        return {
+            "wall_count": len(self.segments),
+            "duplicates": [asdict(p) for p in duplicates],
+            "collinear_overlaps": [asdict(p) for p in overlaps],
+            "near_miss_joins": [asdict(m) for m in near_misses],
+            "issue_count": len(duplicates) + len(overlaps) + len(near_misses),
+        }
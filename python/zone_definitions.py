@@ -13,7 +13,9 @@ Design Principle:
     - Daylight priority decreases with privacy level
 """
 
-from typing import Dict, List, Optional, Set
+import re
+import sys
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from enum import IntEnum
 
@@ -38,29 +40,54 @@ class Zone:
     can_transition_to: List[ZoneType] = field(default_factory=list)  # Adjacent zones allowed
 
 
+# Trailing room numbers ("Private Office 2" -> "private office")
+_TRAILING_NUMBER = re.compile(r'\s*\d+$')
+
+# Bound on memoized room-name lookups per building type
+ZONE_CACHE_SIZE = 4096
+
+
 @dataclass
 class BuildingZones:
-    """Complete zone configuration for a building type."""
+    """
+    Complete zone configuration for a building type.
+
+    Room names resolved through get_zone() are memoized, so room_zone_map
+    must not be mutated after construction.
+    """
     building_type: str
     zones: Dict[ZoneType, Zone] = field(default_factory=dict)
     room_zone_map: Dict[str, ZoneType] = field(default_factory=dict)
+    _keys: List[Tuple[str, ZoneType]] = field(init=False, repr=False, compare=False)
+    _resolved: Dict[str, Optional[ZoneType]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.room_zone_map = {sys.intern(k): v for k, v in self.room_zone_map.items()}
+        self._keys = list(self.room_zone_map.items())
+        self._resolved = {}
 
     def get_zone(self, room_name: str) -> Optional[ZoneType]:
         """Get the zone type for a room name."""
-        # Normalize name (remove numbers, lowercase)
-        import re
-        normalized = re.sub(r'\s*\d+$', '', room_name.lower().strip())
-
-        # Direct lookup
-        if normalized in self.room_zone_map:
-            return self.room_zone_map[normalized]
+        try:
+            return self._resolved[room_name]
+        except KeyError:
+            pass
 
-        # Partial match
-        for key, zone in self.room_zone_map.items():
-            if key in normalized or normalized in key:
-                return zone
-
-        return None
+        # Normalize name (remove numbers, lowercase)
+        normalized = _TRAILING_NUMBER.sub('', room_name.lower().strip())
+
+        # Direct lookup, then partial match
+        zone = self.room_zone_map.get(normalized)
+        if zone is None:
+            for key, candidate in self._keys:
+                if key in normalized or normalized in key:
+                    zone = candidate
+                    break
+
+        if len(self._resolved) >= ZONE_CACHE_SIZE:
+            self._resolved.clear()
+        self._resolved[room_name] = zone
+        return zone
 
     def get_rooms_in_zone(self, zone_type: ZoneType) -> List[str]:
         """Get all room types that belong to a zone."""
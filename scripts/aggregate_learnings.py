@@ -5,165 +5,264 @@ Aggregate Detail Library Extractions into Learning Summaries
 Runs after extract_all_details.ps1 to consolidate extracted data
 into structured knowledge files that Claude can reference.
 
-Usage: python3 aggregate_learnings.py
+Extraction files are streamed (read in parallel, folded into every aggregate
+in one pass, then dropped), so memory depends on the number of distinct
+components/notes rather than on the number of files. The running totals are
+saved to aggregate_state.json; the next run only reads files that are new
+since then. If a previously aggregated file changed or disappeared the
+totals cannot be corrected in place, so the run starts over.
+
+Usage: python3 aggregate_learnings.py [--rebuild]
 """
 
 import os
+import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from collections import defaultdict
+from collections import defaultdict, deque
 from datetime import datetime
 
 # Configuration
 EXTRACTIONS_DIR = Path("/mnt/d/RevitMCPBridge2026/knowledge/detail_library/extractions")
 OUTPUT_DIR = Path("/mnt/d/RevitMCPBridge2026/knowledge/detail_library")
+STATE_FILE = "aggregate_state.json"
+STATE_VERSION = 1
+EXAMPLE_FILES = 5      # Example files kept per component
+READ_WORKERS = 8
 
-def load_all_extractions():
-    """Load all extraction JSON files"""
-    extractions = []
+
+def list_extraction_files():
+    """(relative key, path, size, mtime_ns, category) for every extraction file."""
+    files = []
 
     if not EXTRACTIONS_DIR.exists():
         print(f"No extractions found at {EXTRACTIONS_DIR}")
         return []
 
-    for category_dir in EXTRACTIONS_DIR.iterdir():
+    for category_dir in sorted(EXTRACTIONS_DIR.iterdir()):
         if category_dir.is_dir():
-            for json_file in category_dir.glob("*.json"):
-                try:
-                    with open(json_file) as f:
-                        data = json.load(f)
-                        data['category'] = category_dir.name
-                        extractions.append(data)
-                except Exception as e:
-                    print(f"Error loading {json_file}: {e}")
-
-    return extractions
-
-
-def aggregate_detail_components(extractions):
-    """Aggregate all detail component families used"""
-    components = defaultdict(lambda: {"count": 0, "files": [], "categories": set()})
+            for json_file in sorted(category_dir.glob("*.json")):
+                st = json_file.stat()
+                key = f"{category_dir.name}/{json_file.name}"
+                files.append((key, json_file, st.st_size, st.st_mtime_ns, category_dir.name))
+
+    return files
+
+
+def _read_extraction(path):
+    try:
+        with open(path) as f:
+            return json.load(f), None
+    except Exception as e:
+        return None, e
+
+
+def stream_extractions(files, workers=READ_WORKERS):
+    """
+    Yield (file entry, data) in order, reading ahead on a thread pool.
+    At most workers * 2 parsed files are held at once.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        window = deque()
+        for entry in files:
+            window.append((entry, pool.submit(_read_extraction, entry[1])))
+            if len(window) >= workers * 2:
+                yield _finish(*window.popleft())
+        while window:
+            yield _finish(*window.popleft())
+
+
+def _finish(entry, future):
+    data, error = future.result()
+    if error is not None:
+        print(f"Error loading {entry[1]}: {error}")
+    return entry, data
+
+
+class LearningAggregator:
+    """Running totals for every learned aggregate, updated one extraction at a time."""
+
+    def __init__(self):
+        self.files = {}   # relative key -> [size, mtime_ns]
+        self.components = defaultdict(lambda: {"count": 0, "files": [], "categories": set()})
+        self.notes = defaultdict(lambda: {"count": 0, "categories": set()})
+        self.styles = defaultdict(lambda: {"count": 0, "categories": set()})
+        self.categories = defaultdict(lambda: {
+            "fileCount": 0,
+            "totalComponents": 0,
+            "totalTextNotes": 0,
+            "commonComponents": defaultdict(int),
+            "commonNotes": defaultdict(int)
+        })
+
+    # -------------------------------------------------------------------------
+    # Streaming update
+    # -------------------------------------------------------------------------
+
+    def add(self, ext, category):
+        """Fold one extraction into all aggregates."""
+        file_name = ext.get('file', '')
+        cat = self.categories[category]
+        cat["fileCount"] += 1
 
-    for ext in extractions:
-        category = ext.get('category', 'Unknown')
         for comp in ext.get('detailComponents', []):
             if isinstance(comp, dict):
                 name = comp.get('typeName') or comp.get('familyName', 'Unknown')
+                cat_name = comp.get('typeName', '')
             else:
-                name = str(comp)
-
-            components[name]["count"] += 1
-            components[name]["files"].append(ext.get('file', ''))
-            components[name]["categories"].add(category)
-
-    # Convert sets to lists for JSON
-    result = {}
-    for name, data in sorted(components.items(), key=lambda x: -x[1]["count"]):
-        result[name] = {
-            "usageCount": data["count"],
-            "categories": list(data["categories"]),
-            "exampleFiles": data["files"][:5]  # First 5 examples
-        }
-
-    return result
+                name = cat_name = str(comp)
 
+            entry = self.components[name]
+            entry["count"] += 1
+            entry["categories"].add(category)
+            if len(entry["files"]) < EXAMPLE_FILES and file_name not in entry["files"]:
+                entry["files"].append(file_name)
 
-def aggregate_text_notes(extractions):
-    """Aggregate all text notes/callouts used"""
-    notes = defaultdict(lambda: {"count": 0, "categories": set()})
+            if cat_name:
+                cat["commonComponents"][cat_name] += 1
+                cat["totalComponents"] += 1
 
-    for ext in extractions:
-        category = ext.get('category', 'Unknown')
         for note in ext.get('textNotes', []):
             if note and isinstance(note, str) and len(note) > 2:
                 # Normalize: uppercase, strip
                 normalized = note.strip().upper()
-                notes[normalized]["count"] += 1
-                notes[normalized]["categories"].add(category)
-
-    # Convert to list sorted by frequency
-    result = []
-    for note, data in sorted(notes.items(), key=lambda x: -x[1]["count"]):
-        if data["count"] >= 2:  # Only include notes used 2+ times
-            result.append({
-                "text": note,
-                "usageCount": data["count"],
-                "categories": list(data["categories"])
-            })
-
-    return result[:200]  # Top 200 notes
-
-
-def aggregate_line_styles(extractions):
-    """Aggregate line styles used"""
-    styles = defaultdict(lambda: {"count": 0, "categories": set()})
+                self.notes[normalized]["count"] += 1
+                self.notes[normalized]["categories"].add(category)
+            if note:
+                cat["commonNotes"][note] += 1
+                cat["totalTextNotes"] += 1
 
-    for ext in extractions:
-        category = ext.get('category', 'Unknown')
         for style in ext.get('lineStyles', []):
             if style:
-                styles[style]["count"] += 1
-                styles[style]["categories"].add(category)
-
-    result = {}
-    for style, data in sorted(styles.items(), key=lambda x: -x[1]["count"]):
-        result[style] = {
-            "usageCount": data["count"],
-            "categories": list(data["categories"])
+                self.styles[style]["count"] += 1
+                self.styles[style]["categories"].add(category)
+
+    def update(self, files, workers=READ_WORKERS):
+        """Read and fold in files not aggregated yet. Returns how many were added."""
+        pending = [f for f in files if f[0] not in self.files]
+        added = 0
+        for (key, path, size, mtime_ns, category), data in stream_extractions(pending, workers):
+            if data is None:
+                continue
+            self.add(data, category)
+            self.files[key] = [size, mtime_ns]
+            added += 1
+        return added
+
+    def is_stale(self, files):
+        """True if any aggregated file changed or was removed since it was read."""
+        current = {key: [size, mtime_ns] for key, _, size, mtime_ns, _ in files}
+        return any(current.get(key) != sig for key, sig in self.files.items())
+
+    # -------------------------------------------------------------------------
+    # Persistence (resume)
+    # -------------------------------------------------------------------------
+
+    def save_state(self, path):
+        state = {
+            "version": STATE_VERSION,
+            "saved_at": datetime.now().isoformat(),
+            "files": self.files,
+            "components": {n: {**d, "categories": sorted(d["categories"])}
+                           for n, d in self.components.items()},
+            "notes": {n: {**d, "categories": sorted(d["categories"])} for n, d in self.notes.items()},
+            "styles": {n: {**d, "categories": sorted(d["categories"])} for n, d in self.styles.items()},
+            "categories": self.categories,
         }
-
-    return result
-
-
-def aggregate_by_category(extractions):
-    """Summarize patterns per category"""
-    categories = defaultdict(lambda: {
-        "fileCount": 0,
-        "totalComponents": 0,
-        "totalTextNotes": 0,
-        "commonComponents": defaultdict(int),
-        "commonNotes": defaultdict(int)
-    })
-
-    for ext in extractions:
-        cat = ext.get('category', 'Unknown')
-        categories[cat]["fileCount"] += 1
-
-        for comp in ext.get('detailComponents', []):
-            name = comp.get('typeName', '') if isinstance(comp, dict) else str(comp)
-            if name:
-                categories[cat]["commonComponents"][name] += 1
-                categories[cat]["totalComponents"] += 1
-
-        for note in ext.get('textNotes', []):
-            if note:
-                categories[cat]["commonNotes"][note] += 1
-                categories[cat]["totalTextNotes"] += 1
-
-    # Convert to final format
-    result = {}
-    for cat, data in categories.items():
-        # Get top 10 components and notes for this category
-        top_components = sorted(data["commonComponents"].items(), key=lambda x: -x[1])[:10]
-        top_notes = sorted(data["commonNotes"].items(), key=lambda x: -x[1])[:10]
-
-        result[cat] = {
-            "fileCount": data["fileCount"],
-            "totalComponents": data["totalComponents"],
-            "totalTextNotes": data["totalTextNotes"],
-            "topComponents": [{"name": n, "count": c} for n, c in top_components],
-            "topNotes": [{"text": n, "count": c} for n, c in top_notes]
-        }
-
-    return result
-
-
-def generate_learning_summary(extractions, components, notes, styles, categories):
+        tmp_path = Path(str(path) + ".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load_state(cls, path):
+        """Aggregator restored from a saved state, or None if there is none usable."""
+        try:
+            with open(path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if state.get("version") != STATE_VERSION:
+            return None
+
+        agg = cls()
+        agg.files = state["files"]
+        for target, saved in ((agg.components, state["components"]),
+                              (agg.notes, state["notes"]),
+                              (agg.styles, state["styles"])):
+            for name, data in saved.items():
+                target[name].update({**data, "categories": set(data["categories"])})
+        for cat, data in state["categories"].items():
+            entry = agg.categories[cat]
+            for field in ("fileCount", "totalComponents", "totalTextNotes"):
+                entry[field] = data[field]
+            entry["commonComponents"].update(data["commonComponents"])
+            entry["commonNotes"].update(data["commonNotes"])
+        return agg
+
+    # -------------------------------------------------------------------------
+    # Final outputs
+    # -------------------------------------------------------------------------
+
+    def detail_components(self):
+        """All detail component families used"""
+        result = {}
+        for name, data in sorted(self.components.items(), key=lambda x: -x[1]["count"]):
+            result[name] = {
+                "usageCount": data["count"],
+                "categories": list(data["categories"]),
+                "exampleFiles": data["files"][:EXAMPLE_FILES]
+            }
+        return result
+
+    def text_notes(self):
+        """Text notes/callouts used 2+ times, most frequent first"""
+        result = []
+        for note, data in sorted(self.notes.items(), key=lambda x: -x[1]["count"]):
+            if data["count"] >= 2:  # Only include notes used 2+ times
+                result.append({
+                    "text": note,
+                    "usageCount": data["count"],
+                    "categories": list(data["categories"])
+                })
+
+        return result[:200]  # Top 200 notes
+
+    def line_styles(self):
+        """Line styles used"""
+        result = {}
+        for style, data in sorted(self.styles.items(), key=lambda x: -x[1]["count"]):
+            result[style] = {
+                "usageCount": data["count"],
+                "categories": list(data["categories"])
+            }
+        return result
+
+    def by_category(self):
+        """Patterns per category"""
+        result = {}
+        for cat, data in self.categories.items():
+            # Get top 10 components and notes for this category
+            top_components = sorted(data["commonComponents"].items(), key=lambda x: -x[1])[:10]
+            top_notes = sorted(data["commonNotes"].items(), key=lambda x: -x[1])[:10]
+
+            result[cat] = {
+                "fileCount": data["fileCount"],
+                "totalComponents": data["totalComponents"],
+                "totalTextNotes": data["totalTextNotes"],
+                "topComponents": [{"name": n, "count": c} for n, c in top_components],
+                "topNotes": [{"text": n, "count": c} for n, c in top_notes]
+            }
+        return result
+
+
+def generate_learning_summary(files_processed, components, notes, styles, categories):
     """Generate human-readable summary"""
     summary = []
     summary.append("# Detail Library Learning Summary")
     summary.append(f"\nGenerated: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-    summary.append(f"Files Processed: {len(extractions)}")
+    summary.append(f"Files Processed: {files_processed}")
 
     summary.append("\n## Overall Statistics")
     summary.append(f"- Unique Detail Components: {len(components)}")
@@ -209,35 +308,48 @@ def main():
     print("AGGREGATING DETAIL LIBRARY LEARNINGS")
     print("=" * 60)
 
-    # Load all extractions
-    print("\n[1/6] Loading extractions...")
-    extractions = load_all_extractions()
-    print(f"      Loaded {len(extractions)} files")
+    state_path = OUTPUT_DIR / STATE_FILE
+    rebuild = "--rebuild" in sys.argv[1:]
 
-    if not extractions:
+    # Find extraction files and restore previous totals
+    print("\n[1/6] Listing extractions...")
+    files = list_extraction_files()
+    print(f"      Found {len(files)} files")
+
+    if not files:
         print("No extractions to process. Run extract_all_details.ps1 first.")
         return
 
-    # Aggregate data
-    print("\n[2/6] Aggregating detail components...")
-    components = aggregate_detail_components(extractions)
+    aggregator = None if rebuild else LearningAggregator.load_state(state_path)
+    if aggregator and aggregator.is_stale(files):
+        print("      Previously aggregated files changed or were removed - rebuilding")
+        aggregator = None
+    if aggregator:
+        print(f"      Resuming: {len(aggregator.files)} files already aggregated")
+    else:
+        aggregator = LearningAggregator()
+
+    # Stream new files through every aggregate in one pass
+    print("\n[2/6] Aggregating new extractions...")
+    added = aggregator.update(files)
+    print(f"      Added {added} files ({len(aggregator.files)} total)")
+    aggregator.save_state(state_path)
+
+    print("\n[3/6] Detail components...")
+    components = aggregator.detail_components()
     print(f"      Found {len(components)} unique components")
 
-    print("\n[3/6] Aggregating text notes...")
-    notes = aggregate_text_notes(extractions)
-    print(f"      Found {len(notes)} common callouts")
-
-    print("\n[4/6] Aggregating line styles...")
-    styles = aggregate_line_styles(extractions)
-    print(f"      Found {len(styles)} line styles")
+    print("\n[4/6] Text notes and line styles...")
+    notes = aggregator.text_notes()
+    styles = aggregator.line_styles()
+    print(f"      Found {len(notes)} common callouts, {len(styles)} line styles")
 
-    print("\n[5/6] Aggregating by category...")
-    categories = aggregate_by_category(extractions)
+    print("\n[5/6] By category...")
+    categories = aggregator.by_category()
     print(f"      Processed {len(categories)} categories")
 
     # Save aggregated data
     print("\n[6/6] Saving aggregated data...")
-
     # Components
     with open(OUTPUT_DIR / "learned_components.json", 'w') as f:
         json.dump(components, f, indent=2)
@@ -259,7 +371,7 @@ def main():
     print(f"      Saved: learned_by_category.json")
 
     # Human-readable summary
-    summary = generate_learning_summary(extractions, components, notes, styles, categories)
+    summary = generate_learning_summary(len(aggregator.files), components, notes, styles, categories)
     with open(OUTPUT_DIR / "learning_summary.md", 'w') as f:
         f.write(summary)
     print(f"      Saved: learning_summary.md")
@@ -274,6 +386,7 @@ def main():
     print("  - learned_line_styles.json   (line weights/styles)")
     print("  - learned_by_category.json   (patterns per category)")
     print("  - learning_summary.md        (human-readable report)")
+    print(f"  - {STATE_FILE:<27}(running totals for the next run)")
 
 
 if __name__ == "__main__":
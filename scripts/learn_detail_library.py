@@ -6,7 +6,8 @@ Automatically catalogs and learns from the Revit Detail Library.
 Creates a structured knowledge base that Claude can reference.
 
 Usage:
-  python learn_detail_library.py catalog    # Catalog all files
+  python learn_detail_library.py catalog    # Catalog new/changed files
+  python learn_detail_library.py catalog --full   # Re-process every file
   python learn_detail_library.py analyze    # Analyze naming patterns
   python learn_detail_library.py extract    # Extract via MCP (needs Revit open)
   python learn_detail_library.py report     # Generate summary report
@@ -17,6 +18,8 @@ import sys
 import json
 import socket
 import re
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
@@ -38,13 +41,148 @@ MCP_PIPE_NAME = r"\\.\pipe\RevitMCPBridge2026"
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# =============================================================================
+# INCREMENTAL CATALOG INDEX
+# =============================================================================
+
+CATALOG_INDEX_NAME = "library_catalog.db"
+SCAN_WORKERS = 16
+
+# Suffix -> catalog kind
+REVIT_KINDS = {".rfa": "family", ".rvt": "project"}
+
+
+def _scan_directory(path: str):
+    """One directory level: (revit files as (path, kind, size, mtime_ns), subdirectories)."""
+    files, subdirs = [], []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                    kind = REVIT_KINDS.get(os.path.splitext(entry.name)[1].lower())
+                    if kind:
+                        st = entry.stat()  # cached by scandir on Windows
+                        files.append((entry.path, kind, st.st_size, st.st_mtime_ns))
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return files, subdirs
+
+
+def scan_library(root: Path, workers: int = SCAN_WORKERS) -> Dict[str, tuple]:
+    """
+    Walk the library with a thread pool (one task per directory).
+
+    Returns {relative path: (kind, size, mtime_ns)}. Directory listing is I/O
+    bound, so threads overlap the latency of network and WSL-mounted drives.
+    """
+    root_str = str(root)
+    found: Dict[str, tuple] = {}
+    if not root.exists():
+        return found
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(_scan_directory, root_str)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                for path, kind, size, mtime_ns in files:
+                    found[os.path.relpath(path, root_str)] = (kind, size, mtime_ns)
+                pending.update(pool.submit(_scan_directory, d) for d in subdirs)
+    return found
+
+
+class CatalogIndex:
+    """SQLite store of catalogued files keyed by relative path."""
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS files (
+        rel_path TEXT PRIMARY KEY,
+        kind TEXT NOT NULL,
+        name TEXT NOT NULL,
+        category TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        mtime_ns INTEGER NOT NULL,
+        patterns_json TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_files_category ON files(category);
+    CREATE INDEX IF NOT EXISTS idx_files_kind ON files(kind);
+    """
+
+    def __init__(self, db_path: Path):
+        self.conn = sqlite3.connect(str(db_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(self.SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.conn.close()
+
+    def update(self, scanned: Dict[str, tuple], describe, full: bool = False) -> Dict[str, int]:
+        """
+        Bring the index in line with a scan. describe(rel_path, kind) is only
+        called for new or changed files.
+        """
+        known = {
+            rel_path: (size, mtime_ns)
+            for rel_path, size, mtime_ns in self.conn.execute(
+                "SELECT rel_path, size, mtime_ns FROM files")
+        }
+
+        upserts = []
+        added = changed = 0
+        for rel_path, (kind, size, mtime_ns) in scanned.items():
+            previous = known.get(rel_path)
+            if previous == (size, mtime_ns) and not full:
+                continue
+            if previous is None:
+                added += 1
+            else:
+                changed += 1
+            info = describe(rel_path, kind)
+            patterns = info.get("patterns")
+            upserts.append((rel_path, kind, info["name"], info["category"], size, mtime_ns,
+                            json.dumps(patterns) if patterns is not None else None))
+
+        removed = [(p,) for p in known if p not in scanned]
+
+        with self.conn:
+            self.conn.executemany("DELETE FROM files WHERE rel_path = ?", removed)
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)", upserts)
+
+        return {
+            "added": added,
+            "changed": changed,
+            "removed": len(removed),
+            "unchanged": len(scanned) - added - changed,
+        }
+
+    def rows(self):
+        """(rel_path, kind, name, category, size, mtime_ns, patterns) in path order."""
+        for rel_path, kind, name, category, size, mtime_ns, patterns_json in self.conn.execute(
+                "SELECT * FROM files ORDER BY rel_path"):
+            yield (rel_path, kind, name, category, size, mtime_ns,
+                   json.loads(patterns_json) if patterns_json else None)
+
+
 class DetailLibraryLearner:
     """Learns from Revit Detail Library files"""
 
-    def __init__(self):
+    def __init__(self, library_root: Path = LIBRARY_ROOT, output_dir: Path = OUTPUT_DIR):
+        self.library_root = Path(library_root)
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
         self.catalog = {
             "generated_at": datetime.now().isoformat(),
-            "library_root": str(LIBRARY_ROOT),
+            "library_root": str(self.library_root),
             "families": {},      # .rfa files
             "projects": {},      # .rvt files
             "patterns": {},      # Naming patterns discovered
@@ -52,53 +190,31 @@ class DetailLibraryLearner:
             "lessons": []        # Extracted lessons
         }
 
-    def catalog_files(self) -> Dict[str, Any]:
-        """Scan all Revit files and build catalog"""
+    def catalog_files(self, full: bool = False) -> Dict[str, Any]:
+        """
+        Scan all Revit files and build catalog.
+
+        Incremental: the catalog index remembers (size, mtime) per file, so
+        only new or changed files are re-processed and removed files are
+        dropped. Pass full=True to re-process everything.
+        """
         print("=" * 60)
         print("CATALOGING REVIT DETAIL LIBRARY")
         print("=" * 60)
 
-        # Scan for .rfa files
-        print("\n[1/4] Scanning for family files (.rfa)...")
-        rfa_files = list(LIBRARY_ROOT.rglob("*.rfa"))
-        print(f"      Found: {len(rfa_files)} families")
-
-        for f in rfa_files:
-            rel_path = f.relative_to(LIBRARY_ROOT)
-            category = self._get_category(f)
-
-            self.catalog["families"][str(rel_path)] = {
-                "name": f.stem,
-                "category": category,
-                "size_kb": f.stat().st_size / 1024,
-                "modified": datetime.fromtimestamp(f.stat().st_mtime).isoformat(),
-                "patterns": self._extract_naming_patterns(f.stem)
-            }
-
-            # Track category stats
-            if category not in self.catalog["categories"]:
-                self.catalog["categories"][category] = {"families": 0, "projects": 0}
-            self.catalog["categories"][category]["families"] += 1
-
-        # Scan for .rvt files
-        print("\n[2/4] Scanning for project files (.rvt)...")
-        rvt_files = list(LIBRARY_ROOT.rglob("*.rvt"))
-        print(f"      Found: {len(rvt_files)} projects")
-
-        for f in rvt_files:
-            rel_path = f.relative_to(LIBRARY_ROOT)
-            category = self._get_category(f)
-
-            self.catalog["projects"][str(rel_path)] = {
-                "name": f.stem,
-                "category": category,
-                "size_mb": f.stat().st_size / (1024 * 1024),
-                "modified": datetime.fromtimestamp(f.stat().st_mtime).isoformat()
-            }
-
-            if category not in self.catalog["categories"]:
-                self.catalog["categories"][category] = {"families": 0, "projects": 0}
-            self.catalog["categories"][category]["projects"] += 1
+        # Scan the tree in parallel
+        print("\n[1/4] Scanning library for .rfa / .rvt files...")
+        scanned = scan_library(self.library_root)
+        families = sum(1 for kind, _, _ in scanned.values() if kind == "family")
+        print(f"      Found: {families} families, {len(scanned) - families} projects")
+
+        # Diff against the index and process only what changed
+        print("\n[2/4] Updating catalog index...")
+        with CatalogIndex(self.output_dir / CATALOG_INDEX_NAME) as index:
+            changes = index.update(scanned, self._describe, full=full)
+            print(f"      New: {changes['added']}  Changed: {changes['changed']}  "
+                  f"Removed: {changes['removed']}  Unchanged: {changes['unchanged']}")
+            self._load_from_index(index)
 
         # Analyze patterns
         print("\n[3/4] Analyzing naming patterns...")
@@ -106,16 +222,58 @@ class DetailLibraryLearner:
 
         # Save catalog
         print("\n[4/4] Saving catalog...")
-        catalog_path = OUTPUT_DIR / "library_catalog.json"
+        catalog_path = self.output_dir / "library_catalog.json"
+        if catalog_path.exists() and not (changes["added"] or changes["changed"] or changes["removed"]):
+            print(f"      Unchanged: {catalog_path}")
+            return self.catalog
         with open(catalog_path, 'w') as f:
             json.dump(self.catalog, f, indent=2)
         print(f"      Saved to: {catalog_path}")
 
         return self.catalog
 
+    def _describe(self, rel_path: str, kind: str) -> Dict[str, Any]:
+        """Per-file catalog fields derived from the path (no I/O)."""
+        path = self.library_root / rel_path
+        description = {"name": path.stem, "category": self._get_category(path)}
+        if kind == "family":
+            description["patterns"] = self._extract_naming_patterns(path.stem)
+        return description
+
+    def _load_from_index(self, index: "CatalogIndex"):
+        """Rebuild the in-memory catalog (files + category stats) from the index."""
+        families, projects = {}, {}
+        categories: Dict[str, Dict[str, int]] = {}
+
+        for rel_path, kind, name, category, size, mtime_ns, patterns in index.rows():
+            # Same float os.stat() reports as st_mtime
+            modified = datetime.fromtimestamp(mtime_ns // 10**9 + (mtime_ns % 10**9) * 1e-9).isoformat()
+            stats = categories.setdefault(category, {"families": 0, "projects": 0})
+            if kind == "family":
+                families[rel_path] = {
+                    "name": name,
+                    "category": category,
+                    "size_kb": size / 1024,
+                    "modified": modified,
+                    "patterns": patterns,
+                }
+                stats["families"] += 1
+            else:
+                projects[rel_path] = {
+                    "name": name,
+                    "category": category,
+                    "size_mb": size / (1024 * 1024),
+                    "modified": modified,
+                }
+                stats["projects"] += 1
+
+        self.catalog["families"] = families
+        self.catalog["projects"] = projects
+        self.catalog["categories"] = categories
+
     def _get_category(self, path: Path) -> str:
         """Extract category from file path"""
-        parts = path.relative_to(LIBRARY_ROOT).parts
+        parts = path.relative_to(self.library_root).parts
 
         if len(parts) >= 3 and parts[0] == "Master Library" and parts[1] == "Families":
             return parts[2]  # The folder under Families
@@ -217,7 +375,7 @@ class DetailLibraryLearner:
         print("=" * 60)
 
         detail_items = {}
-        detail_path = LIBRARY_ROOT / "Master Library" / "Families" / "Detail Items"
+        detail_path = self.library_root / "Master Library" / "Families" / "Detail Items"
 
         if not detail_path.exists():
             print("Detail Items folder not found!")
@@ -254,7 +412,7 @@ class DetailLibraryLearner:
         }
 
         # Save analysis
-        analysis_path = OUTPUT_DIR / "detail_items_analysis.json"
+        analysis_path = self.output_dir / "detail_items_analysis.json"
         with open(analysis_path, 'w') as f:
             json.dump(detail_items, f, indent=2)
         print(f"Saved analysis to: {analysis_path}")
@@ -274,7 +432,7 @@ class DetailLibraryLearner:
                        if "Detail Items" in p and ".0001" not in p and ".0002" not in p]
         for p in detail_items[:20]:  # Top 20
             queue.append({
-                "path": str(LIBRARY_ROOT / p),
+                "path": str(self.library_root / p),
                 "priority": 1,
                 "reason": "Detail Items - core for CD production",
                 "category": "Detail Items"
@@ -285,7 +443,7 @@ class DetailLibraryLearner:
                    if "Profile" in p and ".0001" not in p]
         for p in profiles[:10]:
             queue.append({
-                "path": str(LIBRARY_ROOT / p),
+                "path": str(self.library_root / p),
                 "priority": 2,
                 "reason": "Profiles - needed for system families",
                 "category": "Profiles"
@@ -296,14 +454,14 @@ class DetailLibraryLearner:
                       if any(x in p for x in ["Tag", "Mark", "Head"]) and ".0001" not in p]
         for p in annotations[:10]:
             queue.append({
-                "path": str(LIBRARY_ROOT / p),
+                "path": str(self.library_root / p),
                 "priority": 3,
                 "reason": "Annotations - documentation standards",
                 "category": "Annotations"
             })
 
         # Save queue
-        queue_path = OUTPUT_DIR / "learning_queue.json"
+        queue_path = self.output_dir / "learning_queue.json"
         with open(queue_path, 'w') as f:
             json.dump(queue, f, indent=2)
         print(f"Generated queue with {len(queue)} priority files")
@@ -318,7 +476,7 @@ class DetailLibraryLearner:
         print("=" * 60)
 
         # Load existing catalog if available
-        catalog_path = OUTPUT_DIR / "library_catalog.json"
+        catalog_path = self.output_dir / "library_catalog.json"
         if catalog_path.exists():
             with open(catalog_path) as f:
                 self.catalog = json.load(f)
@@ -326,7 +484,7 @@ class DetailLibraryLearner:
         report = []
         report.append("# Revit Detail Library Analysis Report")
         report.append(f"\nGenerated: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-        report.append(f"Library Root: {LIBRARY_ROOT}")
+        report.append(f"Library Root: {self.library_root}")
 
         report.append("\n## Summary Statistics")
         report.append(f"- Total Families (.rfa): {len(self.catalog.get('families', {}))}")
@@ -369,7 +527,7 @@ class DetailLibraryLearner:
         report_text = "\n".join(report)
 
         # Save report
-        report_path = OUTPUT_DIR / "library_report.md"
+        report_path = self.output_dir / "library_report.md"
         with open(report_path, 'w') as f:
             f.write(report_text)
         print(f"Saved report to: {report_path}")
@@ -414,7 +572,7 @@ def main():
     command = sys.argv[1].lower()
 
     if command == "catalog":
-        learner.catalog_files()
+        learner.catalog_files(full="--full" in sys.argv[2:])
     elif command == "analyze":
         learner.catalog_files()
         learner.analyze_detail_items()
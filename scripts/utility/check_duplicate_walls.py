@@ -1,10 +1,13 @@
 """
 Check for duplicate/overlapping walls that may prevent door cuts
 """
+import os
+import sys
 import win32file
 import json
-from collections import defaultdict
-import math
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'python'))
+from wall_geometry import WallIndex
 
 pipe = win32file.CreateFile(
     r'\\.\pipe\RevitMCPBridge2026',
@@ -52,40 +55,36 @@ for wall in walls:
             "length": info.get("length", 0)
         })
 
-# Check for overlapping walls (same start/end or very close)
+# One spatial index serves every check below
+index = WallIndex.from_dicts(wall_data)
+by_id = {w["id"]: w for w in wall_data}
+
+def describe(wall_id):
+    w = by_id[wall_id]
+    return f"Wall {wall_id}: {w['start']} to {w['end']} (L={w['length']:.1f})"
+
+report = index.analyze()
+
 print("\n[1] CHECKING FOR OVERLAPPING WALLS:")
 
-def walls_overlap(w1, w2):
-    """Check if two walls overlap or are very close"""
-    # Check if endpoints match
-    if (w1["start"] == w2["start"] and w1["end"] == w2["end"]) or \
-       (w1["start"] == w2["end"] and w1["end"] == w2["start"]):
-        return True
-
-    # Check if they're parallel and close
-    def point_dist(p1, p2):
-        return math.sqrt((p1[0]-p2[0])**2 + (p1[1]-p2[1])**2)
-
-    # Check if any endpoints are very close
-    if point_dist(w1["start"], w2["start"]) < 0.5 and point_dist(w1["end"], w2["end"]) < 0.5:
-        return True
-    if point_dist(w1["start"], w2["end"]) < 0.5 and point_dist(w1["end"], w2["start"]) < 0.5:
-        return True
-
-    return False
-
-overlaps_found = False
-for i, w1 in enumerate(wall_data):
-    for w2 in wall_data[i+1:]:
-        if walls_overlap(w1, w2):
-            overlaps_found = True
-            print(f"\n  Overlap found:")
-            print(f"    Wall {w1['id']}: {w1['start']} to {w1['end']} (L={w1['length']:.1f})")
-            print(f"    Wall {w2['id']}: {w2['start']} to {w2['end']} (L={w2['length']:.1f})")
-
-if not overlaps_found:
+for pair in report["duplicates"]:
+    print(f"\n  Overlap found:")
+    print(f"    {describe(pair['a'])}")
+    print(f"    {describe(pair['b'])}")
+
+if not report["duplicates"]:
     print("  No overlapping walls found")
 
+if report["collinear_overlaps"]:
+    print(f"\n  Collinear overlaps ({len(report['collinear_overlaps'])}):")
+    for pair in report["collinear_overlaps"]:
+        print(f"    Walls {pair['a']} and {pair['b']} share {pair['overlap']:.2f} ft")
+
+if report["near_miss_joins"]:
+    print(f"\n  Near-miss joins ({len(report['near_miss_joins'])}):")
+    for miss in report["near_miss_joins"]:
+        print(f"    Wall {miss['wall']} {miss['end']} stops {miss['gap']:.2f} ft from wall {miss['other']}")
+
 # Check walls near problem door locations
 print("\n\n[2] WALLS NEAR PROBLEM DOOR LOCATIONS:")
 
@@ -100,29 +99,9 @@ problem_locs = [
 
 for loc, name in problem_locs:
     print(f"\n  {name} at {loc}:")
-    # Find walls that pass near this point
-    nearby_walls = []
-    for w in wall_data:
-        # Simple check: is point close to line between start and end?
-        x, y = loc
-        x1, y1 = w["start"]
-        x2, y2 = w["end"]
-
-        # Distance from point to line segment
-        dx = x2 - x1
-        dy = y2 - y1
-        len_sq = dx*dx + dy*dy
-        if len_sq > 0:
-            t = max(0, min(1, ((x-x1)*dx + (y-y1)*dy) / len_sq))
-            cx = x1 + t * dx
-            cy = y1 + t * dy
-            dist = math.sqrt((x-cx)**2 + (y-cy)**2)
-            if dist < 2.0:  # Within 2 feet of wall
-                nearby_walls.append((w["id"], dist, w["length"]))
-
-    nearby_walls.sort(key=lambda x: x[1])
-    for wall_id, dist, length in nearby_walls[:3]:
-        print(f"    Wall {wall_id}: dist={dist:.2f} ft, length={length:.1f} ft")
+    # Walls within 2 feet of the door, closest first
+    for wall, dist in index.nearest(loc, 2.0, limit=3):
+        print(f"    Wall {wall.id}: dist={dist:.2f} ft, length={by_id[wall.id]['length']:.1f} ft")
 
 win32file.CloseHandle(pipe)
 
@@ -2,25 +2,46 @@
 """
 Model Transfer Script - Transfer model data from 512 Clematis to MFI Project
 This script extracts data from source and creates elements in target
+
+Extraction is streamed into a chunked journal (transfer_data/journal/) and
+creation runs chunk by chunk through batchExecute. Every created element is
+recorded in an id map, so an interrupted run picks up where it stopped:
+
+    python model_transfer.py extract            # resumes a partial extraction
+    python model_transfer.py create             # skips chunks/elements already created
+    python model_transfer.py status             # journal and id map summary
+    python model_transfer.py extract --restart  # discard the journal and start over
+
+A batch whose reply is lost (pipe timeout, transport error) may already have
+committed, so its chunk is marked indeterminate and left alone. Check the
+target model, delete anything half-created, then retry those chunks with:
+
+    python model_transfer.py create --retry-indeterminate
 """
 
 import json
 import time
 import sys
 import os
+import shutil
 
 try:
     import win32pipe
     import win32file
     import pywintypes
 except ImportError:
-    print("ERROR: pywin32 not installed. Install with: pip install pywin32")
-    sys.exit(1)
+    win32file = None
 
 PIPE_NAME = r'\\.\pipe\RevitMCPBridge2026'
 
+TRANSFER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'transfer_data')
+JOURNAL_DIR = os.path.join(TRANSFER_DIR, 'journal')
+CHUNK_SIZE = 50  # records per journal chunk / batchExecute envelope
+
 def send_request(method, parameters=None):
     """Send a request to the MCP server and return the response"""
+    if win32file is None:
+        return {"success": False, "error": "pywin32 not installed"}
     try:
         handle = win32file.CreateFile(
             PIPE_NAME,
@@ -41,163 +62,421 @@ def send_request(method, parameters=None):
     except Exception as e:
         return {"success": False, "error": str(e)}
 
-def save_json(data, filename):
-    """Save data to JSON file"""
-    filepath = os.path.join(os.path.dirname(__file__), 'transfer_data', filename)
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
-    print(f"  Saved: {filepath}")
-    return filepath
-
-def load_json(filename):
-    """Load data from JSON file"""
-    filepath = os.path.join(os.path.dirname(__file__), 'transfer_data', filename)
-    with open(filepath, 'r') as f:
-        return json.load(f)
-
 def print_header(text):
     print("\n" + "=" * 80)
     print(f"  {text}")
     print("=" * 80)
 
+def unwrap(response):
+    """Payload of a response, tolerating result-wrapped responses."""
+    inner = response.get("result")
+    return inner if isinstance(inner, dict) else response
+
+def format_rate(count, seconds):
+    rate = count / seconds if seconds > 0 else 0.0
+    return f"{count} in {seconds:.1f}s ({rate:.1f} elements/s)"
+
+# ============================================================================
+# JOURNAL
+# ============================================================================
+class TransferJournal:
+    """
+    On-disk transfer state.
+
+    - <kind>.NNNN.jsonl   extracted records, one chunk per file
+    - id_map.jsonl        append-only source id -> target id mappings
+    - checkpoint.json     finished extraction steps, created chunks and
+                          chunks whose batch reply was lost
+
+    Chunks and mappings are flushed and fsynced as they are written and the
+    checkpoint is replaced atomically, so a crash loses at most the chunk that
+    was in flight - and the id map makes replaying that chunk harmless.
+    """
+
+    def __init__(self, root=JOURNAL_DIR, chunk_size=CHUNK_SIZE):
+        self.root = root
+        self.chunk_size = chunk_size
+        os.makedirs(root, exist_ok=True)
+        self.checkpoint = self._load_checkpoint()
+        self.id_map = self._load_id_map()
+
+    # -- checkpoint ----------------------------------------------------------
+    def _load_checkpoint(self):
+        path = os.path.join(self.root, 'checkpoint.json')
+        if os.path.exists(path):
+            with open(path) as f:
+                return json.load(f)
+        return {"source_project": None, "steps_done": [], "chunks": {},
+                "extraction_complete": False, "chunks_done": []}
+
+    def save_checkpoint(self):
+        path = os.path.join(self.root, 'checkpoint.json')
+        tmp = path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(self.checkpoint, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    def step_done(self, step):
+        return step in self.checkpoint["steps_done"]
+
+    def mark_step(self, step):
+        self.checkpoint["steps_done"].append(step)
+        self.save_checkpoint()
+
+    def chunk_done(self, name):
+        return name in self.checkpoint["chunks_done"]
+
+    def mark_chunk(self, name):
+        self.checkpoint["chunks_done"].append(name)
+        self.save_checkpoint()
+
+    def chunk_indeterminate(self, name):
+        return name in self.checkpoint.get("chunks_indeterminate", [])
+
+    def mark_indeterminate(self, name):
+        self.checkpoint.setdefault("chunks_indeterminate", []).append(name)
+        self.save_checkpoint()
+
+    def clear_indeterminate(self):
+        self.checkpoint["chunks_indeterminate"] = []
+        self.save_checkpoint()
+
+    # -- records -------------------------------------------------------------
+    def append_records(self, kind, records):
+        """Append records for a kind as one or more chunk files."""
+        chunks = self.checkpoint["chunks"].setdefault(kind, [])
+        for start in range(0, len(records), self.chunk_size):
+            name = f"{kind}.{len(chunks):04d}.jsonl"
+            path = os.path.join(self.root, name)
+            with open(path, 'w') as f:
+                for record in records[start:start + self.chunk_size]:
+                    f.write(json.dumps(record) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            chunks.append(name)
+        return len(records)
+
+    def chunks(self, kind):
+        return list(self.checkpoint["chunks"].get(kind, []))
+
+    def read_chunk(self, name):
+        with open(os.path.join(self.root, name)) as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def records(self, kind):
+        for name in self.chunks(kind):
+            yield from self.read_chunk(name)
+
+    def count(self, kind):
+        return sum(1 for _ in self.records(kind))
+
+    # -- id map --------------------------------------------------------------
+    def _load_id_map(self):
+        id_map = {}
+        path = os.path.join(self.root, 'id_map.jsonl')
+        if not os.path.exists(path):
+            return id_map
+        with open(path, 'rb+') as f:
+            data = f.read()
+            if data and not data.endswith(b"\n"):
+                # Torn final line from an interrupted write: drop it so the
+                # next append starts on a fresh line
+                data = data[:data.rfind(b"\n") + 1]
+                f.seek(0)
+                f.truncate(len(data))
+        for line in data.decode('utf-8').splitlines():
+            entry = json.loads(line)
+            id_map.setdefault(entry["kind"], {})[str(entry["source"])] = entry["target"]
+        return id_map
+
+    def target_id(self, kind, source_id):
+        return self.id_map.get(kind, {}).get(str(source_id))
+
+    def record_mappings(self, kind, pairs):
+        if not pairs:
+            return
+        with open(os.path.join(self.root, 'id_map.jsonl'), 'a') as f:
+            for source_id, target_id in pairs:
+                f.write(json.dumps({"kind": kind, "source": source_id, "target": target_id}) + "\n")
+                self.id_map.setdefault(kind, {})[str(source_id)] = target_id
+            f.flush()
+            os.fsync(f.fileno())
+
+    @staticmethod
+    def reset(root=JOURNAL_DIR):
+        if os.path.isdir(root):
+            shutil.rmtree(root)
+
+# ============================================================================
+# ELEMENT KINDS
+# ============================================================================
+def _point(p):
+    """Extracted points are {x, y, z}; create methods take [x, y, z]."""
+    if isinstance(p, dict):
+        return [p.get("x", 0), p.get("y", 0), p.get("z", 0)]
+    return p
+
+def _target_level(journal, record):
+    """Target level id for a record, by mapped source id or by level name."""
+    if record.get("levelId") is not None:
+        mapped = journal.target_id("levels", record["levelId"])
+        if mapped is not None:
+            return mapped
+    name = record.get("baseLevel") or record.get("level")
+    if name:
+        return journal.target_id("level_names", name)
+    return None
+
+def level_params(journal, lvl):
+    return {"name": lvl.get("name"), "elevation": lvl.get("elevation")}
+
+def wall_params(journal, wall):
+    level_id = _target_level(journal, wall)
+    if level_id is None or not wall.get("startPoint") or not wall.get("endPoint"):
+        return None
+    params = {
+        "startPoint": _point(wall.get("startPoint")),
+        "endPoint": _point(wall.get("endPoint")),
+        "levelId": level_id,
+        "height": wall.get("height") or 10,
+    }
+    # Type ids differ between documents; names survive Transfer Project Standards
+    if wall.get("wallType"):
+        params["wallTypeName"] = wall["wallType"]
+    else:
+        params["wallTypeId"] = wall.get("wallTypeId")
+    return params
+
+def floor_params(journal, floor):
+    level_id = _target_level(journal, floor)
+    if level_id is None or not floor.get("boundaryPoints"):
+        return None  # getFloors does not return boundaries
+    return {"boundaryPoints": [_point(p) for p in floor["boundaryPoints"]], "levelId": level_id}
+
+def room_params(journal, room):
+    level_id = _target_level(journal, room)
+    if level_id is None or not room.get("location"):
+        return None  # getRooms does not return a placement point
+    return {"location": _point(room["location"]), "levelId": level_id,
+            "name": room.get("name"), "number": room.get("number")}
+
+# kind -> (create method, source id key, target id key, params builder); creation order
+CREATE_KINDS = [
+    ("levels", "createLevel", "levelId", "levelId", level_params),
+    ("walls", "createWall", "wallId", "wallId", wall_params),
+    ("floors", "createFloor", "floorId", "floorId", floor_params),
+    ("rooms", "createRoom", "roomId", "roomId", room_params),
+]
+
 # ============================================================================
 # PHASE 1: Extract from Source (512 Clematis)
 # ============================================================================
-def extract_source_data():
+def _extract_step(journal, step, kind, method, params, list_key, send):
+    """Run one extraction query and journal its records, unless already done."""
+    if journal.step_done(step):
+        return None
+    response = send(method, params)
+    if not response.get("success"):
+        print(f"  ERROR ({step}): {response.get('error')}")
+        return None
+    records = unwrap(response).get(list_key, [])
+    journal.append_records(kind, records)
+    journal.mark_step(step)
+    return records
+
+def extract_source_data(send=send_request, journal=None):
     """Extract all data from the source project (512 Clematis)"""
     print_header("PHASE 1: EXTRACTING DATA FROM SOURCE PROJECT")
+    journal = journal or TransferJournal()
+    started = time.perf_counter()
+    extracted = 0
+
+    if journal.checkpoint["extraction_complete"]:
+        print("\n  Extraction already complete (use --restart to extract again)")
+        return True
 
     # Get project info
     print("\n1. Getting project info...")
-    info = send_request("getProjectInfo", {})
+    info = send("getProjectInfo", {})
     if info.get("success"):
-        project_name = info.get("projectName", "Unknown")
+        project_name = unwrap(info).get("projectName", "Unknown")
         print(f"  Active Project: {project_name}")
         if "512" not in project_name.lower() and "clematis" not in project_name.lower():
             print("\n  WARNING: This doesn't look like 512 Clematis!")
             print("  Please make sure 512 Clematis is the active project in Revit.")
             return False
+        if journal.checkpoint["source_project"] not in (None, project_name):
+            print(f"\n  ERROR: Journal belongs to {journal.checkpoint['source_project']}.")
+            print("  Run with --restart to discard it.")
+            return False
+        journal.checkpoint["source_project"] = project_name
+        journal.save_checkpoint()
     else:
         print(f"  ERROR: {info.get('error')}")
         return False
 
     # Get levels
     print("\n2. Extracting levels...")
-    levels = send_request("getLevels", {})
-    if levels.get("success"):
-        level_list = levels.get("levels", [])
-        print(f"  Found {len(level_list)} levels")
-        save_json(level_list, "source_levels.json")
-        for lvl in level_list:
-            print(f"    - {lvl.get('name')}: {lvl.get('elevation')}'")
-    else:
-        print(f"  ERROR: {levels.get('error')}")
-
-    # Get wall types
-    print("\n3. Extracting wall types...")
-    wall_types = send_request("getWallTypes", {})
-    if wall_types.get("success"):
-        types = wall_types.get("wallTypes", [])
-        print(f"  Found {len(types)} wall types")
-        save_json(types, "source_wall_types.json")
-    else:
-        print(f"  ERROR: {wall_types.get('error')}")
-
-    # Get door types
-    print("\n4. Extracting door types...")
-    door_types = send_request("getDoorTypes", {})
-    if door_types.get("success"):
-        types = door_types.get("doorTypes", [])
-        print(f"  Found {len(types)} door types")
-        save_json(types, "source_door_types.json")
-    else:
-        print(f"  ERROR: {door_types.get('error')}")
-
-    # Get window types
-    print("\n5. Extracting window types...")
-    window_types = send_request("getWindowTypes", {})
-    if window_types.get("success"):
-        types = window_types.get("windowTypes", [])
-        print(f"  Found {len(types)} window types")
-        save_json(types, "source_window_types.json")
-    else:
-        print(f"  ERROR: {window_types.get('error')}")
-
-    # Get family types by category
-    print("\n6. Extracting family types by category...")
-    categories = [
-        ("Plumbing Fixtures", "plumbing_fixtures"),
-        ("Lighting Fixtures", "lighting_fixtures"),
-        ("Electrical Fixtures", "electrical_fixtures"),
-        ("Furniture", "furniture"),
-        ("Casework", "casework"),
-        ("Specialty Equipment", "specialty_equipment"),
-        ("Curtain Panels", "curtain_panels"),
-        ("Railings", "railings")
+    if _extract_step(journal, "levels", "levels", "getLevels", {}, "levels", send) is not None:
+        extracted += journal.count("levels")
+    level_list = list(journal.records("levels"))
+    print(f"  {len(level_list)} levels")
+
+    # Type catalogs (listed for Transfer Project Standards, not created)
+    print("\n3. Extracting type catalogs...")
+    catalogs = [
+        ("wall_types", "getWallTypes", {}, "wallTypes"),
+        ("door_types", "getDoorTypes", {}, "doorTypes"),
+        ("window_types", "getWindowTypes", {}, "windowTypes"),
+        ("plumbing_fixtures", "getFamilyTypesByCategory", {"category": "Plumbing Fixtures"}, "familyTypes"),
+        ("lighting_fixtures", "getFamilyTypesByCategory", {"category": "Lighting Fixtures"}, "familyTypes"),
+        ("electrical_fixtures", "getFamilyTypesByCategory", {"category": "Electrical Fixtures"}, "familyTypes"),
+        ("furniture", "getFamilyTypesByCategory", {"category": "Furniture"}, "familyTypes"),
+        ("casework", "getFamilyTypesByCategory", {"category": "Casework"}, "familyTypes"),
+        ("specialty_equipment", "getFamilyTypesByCategory", {"category": "Specialty Equipment"}, "familyTypes"),
+        ("curtain_panels", "getFamilyTypesByCategory", {"category": "Curtain Panels"}, "familyTypes"),
+        ("railings", "getFamilyTypesByCategory", {"category": "Railings"}, "familyTypes"),
     ]
-
-    for cat_name, file_prefix in categories:
-        types = send_request("getFamilyTypesByCategory", {"category": cat_name})
-        if types.get("success"):
-            type_list = types.get("familyTypes", [])
-            if type_list:
-                print(f"  {cat_name}: {len(type_list)} types")
-                save_json(type_list, f"source_{file_prefix}.json")
-        else:
-            print(f"  {cat_name}: Error - {types.get('error', 'Unknown')}")
-
-    # Get walls
-    print("\n7. Extracting walls...")
-    walls = send_request("getAllWalls", {})
-    if walls.get("success"):
-        wall_list = walls.get("walls", [])
-        print(f"  Found {len(wall_list)} walls")
-        save_json(wall_list, "source_walls.json")
-    else:
-        print(f"  ERROR: {walls.get('error')}")
-
-    # Get floors
-    print("\n8. Extracting floors...")
-    floors = send_request("getFloors", {})
-    if floors.get("success"):
-        floor_list = floors.get("floors", [])
-        print(f"  Found {len(floor_list)} floors")
-        save_json(floor_list, "source_floors.json")
-    else:
-        print(f"  Note: {floors.get('error')}")
-
-    # Get rooms
-    print("\n9. Extracting rooms...")
-    rooms = send_request("getRooms", {})
-    if rooms.get("success"):
-        room_list = rooms.get("rooms", [])
-        print(f"  Found {len(room_list)} rooms")
-        save_json(room_list, "source_rooms.json")
-    else:
-        print(f"  Note: {rooms.get('error')}")
-
+    for kind, method, params, list_key in catalogs:
+        records = _extract_step(journal, kind, kind, method, params, list_key, send)
+        if records is not None:
+            extracted += len(records)
+        print(f"  {kind}: {journal.count(kind)} types")
+
+    # Element lists: each query is journaled as soon as it returns, so a
+    # failure only repeats the query that was in flight
+    print("\n4. Extracting walls, floors and rooms...")
+    for kind, method in (("walls", "getWalls"), ("floors", "getFloors"), ("rooms", "getRooms")):
+        records = _extract_step(journal, kind, kind, method, {}, kind, send)
+        if records is not None:
+            extracted += len(records)
+        print(f"  {kind}: {journal.count(kind)}")
+
+    journal.checkpoint["extraction_complete"] = all(
+        journal.step_done(step) for step in ("levels", "walls", "floors", "rooms")
+    )
+    journal.save_checkpoint()
+
+    elapsed = time.perf_counter() - started
     print("\n" + "=" * 80)
-    print("  EXTRACTION COMPLETE!")
-    print("  Data saved to transfer_data/ folder")
+    print("  EXTRACTION COMPLETE!" if journal.checkpoint["extraction_complete"]
+          else "  EXTRACTION INCOMPLETE - run extract again to resume")
+    print(f"  Extracted {format_rate(extracted, elapsed)}")
+    print(f"  Journal: {journal.root}")
     print("=" * 80)
 
-    return True
+    return journal.checkpoint["extraction_complete"]
 
 # ============================================================================
 # PHASE 2: Create in Target (MFI Project)
 # ============================================================================
-def create_in_target():
+def _map_existing_levels(journal, send):
+    """Levels that already exist in the target (by name) are mapped, not re-created."""
+    response = send("getLevels", {})
+    if not response.get("success"):
+        return
+    by_name = {lvl.get("name"): lvl.get("levelId") for lvl in unwrap(response).get("levels", [])}
+    journal.record_mappings("level_names", [
+        (name, target) for name, target in by_name.items()
+        if journal.target_id("level_names", name) is None
+    ])
+    journal.record_mappings("levels", [
+        (lvl.get("levelId"), by_name[lvl.get("name")])
+        for lvl in journal.records("levels")
+        if lvl.get("name") in by_name and journal.target_id("levels", lvl.get("levelId")) is None
+    ])
+
+def _run_batch(method, param_list, send, batch_name):
+    """
+    Create a chunk in one batchExecute. Returns one result per operation, or
+    None if the outcome is unknown.
+
+    Only a server without batchExecute (METHOD_NOT_FOUND) falls back to single
+    requests. Any other reply without results - a timeout or transport error -
+    may have arrived after the batch committed, so re-sending could create
+    every element twice.
+    """
+    response = send("batchExecute", {
+        "batchName": batch_name,
+        "stopOnError": False,
+        "operations": [{"method": method, "params": p} for p in param_list]
+    })
+    results = unwrap(response).get("results")
+    if isinstance(results, list) and len(results) == len(param_list):
+        return [entry.get("result") if isinstance(entry.get("result"), dict)
+                else {"success": False, "error": entry.get("error", "No result")}
+                for entry in results]
+    if unwrap(response).get("errorCode") == "METHOD_NOT_FOUND":
+        return [send(method, p) for p in param_list]
+    return None
+
+def create_kind(journal, kind, method, source_key, target_key, build, send):
+    """Create every journaled record of a kind, chunk by chunk. Returns stats."""
+    stats = {"created": 0, "skipped": 0, "failed": 0, "already": 0, "indeterminate": 0}
+    for name in journal.chunks(kind):
+        if journal.chunk_done(name):
+            stats["already"] += len(journal.read_chunk(name))
+            continue
+        if journal.chunk_indeterminate(name):
+            stats["indeterminate"] += len(journal.read_chunk(name))
+            continue
+
+        pending, params = [], []
+        for record in journal.read_chunk(name):
+            source_id = record.get(source_key)
+            if journal.target_id(kind, source_id) is not None:
+                stats["already"] += 1
+                continue
+            p = build(journal, record)
+            if p is None:
+                stats["skipped"] += 1
+                continue
+            pending.append(record)
+            params.append(p)
+
+        mappings, failures = [], 0
+        results = _run_batch(method, params, send, f"transfer {name}") if params else []
+        if results is None:
+            journal.mark_indeterminate(name)
+            stats["indeterminate"] += len(pending)
+            continue
+        for record, result in zip(pending, results):
+            target_id = unwrap(result).get(target_key) if result.get("success") else None
+            if target_id is None:
+                failures += 1
+                continue
+            mappings.append((record.get(source_key), target_id))
+            if kind == "levels":
+                journal.record_mappings("level_names", [(record.get("name"), target_id)])
+        journal.record_mappings(kind, mappings)
+
+        stats["created"] += len(mappings)
+        stats["failed"] += failures
+        # Chunks with failures stay open; the next run retries only those records
+        if not failures:
+            journal.mark_chunk(name)
+    return stats
+
+def create_in_target(send=send_request, journal=None, confirm=True, retry_indeterminate=False):
     """Create elements in the target project (MFI Project)"""
     print_header("PHASE 2: CREATING IN TARGET PROJECT")
+    journal = journal or TransferJournal()
+    if retry_indeterminate:
+        journal.clear_indeterminate()
+
+    if not journal.chunks("levels"):
+        print("  ERROR: No extracted levels in the journal. Run extraction first.")
+        return False
 
     # Get project info
     print("\n1. Verifying target project...")
-    info = send_request("getProjectInfo", {})
+    info = send("getProjectInfo", {})
     if info.get("success"):
-        project_name = info.get("projectName", "Unknown")
+        project_name = unwrap(info).get("projectName", "Unknown")
         print(f"  Active Project: {project_name}")
-        if "mfi" not in project_name.lower() and "test" not in project_name.lower():
+        if confirm and "mfi" not in project_name.lower() and "test" not in project_name.lower():
             print("\n  WARNING: This doesn't look like the MFI test project!")
             print("  Please make sure MFI Project is the active project in Revit.")
             resp = input("  Continue anyway? (y/n): ")
@@ -207,88 +486,67 @@ def create_in_target():
         print(f"  ERROR: {info.get('error')}")
         return False
 
-    # Create levels
-    print("\n2. Creating levels...")
-    try:
-        source_levels = load_json("source_levels.json")
-        for lvl in source_levels:
-            result = send_request("createLevel", {
-                "name": lvl.get("name"),
-                "elevation": lvl.get("elevation")
-            })
-            if result.get("success"):
-                print(f"  Created: {lvl.get('name')} at {lvl.get('elevation')}'")
-            else:
-                print(f"  Note: {lvl.get('name')} - {result.get('error')}")
-            time.sleep(0.1)  # Small delay between operations
-    except FileNotFoundError:
-        print("  ERROR: source_levels.json not found. Run extraction first.")
+    _map_existing_levels(journal, send)
 
     # Load wall types (using transfer project standards or loading families)
-    print("\n3. Loading wall types...")
-    print("  Note: Wall types require Transfer Project Standards in Revit UI")
-    print("  or loading specific wall families.")
-
-    # Load families from source data
-    print("\n4. Loading family types...")
-    family_files = [
-        ("source_door_types.json", "Doors"),
-        ("source_window_types.json", "Windows"),
-        ("source_plumbing_fixtures.json", "Plumbing Fixtures"),
-        ("source_lighting_fixtures.json", "Lighting Fixtures"),
-        ("source_furniture.json", "Furniture"),
-        ("source_casework.json", "Casework")
-    ]
-
-    for filename, category in family_files:
-        try:
-            types = load_json(filename)
-            print(f"  {category}: {len(types)} types to transfer")
-            # Note: Actual loading requires family file paths or Transfer Project Standards
-        except FileNotFoundError:
-            pass
-
-    # Create walls from source data
-    print("\n5. Creating walls...")
-    try:
-        source_walls = load_json("source_walls.json")
-        created = 0
-        failed = 0
-
-        for i, wall in enumerate(source_walls[:20]):  # Limit to first 20 for testing
-            result = send_request("createWall", {
-                "startPoint": wall.get("startPoint"),
-                "endPoint": wall.get("endPoint"),
-                "levelId": wall.get("levelId"),
-                "height": wall.get("height", 10),
-                "wallTypeId": wall.get("wallTypeId")
-            })
-
-            if result.get("success"):
-                created += 1
-            else:
-                failed += 1
-
-            if (i + 1) % 5 == 0:
-                print(f"  Progress: {i + 1}/{len(source_walls[:20])} walls")
-            time.sleep(0.1)
-
-        print(f"  Created: {created} walls")
-        print(f"  Failed: {failed} walls")
-
-    except FileNotFoundError:
-        print("  ERROR: source_walls.json not found. Run extraction first.")
-
+    print("\n2. Type catalogs...")
+    print("  Note: Wall, door, window and fixture types require Transfer Project Standards")
+    print("  in the Revit UI or loading specific families.")
+    for kind in ("wall_types", "door_types", "window_types", "plumbing_fixtures",
+                 "lighting_fixtures", "furniture", "casework"):
+        count = journal.count(kind)
+        if count:
+            print(f"  {kind}: {count} types to transfer")
+
+    print("\n3. Creating elements...")
+    total_created = 0
+    total_failed = 0
+    total_indeterminate = 0
+    started = time.perf_counter()
+    for kind, method, source_key, target_key, build in CREATE_KINDS:
+        kind_started = time.perf_counter()
+        stats = create_kind(journal, kind, method, source_key, target_key, build, send)
+        elapsed = time.perf_counter() - kind_started
+        total_created += stats["created"]
+        total_failed += stats["failed"]
+        total_indeterminate += stats["indeterminate"]
+        print(f"  {kind}: created {format_rate(stats['created'], elapsed)}, "
+              f"already done {stats['already']}, skipped {stats['skipped']}, failed {stats['failed']}, "
+              f"unknown {stats['indeterminate']}")
+
+    elapsed = time.perf_counter() - started
     print("\n" + "=" * 80)
-    print("  TARGET CREATION COMPLETE!")
+    print("  TARGET CREATION COMPLETE!" if not total_failed
+          else f"  {total_failed} FAILED - run create again to retry them")
+    if total_indeterminate:
+        print(f"  {total_indeterminate} UNKNOWN - batch reply lost; check the target model,")
+        print("  remove partial elements, then run: create --retry-indeterminate")
+    print(f"  Created {format_rate(total_created, elapsed)}")
     print("=" * 80)
 
-    return True
+    return total_failed == 0 and total_indeterminate == 0
+
+def print_status(journal=None):
+    journal = journal or TransferJournal()
+    print_header("TRANSFER STATUS")
+    print(f"  Source project: {journal.checkpoint['source_project']}")
+    print(f"  Extraction complete: {journal.checkpoint['extraction_complete']}")
+    for kind, _, _, _, _ in CREATE_KINDS:
+        chunks = journal.chunks(kind)
+        done = sum(1 for c in chunks if journal.chunk_done(c))
+        unknown = sum(1 for c in chunks if journal.chunk_indeterminate(c))
+        print(f"  {kind}: {journal.count(kind)} extracted, "
+              f"{len(journal.id_map.get(kind, {}))} created, {done}/{len(chunks)} chunks done"
+              + (f", {unknown} indeterminate" if unknown else ""))
 
 # ============================================================================
 # MAIN
 # ============================================================================
 if __name__ == "__main__":
+    if win32file is None:
+        print("ERROR: pywin32 not installed. Install with: pip install pywin32")
+        sys.exit(1)
+
     print("\n" + "=" * 80)
     print("  MODEL TRANSFER: 512 Clematis -> MFI Project")
     print("=" * 80)
@@ -297,18 +555,27 @@ if __name__ == "__main__":
     print("  1. Extract data from 512 Clematis (make it active first)")
     print("  2. Create elements in MFI Project (make it active first)")
 
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "extract":
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if "--restart" in sys.argv:
+        TransferJournal.reset()
+        print("\n  Journal cleared")
+
+    if args:
+        if args[0] == "extract":
             extract_source_data()
-        elif sys.argv[1] == "create":
-            create_in_target()
+        elif args[0] == "create":
+            create_in_target(retry_indeterminate="--retry-indeterminate" in sys.argv)
+        elif args[0] == "status":
+            print_status()
         else:
-            print(f"\nUnknown command: {sys.argv[1]}")
-            print("Usage: python model_transfer.py [extract|create]")
+            print(f"\nUnknown command: {args[0]}")
+            print("Usage: python model_transfer.py [extract|create|status] [--restart] "
+                  "[--retry-indeterminate]")
     else:
         print("\nUsage:")
         print("  python model_transfer.py extract  - Extract from 512 Clematis")
         print("  python model_transfer.py create   - Create in MFI Project")
+        print("  python model_transfer.py status   - Show journal progress")
         print("\nInteractive mode:")
 
         choice = input("\nChoose action:\n  1. Extract from source (512 Clematis)\n  2. Create in target (MFI Project)\n  Enter (1 or 2): ")
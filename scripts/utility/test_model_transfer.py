@@ -0,0 +1,101 @@
+"""
+Model transfer batch handling against an in-memory target model.
+
+Run with: python -m pytest scripts/utility/test_model_transfer.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import model_transfer
+from model_transfer import TransferJournal, create_kind, create_in_target
+
+LEVELS = [{"levelId": 100 + i, "name": f"Level {i}", "elevation": i * 10.0} for i in range(5)]
+
+
+class TargetModel:
+    """Creates levels like the bridge does; optionally loses the batch reply."""
+
+    def __init__(self, batch_reply="ok"):
+        self.batch_reply = batch_reply
+        self.levels = []
+        self.calls = []
+
+    def create(self, params):
+        self.levels.append(params["name"])
+        return {"success": True, "levelId": 900 + len(self.levels)}
+
+    def send(self, method, params=None):
+        self.calls.append(method)
+        if method == "batchExecute":
+            if self.batch_reply == "unknown":
+                return {"success": False, "error": "Unknown method: batchExecute",
+                        "errorCode": "METHOD_NOT_FOUND"}
+            results = [{"result": self.create(op["params"])} for op in params["operations"]]
+            if self.batch_reply == "lost":
+                # The TransactionGroup committed, then the pipe timed out
+                return {"success": False, "error": "Pipe error: timed out"}
+            return {"success": True, "results": results}
+        if method == "createLevel":
+            return self.create(params)
+        if method == "getProjectInfo":
+            return {"success": True, "projectName": "MFI Test"}
+        if method == "getLevels":
+            return {"success": True, "levels": []}
+        return {"success": False, "error": f"Unknown method: {method}"}
+
+
+def _journal(tmp_path):
+    journal = TransferJournal(root=str(tmp_path), chunk_size=2)
+    journal.append_records("levels", LEVELS)
+    return journal
+
+
+def _create_levels(journal, target):
+    return create_kind(journal, "levels", "createLevel", "levelId", "levelId",
+                       model_transfer.level_params, target.send)
+
+
+def test_batch_creates_every_level_once(tmp_path):
+    journal, target = _journal(tmp_path), TargetModel()
+    stats = _create_levels(journal, target)
+    assert stats["created"] == len(LEVELS)
+    assert sorted(target.levels) == sorted(r["name"] for r in LEVELS)
+    assert "createLevel" not in target.calls
+
+
+def test_lost_batch_reply_is_not_resent(tmp_path):
+    journal, target = _journal(tmp_path), TargetModel(batch_reply="lost")
+    stats = _create_levels(journal, target)
+
+    assert "createLevel" not in target.calls
+    assert sorted(target.levels) == sorted(r["name"] for r in LEVELS)
+    assert stats["indeterminate"] == len(LEVELS)
+    assert stats["created"] == 0
+
+    # Re-running leaves the indeterminate chunks alone, even from a fresh journal load
+    target.calls.clear()
+    stats = _create_levels(TransferJournal(root=str(tmp_path), chunk_size=2), target)
+    assert target.calls == []
+    assert stats["indeterminate"] == len(LEVELS)
+    assert len(target.levels) == len(LEVELS)
+
+
+def test_retry_indeterminate_runs_the_chunks_again(tmp_path):
+    journal, target = _journal(tmp_path), TargetModel(batch_reply="lost")
+    assert not create_in_target(target.send, journal, confirm=False)
+
+    # The user checked the model and removed the partial levels
+    target.levels.clear()
+    target.batch_reply = "ok"
+    assert create_in_target(target.send, journal, confirm=False, retry_indeterminate=True)
+    assert sorted(target.levels) == sorted(r["name"] for r in LEVELS)
+
+
+def test_server_without_batch_falls_back_to_single_requests(tmp_path):
+    journal, target = _journal(tmp_path), TargetModel(batch_reply="unknown")
+    stats = _create_levels(journal, target)
+    assert stats["created"] == len(LEVELS)
+    assert target.calls.count("createLevel") == len(LEVELS)
@@ -25,9 +25,11 @@ import hashlib
 import json
 import os
 import platform
+import queue
 import shutil
 import subprocess
 import sys
+import threading
 import zipfile
 from dataclasses import dataclass, asdict
 from datetime import datetime
@@ -36,12 +38,12 @@ from typing import Dict, List, Optional, Any
 
 # Local imports
 from filtered_queries import send_mcp_request
+from model_digest import ModelDigest, fetch_model_digest
 from template_packs.pack_resolver import resolve_pack
 from pack_assessor import PackAssessor
 from spine_autopilot import SpineAutopilot
 
 # Spine Learning System - persistent memory & governed learning
-import sys
 sys.path.insert(0, '/mnt/d/_AI-PROJECTS/spine-aec-learning')
 from spine_learning import (
     LearningStore,
@@ -133,26 +135,22 @@ def get_dll_sha256(dll_path: str) -> str:
     return sha256.hexdigest()
 
 
-def collect_environment(run_id: str, sector: str, firm: str, mode: str, revit_version: str = "2026") -> Environment:
+def collect_environment(run_id: str, sector: str, firm: str, mode: str, revit_version: str = "2026",
+                        digest: Optional[ModelDigest] = None) -> Environment:
     """Collect environment information from system and Revit."""
 
-    # Get Revit info via MCP
-    # Note: getDocumentInfo doesn't exist, so we infer from available data
+    # Get Revit info via MCP (shared model digest - no extra round trips)
     doc_title = "unknown"
     doc_path = "unknown"
 
-    # Try to get basic info from getLevels response (proves connection works)
-    resp = send_mcp_request("getLevels", timeout=30)
-    if resp.get("success"):
-        # Connection works, try getAllSheets for document context
-        sheet_resp = send_mcp_request("getAllSheets", timeout=30)
-        if sheet_resp.get("success"):
-            result = sheet_resp.get("result", sheet_resp)
-            sheets = result.get("sheets", [])
-            if sheets:
-                # Infer document name from sheet names if available
-                first_sheet = sheets[0]
-                doc_title = f"Document with {len(sheets)} sheets"
+    digest = digest or fetch_model_digest()
+    if digest.ok("levels"):
+        # Connection works, use sheets for document context
+        sheets = digest.items("sheets", "sheets")
+        if sheets:
+            # Title stays sheet-derived so learning fingerprints remain stable
+            doc_title = f"Document with {len(sheets)} sheets"
+        doc_path = digest.document_info.get("pathName") or doc_path
 
     # DLL path (version-specific)
     dll_path = rf"C:\Users\rick\AppData\Roaming\Autodesk\Revit\Addins\{revit_version}\RevitMCPBridge{revit_version}.dll"
@@ -195,18 +193,18 @@ def collect_environment(run_id: str, sector: str, firm: str, mode: str, revit_ve
 #
 # =============================================================================
 
-def check_readiness(sector: str) -> ReadinessReport:
+def check_readiness(sector: str, digest: Optional[ModelDigest] = None) -> ReadinessReport:
     """
     Run preflight readiness checks for BYOP lane.
 
     Returns a ReadinessReport with explicit green/yellow/red grading.
     """
     checks = []
+    digest = digest or fetch_model_digest()
 
     # 1. MCP Connection (BLOCKER if fails)
-    resp = send_mcp_request("getLevels", timeout=30)
-    mcp_ok = resp.get("success", False)
-    level_count = len(resp.get("levels", [])) if mcp_ok else 0
+    mcp_ok = digest.ok("levels")
+    level_count = len(digest.items("levels", "levels")) if mcp_ok else 0
     checks.append(ReadinessCheck(
         check_id="MCP_CONNECTION",
         name="MCP Bridge Connected",
@@ -226,9 +224,8 @@ def check_readiness(sector: str) -> ReadinessReport:
     ))
 
     # 3. Sheets Queryable (WARNING if fails)
-    sheet_resp = send_mcp_request("getAllSheets", timeout=30)
-    sheet_ok = sheet_resp.get("success", False)
-    existing_sheets = len(sheet_resp.get("result", sheet_resp).get("sheets", [])) if sheet_ok else 0
+    sheet_ok = digest.ok("sheets")
+    existing_sheets = len(digest.items("sheets", "sheets")) if sheet_ok else 0
     checks.append(ReadinessCheck(
         check_id="SHEETS_QUERYABLE",
         name="Sheets Accessible",
@@ -249,8 +246,7 @@ def check_readiness(sector: str) -> ReadinessReport:
     ))
 
     # 5. Views Queryable (WARNING if fails)
-    view_resp = send_mcp_request("getViews", {"viewType": "FloorPlan", "limit": 10}, timeout=60)
-    view_ok = view_resp.get("success", False)
+    view_ok = digest.ok("views")
     checks.append(ReadinessCheck(
         check_id="VIEWS_QUERYABLE",
         name="Views Accessible",
@@ -308,8 +304,14 @@ def check_readiness(sector: str) -> ReadinessReport:
 # Code Compliance Check
 # =============================================================================
 
-def extract_model_for_compliance() -> Dict[str, Any]:
-    """Extract model data from Revit via MCP for compliance checking."""
+def extract_model_for_compliance(digest: Optional[ModelDigest] = None) -> Dict[str, Any]:
+    """
+    Extract model data from Revit via MCP for compliance checking.
+
+    Uses the shared model digest (one batched request, cached per document
+    revision) instead of one request per list. The digest only samples floor
+    plan views, so the full view list is queried here.
+    """
     model_data = {
         "project_name": "Unknown",
         "levels": [],
@@ -325,80 +327,41 @@ def extract_model_for_compliance() -> Dict[str, Any]:
     }
 
     try:
-        # Get levels
-        resp = send_mcp_request("getLevels", timeout=30)
-        if resp.get("success"):
-            result = resp.get("result", resp)
-            levels = result.get("levels", [])
-            model_data["levels"] = [
-                {"name": l.get("name"), "elevation": l.get("elevation")}
-                for l in levels
-            ]
-
-        # Get sheets
-        resp = send_mcp_request("getAllSheets", timeout=30)
-        if resp.get("success"):
-            result = resp.get("result", resp)
-            sheets = result.get("sheets", [])
-            model_data["sheets"] = [
-                {"number": s.get("number"), "name": s.get("name")}
-                for s in sheets
-            ]
-
-        # Get views
+        digest = digest or fetch_model_digest()
+
+        model_data["levels"] = [
+            {"name": l.get("name"), "elevation": l.get("elevation")}
+            for l in digest.items("levels", "levels")
+        ]
+        model_data["sheets"] = [
+            {"number": s.get("number"), "name": s.get("name")}
+            for s in digest.items("sheets", "sheets")
+        ]
         resp = send_mcp_request("getViews", timeout=30)
         if resp.get("success"):
-            result = resp.get("result", resp)
-            views = result.get("views", [])
             model_data["views"] = [
                 {"name": v.get("name"), "type": v.get("viewType")}
-                for v in views
-            ]
-
-        # Get rooms
-        resp = send_mcp_request("getRooms", timeout=30)
-        if resp.get("success"):
-            result = resp.get("result", resp)
-            rooms = result.get("rooms", [])
-            model_data["rooms"] = [
-                {"name": r.get("name"), "number": r.get("number"), "area": r.get("area")}
-                for r in rooms
-            ]
-
-        # Get wall types
-        resp = send_mcp_request("getWallTypes", timeout=30)
-        if resp.get("success"):
-            result = resp.get("result", resp)
-            wall_types = result.get("wallTypes", [])
-            model_data["wall_types"] = [
-                {"name": wt.get("name"), "width": wt.get("width")}
-                for wt in wall_types
-            ]
-
-        # Get door types
-        resp = send_mcp_request("getDoorTypes", timeout=30)
-        if resp.get("success"):
-            result = resp.get("result", resp)
-            door_types = result.get("doorTypes", result.get("types", []))
-            model_data["door_types"] = [
-                {"name": dt.get("name"), "width": dt.get("width"), "height": dt.get("height")}
-                for dt in door_types
+                for v in resp.get("result", resp).get("views", [])
             ]
-
-        # Get window types
-        resp = send_mcp_request("getWindowTypes", timeout=30)
-        if resp.get("success"):
-            result = resp.get("result", resp)
-            window_types = result.get("windowTypes", result.get("types", []))
-            model_data["window_types"] = [
-                {"name": wt.get("name"), "width": wt.get("width"), "height": wt.get("height")}
-                for wt in window_types
-            ]
-
-        # Get project info
-        resp = send_mcp_request("getProjectInfo", timeout=30)
-        if resp.get("success"):
-            result = resp.get("result", resp)
+        model_data["rooms"] = [
+            {"name": r.get("name"), "number": r.get("number"), "area": r.get("area")}
+            for r in digest.items("rooms", "rooms")
+        ]
+        model_data["wall_types"] = [
+            {"name": wt.get("name"), "width": wt.get("width")}
+            for wt in digest.items("wall_types", "wallTypes")
+        ]
+        model_data["door_types"] = [
+            {"name": dt.get("name"), "width": dt.get("width"), "height": dt.get("height")}
+            for dt in digest.items("door_types", "doorTypes", "types")
+        ]
+        model_data["window_types"] = [
+            {"name": wt.get("name"), "width": wt.get("width"), "height": wt.get("height")}
+            for wt in digest.items("window_types", "windowTypes", "types")
+        ]
+
+        if digest.ok("project_info"):
+            result = digest.result("project_info")
             model_data["project_info"] = result
             model_data["project_name"] = result.get("projectName", result.get("name", "Unknown"))
 
@@ -483,17 +446,6 @@ def run_compliance_check(
 # Evidence Zipper
 # =============================================================================
 
-def sha256_file(path: str) -> str:
-    """Calculate SHA256 of a file."""
-    if not os.path.exists(path):
-        return "not_found"
-    sha256 = hashlib.sha256()
-    with open(path, 'rb') as f:
-        for chunk in iter(lambda: f.read(8192), b''):
-            sha256.update(chunk)
-    return sha256.hexdigest()
-
-
 def get_git_commit() -> str:
     """Get current git commit hash if available."""
     try:
@@ -674,6 +626,77 @@ class AutopilotSummary:
     human_tasks: List[str]
 
 
+# Exports at least this big are hashed on a helper thread while the zip
+# writer compresses them (hashlib and zlib both release the GIL).
+PARALLEL_HASH_THRESHOLD = 4 * 1024 * 1024
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Already-compressed formats are stored rather than deflated a second time
+STORED_SUFFIXES = {".png", ".jpg", ".jpeg", ".zip", ".gz", ".7z"}
+
+
+class EvidenceZipBuilder:
+    """
+    Writes evidence members straight into the zip - no staging directory.
+
+    Files are read exactly once: each chunk goes to the compressor and the
+    SHA256 in the same pass, so the manifest is available as soon as the
+    member is written.
+    """
+
+    def __init__(self, zip_path: Path):
+        self.zip_path = zip_path
+        self._zf = zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED)
+
+    def __enter__(self) -> 'EvidenceZipBuilder':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._zf.close()
+        if exc_type is not None and self.zip_path.exists():
+            # Never leave a half-written evidence package behind
+            self.zip_path.unlink()
+        return False
+
+    def add_text(self, arcname: str, text: str) -> None:
+        self._zf.writestr(arcname, text)
+
+    def add_json(self, arcname: str, data: Any) -> None:
+        self._zf.writestr(arcname, json.dumps(data, indent=2))
+
+    def add_file(self, arcname: str, src: Path) -> Dict[str, Any]:
+        """Stream a file into the zip; returns {"sha256", "size_bytes"}."""
+        zinfo = zipfile.ZipInfo.from_file(src, arcname)
+        zinfo.compress_type = (zipfile.ZIP_STORED if src.suffix.lower() in STORED_SUFFIXES
+                               else zipfile.ZIP_DEFLATED)
+        sha256 = hashlib.sha256()
+
+        if zinfo.file_size < PARALLEL_HASH_THRESHOLD:
+            with open(src, 'rb') as f, self._zf.open(zinfo, 'w') as dest:
+                for chunk in iter(lambda: f.read(STREAM_CHUNK_SIZE), b''):
+                    sha256.update(chunk)
+                    dest.write(chunk)
+        else:
+            chunks: queue.Queue = queue.Queue(maxsize=8)
+
+            def hash_worker():
+                while (chunk := chunks.get()) is not None:
+                    sha256.update(chunk)
+
+            hasher = threading.Thread(target=hash_worker, daemon=True)
+            hasher.start()
+            try:
+                with open(src, 'rb') as f, self._zf.open(zinfo, 'w', force_zip64=True) as dest:
+                    for chunk in iter(lambda: f.read(STREAM_CHUNK_SIZE), b''):
+                        chunks.put(chunk)
+                        dest.write(chunk)
+            finally:
+                chunks.put(None)
+                hasher.join()
+
+        return {"sha256": sha256.hexdigest(), "size_bytes": zinfo.file_size}
+
+
 def create_evidence_zip(
     run_id: str,
     environment: Environment,
@@ -703,28 +726,18 @@ def create_evidence_zip(
         └── diagnostics/
             └── warnings.json
     """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    zip_path = output_dir / f"evidence_{run_id}.zip"
 
-    # Create temp directory for staging
-    staging_dir = output_dir / f"staging_{run_id}"
-    staging_dir.mkdir(parents=True, exist_ok=True)
-
-    try:
-        # Create subdirectories
-        (staging_dir / "run").mkdir(exist_ok=True)
-        (staging_dir / "artifacts" / "exports").mkdir(parents=True, exist_ok=True)
-        (staging_dir / "diagnostics").mkdir(exist_ok=True)
-
+    with EvidenceZipBuilder(zip_path) as zb:
         # Build reviewer-friendly README
-        readme = _build_reviewer_readme(run_id, environment, readiness, autopilot_summary)
-        (staging_dir / "README.txt").write_text(readme)
+        zb.add_text("README.txt", _build_reviewer_readme(run_id, environment, readiness, autopilot_summary))
 
         # Environment
-        (staging_dir / "run" / "environment.json").write_text(
-            json.dumps(asdict(environment), indent=2)
-        )
+        zb.add_json("run/environment.json", asdict(environment))
 
         # Readiness with top-level grade
-        readiness_data = {
+        zb.add_json("run/readiness.json", {
             "readiness_grade": readiness.recommendation.upper(),  # GREEN/YELLOW/RED
             "ready": readiness.ready,
             "score": readiness.score,
@@ -736,16 +749,13 @@ def create_evidence_zip(
             "blockers": readiness.blockers,
             "warnings": readiness.warnings,
             "checks": [asdict(c) for c in readiness.checks]
-        }
-        (staging_dir / "run" / "readiness.json").write_text(
-            json.dumps(readiness_data, indent=2)
-        )
+        })
 
         # Command
-        (staging_dir / "run" / "command.txt").write_text(environment.command_line)
+        zb.add_text("run/command.txt", environment.command_line)
 
         # Versions provenance
-        versions_data = {
+        zb.add_json("run/versions.json", {
             "spine_version": "0.4",
             "beta_runner_version": "1.1",
             "pack_adapter_version": "2.0",
@@ -753,57 +763,35 @@ def create_evidence_zip(
             "python_version": environment.python_version,
             "git_commit": get_git_commit(),
             "generated_at": datetime.now().isoformat()
-        }
-        (staging_dir / "run" / "versions.json").write_text(
-            json.dumps(versions_data, indent=2)
-        )
+        })
 
         # Autopilot report
         if autopilot_report_path and os.path.exists(autopilot_report_path):
-            shutil.copy(autopilot_report_path, staging_dir / "run" / "autopilot_report.json")
+            zb.add_file("run/autopilot_report.json", Path(autopilot_report_path))
 
         # Resolved pack
         if resolved_pack_path and os.path.exists(resolved_pack_path):
-            shutil.copy(resolved_pack_path, staging_dir / "run" / "resolved_pack.json")
+            zb.add_file("run/resolved_pack.json", Path(resolved_pack_path))
 
-        # Exports with manifest
+        # Exports - hashed while they are written, manifest built in the same pass
         exports_manifest = {"files": [], "generated": datetime.now().isoformat()}
         if exports_dir and os.path.exists(exports_dir):
-            for f in Path(exports_dir).glob("*"):
+            for f in sorted(Path(exports_dir).glob("*")):
                 if f.is_file():
-                    dest = staging_dir / "artifacts" / "exports" / f.name
-                    shutil.copy(f, dest)
+                    digest = zb.add_file(f"artifacts/exports/{f.name}", f)
                     exports_manifest["files"].append({
                         "name": f.name,
-                        "sha256": sha256_file(str(f)),
-                        "size_bytes": f.stat().st_size,
+                        "sha256": digest["sha256"],
+                        "size_bytes": digest["size_bytes"],
                         "type": f.suffix.lstrip(".")
                     })
 
-        (staging_dir / "artifacts" / "exports_manifest.json").write_text(
-            json.dumps(exports_manifest, indent=2)
-        )
+        zb.add_json("artifacts/exports_manifest.json", exports_manifest)
 
         # Diagnostics - warnings placeholder
-        (staging_dir / "diagnostics" / "warnings.json").write_text(
-            json.dumps({"warnings": readiness.warnings}, indent=2)
-        )
-
-        # Create zip
-        zip_path = output_dir / f"evidence_{run_id}.zip"
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-            for root, dirs, files in os.walk(staging_dir):
-                for file in files:
-                    file_path = Path(root) / file
-                    arcname = file_path.relative_to(staging_dir)
-                    zf.write(file_path, arcname)
-
-        return str(zip_path)
+        zb.add_json("diagnostics/warnings.json", {"warnings": readiness.warnings})
 
-    finally:
-        # Cleanup staging
-        if staging_dir.exists():
-            shutil.rmtree(staging_dir)
+    return str(zip_path)
 
 
 # =============================================================================
@@ -852,7 +840,8 @@ def run_beta(
 
     # Collect environment
     print("\n[1] Collecting environment...")
-    environment = collect_environment(run_id, sector, firm, mode, revit_version)
+    digest = fetch_model_digest()
+    environment = collect_environment(run_id, sector, firm, mode, revit_version, digest=digest)
     print(f"  Revit: {environment.revit_version}")
     print(f"  Document: {environment.revit_doc_title}")
     print(f"  DLL SHA256: {environment.addin_dll_sha256[:16]}...")
@@ -885,7 +874,7 @@ def run_beta(
 
     # Check readiness
     print("\n[2] Checking readiness...")
-    readiness = check_readiness(sector)
+    readiness = check_readiness(sector, digest=digest)
     print(f"  Score: {readiness.score}%")
     print(f"  Recommendation: {readiness.recommendation.upper()}")
     if readiness.blockers:
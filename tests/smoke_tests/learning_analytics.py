@@ -0,0 +1,682 @@
+#!/usr/bin/env python3
+"""
+Learning Analytics - Bulk ingestion and trend queries over spine_learning.db
+
+Run results are scattered across reports/autopilot_*.json, the NDJSON
+forensic logs and the evidence zips. This module loads them into
+learning_data/spine_learning.db (runs, issues, gate_decisions, plus the
+mcp_calls / run_metrics tables it adds) and answers trend questions with
+plain SQL.
+
+Queries open the database read-only; only ingestion adds the analytics
+tables. Ingestion runs in WAL mode and writes one transaction per batch of
+artifacts with prepared executemany inserts. Artifacts already ingested (same path,
+mtime and size) are skipped, so re-running over a growing reports folder only
+loads what is new. Child rows are owned by the kind of artifact that produced
+them (autopilot report, NDJSON log, readiness check), so a run seen in both
+its report and its evidence zip, or a re-ingested file, is never doubled.
+
+Usage:
+    python learning_analytics.py ingest                 # reports/ + evidence/
+    python learning_analytics.py ingest path/to/run.zip --rebuild
+    python learning_analytics.py report --since 2025-12-01
+
+    from learning_analytics import LearningAnalytics
+    analytics = LearningAnalytics()
+    analytics.duration_percentile(95, by="sector")
+    analytics.top_issue_codes(10)
+    analytics.gate_rejection_rate()
+"""
+
+import json
+import os
+import sqlite3
+import zipfile
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+SMOKE_DIR = Path(__file__).parent
+DEFAULT_DB = SMOKE_DIR / "learning_data" / "spine_learning.db"
+DEFAULT_SOURCES = [SMOKE_DIR / "reports", SMOKE_DIR / "evidence"]
+BATCH_SIZE = 500
+
+# Tables this module adds next to the learning schema
+ANALYTICS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mcp_calls (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    step_id INTEGER,
+    method TEXT,
+    result TEXT,
+    elapsed_ms REAL,
+    retry_index INTEGER,
+    error TEXT,
+    FOREIGN KEY(run_id) REFERENCES runs(run_id)
+);
+CREATE INDEX IF NOT EXISTS idx_mcp_calls_run ON mcp_calls(run_id);
+CREATE INDEX IF NOT EXISTS idx_mcp_calls_method ON mcp_calls(method);
+
+CREATE TABLE IF NOT EXISTS run_metrics (
+    run_id TEXT PRIMARY KEY,
+    duration_ms REAL,
+    mcp_calls INTEGER,
+    mcp_failures INTEGER,
+    FOREIGN KEY(run_id) REFERENCES runs(run_id)
+);
+
+CREATE TABLE IF NOT EXISTS ingested_sources (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    run_id TEXT,
+    ingested_ts_utc INTEGER NOT NULL
+);
+"""
+
+# Only fill columns that a source actually knows; never blank existing values
+UPSERT_RUN = """
+INSERT INTO runs (run_id, ts_utc, project_fingerprint, sector, firm, readiness_grade,
+                  stop_reason, baseline_scores_json, final_scores_json, versions_json,
+                  evidence_zip_path)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(run_id) DO UPDATE SET
+    ts_utc = CASE WHEN runs.ts_utc = 0 THEN excluded.ts_utc
+                  WHEN excluded.ts_utc = 0 THEN runs.ts_utc
+                  ELSE MIN(runs.ts_utc, excluded.ts_utc) END,
+    project_fingerprint = CASE WHEN excluded.project_fingerprint = 'unknown'
+                               THEN runs.project_fingerprint ELSE excluded.project_fingerprint END,
+    sector = COALESCE(excluded.sector, runs.sector),
+    firm = COALESCE(excluded.firm, runs.firm),
+    readiness_grade = COALESCE(excluded.readiness_grade, runs.readiness_grade),
+    stop_reason = COALESCE(excluded.stop_reason, runs.stop_reason),
+    baseline_scores_json = COALESCE(excluded.baseline_scores_json, runs.baseline_scores_json),
+    final_scores_json = COALESCE(excluded.final_scores_json, runs.final_scores_json),
+    versions_json = COALESCE(excluded.versions_json, runs.versions_json),
+    evidence_zip_path = COALESCE(excluded.evidence_zip_path, runs.evidence_zip_path)
+"""
+
+INSERT_ISSUE = """
+INSERT INTO issues (run_id, kind, code, severity, message, data_json) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_GATE = """
+INSERT INTO gate_decisions (run_id, gate_name, decision, notes) VALUES (?, ?, ?, ?)
+"""
+
+INSERT_CALL = """
+INSERT INTO mcp_calls (run_id, step_id, method, result, elapsed_ms, retry_index, error)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+UPSERT_METRICS = """
+INSERT OR REPLACE INTO run_metrics (run_id, duration_ms, mcp_calls, mcp_failures) VALUES (?, ?, ?, ?)
+"""
+
+UPSERT_SOURCE = """
+INSERT OR REPLACE INTO ingested_sources (path, mtime_ns, size, run_id, ingested_ts_utc)
+VALUES (?, ?, ?, ?, ?)
+"""
+
+# human_gates.GateDecision values -> learning schema decisions
+GATE_DECISIONS = {"approved": "approved", "denied": "rejected", "skipped": "auto"}
+
+# Artifact kinds that own child rows (stored as issues.data_json.origin)
+ORIGIN_AUTOPILOT = "autopilot"    # gate decisions, human-action issues
+ORIGIN_NDJSON = "ndjson"          # mcp_calls, failed-call issues, run_metrics
+ORIGIN_READINESS = "readiness"    # readiness blockers/warnings, diagnostics
+
+DELETE_ISSUES = "DELETE FROM issues WHERE run_id = ? AND json_extract(data_json, '$.origin') = ?"
+DELETE_GATES = "DELETE FROM gate_decisions WHERE run_id = ?"
+DELETE_CALLS = "DELETE FROM mcp_calls WHERE run_id = ?"
+
+
+# =============================================================================
+# Parsed artifacts
+# =============================================================================
+
+@dataclass
+class RunRecord:
+    """Everything one artifact contributes for one run."""
+    run_id: str
+    ts_utc: int
+    project_fingerprint: str = "unknown"
+    sector: Optional[str] = None
+    firm: Optional[str] = None
+    readiness_grade: Optional[str] = None
+    stop_reason: Optional[str] = None
+    baseline_scores: Optional[Dict] = None
+    final_scores: Optional[Dict] = None
+    versions: Optional[Dict] = None
+    evidence_zip_path: Optional[str] = None
+    origins: set = field(default_factory=set)             # child-row sets this record replaces
+    issues: List[Tuple] = field(default_factory=list)     # (origin, kind, code, severity, message, data)
+    gates: List[Tuple] = field(default_factory=list)      # (gate_name, decision, notes)
+    calls: List[Tuple] = field(default_factory=list)      # (step_id, method, result, elapsed_ms, retry, error)
+    metrics: Optional[Tuple] = None                       # (duration_ms, calls, failures)
+
+    def run_row(self) -> Tuple:
+        return (
+            self.run_id, self.ts_utc, self.project_fingerprint, self.sector, self.firm,
+            self.readiness_grade, self.stop_reason, _dumps(self.baseline_scores),
+            _dumps(self.final_scores), _dumps(self.versions), self.evidence_zip_path,
+        )
+
+
+@dataclass
+class IngestStats:
+    sources_seen: int = 0
+    sources_ingested: int = 0
+    sources_skipped: int = 0
+    sources_failed: int = 0
+    runs: int = 0
+    issues: int = 0
+    gates: int = 0
+    calls: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+def _dumps(value) -> Optional[str]:
+    return json.dumps(value, sort_keys=True) if value is not None else None
+
+
+def _epoch(timestamp: Optional[str]) -> Optional[float]:
+    """ISO timestamp (naive = UTC) to epoch seconds."""
+    if not timestamp:
+        return None
+    try:
+        dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def parse_autopilot_report(report: Dict) -> Optional[RunRecord]:
+    """RunRecord from an autopilot report (reports/autopilot_*.json)."""
+    run_id = report.get("run_id")
+    if not run_id:
+        return None
+
+    config = report.get("config", {})
+    autopilot = report.get("autopilot", {})
+    record = RunRecord(
+        run_id=run_id,
+        ts_utc=int(_epoch(report.get("timestamp")) or 0),
+        sector=config.get("sector"),
+        firm=config.get("firm"),
+        stop_reason=autopilot.get("stop_reason"),
+        baseline_scores=report.get("baseline_scores"),
+        final_scores=report.get("final_scores"),
+        versions={
+            "workflow": report.get("workflow"),
+            "version": report.get("version"),
+            "schema_version": report.get("schema_version"),
+        },
+        origins={ORIGIN_AUTOPILOT},
+    )
+
+    for detail in autopilot.get("iteration_details", []):
+        decision = detail.get("gate_decision")
+        if decision:
+            record.gates.append((
+                "structure",
+                GATE_DECISIONS.get(decision, decision),
+                f"iteration {detail.get('iteration')}",
+            ))
+
+    if (record.stop_reason or "").startswith("Gate denied"):
+        record.gates.append(("structure", "rejected", record.stop_reason))
+    if "human action" in (record.stop_reason or ""):
+        record.issues.append((ORIGIN_AUTOPILOT, "human_action_required", "HUMAN_ACTION",
+                              "warn", record.stop_reason, {}))
+    return record
+
+
+def parse_ndjson_log(lines: Iterable[str]) -> Optional[RunRecord]:
+    """RunRecord with per-call rows and run metrics from an NDJSON forensic log."""
+    run_id = None
+    workflow = None
+    first_ts = last_end = None
+    calls = []
+    issues = []
+
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        run_id = run_id or event.get("run_id")
+        ts = _epoch(event.get("ts"))
+        if ts is not None:
+            first_ts = ts if first_ts is None else min(first_ts, ts)
+            end = ts + (event.get("elapsed_ms") or 0) / 1000.0
+            last_end = end if last_end is None else max(last_end, end)
+
+        event_type = event.get("event_type")
+        if event_type == "workflow_start":
+            workflow = event.get("workflow")
+        elif event_type == "mcp_call":
+            calls.append((
+                event.get("step_id"), event.get("method"), event.get("result"),
+                event.get("elapsed_ms"), event.get("retry_index"), event.get("error"),
+            ))
+            if event.get("result") == "fail":
+                issues.append((ORIGIN_NDJSON, "error", event.get("method"), "error",
+                               (event.get("error") or "")[:500],
+                               {"step_id": event.get("step_id"), "tx": event.get("tx")}))
+
+    if not run_id:
+        return None
+
+    failures = sum(1 for c in calls if c[2] == "fail")
+    duration_ms = (last_end - first_ts) * 1000.0 if first_ts is not None else None
+    return RunRecord(
+        run_id=run_id,
+        ts_utc=int(first_ts or 0),
+        versions={"workflow": workflow} if workflow else None,
+        origins={ORIGIN_NDJSON},
+        issues=issues,
+        calls=calls,
+        metrics=(duration_ms, len(calls), failures),
+    )
+
+
+def parse_evidence_zip(path: Path) -> Optional[RunRecord]:
+    """RunRecord from a beta_runner evidence zip (run/*.json, diagnostics/*)."""
+    with zipfile.ZipFile(path) as zf:
+        names = set(zf.namelist())
+
+        def load(name):
+            return json.loads(zf.read(name)) if name in names else None
+
+        report = load("run/autopilot_report.json")
+        environment = load("run/environment.json") or {}
+        readiness = load("run/readiness.json") or {}
+        versions = load("run/versions.json")
+        warnings = (load("diagnostics/warnings.json") or {}).get("warnings", [])
+
+    record = parse_autopilot_report(report) if report else None
+    if record is None:
+        if not environment.get("run_id"):
+            return None
+        record = RunRecord(run_id=environment["run_id"],
+                           ts_utc=int(_epoch(environment.get("timestamp")) or 0))
+
+    record.sector = record.sector or environment.get("sector")
+    record.firm = record.firm or environment.get("firm")
+    record.readiness_grade = readiness.get("readiness_grade")
+    record.evidence_zip_path = str(path)
+    record.origins.add(ORIGIN_READINESS)
+    if versions:
+        record.versions = {**(record.versions or {}), **versions}
+
+    doc = environment.get("revit_doc_path")
+    if doc and doc != "unknown":
+        record.project_fingerprint = doc
+    elif environment.get("revit_doc_title"):
+        record.project_fingerprint = environment["revit_doc_title"]
+
+    for check in readiness.get("blockers", []) + readiness.get("warnings", []):
+        severity = check.get("severity", "warning")
+        record.issues.append((
+            ORIGIN_READINESS,
+            "error" if severity == "blocker" else "warning",
+            check.get("check_id"),
+            "error" if severity == "blocker" else "warn",
+            check.get("details") or check.get("name"),
+            {},
+        ))
+    for warning in warnings:
+        if isinstance(warning, dict):
+            record.issues.append((ORIGIN_READINESS, "warning",
+                                  warning.get("code") or warning.get("check_id"), "warn",
+                                  warning.get("message") or warning.get("details"), dict(warning)))
+        else:
+            record.issues.append((ORIGIN_READINESS, "warning", None, "warn", str(warning), {}))
+    return record
+
+
+def parse_artifact(path: Path) -> Optional[RunRecord]:
+    """Dispatch on artifact type. None for files that carry no run data."""
+    if path.suffix == ".ndjson":
+        with open(path, encoding="utf-8") as f:
+            return parse_ndjson_log(f)
+    if path.suffix == ".zip":
+        return parse_evidence_zip(path)
+    if path.suffix == ".json" and path.name.startswith("autopilot_"):
+        with open(path, encoding="utf-8") as f:
+            return parse_autopilot_report(json.load(f))
+    return None
+
+
+def discover_artifacts(roots: Iterable[Path]) -> List[Path]:
+    """Run artifacts under the given files/folders, oldest first."""
+    found = []
+    for root in roots:
+        root = Path(root)
+        if root.is_file():
+            found.append(root)
+            continue
+        if not root.is_dir():
+            continue
+        found.extend(root.rglob("autopilot_*.json"))
+        found.extend(root.rglob("*.ndjson"))
+        found.extend(root.rglob("*.zip"))
+    return sorted(set(found), key=lambda p: (p.stat().st_mtime_ns, str(p)))
+
+
+# =============================================================================
+# Ingestion
+# =============================================================================
+
+def connect(db_path: Path = DEFAULT_DB, read_only: bool = False) -> sqlite3.Connection:
+    """
+    Open the learning database.
+
+    Writers get WAL mode and the analytics tables. Readers open the file
+    read-only so queries never modify it; analytics tables it does not have
+    yet are stood in for by empty temporary tables.
+    """
+    if not read_only:
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(ANALYTICS_SCHEMA)
+        return conn
+
+    if not Path(db_path).exists():
+        raise FileNotFoundError(f"{db_path} not found; run 'ingest' first")
+    conn = sqlite3.connect(Path(db_path).resolve().as_uri() + "?mode=ro", uri=True)
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    for statement in ANALYTICS_SCHEMA.split(";"):
+        statement = statement.strip()
+        prefix = "CREATE TABLE IF NOT EXISTS "
+        if statement.startswith(prefix) and statement[len(prefix):].split()[0] not in tables:
+            conn.execute("CREATE TEMP TABLE " + statement[len("CREATE TABLE "):])
+    return conn
+
+
+def _write_batch(conn: sqlite3.Connection, records: List[Tuple[Path, os.stat_result, RunRecord]],
+                 stats: IngestStats):
+    """
+    One transaction for the whole batch. Each (run, origin) keeps only the
+    child rows of the last record that carried it.
+    """
+    runs, metrics, sources = [], [], []
+    owned: Dict[Tuple[str, str], RunRecord] = {}
+    now = int(datetime.now(timezone.utc).timestamp())
+
+    for path, st, record in records:
+        sources.append((str(path), st.st_mtime_ns, st.st_size,
+                        record.run_id if record else None, now))
+        if record is None:
+            continue
+        runs.append(record.run_row())
+        if record.metrics:
+            metrics.append((record.run_id, *record.metrics))
+        for origin in record.origins:
+            owned[(record.run_id, origin)] = record
+
+    issues, gates, calls = [], [], []
+    for (run_id, origin), record in owned.items():
+        issues.extend((run_id, kind, code, severity, message, _dumps({**data, "origin": origin}))
+                      for issue_origin, kind, code, severity, message, data in record.issues
+                      if issue_origin == origin)
+        if origin == ORIGIN_AUTOPILOT:
+            gates.extend((run_id, *gate) for gate in record.gates)
+        elif origin == ORIGIN_NDJSON:
+            calls.extend((run_id, *call) for call in record.calls)
+
+    with conn:
+        conn.executemany(UPSERT_RUN, runs)
+        conn.executemany(DELETE_ISSUES, list(owned))
+        conn.executemany(DELETE_GATES, [(r,) for r, o in owned if o == ORIGIN_AUTOPILOT])
+        conn.executemany(DELETE_CALLS, [(r,) for r, o in owned if o == ORIGIN_NDJSON])
+        conn.executemany(INSERT_ISSUE, issues)
+        conn.executemany(INSERT_GATE, gates)
+        conn.executemany(INSERT_CALL, calls)
+        conn.executemany(UPSERT_METRICS, metrics)
+        conn.executemany(UPSERT_SOURCE, sources)
+
+    stats.runs += len(runs)
+    stats.issues += len(issues)
+    stats.gates += len(gates)
+    stats.calls += len(calls)
+
+
+def ingest_artifacts(paths: Iterable[Path] = None, db_path: Path = DEFAULT_DB,
+                     batch_size: int = BATCH_SIZE, rebuild: bool = False) -> IngestStats:
+    """
+    Load run artifacts into the learning database.
+
+    Args:
+        paths: Files or folders to scan (default: reports/ and evidence/)
+        db_path: SQLite database to write
+        batch_size: Artifacts per transaction
+        rebuild: Clear run data and ingest everything again
+    """
+    stats = IngestStats()
+    conn = connect(db_path)
+    try:
+        if rebuild:
+            with conn:
+                for table in ("mcp_calls", "run_metrics", "issues", "gate_decisions",
+                              "ingested_sources", "runs"):
+                    conn.execute(f"DELETE FROM {table}")
+
+        known = {row[0]: (row[1], row[2]) for row in
+                 conn.execute("SELECT path, mtime_ns, size FROM ingested_sources")}
+
+        batch = []
+        for path in discover_artifacts(paths or DEFAULT_SOURCES):
+            stats.sources_seen += 1
+            st = path.stat()
+            if known.get(str(path)) == (st.st_mtime_ns, st.st_size):
+                stats.sources_skipped += 1
+                continue
+            try:
+                record = parse_artifact(path)
+            except (OSError, ValueError, zipfile.BadZipFile) as e:
+                stats.sources_failed += 1
+                stats.errors.append(f"{path}: {e}")
+                continue
+            stats.sources_ingested += 1
+            batch.append((path, st, record))
+            if len(batch) >= batch_size:
+                _write_batch(conn, batch, stats)
+                batch = []
+        if batch:
+            _write_batch(conn, batch, stats)
+    finally:
+        conn.close()
+    return stats
+
+
+# =============================================================================
+# Analytics
+# =============================================================================
+
+GROUPINGS = {
+    "sector": "COALESCE(r.sector, 'unknown')",
+    "firm": "COALESCE(r.firm, 'none')",
+    "project": "r.project_fingerprint",
+    "stop_reason": "COALESCE(r.stop_reason, 'unknown')",
+    None: "'all'",
+}
+
+
+class LearningAnalytics:
+    """Trend queries over the learning database."""
+
+    def __init__(self, db_path: Path = DEFAULT_DB):
+        self.conn = connect(db_path, read_only=True)
+        self.conn.row_factory = sqlite3.Row
+
+    def close(self):
+        self.conn.close()
+
+    def _rows(self, sql: str, params: Tuple = ()) -> List[Dict]:
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def duration_percentile(self, percentile: int = 95, by: Optional[str] = "sector",
+                            since: Optional[int] = None) -> List[Dict]:
+        """
+        Nearest-rank percentile of run duration (ms) per group.
+
+        Args:
+            percentile: 1-100
+            by: "sector", "firm", "project", "stop_reason" or None for overall
+            since: Only runs with ts_utc >= since (epoch seconds)
+        """
+        group = GROUPINGS[by]
+        return self._rows(f"""
+            WITH ranked AS (
+                SELECT {group} AS grp, m.duration_ms AS duration_ms,
+                       ROW_NUMBER() OVER (PARTITION BY {group} ORDER BY m.duration_ms) AS rn,
+                       COUNT(*) OVER (PARTITION BY {group}) AS n
+                FROM run_metrics m JOIN runs r ON r.run_id = m.run_id
+                WHERE m.duration_ms IS NOT NULL AND r.ts_utc >= ?
+            )
+            SELECT grp AS "group", n AS runs, ROUND(duration_ms, 1) AS p{int(percentile)}_ms
+            FROM ranked
+            WHERE rn = MAX(1, (n * ? + 99) / 100)
+            ORDER BY duration_ms DESC
+        """, (since or 0, int(percentile)))
+
+    def top_issue_codes(self, limit: int = 10, kind: Optional[str] = None,
+                        since: Optional[int] = None) -> List[Dict]:
+        """Most frequent issue codes, with how many distinct runs hit each."""
+        return self._rows("""
+            SELECT i.code, i.kind, COUNT(*) AS occurrences, COUNT(DISTINCT i.run_id) AS runs
+            FROM issues i JOIN runs r ON r.run_id = i.run_id
+            WHERE i.code IS NOT NULL AND (? IS NULL OR i.kind = ?) AND r.ts_utc >= ?
+            GROUP BY i.code, i.kind
+            ORDER BY occurrences DESC, i.code
+            LIMIT ?
+        """, (kind, kind, since or 0, limit))
+
+    def gate_rejection_rate(self, by: Optional[str] = None,
+                            since: Optional[int] = None) -> List[Dict]:
+        """Share of gate decisions that were rejections, per group."""
+        group = GROUPINGS[by]
+        return self._rows(f"""
+            SELECT {group} AS "group", g.gate_name,
+                   COUNT(*) AS decisions,
+                   SUM(g.decision = 'rejected') AS rejected,
+                   ROUND(100.0 * SUM(g.decision = 'rejected') / COUNT(*), 1) AS rejection_pct
+            FROM gate_decisions g JOIN runs r ON r.run_id = g.run_id
+            WHERE r.ts_utc >= ?
+            GROUP BY 1, g.gate_name
+            ORDER BY rejection_pct DESC
+        """, (since or 0,))
+
+    def slowest_methods(self, limit: int = 10, since: Optional[int] = None) -> List[Dict]:
+        """MCP methods by total time spent, with failure rate."""
+        return self._rows("""
+            SELECT c.method, COUNT(*) AS calls,
+                   ROUND(AVG(c.elapsed_ms), 1) AS avg_ms,
+                   ROUND(SUM(c.elapsed_ms) / 1000.0, 1) AS total_s,
+                   ROUND(100.0 * SUM(c.result = 'fail') / COUNT(*), 1) AS failure_pct
+            FROM mcp_calls c JOIN runs r ON r.run_id = c.run_id
+            WHERE r.ts_utc >= ?
+            GROUP BY c.method
+            ORDER BY total_s DESC
+            LIMIT ?
+        """, (since or 0, limit))
+
+    def stop_reasons(self, since: Optional[int] = None) -> List[Dict]:
+        return self._rows("""
+            SELECT COALESCE(stop_reason, 'unknown') AS stop_reason, COUNT(*) AS runs
+            FROM runs WHERE ts_utc >= ?
+            GROUP BY 1 ORDER BY runs DESC
+        """, (since or 0,))
+
+    def score_trend(self, sector: Optional[str] = None, metric: str = "pack_coverage_pct") -> List[Dict]:
+        """Baseline vs final score per day (from the stored score JSON)."""
+        return self._rows("""
+            SELECT DATE(ts_utc, 'unixepoch') AS day, COUNT(*) AS runs,
+                   ROUND(AVG(json_extract(baseline_scores_json, '$.' || ?)), 1) AS baseline,
+                   ROUND(AVG(json_extract(final_scores_json, '$.' || ?)), 1) AS final
+            FROM runs
+            WHERE final_scores_json IS NOT NULL AND (? IS NULL OR sector = ?)
+            GROUP BY day ORDER BY day
+        """, (metric, metric, sector, sector))
+
+    def summary(self, since: Optional[int] = None) -> Dict:
+        return {
+            "runs": self.conn.execute("SELECT COUNT(*) FROM runs WHERE ts_utc >= ?",
+                                      (since or 0,)).fetchone()[0],
+            "p95_duration_by_sector": self.duration_percentile(95, "sector", since),
+            "top_issue_codes": self.top_issue_codes(10, since=since),
+            "gate_rejection_rate": self.gate_rejection_rate(since=since),
+            "slowest_methods": self.slowest_methods(5, since),
+            "stop_reasons": self.stop_reasons(since),
+        }
+
+
+def _print_table(title: str, rows: List[Dict]):
+    print(f"\n{title}")
+    print("-" * 60)
+    if not rows:
+        print("  (no data)")
+        return
+    for row in rows:
+        print("  " + "  ".join(f"{k}={v}" for k, v in row.items()))
+
+
+def main():
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Spine learning ingestion and analytics")
+    parser.add_argument("--db", default=str(DEFAULT_DB), help="Learning database path")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    ingest = sub.add_parser("ingest", help="Load reports, NDJSON logs and evidence zips")
+    ingest.add_argument("paths", nargs="*", help="Files or folders (default: reports/ evidence/)")
+    ingest.add_argument("--rebuild", action="store_true", help="Clear and reload all run data")
+    ingest.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+
+    report = sub.add_parser("report", help="Print trend summary")
+    report.add_argument("--since", help="Only runs on/after this date (YYYY-MM-DD)")
+    report.add_argument("--json", action="store_true", help="Print JSON instead of tables")
+
+    args = parser.parse_args()
+
+    if args.command == "ingest":
+        start = time.perf_counter()
+        stats = ingest_artifacts([Path(p) for p in args.paths] or None, Path(args.db),
+                                 args.batch_size, args.rebuild)
+        print(f"Ingested {stats.sources_ingested} artifacts "
+              f"({stats.sources_skipped} unchanged, {stats.sources_failed} failed) "
+              f"in {time.perf_counter() - start:.2f}s")
+        print(f"  runs={stats.runs} issues={stats.issues} gates={stats.gates} calls={stats.calls}")
+        for error in stats.errors:
+            print(f"  ! {error}")
+        return
+
+    since = int(_epoch(args.since)) if args.since else None
+    analytics = LearningAnalytics(Path(args.db))
+    try:
+        summary = analytics.summary(since)
+    finally:
+        analytics.close()
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+    print(f"Runs: {summary['runs']}")
+    _print_table("p95 duration per sector (ms)", summary["p95_duration_by_sector"])
+    _print_table("Most frequent issue codes", summary["top_issue_codes"])
+    _print_table("Gate rejection rate", summary["gate_rejection_rate"])
+    _print_table("Slowest MCP methods", summary["slowest_methods"])
+    _print_table("Stop reasons", summary["stop_reasons"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,504 @@
+#!/usr/bin/env python3
+"""
+Method Gym Runner - Run capability_system/method_gym tests concurrently
+
+Loads every gym test (pending/*.json and tests/<method>/<test>/test_artifact.json),
+executes them against one or more bridge endpoints, evaluates
+expectedOutcome.assertions the same way CapabilityMethods.ValidateAssertions
+does, and reports per-method latency distributions.
+
+Bench mode repeats each read-only method from method_registry.json N times
+(filtered by tier / category) to produce a per-release performance baseline.
+
+Endpoints are the same pool the regression harness uses: live Revit sessions
+(named pipes, always driven serially - Revit is single-threaded) or recorded
+snapshots. With --replay the recorded actualResult of every executed gym
+artifact stands in for the bridge, so the runner also works without Revit.
+
+Usage:
+    python method_gym_runner.py                        # run all gym tests on the default pipe
+    python method_gym_runner.py --replay               # run against recorded gym results
+    python method_gym_runner.py --endpoints endpoints.json --workers 8
+    python method_gym_runner.py --bench --repeat 20 --tier 1 --category Levels
+    python method_gym_runner.py --bench --release 2.4.0 --save --compare baseline.json
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, field
+from datetime import datetime
+from pathlib import Path
+from queue import Queue
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from regression_harness import BridgeEndpoint, load_endpoints, snapshot_key
+
+CAPABILITY_DIR = Path(__file__).resolve().parents[2] / "capability_system"
+GYM_DIR = CAPABILITY_DIR / "method_gym"
+REGISTRY_FILE = CAPABILITY_DIR / "method_registry" / "method_registry.json"
+
+# Methods with these prefixes only read the model and are safe to repeat
+READ_ONLY_PREFIXES = ("get", "list", "ping", "find", "search", "query", "count")
+
+# Bench regressions: p50 slower than baseline by more than this factor
+REGRESSION_FACTOR = 1.2
+
+Transport = Callable[..., dict]
+
+
+@dataclass
+class GymTest:
+    """One gym test case."""
+    test_id: str
+    method: str
+    params: Dict[str, Any]
+    expected: Dict[str, Any]
+    source: str
+
+
+@dataclass
+class GymResult:
+    """Outcome of running one gym test."""
+    test_id: str
+    method: str
+    passed: bool
+    duration_ms: float
+    endpoint: str
+    assertion_results: List[Dict] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+# =============================================================================
+# LOADING
+# =============================================================================
+
+def load_gym_tests(gym_dir: Path = GYM_DIR) -> List[GymTest]:
+    """All gym tests, pending and executed, de-duplicated by testId."""
+    files = sorted((gym_dir / "pending").glob("*.json"))
+    files += sorted((gym_dir / "tests").glob("*/*/test_artifact.json"))
+
+    tests: Dict[str, GymTest] = {}
+    for path in files:
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"  Skipping {path}: {e}")
+            continue
+        request = data.get("taskRequest", {})
+        method = request.get("method") or data.get("methodName")
+        test_id = data.get("testId") or path.stem
+        if not method or test_id in tests:
+            continue
+        tests[test_id] = GymTest(
+            test_id=test_id,
+            method=method,
+            params=request.get("params") or {},
+            expected=data.get("expectedOutcome") or {"success": True},
+            source=str(path),
+        )
+    return list(tests.values())
+
+
+def load_registry(path: Path = REGISTRY_FILE) -> Dict[str, Dict]:
+    """Method name -> registry entry (tier, category, status, ...)."""
+    with open(path) as f:
+        return json.load(f).get("methods", {})
+
+
+def recorded_transport(gym_dir: Path = GYM_DIR) -> Transport:
+    """Replay the actualResult recorded in executed gym artifacts."""
+    responses: Dict[str, dict] = {}
+    files = sorted((gym_dir / "tests").glob("*/*/test_artifact.json"))
+    files += sorted((gym_dir / "results").glob("*.json"))
+    for path in files:
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            continue
+        request = data.get("taskRequest", {})
+        if "actualResult" in data and request.get("method"):
+            responses[snapshot_key(request["method"], request.get("params") or None)] = data["actualResult"]
+
+    def replay(method: str, params: dict = None, timeout: int = 60) -> dict:
+        key = snapshot_key(method, params or None)
+        if key not in responses:
+            return {"success": False, "error": f"Not in recording: {key}"}
+        return responses[key]
+
+    return replay
+
+
+# =============================================================================
+# ASSERTIONS
+# =============================================================================
+
+_OPERATORS = {
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    ">=": lambda a, b: a >= b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    "<": lambda a, b: a < b,
+}
+
+
+def _count(value: Any) -> int:
+    if isinstance(value, (list, dict)):
+        return len(value)
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def evaluate_assertions(expected: Dict, actual: Dict) -> List[Dict]:
+    """
+    Mirror of CapabilityMethods.ValidateAssertions. Also accepts the
+    {field, operator, value} form used by pending tests; assertions that need
+    before/after model state (elementCreated, ...) are reported as skipped.
+    """
+    results = []
+    expected_success = expected.get("success", True)
+    actual_success = bool(actual.get("success", False))
+    results.append({
+        "assertion": {"type": "successEquals"},
+        "passed": expected_success == actual_success,
+        "expected": expected_success,
+        "actual": actual_success,
+        "message": "Success check passed" if expected_success == actual_success
+                   else f"Expected success={expected_success}, got {actual_success}",
+    })
+
+    for assertion in expected.get("assertions", []):
+        kind = assertion.get("type")
+        target = assertion.get("target") or assertion.get("field")
+        want = assertion.get("expected", assertion.get("value"))
+
+        if kind == "noError":
+            error = actual.get("error")
+            results.append({"assertion": assertion, "passed": error is None, "actual": error,
+                            "message": f"Error occurred: {error}" if error is not None else "No errors"})
+        elif kind == "countEquals":
+            op = assertion.get("operator", "==")
+            got = _count(actual.get(target))
+            want_count = _count(want)
+            ok = _OPERATORS.get(op, _OPERATORS["=="])(got, want_count)
+            results.append({"assertion": assertion, "passed": ok, "expected": want_count, "actual": got,
+                            "message": "Count matches" if ok else f"Expected {op} {want_count}, got {got}"})
+        elif kind == "parameterEquals":
+            got = actual.get(target)
+            got_str = None if got is None else str(got)
+            want_str = None if want is None else str(want)
+            results.append({"assertion": assertion, "passed": got_str == want_str,
+                            "expected": want_str, "actual": got_str,
+                            "message": "Parameter matches" if got_str == want_str
+                                       else f"Expected {want_str}, got {got_str}"})
+        elif kind == "errorType":
+            error = str(actual.get("error") or "")
+            ok = bool(error) and str(want or "").lower() in error.lower()
+            results.append({"assertion": assertion, "passed": ok, "expected": want, "actual": error or None,
+                            "message": "Error matches" if ok else f"Expected error like {want}"})
+        else:
+            results.append({"assertion": assertion, "passed": None,
+                            "message": f"Skipped: {kind} needs model state capture"})
+    return results
+
+
+# =============================================================================
+# LATENCY
+# =============================================================================
+
+def latency_summary(samples_ms: List[float]) -> Dict[str, float]:
+    """count/mean/min/max and nearest-rank percentiles of latency samples."""
+    if not samples_ms:
+        return {"count": 0}
+    ordered = sorted(samples_ms)
+    n = len(ordered)
+
+    def pct(p: float) -> float:
+        return round(ordered[max(0, min(n - 1, int(-(-p * n // 100)) - 1))], 2)
+
+    return {
+        "count": n,
+        "mean": round(sum(ordered) / n, 2),
+        "min": round(ordered[0], 2),
+        "p50": pct(50),
+        "p90": pct(90),
+        "p99": pct(99),
+        "max": round(ordered[-1], 2),
+    }
+
+
+# =============================================================================
+# RUNNER
+# =============================================================================
+
+class MethodGymRunner:
+    """
+    Runs gym tests across a pool of transports.
+
+    Live endpoints get one slot each (their requests are serialized); recorded
+    endpoints get `workers` slots since replay has no shared state.
+    """
+
+    def __init__(self, transports: List[Tuple[str, Transport, bool]], workers: int = 4,
+                 timeout: int = 60):
+        self.timeout = timeout
+        self.slots: "Queue[Tuple[str, Transport]]" = Queue()
+        for name, send, is_live in transports:
+            for _ in range(1 if is_live else max(1, workers)):
+                self.slots.put((name, send))
+        self.workers = self.slots.qsize()
+        self.latencies: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_endpoints(cls, endpoints: List[BridgeEndpoint], workers: int = 4,
+                       timeout: int = 60) -> "MethodGymRunner":
+        return cls([(e.name, e.make_transport(), e.snapshot_file is None) for e in endpoints],
+                   workers=workers, timeout=timeout)
+
+    def _call(self, method: str, params: Dict) -> Tuple[dict, float, str]:
+        name, send = self.slots.get()
+        try:
+            start = time.perf_counter()
+            try:
+                response = send(method, params or None, timeout=self.timeout)
+            except Exception as e:
+                response = {"success": False, "error": str(e)}
+            elapsed_ms = (time.perf_counter() - start) * 1000
+        finally:
+            self.slots.put((name, send))
+        with self._lock:
+            self.latencies.setdefault(method, []).append(elapsed_ms)
+        return response, elapsed_ms, name
+
+    def run_test(self, test: GymTest) -> GymResult:
+        response, elapsed_ms, endpoint = self._call(test.method, test.params)
+        assertions = evaluate_assertions(test.expected, response)
+        passed = all(a["passed"] is not False for a in assertions)
+        return GymResult(
+            test_id=test.test_id,
+            method=test.method,
+            passed=passed,
+            duration_ms=round(elapsed_ms, 2),
+            endpoint=endpoint,
+            assertion_results=assertions,
+            error=response.get("error"),
+        )
+
+    def run(self, tests: List[GymTest]) -> List[GymResult]:
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(self.run_test, tests))
+
+    def bench(self, methods: List[str], repeat: int,
+              params_for: Optional[Dict[str, Dict]] = None) -> Dict[str, Dict]:
+        """
+        Call each method `repeat` times (after one warm-up call). Methods whose
+        warm-up fails are reported with the error and not repeated.
+        """
+        params_for = params_for or {}
+        results: Dict[str, Dict] = {}
+
+        def warm(method: str):
+            response, _, _ = self._call(method, params_for.get(method, {}))
+            return method, response
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            warmed = list(pool.map(warm, methods))
+            with self._lock:
+                self.latencies.clear()
+
+            runnable = []
+            for method, response in warmed:
+                if response.get("success"):
+                    runnable.append(method)
+                else:
+                    results[method] = {"error": response.get("error", "call failed")}
+
+            calls = [m for m in runnable for _ in range(repeat)]
+            errors: Dict[str, int] = {}
+            for method, (response, _, _) in zip(calls, pool.map(
+                    lambda m: self._call(m, params_for.get(m, {})), calls)):
+                if not response.get("success"):
+                    errors[method] = errors.get(method, 0) + 1
+
+        for method in runnable:
+            results[method] = latency_summary(self.latencies.get(method, []))
+            results[method]["errors"] = errors.get(method, 0)
+        return results
+
+    def latency_report(self) -> Dict[str, Dict]:
+        with self._lock:
+            return {m: latency_summary(s) for m, s in sorted(self.latencies.items())}
+
+
+def select_bench_methods(registry: Dict[str, Dict], tiers: Optional[List[int]] = None,
+                         categories: Optional[List[str]] = None) -> List[str]:
+    """Active read-only registry methods, optionally filtered by tier and category."""
+    selected = []
+    for name, entry in registry.items():
+        if entry.get("status", "active") != "active" or not name.startswith(READ_ONLY_PREFIXES):
+            continue
+        if tiers and entry.get("tier") not in tiers:
+            continue
+        if categories and entry.get("category") not in categories:
+            continue
+        selected.append(name)
+    return selected
+
+
+def build_baseline(bench: Dict[str, Dict], registry: Dict[str, Dict], release: str,
+                   repeat: int) -> Dict:
+    """Baseline document: per-method stats plus per-category p50 medians."""
+    by_category: Dict[str, List[float]] = {}
+    methods = {}
+    for name, stats in sorted(bench.items()):
+        entry = registry.get(name, {})
+        methods[name] = {"tier": entry.get("tier"), "category": entry.get("category"), **stats}
+        if "p50" in stats:
+            by_category.setdefault(entry.get("category", "Unknown"), []).append(stats["p50"])
+
+    return {
+        "release": release,
+        "recorded_at": datetime.now().isoformat(),
+        "repeat": repeat,
+        "methods": methods,
+        "categories": {
+            cat: {"methods": len(vals), "median_p50": latency_summary(vals)["p50"]}
+            for cat, vals in sorted(by_category.items())
+        },
+    }
+
+
+def compare_baselines(current: Dict, baseline: Dict, factor: float = REGRESSION_FACTOR) -> List[Dict]:
+    """Methods whose p50 grew by more than `factor` against the baseline."""
+    regressions = []
+    for name, stats in current.get("methods", {}).items():
+        before = baseline.get("methods", {}).get(name, {})
+        if "p50" in stats and before.get("p50"):
+            ratio = stats["p50"] / before["p50"]
+            if ratio > factor:
+                regressions.append({"method": name, "baseline_p50": before["p50"],
+                                    "p50": stats["p50"], "ratio": round(ratio, 2)})
+    return sorted(regressions, key=lambda r: -r["ratio"])
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def _print_latencies(report: Dict[str, Dict]):
+    print(f"\n  {'method':<36}{'n':>5}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}  (ms)")
+    for method, stats in report.items():
+        if "error" in stats:
+            print(f"  {method:<36}  ERROR: {stats['error']}")
+            continue
+        print(f"  {method:<36}{stats['count']:>5}{stats['p50']:>10.1f}{stats['p90']:>10.1f}"
+              f"{stats['p99']:>10.1f}{stats['max']:>10.1f}")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run method gym tests and bridge benchmarks")
+    parser.add_argument("--endpoints", "-e", help="Endpoint pool JSON (see regression_harness.py)")
+    parser.add_argument("--replay", action="store_true", help="Use recorded gym results instead of Revit")
+    parser.add_argument("--workers", "-w", type=int, default=4, help="Concurrent calls per recorded endpoint")
+    parser.add_argument("--timeout", type=int, default=60)
+    parser.add_argument("--method", "-m", action="append", help="Only run tests for this method")
+    parser.add_argument("--bench", action="store_true", help="Benchmark read-only registry methods")
+    parser.add_argument("--repeat", "-n", type=int, default=10, help="Calls per method in bench mode")
+    parser.add_argument("--tier", type=int, action="append", help="Bench only this tier (repeatable)")
+    parser.add_argument("--category", action="append", help="Bench only this category (repeatable)")
+    parser.add_argument("--release", help="Bridge release label for the baseline")
+    parser.add_argument("--compare", "-c", help="Baseline JSON to compare bench results against")
+    parser.add_argument("--save", "-s", action="store_true", help="Save results under method_gym/results")
+    args = parser.parse_args()
+
+    if args.replay:
+        runner = MethodGymRunner([("recorded", recorded_transport(), False)], workers=args.workers,
+                                 timeout=args.timeout)
+    elif args.endpoints:
+        runner = MethodGymRunner.from_endpoints(load_endpoints(Path(args.endpoints)),
+                                                workers=args.workers, timeout=args.timeout)
+    else:
+        runner = MethodGymRunner.from_endpoints([BridgeEndpoint(name="local")],
+                                                workers=args.workers, timeout=args.timeout)
+
+    tests = load_gym_tests()
+    if args.method:
+        tests = [t for t in tests if t.method in args.method]
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    print("=" * 70)
+    print("METHOD GYM " + ("BENCH" if args.bench else "RUN"))
+    print("=" * 70)
+    print(f"  Slots: {runner.workers}")
+
+    if args.bench:
+        registry = load_registry()
+        methods = select_bench_methods(registry, args.tier, args.category)
+        if args.method:
+            methods = [m for m in methods if m in args.method]
+        params_for = {t.method: t.params for t in reversed(tests)}
+        print(f"  Methods: {len(methods)} read-only, {args.repeat} calls each")
+
+        start = time.perf_counter()
+        bench = runner.bench(methods, args.repeat, params_for)
+        elapsed = time.perf_counter() - start
+        release = args.release or json.loads(REGISTRY_FILE.read_text()).get("version", "unknown")
+        baseline = build_baseline(bench, registry, release, args.repeat)
+
+        _print_latencies(dict(sorted(bench.items())))
+        print(f"\n  {sum(s.get('count', 0) for s in bench.values())} calls in {elapsed:.1f}s")
+
+        if args.compare:
+            with open(args.compare) as f:
+                regressions = compare_baselines(baseline, json.load(f))
+            print(f"\n  Regressions vs {args.compare}: {len(regressions)}")
+            for r in regressions:
+                print(f"    {r['method']}: p50 {r['baseline_p50']} -> {r['p50']} ms ({r['ratio']}x)")
+            baseline["regressions"] = regressions
+
+        if args.save:
+            out = GYM_DIR / "results" / f"bench_{release}_{stamp}.json"
+            out.write_text(json.dumps(baseline, indent=2))
+            print(f"\n  Baseline saved: {out}")
+        return 0
+
+    print(f"  Tests: {len(tests)}")
+    start = time.perf_counter()
+    results = runner.run(tests)
+    elapsed = time.perf_counter() - start
+
+    for r in results:
+        print(f"  [{'PASS' if r.passed else 'FAIL'}] {r.test_id} ({r.method}, {r.duration_ms:.0f} ms, {r.endpoint})")
+        for a in r.assertion_results:
+            if a["passed"] is False:
+                print(f"         {a['message']}")
+
+    passed = sum(1 for r in results if r.passed)
+    print(f"\n  {passed}/{len(results)} passed in {elapsed:.2f}s")
+    _print_latencies(runner.latency_report())
+
+    if args.save:
+        out = GYM_DIR / "results" / f"gym_run_{stamp}.json"
+        out.write_text(json.dumps({
+            "run_at": datetime.now().isoformat(),
+            "passed": passed,
+            "total": len(results),
+            "results": [asdict(r) for r in results],
+            "latency": runner.latency_report(),
+        }, indent=2))
+        print(f"\n  Results saved: {out}")
+
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
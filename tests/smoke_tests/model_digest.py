@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Model Digest - One extraction of the model basics, shared by every consumer
+
+Readiness checks, environment capture, compliance extraction and the project
+profiler all need the same handful of lists (levels, sheets, rooms,
+wall/door/window types, project info, plus a few floor plan views to prove
+views are queryable). Fetching them one request at a time
+costs a PowerShell spawn and a pipe round trip each.
+
+The digest fetches them in ONE batchExecute envelope (falling back to single
+requests, one after another, if the bridge rejects the batch) and caches the
+result per document revision, so nothing is re-queried until the model
+actually changes.
+
+Usage:
+    from model_digest import fetch_model_digest
+
+    digest = fetch_model_digest()
+    levels = digest.items("levels", "levels")
+    resp = digest.response("sheets")   # same shape send_mcp_request returns
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from filtered_queries import send_mcp_request
+
+
+# Digest key -> (MCP method, params)
+DIGEST_QUERIES: Dict[str, Tuple[str, Optional[dict]]] = {
+    "levels": ("getLevels", None),
+    "sheets": ("getAllSheets", None),
+    # Readiness only needs to know views are queryable; consumers that need
+    # every view query getViews themselves
+    "views": ("getViews", {"viewType": "FloorPlan", "limit": 10}),
+    "rooms": ("getRooms", None),
+    "wall_types": ("getWallTypes", None),
+    "door_types": ("getDoorTypes", None),
+    "window_types": ("getWindowTypes", None),
+    "project_info": ("getProjectInfo", None),
+}
+
+# Cheap queries that identify the document and its last modification
+REVISION_QUERIES: Dict[str, Tuple[str, Optional[dict]]] = {
+    "document_info": ("getDocumentInfo", None),
+    "last_change": ("getLastChangeTime", None),
+}
+
+MAX_CACHED_DIGESTS = 8
+
+_cache: "OrderedDict[str, ModelDigest]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+@dataclass
+class ModelDigest:
+    """Raw responses for each digest key plus the revision they belong to."""
+    revision: Optional[str]
+    fetched_at: str
+    responses: Dict[str, dict] = field(default_factory=dict)
+    document_info: Dict[str, Any] = field(default_factory=dict)
+    batched: bool = True
+
+    def response(self, key: str) -> dict:
+        """Response for a digest key, shaped like send_mcp_request's return."""
+        return self.responses.get(key, {"success": False, "error": f"Not in digest: {key}"})
+
+    def ok(self, key: str) -> bool:
+        return bool(self.response(key).get("success"))
+
+    def items(self, key: str, *list_keys: str) -> List[Dict]:
+        """
+        List payload for a key, tolerating result-wrapped responses.
+        Tries each list key in turn (e.g. "doorTypes", "types").
+        """
+        resp = self.response(key)
+        if not resp.get("success"):
+            return []
+        result = resp.get("result", resp)
+        for list_key in list_keys:
+            if list_key in result:
+                return result.get(list_key) or []
+            if list_key in resp:
+                return resp.get(list_key) or []
+        return []
+
+    def result(self, key: str) -> Dict:
+        """Unwrapped result dict for a key (empty on failure)."""
+        resp = self.response(key)
+        if not resp.get("success"):
+            return {}
+        return resp.get("result", resp)
+
+
+def _batch(send: Callable[..., dict], queries: Dict[str, Tuple[str, Optional[dict]]],
+           name: str, timeout: int) -> Optional[Dict[str, dict]]:
+    """Run queries in one batchExecute envelope. None if the batch itself failed."""
+    keys = list(queries.keys())
+    operations = [{"method": m, "params": p or {}} for m, p in queries.values()]
+
+    resp = send("batchExecute", {
+        "batchName": name,
+        "stopOnError": False,
+        "operations": operations
+    }, timeout=timeout)
+
+    results = resp.get("result", resp).get("results")
+    if not isinstance(results, list) or len(results) != len(keys):
+        return None
+
+    responses = {}
+    for key, entry in zip(keys, results):
+        inner = entry.get("result")
+        if isinstance(inner, dict):
+            responses[key] = inner
+        else:
+            responses[key] = {"success": False, "error": entry.get("error", "No result")}
+    return responses
+
+
+def _sequential(send: Callable[..., dict], queries: Dict[str, Tuple[str, Optional[dict]]],
+                timeout: int) -> Dict[str, dict]:
+    """Fallback: issue each query as its own request. The bridge serves one
+    pipe request at a time, so they go one after another."""
+    responses = {}
+    for key, (method, params) in queries.items():
+        responses[key] = send(method, params, timeout=timeout)
+    return responses
+
+
+def probe_revision(send: Callable[..., dict] = send_mcp_request,
+                   timeout: int = 30) -> Tuple[Optional[str], Dict[str, Any]]:
+    """
+    Identify the open document revision: (revision key, document info).
+    Revision is None when it cannot be determined (nothing gets cached then).
+    """
+    responses = _batch(send, REVISION_QUERIES, "modelDigestProbe", timeout)
+    if responses is None:
+        return None, {}
+
+    doc = responses["document_info"]
+    change = responses["last_change"]
+    if not doc.get("success") or not change.get("success"):
+        return None, doc.get("result", doc) if doc.get("success") else {}
+
+    doc_info = doc.get("result", doc)
+    doc_id = doc_info.get("pathName") or doc_info.get("title") or "untitled"
+    changed_at = change.get("result", change).get("lastChangeTime", "")
+    return f"{doc_id}|{changed_at}", doc_info
+
+
+def fetch_model_digest(send: Callable[..., dict] = send_mcp_request,
+                       use_cache: bool = True, timeout: int = 120) -> ModelDigest:
+    """
+    Fetch (or reuse) the model digest for the currently open document.
+
+    Args:
+        send: Transport with the signature of send_mcp_request
+        use_cache: Reuse a digest fetched for the same document revision
+        timeout: Timeout for the batched request in seconds
+    """
+    revision, doc_info = probe_revision(send)
+
+    if use_cache and revision:
+        with _cache_lock:
+            cached = _cache.get(revision)
+            if cached:
+                _cache.move_to_end(revision)
+                return cached
+
+    responses = _batch(send, DIGEST_QUERIES, "modelDigest", timeout)
+    batched = responses is not None
+    if not batched:
+        responses = _sequential(send, DIGEST_QUERIES, timeout)
+
+    digest = ModelDigest(
+        revision=revision,
+        fetched_at=datetime.now().isoformat(),
+        responses=responses,
+        document_info=doc_info,
+        batched=batched
+    )
+
+    if revision:
+        with _cache_lock:
+            _cache[revision] = digest
+            while len(_cache) > MAX_CACHED_DIGESTS:
+                _cache.popitem(last=False)
+
+    return digest
+
+
+def clear_digest_cache() -> None:
+    """Forget all cached digests (e.g. after a run that modified the model)."""
+    with _cache_lock:
+        _cache.clear()
+
+
+if __name__ == "__main__":
+    import json
+
+    d = fetch_model_digest()
+    print(json.dumps({
+        "revision": d.revision,
+        "batched": d.batched,
+        "counts": {
+            "levels": len(d.items("levels", "levels")),
+            "sheets": len(d.items("sheets", "sheets")),
+            "views": len(d.items("views", "views")),
+            "rooms": len(d.items("rooms", "rooms")),
+        }
+    }, indent=2))
@@ -68,9 +68,9 @@ def load_standards_pack(pack_name: str) -> dict:
     return None
 
 
-def profile_levels(standards: dict = None) -> dict:
+def profile_levels(standards: dict = None, digest=None) -> dict:
     """Profile levels in the project."""
-    resp = send_mcp_request("getLevels")
+    resp = digest.response("levels") if digest else send_mcp_request("getLevels")
 
     if not resp.get("success"):
         return {"detected": [], "count": 0, "error": resp.get("error")}
@@ -249,9 +249,9 @@ def profile_existing_views() -> dict:
     }
 
 
-def profile_existing_sheets() -> dict:
+def profile_existing_sheets(digest=None) -> dict:
     """Profile existing sheets in the project."""
-    resp = send_mcp_request("getAllSheets")
+    resp = digest.response("sheets") if digest else send_mcp_request("getAllSheets")
 
     if not resp.get("success"):
         return {"count": 0, "error": resp.get("error")}
@@ -362,8 +362,12 @@ def profile_project(standards_pack_name: str = None) -> dict:
         else:
             print(f"Warning: Standards pack '{standards_pack_name}' not found")
 
+    # Levels and sheets come from the shared model digest
+    from model_digest import fetch_model_digest
+    digest = fetch_model_digest()
+
     print("\n[1/6] Profiling levels...")
-    levels = profile_levels(standards)
+    levels = profile_levels(standards, digest)
     print(f"  Found {levels['count']} levels")
 
     print("\n[2/6] Profiling title blocks...")
@@ -383,7 +387,7 @@ def profile_project(standards_pack_name: str = None) -> dict:
     print(f"  Sections: {len(views.get('sections', []))}")
 
     print("\n[5/6] Profiling existing sheets...")
-    sheets = profile_existing_sheets()
+    sheets = profile_existing_sheets(digest)
     print(f"  Sheets: {sheets['count']}")
 
     print("\n[6/6] Generating recommendations...")
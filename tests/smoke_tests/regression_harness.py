@@ -10,16 +10,26 @@ Usage:
     python regression_harness.py --run-all        # Run assessment on all projects
     python regression_harness.py --project 512    # Run on specific project
     python regression_harness.py --compare        # Compare to baseline
+    python regression_harness.py --endpoints endpoints.json   # Parallel, one worker per session
 
 Projects are registered in projects.json with expected characteristics.
+
+Endpoints file (one entry per Revit session or recorded snapshot):
+    {"endpoints": [
+        {"name": "rev-a", "pipe_name": "RevitMCPBridge2026_A", "projects": ["512_clematis"]},
+        {"name": "snap-avon", "snapshot_file": "snapshots/avon.json", "projects": ["avon_park_sfh"]}
+    ]}
 """
 
 import json
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, asdict, field
+from typing import Callable, Dict, List, Optional, Any
 
 
 @dataclass
@@ -46,6 +56,83 @@ class ProjectResult:
     state_summary: Optional[Dict] = None
     gap_summary: Optional[Dict] = None
     duration_seconds: float = 0.0
+    endpoint: Optional[str] = None
+
+
+def snapshot_key(method: str, params: Optional[dict] = None) -> str:
+    """Stable lookup key for a recorded MCP response."""
+    if not params:
+        return method
+    return f"{method}|{json.dumps(params, sort_keys=True)}"
+
+
+@dataclass
+class BridgeEndpoint:
+    """
+    One source of MCP responses: a live Revit session (named pipe) or a
+    recorded snapshot of one. Each endpoint serves the projects listed in
+    `projects`; Revit is single-threaded, so requests to one endpoint are
+    always issued serially.
+    """
+    name: str
+    pipe_name: Optional[str] = None
+    snapshot_file: Optional[str] = None
+    projects: List[str] = field(default_factory=list)
+
+    def make_transport(self, record_dir: Optional[Path] = None) -> Callable[..., dict]:
+        """Build a send_mcp_request-compatible callable for this endpoint."""
+        if self.snapshot_file:
+            with open(self.snapshot_file) as f:
+                responses = json.load(f).get("responses", {})
+
+            def replay(method: str, params: dict = None, timeout: int = 60) -> dict:
+                key = snapshot_key(method, params)
+                if key not in responses:
+                    return {"success": False, "error": f"Not in snapshot: {key}"}
+                return responses[key]
+
+            return replay
+
+        from state_assessment import send_mcp_request, DEFAULT_PIPE_NAME
+        pipe_name = self.pipe_name or DEFAULT_PIPE_NAME
+
+        def live(method: str, params: dict = None, timeout: int = 60) -> dict:
+            return send_mcp_request(method, params, timeout=timeout, pipe_name=pipe_name)
+
+        if record_dir is None:
+            return live
+
+        return SnapshotRecorder(live, Path(record_dir) / f"{self.name}.json")
+
+
+class SnapshotRecorder:
+    """Wraps a live transport and saves every response for later replay."""
+
+    def __init__(self, send: Callable[..., dict], output_file: Path):
+        self.send = send
+        self.output_file = output_file
+        self.responses: Dict[str, dict] = {}
+
+    def __call__(self, method: str, params: dict = None, timeout: int = 60) -> dict:
+        resp = self.send(method, params, timeout=timeout)
+        self.responses[snapshot_key(method, params)] = resp
+        return resp
+
+    def save(self) -> Path:
+        self.output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.output_file, 'w') as f:
+            json.dump({
+                "recorded_at": datetime.now().isoformat(),
+                "responses": self.responses
+            }, f, indent=2)
+        return self.output_file
+
+
+def load_endpoints(filepath: Path) -> List[BridgeEndpoint]:
+    """Load endpoint pool from JSON file."""
+    with open(filepath) as f:
+        data = json.load(f)
+    return [BridgeEndpoint(**e) for e in data.get("endpoints", [])]
 
 
 # Default project registry - can be overridden by projects.json
@@ -114,6 +201,7 @@ class RegressionHarness:
             self.projects = {p.id: p for p in DEFAULT_PROJECTS}
 
         self.results: List[ProjectResult] = []
+        self.wall_seconds: Optional[float] = None
 
     def _load_projects(self, filepath: Path) -> Dict[str, ProjectConfig]:
         """Load project configurations from JSON file."""
@@ -142,21 +230,23 @@ class RegressionHarness:
         print(f"Total: {len(self.projects)} projects")
         print()
 
-    def run_assessment(self, project_id: str, verbose: bool = False) -> ProjectResult:
+    def run_assessment(self, project_id: str, verbose: bool = False,
+                       send: Optional[Callable[..., dict]] = None,
+                       endpoint_name: Optional[str] = None) -> ProjectResult:
         """
         Run state assessment on a specific project.
 
         Note: The actual Revit file must be open in Revit for this to work.
-        This method assumes the MCP server is connected to the active project.
+        By default this assumes the MCP server is connected to the active
+        project; pass `send` to target another session or a snapshot.
         """
-        import time
-
         if project_id not in self.projects:
             return ProjectResult(
                 project_id=project_id,
                 timestamp=datetime.now().isoformat(),
                 success=False,
-                error=f"Unknown project ID: {project_id}"
+                error=f"Unknown project ID: {project_id}",
+                endpoint=endpoint_name
             )
 
         project = self.projects[project_id]
@@ -168,23 +258,27 @@ class RegressionHarness:
         try:
             # Import state assessment
             from state_assessment import StateAssessor, send_mcp_request
+            send = send or send_mcp_request
 
             # Verify MCP connection
-            test_resp = send_mcp_request("getLevels")
+            test_resp = send("getLevels")
             if not test_resp.get("success"):
                 return ProjectResult(
                     project_id=project_id,
                     timestamp=datetime.now().isoformat(),
                     success=False,
                     error="MCP not connected",
-                    duration_seconds=time.time() - start_time
+                    duration_seconds=time.time() - start_time,
+                    endpoint=endpoint_name
                 )
 
             levels = test_resp.get("levels", [])
             print(f"  Connected: {len(levels)} levels found")
 
             # Load sector standards
-            sys.path.insert(0, str(self.base_dir / "template_packs"))
+            packs_dir = str(self.base_dir / "template_packs")
+            if packs_dir not in sys.path:
+                sys.path.insert(0, packs_dir)
             from pack_resolver import resolve_pack
 
             core_path = self.base_dir / "template_packs" / "_core" / "standards.json"
@@ -196,13 +290,14 @@ class RegressionHarness:
                     timestamp=datetime.now().isoformat(),
                     success=False,
                     error=f"Sector not found: {project.sector}",
-                    duration_seconds=time.time() - start_time
+                    duration_seconds=time.time() - start_time,
+                    endpoint=endpoint_name
                 )
 
             resolved = resolve_pack(core_path, sector_path)
 
             # Run assessment
-            assessor = StateAssessor(resolved)
+            assessor = StateAssessor(resolved, send=send)
             state = assessor.assess_all()
             gaps = assessor.find_gaps(state)
             report = assessor.generate_report(state, gaps)
@@ -241,7 +336,8 @@ class RegressionHarness:
                 error="; ".join(issues) if issues else None,
                 state_summary=state_summary,
                 gap_summary=gap_summary,
-                duration_seconds=duration
+                duration_seconds=duration,
+                endpoint=endpoint_name
             )
 
             print(f"  Sheets: {state_summary['sheets']}")
@@ -260,7 +356,8 @@ class RegressionHarness:
                 timestamp=datetime.now().isoformat(),
                 success=False,
                 error=str(e),
-                duration_seconds=time.time() - start_time
+                duration_seconds=time.time() - start_time,
+                endpoint=endpoint_name
             )
 
     def run_all(self, skip_inactive: bool = True) -> List[ProjectResult]:
@@ -313,6 +410,99 @@ class RegressionHarness:
 
         return self.results
 
+    def run_parallel(
+        self,
+        endpoints: List[BridgeEndpoint],
+        project_ids: Optional[List[str]] = None,
+        record_dir: Optional[Path] = None
+    ) -> List[ProjectResult]:
+        """
+        Run assessments across a pool of endpoints concurrently.
+
+        One worker thread per endpoint; each worker runs the projects its
+        endpoint serves one after another (a Revit session can only answer
+        one request at a time). Projects not served by any endpoint get a
+        failed result rather than being silently dropped.
+
+        Returns results in registry (or `project_ids`) order.
+        """
+        wanted = project_ids or list(self.projects.keys())
+
+        print("\n" + "=" * 70)
+        print(f"REGRESSION HARNESS - PARALLEL ({len(endpoints)} endpoints)")
+        print("=" * 70)
+
+        # Import once on the main thread so workers don't race on sys.path
+        packs_dir = str(self.base_dir / "template_packs")
+        if packs_dir not in sys.path:
+            sys.path.insert(0, packs_dir)
+        import state_assessment  # noqa: F401
+        import pack_resolver  # noqa: F401
+
+        # Route each project to the first endpoint that serves it
+        assignments: Dict[str, List[str]] = {e.name: [] for e in endpoints}
+        unrouted = []
+        for proj_id in wanted:
+            owner = next((e for e in endpoints if proj_id in e.projects), None)
+            if owner:
+                assignments[owner.name].append(proj_id)
+            else:
+                unrouted.append(proj_id)
+
+        print_lock = threading.Lock()
+
+        def work(endpoint: BridgeEndpoint) -> List[ProjectResult]:
+            try:
+                send = endpoint.make_transport(record_dir)
+            except Exception as e:
+                return [ProjectResult(
+                    project_id=proj_id,
+                    timestamp=datetime.now().isoformat(),
+                    success=False,
+                    error=f"Endpoint unavailable: {e}",
+                    endpoint=endpoint.name
+                ) for proj_id in assignments[endpoint.name]]
+
+            results = []
+            for proj_id in assignments[endpoint.name]:
+                result = self.run_assessment(proj_id, send=send, endpoint_name=endpoint.name)
+                with print_lock:
+                    status = "✓" if result.success else "✗"
+                    print(f"  {status} [{endpoint.name}] {proj_id} ({result.duration_seconds:.1f}s)")
+                results.append(result)
+
+            if isinstance(send, SnapshotRecorder):
+                send.save()
+            return results
+
+        start_time = time.time()
+        by_project: Dict[str, ProjectResult] = {}
+
+        active = [e for e in endpoints if assignments[e.name]]
+        if active:
+            with ThreadPoolExecutor(max_workers=len(active)) as pool:
+                futures = [pool.submit(work, e) for e in active]
+                for future in as_completed(futures):
+                    for result in future.result():
+                        by_project[result.project_id] = result
+
+        for proj_id in unrouted:
+            by_project[proj_id] = ProjectResult(
+                project_id=proj_id,
+                timestamp=datetime.now().isoformat(),
+                success=False,
+                error="No endpoint serves this project"
+            )
+
+        self.wall_seconds = time.time() - start_time
+        ordered = [by_project[p] for p in wanted]
+        self.results.extend(ordered)
+
+        serial = sum(r.duration_seconds for r in ordered)
+        print(f"\nWall time: {self.wall_seconds:.1f}s (serial sum {serial:.1f}s)")
+
+        return ordered
+
     def save_results(self, filename: Optional[str] = None):
         """Save results to JSON file."""
         if not filename:
@@ -327,7 +517,9 @@ class RegressionHarness:
             "summary": {
                 "total": len(self.results),
                 "passed": sum(1 for r in self.results if r.success),
-                "failed": sum(1 for r in self.results if not r.success)
+                "failed": sum(1 for r in self.results if not r.success),
+                "total_duration_seconds": round(sum(r.duration_seconds for r in self.results), 2),
+                "wall_seconds": round(self.wall_seconds, 2) if self.wall_seconds is not None else None
             }
         }
 
@@ -394,11 +586,15 @@ class RegressionHarness:
         failed = len(self.results) - passed
 
         lines.append(f"PASSED: {passed}  |  FAILED: {failed}")
+        if self.wall_seconds is not None:
+            serial = sum(r.duration_seconds for r in self.results)
+            lines.append(f"Wall time: {self.wall_seconds:.1f}s  |  Serial sum: {serial:.1f}s")
         lines.append("-" * 70)
 
         for result in self.results:
             status = "✓" if result.success else "✗"
-            lines.append(f"\n{status} {result.project_id}")
+            via = f"  (via {result.endpoint})" if result.endpoint else ""
+            lines.append(f"\n{status} {result.project_id}{via}")
 
             if result.state_summary:
                 s = result.state_summary
@@ -426,6 +622,8 @@ def main():
     parser.add_argument("--project", "-p", help="Run on specific project ID")
     parser.add_argument("--compare", "-c", help="Compare to baseline file")
     parser.add_argument("--save", "-s", action="store_true", help="Save results to file")
+    parser.add_argument("--endpoints", "-e", help="Endpoint pool JSON; runs projects in parallel")
+    parser.add_argument("--record", help="Directory to record live endpoint responses as snapshots")
     args = parser.parse_args()
 
     harness = RegressionHarness()
@@ -434,7 +632,14 @@ def main():
         harness.list_projects()
         return 0
 
-    if args.project:
+    if args.endpoints:
+        endpoints = load_endpoints(Path(args.endpoints))
+        project_ids = [args.project] if args.project else None
+        harness.run_parallel(endpoints, project_ids,
+                             record_dir=Path(args.record) if args.record else None)
+        print(harness.generate_report())
+
+    elif args.project:
         result = harness.run_assessment(args.project)
         harness.results.append(result)
         print(harness.generate_report())
@@ -17,7 +17,7 @@ import json
 import subprocess
 import sys
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 from datetime import datetime
 from enum import Enum
 
@@ -118,8 +118,12 @@ class ProjectState:
     model_name: str = ""
 
 
-def send_mcp_request(method: str, params: dict = None, timeout: int = 60) -> dict:
-    """Send MCP request to RevitMCPBridge."""
+DEFAULT_PIPE_NAME = "RevitMCPBridge2026"
+
+
+def send_mcp_request(method: str, params: dict = None, timeout: int = 60,
+                     pipe_name: str = DEFAULT_PIPE_NAME) -> dict:
+    """Send MCP request to RevitMCPBridge (one Revit session per pipe name)."""
     request = {"method": method}
     if params:
         request["params"] = params
@@ -129,7 +133,7 @@ def send_mcp_request(method: str, params: dict = None, timeout: int = 60) -> dic
         cmd = [
             "powershell.exe", "-Command",
             f'''
-            $pipe = New-Object System.IO.Pipes.NamedPipeClientStream(".", "RevitMCPBridge2026", [System.IO.Pipes.PipeDirection]::InOut)
+            $pipe = New-Object System.IO.Pipes.NamedPipeClientStream(".", "{pipe_name}", [System.IO.Pipes.PipeDirection]::InOut)
             $pipe.Connect({timeout * 1000})
             $writer = New-Object System.IO.StreamWriter($pipe)
             $reader = New-Object System.IO.StreamReader($pipe)
@@ -170,8 +174,16 @@ def send_mcp_request(method: str, params: dict = None, timeout: int = 60) -> dic
 class StateAssessor:
     """Assesses current project state against standards pack."""
 
-    def __init__(self, standards_pack: Dict):
+    def __init__(self, standards_pack: Dict, send: Optional[Callable[..., dict]] = None):
+        """
+        Args:
+            standards_pack: Resolved standards pack
+            send: Optional transport with the signature of send_mcp_request.
+                  Lets callers target a specific Revit session or a recorded
+                  snapshot instead of the default pipe.
+        """
         self.standards = standards_pack
+        self.send = send or send_mcp_request
         self.permit_skeleton = self._get_permit_skeleton()
 
     def _get_permit_skeleton(self) -> List[Dict]:
@@ -199,7 +211,7 @@ class StateAssessor:
     def analyze_sheets(self) -> SheetAnalysis:
         """Analyze sheet set coverage using canonical contract."""
         # Get existing sheets from MCP
-        resp = send_mcp_request("getAllSheets")
+        resp = self.send("getAllSheets")
         if resp.get("success"):
             result = resp.get("result", resp)
             existing = result.get("sheets", [])
@@ -227,7 +239,7 @@ class StateAssessor:
     def analyze_views(self, verbose: bool = False) -> ViewAnalysis:
         """Analyze view coverage and configuration using filtered queries."""
         # Get levels first
-        level_resp = send_mcp_request("getLevels")
+        level_resp = self.send("getLevels")
         if level_resp.get("success"):
             levels = level_resp.get("levels", [])
         else:
@@ -240,7 +252,7 @@ class StateAssessor:
 
         # Query ONLY floor plan views (not all 2000+ views) - server-side filtering
         floor_plans = {}
-        floor_plan_resp = send_mcp_request("getViews", {"viewType": "FloorPlan"}, timeout=60)
+        floor_plan_resp = self.send("getViews", {"viewType": "FloorPlan"}, timeout=60)
         if floor_plan_resp.get("success"):
             result = floor_plan_resp.get("result", floor_plan_resp)
             fp_views = result.get("views", [])
@@ -263,7 +275,7 @@ class StateAssessor:
 
         # Query ONLY elevation views
         elevations = []
-        elev_resp = send_mcp_request("getViews", {"viewType": "Elevation"}, timeout=60)
+        elev_resp = self.send("getViews", {"viewType": "Elevation"}, timeout=60)
         if elev_resp.get("success"):
             result = elev_resp.get("result", elev_resp)
             elevations = result.get("views", [])
@@ -272,7 +284,7 @@ class StateAssessor:
 
         # Query ONLY section views
         sections = []
-        sect_resp = send_mcp_request("getViews", {"viewType": "Section"}, timeout=60)
+        sect_resp = self.send("getViews", {"viewType": "Section"}, timeout=60)
         if sect_resp.get("success"):
             result = sect_resp.get("result", sect_resp)
             sections = result.get("views", [])
@@ -313,7 +325,7 @@ class StateAssessor:
 
         def get_tag_coverage(category: str) -> Dict:
             # Get all elements of category - handle result-wrapped responses
-            resp = send_mcp_request("getElementsByCategory", {"category": category})
+            resp = self.send("getElementsByCategory", {"category": category})
             if resp.get("success"):
                 result = resp.get("result", resp)
                 elements = result.get("elements", [])
@@ -354,7 +366,7 @@ class StateAssessor:
     def analyze_schedules(self) -> ScheduleAnalysis:
         """Analyze schedule completeness."""
         # Get existing schedules - handle result-wrapped responses
-        resp = send_mcp_request("getSchedules")
+        resp = self.send("getSchedules")
         if resp.get("success"):
             result = resp.get("result", resp)
             existing = result.get("schedules", [])
@@ -393,7 +405,7 @@ class StateAssessor:
         # Check for duplicate marks
         duplicate_marks = {}
         for category in ["Doors", "Windows"]:
-            resp = send_mcp_request("getElementsByCategory", {"category": category})
+            resp = self.send("getElementsByCategory", {"category": category})
             if resp.get("success"):
                 result = resp.get("result", resp)
                 elements = result.get("elements", [])
@@ -423,7 +435,7 @@ class StateAssessor:
     def analyze_dimensions(self) -> DimensionAnalysis:
         """Basic dimension presence check."""
         # Get dimension count - handle result-wrapped responses
-        resp = send_mcp_request("getElementsByCategory", {"category": "Dimensions"})
+        resp = self.send("getElementsByCategory", {"category": "Dimensions"})
         if resp.get("success"):
             result = resp.get("result", resp)
             dims = result.get("elements", [])
@@ -432,7 +444,7 @@ class StateAssessor:
         total_dims = len(dims)
 
         # Get floor plan views
-        view_resp = send_mcp_request("getViews")
+        view_resp = self.send("getViews")
         if view_resp.get("success"):
             result = view_resp.get("result", view_resp)
             views = result.get("views", [])
@@ -11,16 +11,85 @@ Architecture:
         + Sector Module (multifamily, residential_sfh, commercial_ti, etc.)
         + Firm Overrides (optional, e.g., ARKY preferences)
         = Resolved Standards Pack
+
+Resolved packs are frozen (read-only dict/list subclasses) and cached by the
+content hashes of their inputs, so repeated runs share one instance safely
+across threads. Use copy.deepcopy() on a resolved pack for a mutable copy.
 """
 
 import json
 import argparse
+import hashlib
+import threading
 from pathlib import Path
-from typing import Dict, Any, List
-from copy import deepcopy
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 
+class FrozenDict(dict):
+    """Read-only dict. Still a dict, so json.dump and isinstance checks work."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Resolved packs are read-only; use copy.deepcopy() for a mutable copy")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __hash__(self):
+        return id(self)
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+
+class FrozenList(list):
+    """Read-only list. Concatenation still returns a plain list."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Resolved packs are read-only; use copy.deepcopy() for a mutable copy")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def __hash__(self):
+        return id(self)
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts/lists to their frozen counterparts."""
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Recursively convert a (possibly frozen) pack to plain dicts/lists."""
+    if isinstance(value, dict):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [thaw(v) for v in value]
+    return value
+
+
 def deep_merge(base: Dict, overlay: Dict) -> Dict:
     """
     Deep merge overlay into base.
@@ -28,23 +97,24 @@ def deep_merge(base: Dict, overlay: Dict) -> Dict:
     - Lists are replaced (not appended)
     - Scalars are replaced
     - Keys starting with _ are metadata, not merged
+
+    Returns a frozen dict. Subtrees the overlay does not touch are shared
+    with base rather than copied.
     """
-    result = deepcopy(base)
+    base = freeze(base)
+    result = dict(base)
 
     for key, value in overlay.items():
         # Skip metadata keys
         if key.startswith('_'):
             continue
 
-        if key in result:
-            if isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = deep_merge(result[key], value)
-            else:
-                result[key] = deepcopy(value)
+        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
+            result[key] = deep_merge(result[key], value)
         else:
-            result[key] = deepcopy(value)
+            result[key] = freeze(value)
 
-    return result
+    return FrozenDict(result)
 
 
 def load_pack(pack_path: Path) -> Dict:
@@ -56,6 +126,49 @@ def load_pack(pack_path: Path) -> Dict:
         return json.load(f)
 
 
+# Parsed input files keyed by (path, mtime_ns, size) -> (sha256, frozen pack)
+_file_cache: Dict[Tuple[str, int, int], Tuple[str, Dict]] = {}
+# Resolved packs keyed by input paths + content hashes + firm override hash
+_resolved_cache: Dict[Tuple, Dict] = {}
+_cache_lock = threading.Lock()
+
+
+def _load_pack_hashed(pack_path: Path) -> Tuple[str, Dict]:
+    """Load a pack once per file version; returns (sha256, frozen pack)."""
+    if not pack_path.exists():
+        raise FileNotFoundError(f"Pack not found: {pack_path}")
+
+    st = pack_path.stat()
+    stat_key = (str(pack_path.resolve()), st.st_mtime_ns, st.st_size)
+
+    with _cache_lock:
+        cached = _file_cache.get(stat_key)
+    if cached:
+        return cached
+
+    raw = pack_path.read_bytes()
+    entry = (hashlib.sha256(raw).hexdigest(), freeze(json.loads(raw)))
+
+    with _cache_lock:
+        _file_cache[stat_key] = entry
+    return entry
+
+
+def overrides_hash(firm_overrides: Optional[Dict]) -> Optional[str]:
+    """Stable content hash of a firm overrides dict."""
+    if firm_overrides is None:
+        return None
+    canonical = json.dumps(firm_overrides, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def clear_pack_cache() -> None:
+    """Drop all cached input files and resolved packs."""
+    with _cache_lock:
+        _file_cache.clear()
+        _resolved_cache.clear()
+
+
 def list_available_modules(packs_dir: Path) -> List[Dict]:
     """List all available modules with their metadata."""
     modules = []
@@ -96,11 +209,19 @@ def resolve_pack(
         run_id: Optional run ID for naming
 
     Returns:
-        Fully resolved standards pack dict
+        Fully resolved standards pack dict (frozen and shared between
+        callers; resolvedAt is the time it was first resolved)
     """
-    # Load base packs
-    core = load_pack(core_path)
-    sector = load_pack(sector_path)
+    # Load base packs (parsed once per file version)
+    core_hash, core = _load_pack_hashed(Path(core_path))
+    sector_hash, sector = _load_pack_hashed(Path(sector_path))
+
+    cache_key = (str(core_path), core_hash, str(sector_path), sector_hash,
+                 overrides_hash(firm_overrides))
+    with _cache_lock:
+        cached = _resolved_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
     # Merge: Core + Sector
     resolved = deep_merge(core, sector)
@@ -110,17 +231,25 @@ def resolve_pack(
         resolved = deep_merge(resolved, firm_overrides)
 
     # Update identity for resolved pack
-    resolved['identity']['name'] = f"Resolved_{sector.get('identity', {}).get('projectType', 'Unknown')}_{datetime.now().strftime('%Y%m%d')}"
-    resolved['identity']['resolvedFrom'] = {
+    identity = dict(resolved.get('identity', {}))
+    identity['name'] = f"Resolved_{sector.get('identity', {}).get('projectType', 'Unknown')}_{datetime.now().strftime('%Y%m%d')}"
+    identity['resolvedFrom'] = {
         'core': str(core_path),
         'sector': str(sector_path),
         'firmOverrides': firm_overrides is not None
     }
-    resolved['identity']['resolvedAt'] = datetime.now().isoformat()
+    identity['resolvedAt'] = datetime.now().isoformat()
+
+    resolved = dict(resolved)
+    resolved['identity'] = freeze(identity)
+    resolved = FrozenDict(resolved)
 
     # Validate required fields
     validate_resolved_pack(resolved)
 
+    with _cache_lock:
+        # Another thread may have resolved the same inputs meanwhile
+        resolved = _resolved_cache.setdefault(cache_key, resolved)
     return resolved
 
 